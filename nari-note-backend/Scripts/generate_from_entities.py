@@ -1,10 +1,10 @@
 import re
+import sys
+import argparse
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import List
-import inflect
-
-# inflectエンジンの初期化
-P = inflect.engine()
 
 # プロジェクトのルートディレクトリ
 BACKEND_ROOT = Path(__file__).parent.parent
@@ -16,6 +16,26 @@ REPOSITORY_DIR = BACKEND_ROOT / "Src" / "Domain" / "Repository"
 ID_VALUE_GENERATOR_DIR = BACKEND_ROOT / "Src" / "Infrastructure" / "Database" / "IdValueGenerator"
 VALUE_OBJECT_FILE = BACKEND_ROOT / "Src" / "Domain" / "ValueObject" / "EntityKeyObject.cs"
 CONVERTER_FILE = BACKEND_ROOT / "Src" / "Middleware" / "ValueObjectJsonConverterFactory.cs"
+PROFILE_FILE = SCRIPTS_DIR / ".cache" / "profile.json"
+# --profile ではリポジトリ直下の scripts/helpers/profiler.py を使う
+REPO_SCRIPTS_DIR = BACKEND_ROOT.parent / "scripts"
+
+
+class _NoProfiler:
+    """--profile なしのときの何もしない profiler"""
+
+    @contextmanager
+    def phase(self, name: str, files: int = 0, **details):
+        yield {}
+
+
+def create_profiler(args: argparse.Namespace):
+    if not args.profile:
+        return _NoProfiler()
+    if str(REPO_SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(REPO_SCRIPTS_DIR))
+    from helpers.profiler import PhaseProfiler
+    return PhaseProfiler("generate_from_entities", enabled=True, cprofile=bool(args.profile_cprofile))
 
 
 # エンティティファイルから、IDを持つエンティティ名を抽出
@@ -97,6 +117,13 @@ def generate_repository_interfaces(entities: List[str]) -> List[str]:
     return generated
 
 
+@lru_cache(maxsize=None)
+def _inflect_engine():
+    """inflect は読み込みと初期化が重いため、新しい IdValueGenerator を生成するときだけ用意する"""
+    import inflect
+    return inflect.engine()
+
+
 # IdValueGeneratorの生成（既存ファイルはスキップ）
 def generate_id_value_generators(entities: List[str]) -> List[str]:
     template = load_template("id_value_generator.template")
@@ -107,7 +134,7 @@ def generate_id_value_generators(entities: List[str]) -> List[str]:
         if file_path.exists():
             continue
 
-        plural_form = P.plural(entity)
+        plural_form = _inflect_engine().plural(entity)
         content = template.replace("{{ENTITY_NAME}}", entity).replace("{{ENTITY_NAME_PLURAL}}", plural_form)
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(content)
@@ -117,8 +144,44 @@ def generate_id_value_generators(entities: List[str]) -> List[str]:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Entity から ValueObject / JSONコンバーター / IRepository / IdValueGenerator を生成する")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        type=Path,
+        const=PROFILE_FILE,
+        metavar="FILE",
+        help=f"フェーズごとの時間・ファイル数・ピークメモリを JSON で出力する (default: {PROFILE_FILE})",
+    )
+    parser.add_argument(
+        "--profile-cprofile",
+        type=Path,
+        metavar="FILE",
+        help="各フェーズを cProfile でも計測し、最も遅いフェーズの統計を FILE に出力する（--profile を含む）",
+    )
+    args = parser.parse_args()
+    if args.profile_cprofile and not args.profile:
+        args.profile = PROFILE_FILE
+
+    profiler = create_profiler(args)
+    try:
+        run(profiler)
+    finally:
+        if args.profile:
+            profiler.write(args.profile, args.profile_cprofile)
+            print("\n⏱️  Profile (slowest first):")
+            for line in profiler.summary_lines():
+                print(line)
+            print(f"   report: {args.profile}")
+            if args.profile_cprofile:
+                print(f"   cProfile of slowest phase: {args.profile_cprofile}")
+
+
+def run(profiler):
     print("🔍 Entityファイルを解析中...")
-    entities = extract_entities_from_files()
+    with profiler.phase("extract_entities") as record:
+        entities = extract_entities_from_files()
+        record["files"] = len(entities)
     
     if not entities:
         print("❌ エンティティが見つかりませんでした")
@@ -128,21 +191,27 @@ def main():
     
     # ValueObject生成
     print("\n📝 ValueObjectを生成中...")
-    value_object_content = generate_value_objects(entities)
-    with open(VALUE_OBJECT_FILE, "w", encoding="utf-8") as f:
-        f.write(value_object_content)
+    with profiler.phase("render:value_object.template", template="value_object.template"):
+        value_object_content = generate_value_objects(entities)
+    with profiler.phase("write:value_object.template", files=1, template="value_object.template"):
+        with open(VALUE_OBJECT_FILE, "w", encoding="utf-8") as f:
+            f.write(value_object_content)
     print(f"✅ 生成完了: {VALUE_OBJECT_FILE.relative_to(BACKEND_ROOT)}")
     
     # Converter生成
     print("\n📝 JSONコンバーターを生成中...")
-    converter_content = generate_converter(entities)
-    with open(CONVERTER_FILE, "w", encoding="utf-8") as f:
-        f.write(converter_content)
+    with profiler.phase("render:json_converter.template", template="json_converter.template"):
+        converter_content = generate_converter(entities)
+    with profiler.phase("write:json_converter.template", files=1, template="json_converter.template"):
+        with open(CONVERTER_FILE, "w", encoding="utf-8") as f:
+            f.write(converter_content)
     print(f"✅ 生成完了: {CONVERTER_FILE.relative_to(BACKEND_ROOT)}")
     
     # IRepository生成（既存ファイルはスキップ）
     print("\n📝 IRepositoryインターフェースを生成中...")
-    generated_repos = generate_repository_interfaces(entities)
+    with profiler.phase("repository_interface.template", template="repository_interface.template") as record:
+        generated_repos = generate_repository_interfaces(entities)
+        record["files"] = len(generated_repos)
     if generated_repos:
         print(f"✅ 新規生成: {', '.join([f'I{e}Repository.cs' for e in generated_repos])}")
     else:
@@ -150,7 +219,9 @@ def main():
     
     # IdValueGenerator生成（既存ファイルはスキップ）
     print("\n📝 IdValueGeneratorを生成中...")
-    generated_generators = generate_id_value_generators(entities)
+    with profiler.phase("id_value_generator.template", template="id_value_generator.template") as record:
+        generated_generators = generate_id_value_generators(entities)
+        record["files"] = len(generated_generators)
     if generated_generators:
         print(f"✅ 新規生成: {', '.join([f'{e}IdValueGenerator.cs' for e in generated_generators])}")
     else:
@@ -85,6 +85,7 @@ public class ArticlesController : ApplicationController
 
     [HttpPut("{id}")]
     [RequireAuth]
+    [Invalidates(nameof(TagsController.GetPopularTags))]
     [ValidateModelState]
     public async Task<ActionResult<UpdateArticleResponse>> UpdateArticle(ArticleId id, [FromBody] UpdateArticleRequest request)
     {
@@ -122,6 +123,7 @@ public class ArticlesController : ApplicationController
 
     [HttpPost("{id}/like")]
     [RequireAuth]
+    [Invalidates(nameof(UsersController.GetLikedArticles), nameof(UsersController.GetUserProfile))]
     public async Task<ActionResult<ToggleLikeResponse>> ToggleLike(ArticleId id)
     {
         var request = new ToggleLikeRequest
@@ -70,6 +70,7 @@ public class UsersController : ApplicationController
 
     [HttpPost("{id}/follow")]
     [RequireAuth]
+    [Invalidates(nameof(GetFollowings), nameof(GetUserProfile))]
     public async Task<ActionResult> ToggleFollow(UserId id)
     {
         var request = new ToggleFollowRequest
@@ -0,0 +1,20 @@
+namespace NariNoteBackend.Filter;
+
+/// <summary>
+/// 更新系アクションが成功したときに、フロントエンドで無効化するクエリを指定する属性
+/// api-generator はパスパラメータと DTO・ValueObject の型から無効化するクエリを推測するので、
+/// 型からは分からない影響（いいねした記事の一覧など）だけを GET アクションのメソッド名で追加する。
+/// Only = true の場合は推測を使わず、指定したクエリだけを無効化する
+/// </summary>
+[AttributeUsage(AttributeTargets.Method)]
+public class InvalidatesAttribute : Attribute
+{
+    public InvalidatesAttribute(params string[] queries)
+    {
+        Queries = queries;
+    }
+
+    public string[] Queries { get; }
+
+    public bool Only { get; set; }
+}
@@ -0,0 +1,16 @@
+using System.Text.Json;
+using NariNoteBackend.Middleware;
+
+namespace NariNoteBenchmarks;
+
+public static class BenchmarkJson
+{
+    /// <summary>
+    /// Program.cs の AddJsonOptions と同じ設定（MVC の既定の Web 設定 + camelCase + ValueObject のコンバーター）
+    /// </summary>
+    public static readonly JsonSerializerOptions Options = new(JsonSerializerDefaults.Web)
+    {
+        PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+        Converters = { new ValueObjectJsonConverterFactory() },
+    };
+}
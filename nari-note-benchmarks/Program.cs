@@ -0,0 +1,6 @@
+using BenchmarkDotNet.Running;
+
+// 実行例:
+//   dotnet run -c Release -- --filter '*'
+//   dotnet run -c Release -- --filter '*GetArticleContentResponse*'
+BenchmarkSwitcher.FromAssembly(typeof(Program).Assembly).Run(args);
@@ -0,0 +1,87 @@
+namespace NariNoteBenchmarks;
+
+/// <summary>
+/// ベンチマーク用のインスタンスの大きさ
+/// </summary>
+public enum SampleSize
+{
+    /// <summary>文字列は数十文字、コレクションは数件</summary>
+    Typical,
+
+    /// <summary>文字列・一番外側のコレクションを検証属性の上限（[MaxLength] など）まで埋める。上限がなければ Sample.Max* の大きさ</summary>
+    Max,
+}
+
+/// <summary>
+/// 生成された DtoSamples から使う、決まった乱数列で値を作るヘルパー
+/// </summary>
+public static class Sample
+{
+    const int TypicalStringLength = 24;
+    const int TypicalCollectionSize = 3;
+    public const int MaxStringLength = 1000;
+    public const int MaxCollectionSize = 50;
+    const string Alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 ";
+
+    static Random random = new(42);
+    static int serial;
+
+    /// <summary>
+    /// 乱数列を最初に戻す（同じ型・同じ大きさなら毎回同じインスタンスになる）
+    /// </summary>
+    public static void Reset(int seed = 42)
+    {
+        random = new Random(seed);
+        serial = 0;
+    }
+
+    public static string Text(SampleSize size, int min, int? max)
+    {
+        var length = size == SampleSize.Max ? max ?? MaxStringLength : Math.Min(TypicalStringLength, max ?? int.MaxValue);
+        length = Math.Max(length, min);
+        return string.Create(length, random, static (span, r) =>
+        {
+            for (var i = 0; i < span.Length; i++)
+                span[i] = Alphabet[r.Next(Alphabet.Length)];
+        });
+    }
+
+    public static string Email() => $"user{++serial}@example.com";
+
+    public static string Url() => $"https://example.com/{++serial}";
+
+    public static string Phone() => $"090{random.Next(10_000_000, 100_000_000)}";
+
+    /// <summary>min 以上 max 以下（[Range] と同じく上限を含む）</summary>
+    public static int NextInt(int min, int max) => (int)random.NextInt64(min, (long)max + 1);
+
+    public static double NextDouble(double min, double max) => min + random.NextDouble() * (max - min);
+
+    public static bool NextBool() => random.Next(2) == 1;
+
+    public static Guid NextGuid()
+    {
+        Span<byte> bytes = stackalloc byte[16];
+        random.NextBytes(bytes);
+        return new Guid(bytes);
+    }
+
+    public static DateTime NextDateTime() =>
+        new DateTime(2024, 1, 1, 0, 0, 0, DateTimeKind.Utc).AddSeconds(random.Next(365 * 86400));
+
+    /// <summary>
+    /// 要素数は size に従うが、上限まで埋めるのは一番外側の DTO（depth 0）のコレクションだけ
+    /// （GetArticlesResponse の記事は MaxCollectionSize 件、各記事の棋譜は数件）
+    /// </summary>
+    public static List<T> Many<T>(SampleSize size, int depth, int min, int? max, Func<T> element)
+    {
+        var count = size == SampleSize.Max && depth == 0
+            ? max ?? MaxCollectionSize
+            : Math.Min(TypicalCollectionSize, max ?? int.MaxValue);
+        count = Math.Max(count, min);
+        var list = new List<T>(count);
+        for (var i = 0; i < count; i++)
+            list.Add(element());
+        return list;
+    }
+}
@@ -1,3 +1,22 @@
 import { defineCloudflareConfig } from "@opennextjs/cloudflare";
 
+// server.ts の GET（[AllowAnonymous] / [OptionalAuth]）は、環境変数 SERVER_CACHE_REVALIDATE_SECONDS を設定したときだけ
+// fetch の next.revalidate / tags でデータキャッシュに残し、更新系 API の後に revalidateTag で破棄する。
+// Cloudflare でこれを効かせるには、キャッシュとタグの保存先が要る。今はどちらも設定していないので、
+// SERVER_CACHE_REVALIDATE_SECONDS も設定せず、すべて no-store で毎回バックエンドに問い合わせる。
+//
+// 有効にするには R2 バケットと D1 データベースを作成し、wrangler.toml に
+//   [[r2_buckets]] binding = "NEXT_INC_CACHE_R2_BUCKET"
+//   [[d1_databases]] binding = "NEXT_TAG_CACHE_D1"
+// を追加したうえで、次のように指定する。
+//
+//   import r2IncrementalCache from "@opennextjs/cloudflare/overrides/incremental-cache/r2-incremental-cache";
+//   import d1NextTagCache from "@opennextjs/cloudflare/overrides/tag-cache/d1-next-tag-cache";
+//
+//   export default defineCloudflareConfig({
+//     incrementalCache: r2IncrementalCache,
+//     tagCache: d1NextTagCache,
+//   });
+//
+// そのうえで wrangler.toml の [vars] に SERVER_CACHE_REVALIDATE_SECONDS = "60" などを追加する。
 export default defineCloudflareConfig();
@@ -1,5 +1,6 @@
 import { getEnv } from '../../../../utils/env';
 import { type NextRequest } from 'next/server';
+import { revalidateMutation } from '@/lib/api/server';
 
 function getApiUrl(): string {
   return getEnv('API_URL') || 'http://localhost:5243';
@@ -31,7 +32,12 @@ async function proxyRequest(
     }
   }
 
-  return fetch(targetUrl, init);
+  const response = await fetch(targetUrl, init);
+  if (!['GET', 'HEAD'].includes(request.method) && response.ok) {
+    // 更新系 API が成功したら、server.ts のデータキャッシュのうち関係するものを破棄する
+    revalidateMutation(request.method, `/api/${pathStr}`);
+  }
+  return response;
 }
 
 export async function GET(request: NextRequest, context: { params: Promise<{ path: string[] }> }) {
@@ -1,4 +1,5 @@
 // Auto-generated by api-generator.py
+// Input fingerprint: fdc1f31f34cd97a5917f947cfb981ad9
 // Do not edit manually
 
 import { apiClient } from './client';
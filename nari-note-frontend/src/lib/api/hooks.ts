@@ -1,4 +1,5 @@
 // Auto-generated by api-generator.py
+// Input fingerprint: fc0168ff0384342d4bc14b0f4a8032a1
 // Do not edit manually
 
 import { useMutation, useQuery, useQueryClient, type UseMutationOptions, type UseQueryOptions } from '@tanstack/react-query';
@@ -116,7 +117,12 @@ export function useCreateArticle(options?: UseMutationOptions<CreateArticleRespo
   return useMutation<CreateArticleResponse, Error, CreateArticleRequest>({
     mutationFn: (data) => articlesApi.createArticle(data),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['articles'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getArticles'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getArticlesByAuthor'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getArticlesByTag'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getMyArticles'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getDraftArticles'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'searchArticles'] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -136,7 +142,15 @@ export function useUpdateArticle(options?: UseMutationOptions<UpdateArticleRespo
   return useMutation<UpdateArticleResponse, Error, UpdateArticleRequest>({
     mutationFn: (data) => articlesApi.updateArticle(data),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['articles'] });
+      const [, variables] = args;
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getArticles'] });
+      queryClient.invalidateQueries({ queryKey: variables.id === undefined ? ['articles', 'getArticleContent'] : ['articles', 'getArticleContent', { id: variables.id }] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getArticlesByAuthor'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getArticlesByTag'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getMyArticles'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getDraftArticles'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'searchArticles'] });
+      queryClient.invalidateQueries({ queryKey: ['tags', 'getPopularTags'] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -164,7 +178,14 @@ export function useDeleteArticle(options?: UseMutationOptions<void, Error, Delet
   return useMutation<void, Error, DeleteArticleRequest>({
     mutationFn: (data) => articlesApi.deleteArticle(data),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['articles'] });
+      const [, variables] = args;
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getArticles'] });
+      queryClient.invalidateQueries({ queryKey: variables.id === undefined ? ['articles', 'getArticleContent'] : ['articles', 'getArticleContent', { id: variables.id }] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getArticlesByAuthor'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getArticlesByTag'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getMyArticles'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'getDraftArticles'] });
+      queryClient.invalidateQueries({ queryKey: ['articles', 'searchArticles'] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -176,7 +197,10 @@ export function useToggleLike(options?: UseMutationOptions<ToggleLikeResponse, E
   return useMutation<ToggleLikeResponse, Error, ToggleLikeRequest>({
     mutationFn: (data) => articlesApi.toggleLike(data),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['articles'] });
+      const [, variables] = args;
+      queryClient.invalidateQueries({ queryKey: variables.articleId === undefined ? ['articles', 'getArticleContent'] : ['articles', 'getArticleContent', { id: variables.articleId }] });
+      queryClient.invalidateQueries({ queryKey: ['users', 'getUserProfile'] });
+      queryClient.invalidateQueries({ queryKey: ['users', 'getLikedArticles'] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -212,7 +236,8 @@ export function useCreateComment(options?: UseMutationOptions<CreateCommentRespo
   return useMutation<CreateCommentResponse, Error, CreateCommentRequest>({
     mutationFn: (data) => articlesApi.createComment(data),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['articles'] });
+      const [, variables] = args;
+      queryClient.invalidateQueries({ queryKey: variables.articleId === undefined ? ['articles', 'getArticleContent'] : ['articles', 'getArticleContent', { id: variables.articleId }] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -225,7 +250,7 @@ export function useSignUp(options?: UseMutationOptions<AuthResponse, Error, Sign
   return useMutation<AuthResponse, Error, SignUpRequest>({
     mutationFn: (data) => authApi.signUp(data),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['auth'] });
+      queryClient.invalidateQueries({ queryKey: ['auth', 'getCurrentUser'] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -237,7 +262,7 @@ export function useSignIn(options?: UseMutationOptions<AuthResponse, Error, Sign
   return useMutation<AuthResponse, Error, SignInRequest>({
     mutationFn: (data) => authApi.signIn(data),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['auth'] });
+      queryClient.invalidateQueries({ queryKey: ['auth', 'getCurrentUser'] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -257,7 +282,7 @@ export function useVerifyEmail(options?: UseMutationOptions<AuthResponse, Error,
   return useMutation<AuthResponse, Error, VerifyEmailRequest>({
     mutationFn: (data) => authApi.verifyEmail(data),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['auth'] });
+      queryClient.invalidateQueries({ queryKey: ['auth', 'getCurrentUser'] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -265,13 +290,8 @@ export function useVerifyEmail(options?: UseMutationOptions<AuthResponse, Error,
 }
 
 export function useUpdatePassword(options?: UseMutationOptions<UpdatePasswordResponse, Error, UpdatePasswordRequest>) {
-  const queryClient = useQueryClient();
   return useMutation<UpdatePasswordResponse, Error, UpdatePasswordRequest>({
     mutationFn: (data) => authApi.updatePassword(data),
-    onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['auth'] });
-      options?.onSuccess?.(...args);
-    },
     ...options,
   });
 }
@@ -350,7 +370,10 @@ export function useCreateCourse(options?: UseMutationOptions<CreateCourseRespons
   return useMutation<CreateCourseResponse, Error, CreateCourseRequest>({
     mutationFn: (data) => coursesApi.createCourse(data),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['courses'] });
+      queryClient.invalidateQueries({ queryKey: ['courses', 'getCourses'] });
+      queryClient.invalidateQueries({ queryKey: ['courses', 'searchCourses'] });
+      queryClient.invalidateQueries({ queryKey: ['courses', 'getMyCourses'] });
+      queryClient.invalidateQueries({ queryKey: ['courses', 'getCoursesByAuthor'] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -378,7 +401,13 @@ export function useDeleteCourse(options?: UseMutationOptions<void, Error, Delete
   return useMutation<void, Error, DeleteCourseRequest>({
     mutationFn: (data) => coursesApi.deleteCourse(data),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['courses'] });
+      const [, variables] = args;
+      queryClient.invalidateQueries({ queryKey: ['courses', 'getCourses'] });
+      queryClient.invalidateQueries({ queryKey: ['courses', 'searchCourses'] });
+      queryClient.invalidateQueries({ queryKey: ['courses', 'getMyCourses'] });
+      queryClient.invalidateQueries({ queryKey: ['courses', 'getCoursesByAuthor'] });
+      queryClient.invalidateQueries({ queryKey: variables.id === undefined ? ['courses', 'getCourseContent'] : ['courses', 'getCourseContent', { id: variables.id }] });
+      queryClient.invalidateQueries({ queryKey: variables.id === undefined ? ['courses', 'getCourseContentForEdit'] : ['courses', 'getCourseContentForEdit', { id: variables.id }] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -390,7 +419,13 @@ export function useUpdateCourse(options?: UseMutationOptions<UpdateCourseRespons
   return useMutation<UpdateCourseResponse, Error, UpdateCourseRequest>({
     mutationFn: (data) => coursesApi.updateCourse(data),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['courses'] });
+      const [, variables] = args;
+      queryClient.invalidateQueries({ queryKey: ['courses', 'getCourses'] });
+      queryClient.invalidateQueries({ queryKey: ['courses', 'searchCourses'] });
+      queryClient.invalidateQueries({ queryKey: ['courses', 'getMyCourses'] });
+      queryClient.invalidateQueries({ queryKey: ['courses', 'getCoursesByAuthor'] });
+      queryClient.invalidateQueries({ queryKey: variables.id === undefined ? ['courses', 'getCourseContent'] : ['courses', 'getCourseContent', { id: variables.id }] });
+      queryClient.invalidateQueries({ queryKey: variables.id === undefined ? ['courses', 'getCourseContentForEdit'] : ['courses', 'getCourseContentForEdit', { id: variables.id }] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -429,7 +464,9 @@ export function useUploadUserIcon(options?: UseMutationOptions<UploadUserIconRes
   return useMutation<UploadUserIconResponse, Error, File>({
     mutationFn: (file) => usersApi.uploadUserIcon(file),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['users'] });
+      queryClient.invalidateQueries({ queryKey: ['users', 'getUserProfile'] });
+      queryClient.invalidateQueries({ queryKey: ['users', 'getFollowers'] });
+      queryClient.invalidateQueries({ queryKey: ['users', 'getFollowings'] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -441,7 +478,9 @@ export function useUpdateUserProfile(options?: UseMutationOptions<UpdateUserProf
   return useMutation<UpdateUserProfileResponse, Error, UpdateUserProfileRequest>({
     mutationFn: (data) => usersApi.updateUserProfile(data),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['users'] });
+      queryClient.invalidateQueries({ queryKey: ['users', 'getUserProfile'] });
+      queryClient.invalidateQueries({ queryKey: ['users', 'getFollowers'] });
+      queryClient.invalidateQueries({ queryKey: ['users', 'getFollowings'] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -453,7 +492,10 @@ export function useToggleFollow(options?: UseMutationOptions<ToggleFollowRespons
   return useMutation<ToggleFollowResponse, Error, ToggleFollowRequest>({
     mutationFn: (data) => usersApi.toggleFollow(data),
     onSuccess: (...args) => {
-      queryClient.invalidateQueries({ queryKey: ['users'] });
+      const [, variables] = args;
+      queryClient.invalidateQueries({ queryKey: ['users', 'getUserProfile'] });
+      queryClient.invalidateQueries({ queryKey: variables.followingId === undefined ? ['users', 'getFollowers'] : ['users', 'getFollowers', { userId: variables.followingId }] });
+      queryClient.invalidateQueries({ queryKey: ['users', 'getFollowings'] });
       options?.onSuccess?.(...args);
     },
     ...options,
@@ -1,23 +1,39 @@
 // Auto-generated by api-generator.py
+// Input fingerprint: 18ab1ae2ddd5df68d4b2cf8d38e4de95
 // Do not edit manually
 // Server-side fetch functions for Next.js Server Components
 
+import { revalidateTag } from 'next/cache';
 import { getEnv } from '../../../utils/env';
 
 function getBaseUrl(): string {
   return getEnv('API_URL') || 'http://localhost:5243';
 }
 
+type ServerFetchCache = { cache: 'no-store' } | { next: { revalidate: number; tags: string[] } };
+
+/**
+ * [AllowAnonymous] / [OptionalAuth] の GET のキャッシュ設定
+ * SERVER_CACHE_REVALIDATE_SECONDS（秒）を設定したときだけデータキャッシュに残し、未設定・0 なら no-store にする。
+ * Cloudflare（OpenNext）では open-next.config.ts の incrementalCache / tagCache を設定するまで
+ * キャッシュも revalidateTag も効かないので、それまでは設定しない
+ */
+function cacheFor(tags: string[]): ServerFetchCache {
+  const seconds = Number(getEnv('SERVER_CACHE_REVALIDATE_SECONDS') || 0);
+  return seconds > 0 ? { next: { revalidate: seconds, tags } } : { cache: 'no-store' };
+}
+
 /**
  * サーバーサイド用のfetch関数（共通処理）
+ * 既定では常に最新のデータを取得する（ログインが必要な API など）
  */
-async function serverFetch<T>(url: string): Promise<T> {
+async function serverFetch<T>(url: string, caching: ServerFetchCache = { cache: 'no-store' }): Promise<T> {
   const response = await fetch(url, {
     method: 'GET',
     headers: {
       'Content-Type': 'application/json',
     },
-    cache: 'no-store', // Next.js: 常に最新のデータを取得
+    ...caching,
   });
 
   if (!response.ok) {
@@ -71,25 +87,25 @@ export async function getArticles(params: GetArticlesRequest): Promise<GetArticl
     }
   });
 
-  return serverFetch<GetArticlesResponse>(url.toString());
+  return serverFetch<GetArticlesResponse>(url.toString(), cacheFor(['articles', 'articles:getArticles']));
 }
 
 export async function getArticleContent(params: GetArticleContentRequest): Promise<GetArticleContentResponse> {
   const url = `${getBaseUrl()}/api/articles/${params.id}`;
 
-  return serverFetch<GetArticleContentResponse>(url);
+  return serverFetch<GetArticleContentResponse>(url, cacheFor(['articles', 'articles:getArticleContent', `articles:getArticleContent:${params.id}`]));
 }
 
 export async function getArticlesByAuthor(params: GetArticlesByAuthorRequest): Promise<GetArticlesByAuthorResponse> {
   const url = `${getBaseUrl()}/api/articles/author/${params.authorId}`;
 
-  return serverFetch<GetArticlesByAuthorResponse>(url);
+  return serverFetch<GetArticlesByAuthorResponse>(url, cacheFor(['articles', 'articles:getArticlesByAuthor', `articles:getArticlesByAuthor:${params.authorId}`]));
 }
 
 export async function getArticlesByTag(params: GetArticlesByTagRequest): Promise<GetArticlesByTagResponse> {
   const url = `${getBaseUrl()}/api/articles/tag/${params.tagName}`;
 
-  return serverFetch<GetArticlesByTagResponse>(url);
+  return serverFetch<GetArticlesByTagResponse>(url, cacheFor(['articles', 'articles:getArticlesByTag']));
 }
 
 export async function getMyArticles(): Promise<GetMyArticlesResponse> {
@@ -112,7 +128,7 @@ export async function searchArticles(params: SearchArticlesRequest): Promise<Sea
     }
   });
 
-  return serverFetch<SearchArticlesResponse>(url.toString());
+  return serverFetch<SearchArticlesResponse>(url.toString(), cacheFor(['articles', 'articles:searchArticles']));
 }
 
 // Auth Server Functions
@@ -131,7 +147,7 @@ export async function getCourses(params: GetCoursesRequest): Promise<GetCoursesR
     }
   });
 
-  return serverFetch<GetCoursesResponse>(url.toString());
+  return serverFetch<GetCoursesResponse>(url.toString(), cacheFor(['courses', 'courses:getCourses']));
 }
 
 export async function searchCourses(params: SearchCoursesRequest): Promise<SearchCoursesResponse> {
@@ -142,7 +158,7 @@ export async function searchCourses(params: SearchCoursesRequest): Promise<Searc
     }
   });
 
-  return serverFetch<SearchCoursesResponse>(url.toString());
+  return serverFetch<SearchCoursesResponse>(url.toString(), cacheFor(['courses', 'courses:searchCourses']));
 }
 
 export async function getMyCourses(): Promise<GetMyCoursesResponse> {
@@ -154,13 +170,13 @@ export async function getMyCourses(): Promise<GetMyCoursesResponse> {
 export async function getCoursesByAuthor(params: GetCoursesByAuthorRequest): Promise<GetCoursesByAuthorResponse> {
   const url = `${getBaseUrl()}/api/courses/author/${params.authorId}`;
 
-  return serverFetch<GetCoursesByAuthorResponse>(url);
+  return serverFetch<GetCoursesByAuthorResponse>(url, cacheFor(['courses', 'courses:getCoursesByAuthor', `courses:getCoursesByAuthor:${params.authorId}`]));
 }
 
 export async function getCourseContent(params: GetCourseContentRequest): Promise<GetCourseContentResponse> {
   const url = `${getBaseUrl()}/api/courses/${params.id}`;
 
-  return serverFetch<GetCourseContentResponse>(url);
+  return serverFetch<GetCourseContentResponse>(url, cacheFor(['courses', 'courses:getCourseContent', `courses:getCourseContent:${params.id}`]));
 }
 
 export async function getCourseContentForEdit(id: string): Promise<GetCourseContentResponse> {
@@ -180,30 +196,61 @@ export async function getHealth(): Promise<GetHealthResponse> {
 export async function getPopularTags(): Promise<GetPopularTagsResponse> {
   const url = `${getBaseUrl()}/api/tags/popular`;
 
-  return serverFetch<GetPopularTagsResponse>(url);
+  return serverFetch<GetPopularTagsResponse>(url, cacheFor(['tags', 'tags:getPopularTags']));
 }
 
 // Users Server Functions
 export async function getUserProfile(params: GetUserProfileRequest): Promise<GetUserProfileResponse> {
   const url = `${getBaseUrl()}/api/users/${params.id}`;
 
-  return serverFetch<GetUserProfileResponse>(url);
+  return serverFetch<GetUserProfileResponse>(url, cacheFor(['users', 'users:getUserProfile', `users:getUserProfile:${params.id}`]));
 }
 
 export async function getFollowers(params: GetFollowersRequest): Promise<GetFollowersResponse> {
   const url = `${getBaseUrl()}/api/users/${params.userId}/followers`;
 
-  return serverFetch<GetFollowersResponse>(url);
+  return serverFetch<GetFollowersResponse>(url, cacheFor(['users', 'users:getFollowers', `users:getFollowers:${params.userId}`]));
 }
 
 export async function getFollowings(params: GetFollowingsRequest): Promise<GetFollowingsResponse> {
   const url = `${getBaseUrl()}/api/users/${params.userId}/followings`;
 
-  return serverFetch<GetFollowingsResponse>(url);
+  return serverFetch<GetFollowingsResponse>(url, cacheFor(['users', 'users:getFollowings', `users:getFollowings:${params.userId}`]));
 }
 
 export async function getLikedArticles(params: GetLikedArticlesRequest): Promise<GetLikedArticlesResponse> {
   const url = `${getBaseUrl()}/api/users/${params.userId}/liked-articles`;
 
-  return serverFetch<GetLikedArticlesResponse>(url);
+  return serverFetch<GetLikedArticlesResponse>(url, cacheFor(['users', 'users:getLikedArticles', `users:getLikedArticles:${params.userId}`]));
+}
+
+// Cache Revalidation
+const mutationTags: Array<[method: string, path: RegExp, tags: (match: RegExpMatchArray) => string[]]> = [
+  ['POST', /^\/api\/articles$/, () => ['articles:getArticles', 'articles:getArticlesByAuthor', 'articles:getArticlesByTag', 'articles:searchArticles']],
+  ['DELETE', /^\/api\/articles\/([^/]+)$/, (match) => ['articles:getArticles', `articles:getArticleContent:${match[1]}`, 'articles:getArticlesByAuthor', 'articles:getArticlesByTag', 'articles:searchArticles']],
+  ['PUT', /^\/api\/articles\/([^/]+)$/, (match) => ['articles:getArticles', `articles:getArticleContent:${match[1]}`, 'articles:getArticlesByAuthor', 'articles:getArticlesByTag', 'articles:searchArticles', 'tags:getPopularTags']],
+  ['POST', /^\/api\/articles\/([^/]+)\/comments$/, (match) => [`articles:getArticleContent:${match[1]}`]],
+  ['POST', /^\/api\/articles\/([^/]+)\/like$/, (match) => [`articles:getArticleContent:${match[1]}`, 'users:getUserProfile', 'users:getLikedArticles']],
+  ['POST', /^\/api\/courses$/, () => ['courses:getCourses', 'courses:searchCourses', 'courses:getCoursesByAuthor']],
+  ['DELETE', /^\/api\/courses\/([^/]+)$/, (match) => ['courses:getCourses', 'courses:searchCourses', 'courses:getCoursesByAuthor', `courses:getCourseContent:${match[1]}`]],
+  ['PUT', /^\/api\/courses\/([^/]+)$/, (match) => ['courses:getCourses', 'courses:searchCourses', 'courses:getCoursesByAuthor', `courses:getCourseContent:${match[1]}`]],
+  ['PUT', /^\/api\/users$/, () => ['users:getUserProfile', 'users:getFollowers', 'users:getFollowings']],
+  ['POST', /^\/api\/users\/icon$/, () => ['users:getUserProfile', 'users:getFollowers', 'users:getFollowings']],
+  ['POST', /^\/api\/users\/([^/]+)\/follow$/, (match) => ['users:getUserProfile', `users:getFollowers:${match[1]}`, 'users:getFollowings']],
+];
+
+/**
+ * 更新系 API が成功した後に、関係するキャッシュタグを破棄する（Route Handler / Server Action から呼ぶ）
+ * 破棄したタグを返す
+ */
+export function revalidateMutation(method: string, path: string): string[] {
+  const tags = new Set<string>();
+  for (const [mutationMethod, pattern, toTags] of mutationTags) {
+    const match = mutationMethod === method ? path.match(pattern) : null;
+    if (match) {
+      toTags(match).forEach((tag) => tags.add(tag));
+    }
+  }
+  tags.forEach((tag) => revalidateTag(tag, { expire: 0 }));
+  return [...tags];
 }
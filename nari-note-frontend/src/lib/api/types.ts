@@ -1,4 +1,5 @@
 // Auto-generated by api-generator.py
+// Input fingerprint: fb4f8b8115d60d3ab527546d2213e389
 // Do not edit manually
 
 
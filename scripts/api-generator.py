@@ -3,213 +3,933 @@
 import os
 import sys
 import re
+import time
 import argparse
+import dataclasses
+import functools
 from pathlib import Path
-from typing import List, Dict
-from templates import TypesTemplate, EndpointsTemplate, HooksTemplate, ServerTemplate
+from typing import Callable, Iterable, List, Dict, NamedTuple, Optional, Sequence, Set, Tuple
+from templates import TypesTemplate, EndpointsTemplate, HooksTemplate, ServerTemplate, BarrelTemplate, endpoint_key
 from models import CSharpClass, EndpointInfo
 from helpers import (
+    FileSystemSource,
+    InvalidationMap,
     load_value_object_types,
-    parse_csharp_class,
-    parse_controller
+    ParseCache,
+    PhaseProfiler,
+    StagedFile,
+    SymbolIndex,
+    hash_files,
+    input_fingerprint,
+    is_fingerprint_line,
+    read_fingerprint,
+    stage_lines,
+    stamp_fingerprint,
+    write_if_changed,
 )
+from api_generator.protocols.convert import endpoint_info_to_http_api, http_api_to_endpoint_info
+from api_generator.protocols.http import HttpApi
 
 
-def _mark_path_param_fields_optional(all_endpoints: List[EndpointInfo], class_map: Dict[str, CSharpClass]) -> None:
+def _path_param_fields(all_endpoints: List[EndpointInfo], index: SymbolIndex) -> Dict[str, Set[str]]:
     """
-    パスパラメータ（{id} 等）に対応する Request フィールドを optional に設定する。
+    パスパラメータ（{id} 等）に対応する Request フィールド（クラス名 → プロパティ名）を返す。これらは optional にする。
 
     例: PUT /api/courses/{id} の UpdateCourseRequest.id を id?: number にする。
     こうすることで、コンポーネント側で courseId: number | undefined を渡してもエラーにならない。
     """
-    def to_camel(name: str) -> str:
-        return name[0].lower() + name[1:] if name else name
-
+    fields: Dict[str, Set[str]] = {}
     for ep in all_endpoints:
-        if not ep.request_type or ep.request_type not in class_map:
-            continue
+        for param in re.findall(r'\{(\w+)\}', ep.path):
+            prop = index.path_param_property(param, ep.request_type)
+            if prop is not None:
+                fields.setdefault(ep.request_type, set()).add(prop.name)
+    return fields
 
-        path_params = re.findall(r'\{(\w+)\}', ep.path)
-        if not path_params:
-            continue
-
-        req_class = class_map[ep.request_type]
-        # キャメルケース名 -> CSharpProperty のマッピングを構築
-        prop_by_camel: Dict[str, object] = {
-            to_camel(prop.name): prop for prop in req_class.properties
-        }
 
-        for param in path_params:
-            camel_param = to_camel(param)
-
-            # 直接一致（例: {id} -> id プロパティ）
-            if camel_param in prop_by_camel:
-                prop_by_camel[camel_param].is_optional = True  # type: ignore[union-attr]
-                continue
-
-            # {id} のとき、*Id で終わるプロパティが1つだけなら採用
-            if camel_param == 'id':
-                id_props = [p for name, p in prop_by_camel.items() if name.endswith('Id')]
-                if len(id_props) == 1:
-                    id_props[0].is_optional = True  # type: ignore[union-attr]
+def _with_optional_fields(cls: CSharpClass, names: Set[str]) -> CSharpClass:
+    """names のプロパティを optional にした CSharpClass を返す"""
+    return dataclasses.replace(cls, properties=[
+        dataclasses.replace(prop, is_optional=True) if prop.name in names else prop
+        for prop in cls.properties
+    ])
 
 
 # 設定
 BACKEND_ROOT = Path("nari-note-backend/Src")
 FRONTEND_API_DIR = Path("nari-note-frontend/src/lib/api")
+# バッチジョブ用の Python クライアント（--backends python）
+PYTHON_CLIENT_FILE = Path("scripts/nari_note_client.py")
+BENCHMARKS_DIR = Path("nari-note-benchmarks/Generated")
+BENCHMARK_FILES = [BENCHMARKS_DIR / "DtoSamples.g.cs", BENCHMARKS_DIR / "DtoJsonBenchmarks.g.cs"]
 CONTROLLER_DIR = BACKEND_ROOT / "Controller"
 REQUEST_DIR = BACKEND_ROOT / "Application/Dto/Request"
 RESPONSE_DIR = BACKEND_ROOT / "Application/Dto/Response"
 DTO_DIR = BACKEND_ROOT / "Application/Dto"
+DTO_DIRS = [REQUEST_DIR, RESPONSE_DIR, DTO_DIR]
 VALUE_OBJECT_FILE = BACKEND_ROOT / "Domain/ValueObject/EntityKeyObject.cs"
+PARSE_CACHE_FILE = Path(__file__).parent / ".cache" / "parse-cache.json"
+PROFILE_FILE = Path(__file__).parent / ".cache" / "profile.json"
+# 生成結果に影響するジェネレーター自身のソース（フィンガープリントに含める）
+SCRIPTS_DIR = Path(__file__).resolve().parent
+# 出力のフィンガープリントに含めるジェネレーターのソース（SCRIPTS_DIR からの glob）。
+# モデルを組み立てる api-generator.py・models・型の解決はどの出力にも効き、残りはテンプレートごとに分ける
+# （パーサーや loadtest などを変えても生成ファイルのヘッダーは変わらない）
+COMMON_RENDERER_SOURCES = ["api-generator.py", "models/*.py", "helpers/symbol_index.py", "helpers/csharp_types.py"]
+RENDERER_SOURCES = {
+    "TypesTemplate": ["templates/base.py", "templates/types_template.py"],
+    "EndpointsTemplate": ["templates/base.py", "templates/endpoints_template.py"],
+    "HooksTemplate": ["templates/base.py", "templates/hooks_template.py", "helpers/invalidation.py"],
+    "ServerTemplate": ["templates/base.py", "templates/server_template.py", "helpers/invalidation.py"],
+    "BarrelTemplate": ["templates/base.py", "templates/barrel_template.py"],
+    "AxiosGenerator": ["api_generator/client/base.py", "api_generator/client/axios/**/*.py", "api_generator/protocols/*.py"],
+    "FetchGenerator": ["api_generator/client/base.py", "api_generator/client/fetch/**/*.py", "api_generator/protocols/*.py"],
+    "PythonClientGenerator": ["api_generator/client/base.py", "api_generator/client/python/**/*.py", "api_generator/protocols/*.py"],
+    "BenchmarkGenerator": ["api_generator/benchmarks/**/*.py", "api_generator/loadtest/payload.py"],
+}
+# 出力バックエンド。--backends で選ぶ（axios / fetch は既存の endpoints.ts と役割が重なるため、python はフロントエンド用ではないため明示したときのみ）
+BACKENDS = ["types", "endpoints", "hooks", "server", "axios", "fetch", "python", "benchmarks"]
+DEFAULT_BACKENDS = ["types", "endpoints", "hooks", "server"]
+# endpoints / hooks の出力形式。modules はコントローラー別の <controller>/endpoints.ts・hooks.ts とバレル（tree shaking 用）
+LAYOUTS = ["monolithic", "modules"]
+# api_generator/<名前>/cli.py の main(argv, load_model) で実行するサブコマンド（diff は別扱い）
+SUBCOMMANDS = ["loadtest", "mock", "waterfalls", "invalidations"]
+
+
+class OutputOptions(NamedTuple):
+    """生成する出力の選択（--backends / --layout）"""
+    backends: Sequence[str] = DEFAULT_BACKENDS
+    layout: str = "monolithic"
+
+
+@functools.lru_cache(maxsize=None)
+def _renderer_hash(template: str) -> str:
+    """
+    template（OutputPlan.template。"BenchmarkGenerator.samples" は "BenchmarkGenerator"）をレンダリングするソースのハッシュ
+
+    読み込み済みのコードに対応するので、プロセス内ではテンプレートごとに1回だけ計算する。
+    """
+    patterns = COMMON_RENDERER_SOURCES + RENDERER_SOURCES[template.split(".", 1)[0]]
+    files = {path for pattern in patterns for path in SCRIPTS_DIR.glob(pattern)}
+    return hash_files(files, SCRIPTS_DIR)
+
+
+def _output_fingerprint(source_fingerprint: Optional[str], options: OutputOptions, template: str) -> str:
+    """
+    生成ファイルのヘッダーに埋め込むフィンガープリント（入力ソース + その出力のレンダラー + レイアウト）
+
+    --backends はどのファイルを生成するかを決めるだけで、各ファイルの内容には影響しないので含めない。
+    """
+    return input_fingerprint(source_fingerprint or "", _renderer_hash(template), [options.layout])
+
+def _source_files(source: Optional[FileSystemSource] = None) -> List[Path]:
+    """生成の入力になる C# ソース（ValueObject・DTO・コントローラー）"""
+    return [VALUE_OBJECT_FILE, *_collect_dto_files(source), *_collect_controller_files(source)]
+
+
+def _source_fingerprint(source: Optional[FileSystemSource] = None) -> str:
+    """入力ソースの内容ハッシュ（パースはしない）"""
+    return hash_files(_source_files(source), BACKEND_ROOT, source)
+
+
+def _is_dto_file(file_path: Path) -> bool:
+    return file_path.suffix == ".cs" and file_path.parent in DTO_DIRS
+
+
+def _is_controller_file(file_path: Path) -> bool:
+    return file_path.parent == CONTROLLER_DIR and file_path.name.endswith("Controller.cs")
+
+
+class ResolvedModel(NamedTuple):
+    """後処理済みの、各出力バックエンドに渡すモデル（endpoints と apis は同じエンドポイントの2つの表現）"""
+    classes: List[CSharpClass]
+    class_map: Dict[str, CSharpClass]
+    endpoints: List[EndpointInfo]
+    apis: List[HttpApi]
+    index: SymbolIndex
+
+
+class ApiModel:
+    """
+    パース済みの DTO クラスとエンドポイント（HttpApi）をファイル単位で保持する
+
+    パースは1回だけ行い、各出力バックエンドには resolve() の結果を共有して渡す。
+    --watch では同じインスタンスを使い回し、変更されたファイルだけ再パースする。
+    """
+
+    def __init__(self, parse_cache: ParseCache, verbose: bool = False, jobs: int = 1):
+        self.parse_cache = parse_cache
+        self.verbose = verbose
+        self.jobs = jobs
+        self.classes_by_file: Dict[Path, Optional[CSharpClass]] = {}
+        self.apis_by_file: Dict[Path, Tuple[List[HttpApi], List[str]]] = {}
+        # パースしたソースの内容ハッシュ（_source_fingerprint）。生成ファイルのフィンガープリントの元になる
+        self.source_fingerprint: Optional[str] = None
+
+    @property
+    def classes(self) -> List[CSharpClass]:
+        return [cls for cls in self.classes_by_file.values() if cls]
+
+    @property
+    def request_types(self) -> Set[str]:
+        return {cls.name for cls in self.classes if cls.name.endswith("Request")}
+
+    @property
+    def response_types(self) -> Set[str]:
+        return {cls.name for cls in self.classes if cls.name.endswith("Response")}
+
+    @property
+    def apis(self) -> List[HttpApi]:
+        return [api for apis, _ in self.apis_by_file.values() for api in apis]
+
+    @property
+    def endpoints(self) -> List[EndpointInfo]:
+        return [http_api_to_endpoint_info(api) for api in self.apis]
+
+    @property
+    def skipped(self) -> Dict[str, List[str]]:
+        return {path.name: skipped for path, (_, skipped) in self.apis_by_file.items() if skipped}
+
+    def update_classes(self, files: Iterable[Path]) -> None:
+        """DTO ファイルを（再）パースする。存在しないファイルはモデルから外す"""
+        existing: List[Path] = []
+        for file_path in files:
+            if file_path.exists():
+                existing.append(file_path)
+            else:
+                self.classes_by_file.pop(file_path, None)
+
+        for file_path, cls in zip(existing, self.parse_cache.get_classes(existing, self.jobs)):
+            self.classes_by_file[file_path] = cls
+            if cls:
+                print(f"  ✓ {cls.name}")
+
+    def update_controllers(self, files: Iterable[Path]) -> None:
+        """コントローラーファイルを（再）パースする。存在しないファイルはモデルから外す"""
+        all_request_types = self.request_types
+        all_response_types = self.response_types
+        existing: List[Path] = []
+        for file_path in files:
+            if file_path.exists():
+                existing.append(file_path)
+            else:
+                self.apis_by_file.pop(file_path, None)
+
+        results = self.parse_cache.get_controllers(existing, all_request_types, all_response_types, self.jobs)
+        for file_path, (endpoints, skipped) in zip(existing, results):
+            self.apis_by_file[file_path] = ([endpoint_info_to_http_api(ep) for ep in endpoints], skipped)
+            if endpoints:
+                print(f"  ✓ {file_path.name}: {len(endpoints)} endpoints")
+            if self.verbose and skipped:
+                print(f"    ⚠️  Skipped {len(skipped)} methods (missing response types)")
+
+    def resolve(self, value_object_types: Dict[str, str]) -> ResolvedModel:
+        """
+        出力バックエンドに渡すモデルを返す
+
+        モデルは不変なので、パスパラメータの optional 化などの後処理は変更するものだけ作り直す
+        （保持しているパース結果はそのまま共有する）。
+        """
+        classes = self.classes
+        endpoints = self.endpoints
+        index = SymbolIndex(classes, value_object_types)
+
+        # パスパラメータに対応する Request フィールドを optional に設定
+        # （例: PUT /api/courses/{id} の UpdateCourseRequest.id → id?: number）
+        optional_fields = _path_param_fields(endpoints, index)
+        if optional_fields:
+            classes = [
+                _with_optional_fields(cls, optional_fields[cls.name]) if cls.name in optional_fields else cls
+                for cls in classes
+            ]
+            index = SymbolIndex(classes, value_object_types)
+        class_map = {cls.name: cls for cls in classes}
+
+        # プロパティのない空の Request 型は void 扱いにする（data 引数不要なエンドポイント）
+        endpoints = [
+            dataclasses.replace(ep, request_type=None)
+            if ep.request_type in class_map and not class_map[ep.request_type].properties else ep
+            for ep in endpoints
+        ]
+
+        apis = [endpoint_info_to_http_api(ep) for ep in endpoints]
+        return ResolvedModel(classes, class_map, endpoints, apis, index)
+
+    def to_ir(self, value_object_types: Dict[str, str]):
+        """パース結果を中間表現（api_generator/protocols/ir.py の ApiIR）にする"""
+        from api_generator.protocols import ir
+        return ir.ApiIR(
+            value_object_types=dict(value_object_types),
+            classes=[
+                ir.ClassIR(path.relative_to(BACKEND_ROOT).as_posix(), cls)
+                for path, cls in self.classes_by_file.items()
+            ],
+            controllers=[
+                ir.ControllerIR(path.relative_to(BACKEND_ROOT).as_posix(), list(apis), list(skipped))
+                for path, (apis, skipped) in self.apis_by_file.items()
+            ],
+            source_fingerprint=self.source_fingerprint,
+        )
+
+    @classmethod
+    def from_ir(cls, api_ir, parse_cache: ParseCache) -> "ApiModel":
+        """中間表現からモデルを復元する（バックエンドのソースは読まない）"""
+        model = cls(parse_cache)
+        for entry in api_ir.classes:
+            model.classes_by_file[BACKEND_ROOT / entry.file] = entry.cls
+        for entry in api_ir.controllers:
+            model.apis_by_file[BACKEND_ROOT / entry.file] = (list(entry.apis), list(entry.skipped))
+        model.source_fingerprint = api_ir.source_fingerprint
+        return model
+
+
+def _collect_dto_files(source: Optional[FileSystemSource] = None) -> List[Path]:
+    """DTO ファイル（source を指定するとそこから探す。既定は作業ツリー）"""
+    files: List[Path] = []
+    for dir_path in DTO_DIRS:
+        if source is None and not dir_path.exists():
+            print(f"⚠️  Directory not found: {dir_path}")
+            continue
+        files.extend((source or FileSystemSource()).glob(dir_path, "*.cs"))
+    return files
+
+
+def _collect_controller_files(source: Optional[FileSystemSource] = None) -> List[Path]:
+    if source is None and not CONTROLLER_DIR.exists():
+        return []
+    return (source or FileSystemSource()).glob(CONTROLLER_DIR, "*Controller.cs")
+
+
+class RenderState:
+    """
+    再生成をまたいで保持するレンダリング結果（--watch で使い回す）
+
+    signatures は出力ファイル → 前回レンダリングしたときの入力シグネチャ（一致すればファイルごとスキップ）。
+    fragments はテンプレート名 → クラス / エンドポイント単位の出力断片で、変更の影響を受けないものは再利用する。
+    通常の1回だけの生成では使わない（_generate に None を渡す）。
+    """
+
+    def __init__(self):
+        self.signatures: Dict[Path, str] = {}
+        self.fragments: Dict[str, Dict[str, List[str]]] = {}
+        self._class_signatures: Optional[Dict[str, str]] = None
+        self._endpoint_signatures: Dict[str, str] = {}
+        self._value_object_signature: Optional[str] = None
+
+    def dirty_keys(self, resolved: ResolvedModel, value_object_types: Dict[str, str]) -> Optional[Set[str]]:
+        """
+        前回から変わったクラス・エンドポイントと、それらに推移的に依存するもののキーを返す（初回は None = すべて）
+
+        例: KifuDto が変わると ArticleDto → GetArticlesResponse などの参照元クラスと、
+        それらを Request / Response に使うエンドポイントが対象になる。
+        ValueObject 型（UserId → string など）が変わった場合はどの断片の TS 型も変わりうるので、
+        断片をすべて捨てて None を返す。
+        """
+        class_signatures = {cls.name: repr(cls) for cls in resolved.classes}
+        endpoint_signatures = {endpoint_key(ep): repr(ep) for ep in resolved.endpoints}
+        value_object_signature = repr(sorted(value_object_types.items()))
+        previous_classes, previous_endpoints = self._class_signatures, self._endpoint_signatures
+        previous_value_objects = self._value_object_signature
+        self._class_signatures, self._endpoint_signatures = class_signatures, endpoint_signatures
+        self._value_object_signature = value_object_signature
+        if previous_classes is None:
+            return None
+        if value_object_signature != previous_value_objects:
+            self.fragments.clear()
+            return None
+
+        changed = {
+            name for name in class_signatures.keys() | previous_classes.keys()
+            if class_signatures.get(name) != previous_classes.get(name)
+        }
+        types = resolved.index.dependents(changed)
+        endpoints = {
+            endpoint_key(ep) for ep in resolved.endpoints
+            if endpoint_signatures[endpoint_key(ep)] != previous_endpoints.get(endpoint_key(ep))
+            or ep.request_type in types or ep.response_type in types
+        }
+        return types | endpoints
+
+
+def _output_name(file_path: Path) -> str:
+    """表示用の出力ファイル名（フロントエンドの出力は FRONTEND_API_DIR からの相対パス）"""
+    if file_path.is_relative_to(FRONTEND_API_DIR):
+        return file_path.relative_to(FRONTEND_API_DIR).as_posix()
+    return file_path.as_posix()
+
+
+class OutputPlan:
+    """1つの出力ファイルと、その入力シグネチャ・レンダリング関数（行を順に返す）"""
+
+    def __init__(self, file_path: Path, template: str, signature: str, render: Callable[[], Iterable[str]]):
+        self.file_path = file_path
+        self.template = template
+        self.signature = signature
+        self.render = render
+        # ヘッダーに埋め込むフィンガープリント（_generate / --check で設定する）
+        self.fingerprint = ""
+
+
+def _plan_outputs(
+    value_object_types: Dict[str, str],
+    resolved: ResolvedModel,
+    options: OutputOptions = OutputOptions(),
+    state: Optional[RenderState] = None,
+    dirty: Optional[Set[str]] = None,
+) -> Tuple[List[OutputPlan], List[str]]:
+    """
+    options.backends で選んだ出力ファイルの一覧を組み立てる
+
+    state を渡すと、各テンプレートは dirty（RenderState.dirty_keys）に含まれない
+    クラス・エンドポイントの出力断片を前回のものから再利用する。
+
+    signature には各出力が依存する入力だけを含める。
+    --watch では前回と同じ signature の出力はレンダリング自体を省略する
+    （例: DTO のみの変更では hooks.ts は再生成しない）。
+
+    Returns:
+        tuple: (出力プラン, スキップ理由メッセージ)
+    """
+    classes, class_map, endpoints, apis, index = resolved
+    backends = options.backends
+    plans: List[OutputPlan] = []
+    notes: List[str] = []
+    vo_sig = repr(sorted(value_object_types.items()))
+    get_endpoints = [ep for ep in endpoints if ep.method == "GET"]
+
+    def reuse_fragments(template) -> None:
+        if state is not None:
+            template.use_fragments(state.fragments.setdefault(type(template).__name__, {}), dirty)
+
+    def request_classes(eps: List[EndpointInfo]) -> str:
+        names = sorted({ep.request_type for ep in eps if ep.request_type in class_map})
+        return repr([class_map[name] for name in names])
+
+    # types.ts（クラスがある場合のみ）
+    if "types" in backends:
+        if classes:
+            types_template = TypesTemplate(value_object_types, index)
+            reuse_fragments(types_template)
+            plans.append(OutputPlan(
+                FRONTEND_API_DIR / "types.ts",
+                "TypesTemplate",
+                vo_sig + repr(sorted(classes, key=lambda c: c.name)),
+                lambda: types_template.render(classes=classes),
+            ))
+        else:
+            notes.append("↷  Skip types.ts (no classes found)")
+
+    # DTO ごとの JSON シリアライズのベンチマーク（api_generator/benchmarks、BenchmarkDotNet）
+    if "benchmarks" in backends:
+        if classes:
+            from api_generator.benchmarks.generator import BenchmarkGenerator
+            benchmark_generator = BenchmarkGenerator(value_object_types, class_map, index)
+            class_sig = vo_sig + repr(sorted(classes, key=lambda c: c.name))
+            samples_file, benchmarks_file = BENCHMARK_FILES
+            plans.append(OutputPlan(
+                samples_file, "BenchmarkGenerator.samples", class_sig,
+                lambda: benchmark_generator.render_samples(classes),
+            ))
+            plans.append(OutputPlan(
+                benchmarks_file, "BenchmarkGenerator.benchmarks", class_sig,
+                lambda: benchmark_generator.render_benchmarks(classes),
+            ))
+        else:
+            notes.append("↷  Skip benchmarks (no classes found)")
+
+    # endpoints.ts / hooks.ts / server.ts / endpoints.axios.ts / endpoints.fetch.ts（エンドポイントがある場合のみ）
+    if not endpoints:
+        notes.append("↷  Skip endpoints.ts/hooks.ts/server.ts (no endpoints found)")
+        return plans, notes
+
+    # hooks.ts の onSuccess と server.ts の revalidateMutation は同じ推測を使う
+    invalidations = InvalidationMap(endpoints, index)
+    if options.layout == "modules":
+        plans.extend(_plan_module_outputs(value_object_types, resolved, backends, vo_sig, request_classes, reuse_fragments, invalidations))
+        if not ("endpoints" in backends and "hooks" in backends):
+            notes.append("↷  Skip <controller>/index.ts and modules.ts (need both the endpoints and hooks backends)")
+    else:
+        if "endpoints" in backends:
+            endpoints_template = EndpointsTemplate(value_object_types, class_map, index)
+            reuse_fragments(endpoints_template)
+            plans.append(OutputPlan(
+                FRONTEND_API_DIR / "endpoints.ts",
+                "EndpointsTemplate",
+                vo_sig + repr(endpoints) + request_classes(endpoints),
+                lambda: endpoints_template.render(endpoints=endpoints),
+            ))
+        if "hooks" in backends:
+            hooks_template = HooksTemplate(value_object_types, index, invalidations)
+            plans.append(OutputPlan(
+                FRONTEND_API_DIR / "hooks.ts",
+                "HooksTemplate",
+                vo_sig + repr(endpoints) + invalidations.signature(endpoints),
+                lambda: hooks_template.render(endpoints=endpoints),
+            ))
+    # server.ts を生成 (GETエンドポイントのみ)
+    if "server" in backends:
+        if get_endpoints:
+            server_template = ServerTemplate(value_object_types, class_map, index, invalidations)
+            reuse_fragments(server_template)
+            plans.append(OutputPlan(
+                FRONTEND_API_DIR / "server.ts",
+                "ServerTemplate",
+                vo_sig + repr(endpoints) + request_classes(get_endpoints) + invalidations.signature(endpoints),
+                lambda: server_template.render(endpoints=endpoints),
+            ))
+        else:
+            notes.append("↷  Skip server.ts (no GET endpoints found)")
+    # HttpApi モデルから Axios クライアントを生成（api_generator/client/axios）
+    if "axios" in backends:
+        from api_generator.client.axios.generator import AxiosGenerator
+        axios_generator = AxiosGenerator(value_object_types, class_map, index)
+        plans.append(OutputPlan(
+            FRONTEND_API_DIR / "endpoints.axios.ts",
+            "AxiosGenerator",
+            vo_sig + repr(apis) + repr(sorted(classes, key=lambda c: c.name)),
+            lambda: axios_generator.render(apis),
+        ))
+    # axios を使わない fetch 版のクライアント（api_generator/client/fetch）
+    if "fetch" in backends:
+        from api_generator.client.fetch.generator import FetchGenerator
+        fetch_generator = FetchGenerator(value_object_types, class_map, index)
+        plans.append(OutputPlan(
+            FRONTEND_API_DIR / "endpoints.fetch.ts",
+            "FetchGenerator",
+            vo_sig + repr(apis) + repr(sorted(classes, key=lambda c: c.name)),
+            lambda: fetch_generator.render(apis),
+        ))
+    # バッチジョブ用の asyncio クライアント（api_generator/client/python）
+    if "python" in backends:
+        from api_generator.client.python.generator import PythonClientGenerator
+        python_generator = PythonClientGenerator(value_object_types, class_map, index)
+        plans.append(OutputPlan(
+            PYTHON_CLIENT_FILE,
+            "PythonClientGenerator",
+            vo_sig + repr(apis) + repr(sorted(classes, key=lambda c: c.name)),
+            lambda: python_generator.render(apis, classes),
+        ))
+
+    return plans, notes
+
+
+def _plan_module_outputs(
+    value_object_types: Dict[str, str],
+    resolved: ResolvedModel,
+    backends: Sequence[str],
+    vo_sig: str,
+    request_classes: Callable[[List[EndpointInfo]], str],
+    reuse_fragments: Callable[[object], None],
+    invalidations: InvalidationMap,
+) -> List[OutputPlan]:
+    """
+    --layout modules: <controller>/endpoints.ts・hooks.ts・index.ts と modules.ts の出力プラン
+
+    無効化するクエリは他のコントローラーの DTO にもよるので、invalidations はすべてのエンドポイントから作ったものを渡す。
+    """
+    plans: List[OutputPlan] = []
+    endpoints_template = EndpointsTemplate(value_object_types, resolved.class_map, resolved.index)
+    reuse_fragments(endpoints_template)
+    hooks_template = HooksTemplate(value_object_types, resolved.index, invalidations)
+    barrel_template = BarrelTemplate(value_object_types)
+    by_controller = sorted(endpoints_template._group_by_controller(resolved.endpoints).items())
+
+    for controller, eps in by_controller:
+        module_dir = FRONTEND_API_DIR / controller
+        if "endpoints" in backends:
+            plans.append(OutputPlan(
+                module_dir / "endpoints.ts",
+                "EndpointsTemplate",
+                vo_sig + repr(eps) + request_classes(eps),
+                lambda controller=controller, eps=eps: endpoints_template.render_module(controller, eps),
+            ))
+        if "hooks" in backends:
+            plans.append(OutputPlan(
+                module_dir / "hooks.ts",
+                "HooksTemplate",
+                vo_sig + repr(eps) + invalidations.signature(eps),
+                lambda controller=controller, eps=eps: hooks_template.render_module(controller, eps),
+            ))
+        if "endpoints" in backends and "hooks" in backends:
+            plans.append(OutputPlan(
+                module_dir / "index.ts",
+                "BarrelTemplate",
+                controller,
+                lambda controller=controller: barrel_template.render_controller(controller),
+            ))
+
+    if "endpoints" in backends and "hooks" in backends:
+        controllers = [controller for controller, _ in by_controller]
+        # modules.ts は export * で束ねるため、コントローラー間で同名の関数があると曖昧になる
+        names = [ep.function_name for _, eps in by_controller for ep in eps]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            print(f"\n⚠️  Functions defined in more than one controller (ambiguous in modules.ts): {', '.join(duplicates)}")
+        plans.append(OutputPlan(
+            FRONTEND_API_DIR / "modules.ts",
+            "BarrelTemplate",
+            repr(controllers),
+            lambda: barrel_template.render(controllers),
+        ))
+    return plans
+
+
+def _print_module_sizes(plans: List[OutputPlan]) -> None:
+    """--layout modules で生成したモジュールごとのバイト数を表示する"""
+    sizes = [
+        (plan.file_path.relative_to(FRONTEND_API_DIR).as_posix(), plan.file_path.stat().st_size)
+        for plan in plans
+        if plan.template in ("EndpointsTemplate", "HooksTemplate", "BarrelTemplate") and plan.file_path.exists()
+    ]
+    if not sizes:
+        return
+    width = max(len(name) for name, _ in sizes)
+    print("\n📦 Module sizes:")
+    for name, size in sorted(sizes):
+        print(f"   {name:<{width}} {size:>8,} B")
+    print(f"   {'total':<{width}} {sum(size for _, size in sizes):>8,} B")
+
+
+def _render_plan(plan: OutputPlan, profiler: PhaseProfiler) -> Tuple[StagedFile, float]:
+    """1つの出力を一時ファイルにレンダリングする（スレッドプールで実行）"""
+    start = time.perf_counter()
+    with profiler.worker_profile(f"render:{plan.template}"):
+        plan.file_path.parent.mkdir(parents=True, exist_ok=True)
+        staged = stage_lines(plan.file_path, stamp_fingerprint(plan.render(), plan.fingerprint))
+    return staged, time.perf_counter() - start
+
+
+def _generate(
+    model: ApiModel,
+    value_object_types: Dict[str, str],
+    state: Optional[RenderState],
+    profiler: PhaseProfiler,
+    options: OutputOptions = OutputOptions(),
+    refresh_fingerprints: bool = False,
+) -> Optional[List[Path]]:
+    """
+    モデルから TypeScript ファイルを生成し、内容が変わったファイルを返す
+
+    各バックエンドはスレッドプールで同時に一時ファイルへレンダリングし、全部が成功してから
+    まとめて出力先を置き換える（どれかが失敗した場合は何も書き換えない）。
+    state（--watch のみ）には前回のレンダリング結果を保持する。入力シグネチャが前回と同じ出力はスキップし、
+    変更の影響を受けないクラス・エンドポイントの出力断片は再利用する。
+    各ファイルのヘッダーには、C# ソースとその出力のレンダラーのフィンガープリント（--check 用）を埋め込む。
+    フィンガープリントの行しか変わらないファイルは書き換えない（コメントだけの変更などで全出力の mtime を変えない）。
+    refresh_fingerprints（--force）なら、その場合もヘッダーを更新する。
+    何も検出できない場合は None を返す。
+    """
+    with profiler.phase("resolve", files=len(model.classes_by_file) + len(model.apis_by_file)):
+        resolved = model.resolve(value_object_types)
+
+    # 何も検出できない場合は上書きを避ける（空ファイル化の防止）
+    if len(resolved.classes) == 0 and len(resolved.endpoints) == 0:
+        print("\n❌ No DTO classes or endpoints detected. Aborting to avoid overwriting with empty content.")
+        return None
+
+    # 出力ディレクトリを作成
+    FRONTEND_API_DIR.mkdir(parents=True, exist_ok=True)
+
+    dirty = state.dirty_keys(resolved, value_object_types) if state is not None else None
+    if dirty is not None:
+        dirty_types = sorted(name for name in dirty if name in resolved.class_map)
+        print(f"\n🔗 Affected: {len(dirty_types)} types, {len(dirty) - len(dirty_types)} endpoints"
+              + (f" ({', '.join(dirty_types)})" if dirty_types else ""))
+
+    all_plans, notes = _plan_outputs(value_object_types, resolved, options, state, dirty)
+    for plan in all_plans:
+        plan.fingerprint = _output_fingerprint(model.source_fingerprint, options, plan.template)
+        plan.signature = plan.fingerprint + plan.signature
+    plans = [plan for plan in all_plans if state is None or state.signatures.get(plan.file_path) != plan.signature]
+    changed_files: List[Path] = []
+
+    # concurrent.futures は logging などを読み込むため、実際に生成するときだけ import する
+    from concurrent.futures import ThreadPoolExecutor
+
+    staged: List[StagedFile] = []
+    with profiler.phase("render_backends", files=len(plans)):
+        with ThreadPoolExecutor(max_workers=max(1, len(plans))) as pool:
+            futures = [pool.submit(_render_plan, plan, profiler) for plan in plans]
+            try:
+                for plan, future in zip(plans, futures):
+                    staged_file, seconds = future.result()
+                    staged.append(staged_file)
+                    # スレッドごとの時間（render_backends の時間は最も遅いバックエンドで決まる）
+                    profiler.add_record(
+                        f"render:{plan.template}", seconds, files=1,
+                        template=plan.template, output=_output_name(plan.file_path),
+                    )
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                for future in futures:
+                    if not future.cancelled() and future.exception() is None:
+                        future.result()[0].discard()
+                raise
+
+    with profiler.phase("commit_outputs", files=len(staged)):
+        for plan, staged_file in zip(plans, staged):
+            print(f"\n✏️  Generating {_output_name(plan.file_path)}...")
+            if staged_file.commit(ignore=None if refresh_fingerprints else is_fingerprint_line):
+                changed_files.append(plan.file_path)
+                print(f"  ✓ {plan.file_path}")
+            else:
+                print(f"  = {plan.file_path} (unchanged)")
+            if state is not None:
+                state.signatures[plan.file_path] = plan.signature
+
+    if options.layout == "modules":
+        _print_module_sizes(all_plans)
+
+    for note in notes:
+        print(f"\n{note}")
+
+    return changed_files
+
+
+def _watch(
+    model: ApiModel,
+    value_object_types: Dict[str, str],
+    state: RenderState,
+    debounce: float,
+    profiler: PhaseProfiler,
+    options: OutputOptions = OutputOptions(),
+) -> None:
+    """ソースの変更を監視し、変更されたファイルだけ再パースして再生成する"""
+    from helpers import FileWatcher
+
+    watcher = FileWatcher(
+        [CONTROLLER_DIR, BACKEND_ROOT / "Application/Dto", VALUE_OBJECT_FILE.parent],
+        debounce=debounce,
+    )
+    print(f"\n👀 Watching for changes ({watcher.backend})... Press Ctrl+C to stop.")
+
+    try:
+        while True:
+            changed = watcher.wait_for_changes()
+            model.parse_cache.hits = model.parse_cache.misses = 0
+            print(f"\n🔄 {len(changed)} file(s) changed: {', '.join(sorted(p.name for p in changed))}")
+
+            if VALUE_OBJECT_FILE in changed:
+                with profiler.phase("load_value_object_types", files=1):
+                    value_object_types = load_value_object_types(VALUE_OBJECT_FILE)
+
+            dto_files = [p for p in changed if _is_dto_file(p)]
+            controller_files = {p for p in changed if _is_controller_file(p)}
 
+            if dto_files:
+                known_types = (model.request_types, model.response_types)
+                with profiler.phase("parse_dtos", files=len(dto_files)):
+                    model.update_classes(dto_files)
+                # Request/Response 型の集合が変わるとエンドポイントの推測結果も変わるため全コントローラーを再パース
+                if (model.request_types, model.response_types) != known_types:
+                    controller_files |= set(model.apis_by_file)
+
+            if controller_files:
+                with profiler.phase("parse_controllers", files=len(controller_files)):
+                    model.update_controllers(sorted(controller_files))
+
+            with profiler.phase("fingerprint_sources"):
+                model.source_fingerprint = _source_fingerprint()
+
+            with profiler.phase("save_parse_cache"):
+                model.parse_cache.save()
+            changed_files = _generate(model, value_object_types, state, profiler, options)
+            if changed_files is not None:
+                names = ", ".join(f.name for f in changed_files) or "none"
+                print(f"\n✅ Regenerated (changed: {names}; parse cache: {model.parse_cache.hits} hits, {model.parse_cache.misses} misses)")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["diff"]:
+        from api_generator.protocols import cli as diff_cli
+        return diff_cli.main(argv[1:], _resolve_source, BACKEND_ROOT)
+    if argv[:1] and argv[0] in SUBCOMMANDS:
+        # サブコマンドは使うときだけ import する
+        import importlib
+        command = argv[0]
+        cli = importlib.import_module(f"api_generator.{command}.cli")
+        return cli.main(argv[1:], functools.partial(_load_resolved, command=command))
 
-def main():
     # コマンドライン引数をパース
     parser = argparse.ArgumentParser(
-        description='Generate TypeScript API definitions from C# backend code'
+        description='Generate TypeScript API definitions from C# backend code',
+        epilog='Run "%(prog)s diff REV_A [REV_B]" to compare the API models of two git revisions, '
+               '"%(prog)s loadtest --help" to load-test a running backend, '
+               '"%(prog)s mock --help" to serve a mock backend, '
+               '"%(prog)s waterfalls --help" to find request waterfalls in the frontend, '
+               'or "%(prog)s invalidations --help" to list the queries each mutation hook invalidates.',
     )
     parser.add_argument(
         '--force', '-f',
         action='store_true',
-        help='Force regeneration of all files'
+        help='Force regeneration of all files (ignore the parse cache and refresh fingerprint-only header changes)'
     )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
         help='Show detailed parsing information'
     )
-    args = parser.parse_args()
-    
+    parser.add_argument(
+        '--watch', '-w',
+        action='store_true',
+        help='Keep running and regenerate incrementally when Controller/DTO files change'
+    )
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=0.3,
+        help='Seconds to wait for further changes before regenerating in watch mode (default: 0.3)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Number of worker processes for parsing (0 = number of CPUs, default: 1)'
+    )
+    parser.add_argument(
+        '--backends',
+        default=",".join(DEFAULT_BACKENDS),
+        metavar='NAMES',
+        help=f'Comma-separated output backends to run ({", ".join(BACKENDS)}; default: {",".join(DEFAULT_BACKENDS)})'
+    )
+    parser.add_argument(
+        '--layout',
+        choices=LAYOUTS,
+        default="monolithic",
+        help='monolithic: endpoints.ts/hooks.ts; modules: <controller>/endpoints.ts, <controller>/hooks.ts and a modules.ts barrel with individually exported functions (tree-shakeable)'
+    )
+    parser.add_argument(
+        '--emit-ir',
+        type=Path,
+        metavar='FILE',
+        help='Also write the parsed model to FILE (JSON if it ends in .json, compact binary otherwise)'
+    )
+    parser.add_argument(
+        '--from-ir',
+        type=Path,
+        metavar='FILE',
+        help='Generate from a model written by --emit-ir instead of parsing nari-note-backend'
+    )
+    parser.add_argument(
+        '--rev',
+        metavar='REV',
+        help='Read the C# sources from a git revision (branch, tag or commit) instead of the working tree, without a checkout'
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Do not write anything; compare the fingerprint embedded in each generated file with the current sources and that file\'s renderer, and if it differs render in memory and exit 1 when the output itself differs (showing the diff)'
+    )
+    parser.add_argument(
+        '--no-diff',
+        action='store_true',
+        help='With --check: exit as soon as the fingerprints mismatch, without rendering the diff'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        type=Path,
+        const=PROFILE_FILE,
+        metavar='FILE',
+        help=f'Write a JSON report of wall time, file counts and peak memory per phase/template (default: {PROFILE_FILE}; peak memory is null for templates rendered in worker threads)'
+    )
+    parser.add_argument(
+        '--profile-cprofile',
+        type=Path,
+        metavar='FILE',
+        help='Also run cProfile on every phase (and on each template in its worker thread) and dump the stats of the slowest one to FILE (implies --profile)'
+    )
+    args = parser.parse_args(argv)
+    if args.from_ir and args.watch:
+        parser.error("--watch cannot be combined with --from-ir")
+    if args.rev and (args.watch or args.from_ir):
+        parser.error("--rev cannot be combined with --watch or --from-ir")
+    if args.check and (args.watch or args.emit_ir):
+        parser.error("--check cannot be combined with --watch or --emit-ir")
+    if args.no_diff and not args.check:
+        parser.error("--no-diff requires --check")
+    args.backends = [name.strip() for name in args.backends.split(",") if name.strip()]
+    unknown = [name for name in args.backends if name not in BACKENDS]
+    if unknown or not args.backends:
+        parser.error(f"--backends: unknown backend(s) {', '.join(unknown) or '(none)'}; choose from {', '.join(BACKENDS)}")
+    if args.profile_cprofile and not args.profile:
+        args.profile = PROFILE_FILE
+    profiler = PhaseProfiler("api-generator", enabled=bool(args.profile), cprofile=bool(args.profile_cprofile))
+
+    try:
+        if args.check:
+            return _check(args, profiler)
+        _run(args, profiler)
+        return 0
+    finally:
+        if args.profile:
+            profiler.write(args.profile, args.profile_cprofile)
+            print(f"\n⏱️  Profile (slowest first):")
+            for line in profiler.summary_lines():
+                print(line)
+            print(f"   report: {args.profile}")
+            if args.profile_cprofile:
+                print(f"   cProfile of slowest phase: {args.profile_cprofile}")
+
+
+def _run(args: argparse.Namespace, profiler: PhaseProfiler) -> None:
+    """パース → 生成（→ --watch）を実行する。各フェーズは profiler で計測する"""
     print("🚀 API Generator - Starting...")
     if args.force:
         print("⚡ Force mode enabled - will regenerate all files")
-    
-    # ディレクトリの存在確認
-    if not BACKEND_ROOT.exists():
-        print(f"❌ Backend directory not found: {BACKEND_ROOT}")
-        return
-    
-    # ValueObject型を読み込み
-    print("\n📦 Loading ValueObject types...")
-    value_object_types = load_value_object_types(VALUE_OBJECT_FILE)
-    
-    # Request/Response/DTOクラスをパース
-    print("\n📖 Parsing Request/Response/DTO classes...")
-    classes: List[CSharpClass] = []
-    all_request_types: set = set()
-    all_response_types: set = set()
-    
-    for dir_path in [REQUEST_DIR, RESPONSE_DIR, DTO_DIR]:
-        if not dir_path.exists():
-            print(f"⚠️  Directory not found: {dir_path}")
-            continue
-        
-        for file_path in dir_path.glob("*.cs"):
-            cls = parse_csharp_class(file_path)
-            if cls:
-                classes.append(cls)
-                print(f"  ✓ {cls.name}")
-                # Request/Response型を収集
-                if cls.name.endswith("Request"):
-                    all_request_types.add(cls.name)
-                elif cls.name.endswith("Response"):
-                    all_response_types.add(cls.name)
-    
-    print(f"\n📊 Found {len(all_request_types)} Request types, {len(all_response_types)} Response types")
-    
-    # コントローラーをパース
-    print("\n📖 Parsing Controllers...")
-    all_endpoints: List[EndpointInfo] = []
-    all_skipped: Dict[str, List[str]] = {}
-    
-    if CONTROLLER_DIR.exists():
-        for file_path in CONTROLLER_DIR.glob("*Controller.cs"):
-            endpoints, skipped = parse_controller(file_path, all_request_types, all_response_types)
-            all_endpoints.extend(endpoints)
-            if skipped:
-                all_skipped[file_path.name] = skipped
-            if endpoints:
-                print(f"  ✓ {file_path.name}: {len(endpoints)} endpoints")
-            if args.verbose and skipped:
-                print(f"    ⚠️  Skipped {len(skipped)} methods (missing response types)")
-    
-    # 出力ディレクトリを作成
-    FRONTEND_API_DIR.mkdir(parents=True, exist_ok=True)
 
-    # 出力先
-    types_file = FRONTEND_API_DIR / "types.ts"
-    endpoints_file = FRONTEND_API_DIR / "endpoints.ts"
-    hooks_file = FRONTEND_API_DIR / "hooks.ts"
-    server_file = FRONTEND_API_DIR / "server.ts"
+    # パース結果キャッシュ（--force の場合は読み込まずに作り直す）
+    with profiler.phase("load_parse_cache"):
+        parse_cache = ParseCache(PARSE_CACHE_FILE, enabled=not args.force and not args.from_ir and not args.rev)
 
-    # 何も検出できない場合は上書きを避ける（空ファイル化の防止）
-    if len(classes) == 0 and len(all_endpoints) == 0:
-        print("\n❌ No DTO classes or endpoints detected. Aborting to avoid overwriting with empty content.")
+    loaded = _load_model(args, parse_cache, profiler)
+    if loaded is None:
         return
+    model, value_object_types = loaded
 
-    # テンプレートインスタンスを作成
-    class_map = {cls.name: cls for cls in classes}
-
-    # パスパラメータに対応する Request フィールドを optional に設定
-    # （例: PUT /api/courses/{id} の UpdateCourseRequest.id → id?: number）
-    _mark_path_param_fields_optional(all_endpoints, class_map)
+    if args.emit_ir:
+        with profiler.phase("emit_ir", files=1) as record:
+            from api_generator.protocols import ir
+            data = ir.dumps(model.to_ir(value_object_types), binary=ir.is_binary_path(args.emit_ir))
+            record["bytes"] = len(data)
+            args.emit_ir.parent.mkdir(parents=True, exist_ok=True)
+            write_if_changed(args.emit_ir, data)
+        print(f"\n💾 Wrote API model IR ({len(data):,} bytes): {args.emit_ir}")
 
-    # プロパティのない空の Request 型は void 扱いにする（data 引数不要なエンドポイント）
-    for ep in all_endpoints:
-        if ep.request_type and ep.request_type in class_map:
-            if not class_map[ep.request_type].properties:
-                ep.request_type = None
-
-    types_template = TypesTemplate(value_object_types)
-    endpoints_template = EndpointsTemplate(value_object_types, class_map)
-    hooks_template = HooksTemplate(value_object_types)
-    server_template = ServerTemplate(value_object_types, class_map)
-
-    # types.ts を生成（クラスがある場合のみ）
-    if len(classes) > 0:
-        print("\n✏️  Generating types.ts (overwrite)...")
-        types_content = types_template.generate(classes=classes)
-        types_file.write_text(types_content, encoding='utf-8')
-        print(f"  ✓ {types_file}")
-    else:
-        print("\n↷  Skip types.ts (no classes found)")
-
-    # endpoints.ts を生成（エンドポイントがある場合のみ）
-    if len(all_endpoints) > 0:
-        print("\n✏️  Generating endpoints.ts (overwrite)...")
-        endpoints_content = endpoints_template.generate(endpoints=all_endpoints)
-        endpoints_file.write_text(endpoints_content, encoding='utf-8')
-        print(f"  ✓ {endpoints_file}")
-
-        # hooks.ts を生成
-        print("\n✏️  Generating hooks.ts (overwrite)...")
-        hooks_content = hooks_template.generate(endpoints=all_endpoints)
-        hooks_file.write_text(hooks_content, encoding='utf-8')
-        print(f"  ✓ {hooks_file}")
-
-        # server.ts を生成 (GETエンドポイントのみ)
-        get_endpoints = [ep for ep in all_endpoints if ep.method == "GET"]
-        if get_endpoints:
-            print("\n✏️  Generating server.ts (overwrite)...")
-            server_content = server_template.generate(endpoints=all_endpoints)
-            server_file.write_text(server_content, encoding='utf-8')
-            print(f"  ✓ {server_file}")
-            print(f"     ({len(get_endpoints)} GET endpoints)")
-        else:
-            print("\n↷  Skip server.ts (no GET endpoints found)")
-    else:
-        print("\n↷  Skip endpoints.ts/hooks.ts/server.ts (no endpoints found)")
+    # 前回の結果を使い回すのは --watch の再生成だけ
+    state = RenderState() if args.watch else None
+    options = OutputOptions(args.backends, args.layout)
+    changed_files = _generate(model, value_object_types, state, profiler, options, refresh_fingerprints=args.force)
+    if changed_files is None:
+        return
 
+    all_endpoints = model.endpoints
     print("\n✅ API generation completed!")
     print(f"\n📊 Summary:")
-    print(f"   - {len(classes)} types generated")
+    print(f"   - {len(model.classes)} types generated")
     print(f"   - {len(all_endpoints)} endpoints found")
     get_endpoints = [ep for ep in all_endpoints if ep.method == "GET"]
     if get_endpoints:
         print(f"   - {len(get_endpoints)} server-side fetch functions generated")
-    
+    if args.from_ir:
+        print(f"   - model loaded from {args.from_ir}")
+    elif args.rev:
+        print(f"   - sources read from git revision {args.rev}")
+    else:
+        print(f"   - parse cache: {parse_cache.hits} hits, {parse_cache.misses} misses")
+    if changed_files:
+        print(f"   - {len(changed_files)} files changed: {', '.join(f.name for f in changed_files)}")
+    else:
+        print("   - no files changed")
+
     # スキップされたメソッドを報告
+    all_skipped = model.skipped
     if all_skipped:
         print(f"\n⚠️  Skipped methods (missing response type definitions):")
         for controller, methods in sorted(all_skipped.items()):
@@ -218,6 +938,312 @@ def main():
                 print(f"     - {method}")
         print("\n💡 Tip: Add explicit ActionResult<TResponse> types or create Response DTOs")
 
+    if args.watch:
+        _watch(model, value_object_types, state, args.debounce, profiler, options)
+
+
+def _expected_outputs(options: OutputOptions) -> Dict[Path, str]:
+    """
+    --check で確認する生成ファイル → それをレンダリングするテンプレート（パースせずに分かるもの）
+
+    modules レイアウトのコントローラー別ファイルは、既に生成されているディレクトリから探す。
+    """
+    backends = options.backends
+    single_files = [
+        ("types", "types.ts", "TypesTemplate"), ("server", "server.ts", "ServerTemplate"),
+        ("axios", "endpoints.axios.ts", "AxiosGenerator"), ("fetch", "endpoints.fetch.ts", "FetchGenerator"),
+    ]
+    outputs = {FRONTEND_API_DIR / name: template for backend, name, template in single_files if backend in backends}
+    if "python" in backends:
+        outputs[PYTHON_CLIENT_FILE] = "PythonClientGenerator"
+    if "benchmarks" in backends:
+        outputs.update((path, "BenchmarkGenerator") for path in BENCHMARK_FILES)
+    templates = {"endpoints": "EndpointsTemplate", "hooks": "HooksTemplate"}
+    if options.layout == "modules":
+        patterns = [(f"*/{backend}.ts", templates[backend]) for backend in ("endpoints", "hooks") if backend in backends]
+        if "endpoints" in backends and "hooks" in backends:
+            patterns.append(("*/index.ts", "BarrelTemplate"))
+            outputs[FRONTEND_API_DIR / "modules.ts"] = "BarrelTemplate"
+        for pattern, template in patterns:
+            outputs.update((path, template) for path in FRONTEND_API_DIR.glob(pattern))
+    else:
+        outputs.update((FRONTEND_API_DIR / f"{backend}.ts", templates[backend]) for backend in ("endpoints", "hooks") if backend in backends)
+    return dict(sorted(outputs.items()))
+
+
+def _check(args: argparse.Namespace, profiler: PhaseProfiler) -> int:
+    """
+    --check: 生成ファイルのヘッダーのフィンガープリントが今の入力と一致するか確認する
+
+    ソースの内容ハッシュと各ファイルの先頭数行を読むだけで判定する（パース・レンダリングはしない）。
+    一致しないファイルがあるときだけ、メモリ上でレンダリングして差分を表示する（--no-diff なら省略）。
+    レンダリングした結果がフィンガープリントの行以外同じなら最新として扱う（C# のコメントだけの変更など）。
+
+    Returns:
+        int: 終了コード（0: 最新, 1: 古い, 2: 入力が見つからない）
+    """
+    options = OutputOptions(args.backends, args.layout)
+    with profiler.phase("fingerprint_sources") as record:
+        if args.from_ir:
+            from api_generator.protocols import ir
+            try:
+                source_fingerprint = ir.load_ir(args.from_ir).source_fingerprint
+            except (OSError, ir.IRError) as e:
+                print(f"❌ Failed to load IR: {e}")
+                return 2
+            if source_fingerprint is None:
+                source_fingerprint = hash_files([args.from_ir.resolve()], args.from_ir.resolve().parent)
+        elif args.rev:
+            from helpers import GitSource, SourceError
+            try:
+                with GitSource(args.rev, [BACKEND_ROOT]) as source:
+                    files = _source_files(source)
+                    record["files"] = len(files)
+                    source_fingerprint = hash_files(files, BACKEND_ROOT, source)
+            except SourceError as e:
+                print(f"❌ {e}")
+                return 2
+        else:
+            if not BACKEND_ROOT.exists():
+                print(f"❌ Backend directory not found: {BACKEND_ROOT}")
+                return 2
+            files = _source_files()
+            record["files"] = len(files)
+            source_fingerprint = hash_files(files, BACKEND_ROOT)
+
+    with profiler.phase("read_fingerprints") as record:
+        outputs = _expected_outputs(options)
+        record["files"] = len(outputs)
+        expected = {path: _output_fingerprint(source_fingerprint, options, template) for path, template in outputs.items()}
+        embedded = {path: read_fingerprint(path) for path in outputs}
+    stale = [path for path in outputs if embedded[path] != expected[path]]
+
+    if not stale:
+        print(f"✅ {len(outputs)} generated files are up to date")
+        return 0
+
+    print(f"❌ {len(stale)} of {len(outputs)} generated files have a different fingerprint:")
+    for path in stale:
+        found = "missing" if not path.exists() else (embedded[path] or "no fingerprint")
+        print(f"   - {_output_name(path)} (expected {expected[path]}, found {found})")
+    if args.no_diff:
+        print("\n💡 Run scripts/api-generator.py to regenerate")
+        return 1
+
+    sys.stdout.flush()
+    with profiler.phase("render_diff"):
+        differs = _print_stale_diff(args, options, source_fingerprint, stale)
+    if differs is None:
+        return 2
+    if not differs:
+        # フィンガープリントの行だけの違いか、パースせずには分からない出力（GET がなく生成されない server.ts など）だけが原因
+        print("\n✅ Rendered output matches the generated files (regenerate with -f to refresh the fingerprints and skip rendering next time)")
+        return 0
+    print("\n💡 Run scripts/api-generator.py to regenerate")
+    return 1
+
+
+def _print_stale_diff(
+    args: argparse.Namespace,
+    options: OutputOptions,
+    source_fingerprint: Optional[str],
+    stale: List[Path],
+    max_lines: int = 200,
+) -> Optional[bool]:
+    """
+    モデルを読み込んでメモリ上でレンダリングし、既存の生成ファイルとの unified diff を表示する（何も書き込まない）
+
+    Returns:
+        フィンガープリントの行以外に差分があれば True（モデルを読み込めなければ None）
+    """
+    import contextlib
+    import difflib
+    import io
+
+    # パースの進捗表示は差分の邪魔になるので捨てる（--verbose なら表示する）
+    progress = io.StringIO()
+    with contextlib.redirect_stdout(sys.stdout if args.verbose else progress):
+        parse_cache = ParseCache(PARSE_CACHE_FILE, enabled=not args.force and not args.from_ir and not args.rev)
+        loaded = _load_model(args, parse_cache, PhaseProfiler("check"))
+    if loaded is None:
+        print(progress.getvalue().strip())
+        return None
+    model, value_object_types = loaded
+    plans, _ = _plan_outputs(value_object_types, model.resolve(value_object_types), options)
+
+    differs = False
+    planned = {plan.file_path for plan in plans}
+    for plan in plans:
+        name = _output_name(plan.file_path)
+        fingerprint = _output_fingerprint(source_fingerprint, options, plan.template)
+        expected = "\n".join(stamp_fingerprint(plan.render(), fingerprint)).splitlines()
+        try:
+            actual = plan.file_path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            actual = []
+        if actual == expected:
+            continue
+        diff = list(difflib.unified_diff(actual, expected, f"a/{name}", f"b/{name}", lineterm=""))
+        changed = [line for line in diff[2:] if line[:1] in "+-"]
+        if all(is_fingerprint_line(line[1:]) for line in changed):
+            print(f"\n📄 {name}: only the fingerprint differs (inputs changed without affecting the output)")
+            continue
+        differs = True
+        print(f"\n📄 {name}:")
+        for line in diff[:max_lines]:
+            print(line)
+        if len(diff) > max_lines:
+            print(f"... ({len(diff) - max_lines} more diff lines)")
+
+    for path in stale:
+        if path not in planned and path.exists():
+            differs = True
+            print(f"\n📄 {_output_name(path)}: no longer generated (delete it)")
+    return differs
+
+
+def _load_model(
+    args: argparse.Namespace,
+    parse_cache: ParseCache,
+    profiler: PhaseProfiler,
+) -> Optional[Tuple[ApiModel, Dict[str, str]]]:
+    """--from-ir / --rev / 作業ツリーのいずれかからモデルと ValueObject 型を読み込む"""
+    if args.from_ir:
+        return _load_model_from_ir(args.from_ir, parse_cache, profiler)
+    if args.rev:
+        return _load_model_from_revision(args.rev, profiler)
+    return _parse_backend(args, parse_cache, profiler)
+
+
+def _parse_source(source: FileSystemSource) -> Tuple[ApiModel, Dict[str, str]]:
+    """
+    source（GitSource など）の C# ソースをパースしてモデルと ValueObject 型を返す
+
+    パースキャッシュはファイルの mtime で検証する作業ツリー用なので使わない。
+    """
+    from api_generator.server.asp_dotnet.parser import AspDotnetParser
+
+    parser = AspDotnetParser(source)
+    value_object_types = parser.parse_value_objects(VALUE_OBJECT_FILE)
+    model = ApiModel(ParseCache(PARSE_CACHE_FILE, enabled=False))
+    dto_files = _collect_dto_files(source)
+    model.classes_by_file = dict(zip(dto_files, parser.parse_classes(dto_files)))
+    controller_files = _collect_controller_files(source)
+    results = parser.parse_controllers(controller_files, model.request_types, model.response_types)
+    model.apis_by_file = dict(zip(controller_files, results))
+    model.source_fingerprint = _source_fingerprint(source)
+    return model, value_object_types
+
+
+def _load_model_from_revision(rev: str, profiler: PhaseProfiler) -> Optional[Tuple[ApiModel, Dict[str, str]]]:
+    """--rev: git のリビジョンのソースをチェックアウトせずに読み込む"""
+    from helpers import GitSource, SourceError
+
+    print(f"\n📦 Reading sources from git revision: {rev}")
+    try:
+        with profiler.phase("parse_revision") as record, GitSource(rev, [BACKEND_ROOT]) as source:
+            model, value_object_types = _parse_source(source)
+            record["files"] = len(model.classes_by_file) + len(model.apis_by_file)
+    except SourceError as e:
+        print(f"❌ {e}")
+        return None
+    print(f"  ✓ {source.label}: {len(model.classes)} classes, {len(model.endpoints)} endpoints")
+    return model, value_object_types
+
+
+def _load_resolved(args: argparse.Namespace, command: str) -> Optional[Tuple[ResolvedModel, Dict[str, str]]]:
+    """
+    サブコマンド用: --from-ir / --rev / 作業ツリーからモデルを読み込み、後処理まで済ませる
+
+    パースの進捗表示はサブコマンドの出力の邪魔になるので捨てる（--verbose なら表示する）。
+    """
+    import contextlib
+    import io
+
+    args.jobs = 1
+    with contextlib.redirect_stdout(sys.stdout if args.verbose else io.StringIO()):
+        parse_cache = ParseCache(PARSE_CACHE_FILE, enabled=not args.from_ir and not args.rev)
+        loaded = _load_model(args, parse_cache, PhaseProfiler(command))
+    if loaded is None:
+        print("❌ Failed to load the API model (run with --verbose for details)")
+        return None
+    model, value_object_types = loaded
+    return model.resolve(value_object_types), value_object_types
+
+
+def _resolve_source(source: FileSystemSource) -> Tuple[ResolvedModel, Dict[str, str]]:
+    """diff 用: source のソースをパースして後処理まで済ませる"""
+    model, value_object_types = _parse_source(source)
+    return model.resolve(value_object_types), value_object_types
+
+
+def _load_model_from_ir(
+    ir_file: Path,
+    parse_cache: ParseCache,
+    profiler: PhaseProfiler,
+) -> Optional[Tuple[ApiModel, Dict[str, str]]]:
+    """--from-ir: 中間表現ファイルからモデルと ValueObject 型を読み込む"""
+    print(f"\n📦 Loading API model IR: {ir_file}")
+    with profiler.phase("load_ir", files=1):
+        from api_generator.protocols import ir
+        try:
+            api_ir = ir.load_ir(ir_file)
+        except (OSError, ir.IRError) as e:
+            print(f"❌ Failed to load IR: {e}")
+            return None
+        model = ApiModel.from_ir(api_ir, parse_cache)
+        if model.source_fingerprint is None:
+            # source_fingerprint のない古い IR は IR ファイル自体の内容で代用する
+            model.source_fingerprint = hash_files([ir_file.resolve()], ir_file.resolve().parent)
+    print(f"  ✓ {len(model.classes)} classes, {len(model.endpoints)} endpoints, {len(api_ir.value_object_types)} ValueObject types")
+    return model, api_ir.value_object_types
+
+
+def _parse_backend(
+    args: argparse.Namespace,
+    parse_cache: ParseCache,
+    profiler: PhaseProfiler,
+) -> Optional[Tuple[ApiModel, Dict[str, str]]]:
+    """nari-note-backend のソースをパースしてモデルと ValueObject 型を返す"""
+    # ディレクトリの存在確認
+    if not BACKEND_ROOT.exists():
+        print(f"❌ Backend directory not found: {BACKEND_ROOT}")
+        return None
+
+    # ValueObject型を読み込み
+    print("\n📦 Loading ValueObject types...")
+    with profiler.phase("load_value_object_types", files=1):
+        value_object_types = load_value_object_types(VALUE_OBJECT_FILE)
+
+    model = ApiModel(parse_cache, verbose=args.verbose, jobs=args.jobs)
+
+    # Request/Response/DTOクラスをパース
+    print("\n📖 Parsing Request/Response/DTO classes...")
+    with profiler.phase("parse_dtos") as record:
+        dto_files = _collect_dto_files()
+        record["files"] = len(dto_files)
+        model.update_classes(dto_files)
+        record["cache_hits"] = parse_cache.hits
+
+    print(f"\n📊 Found {len(model.request_types)} Request types, {len(model.response_types)} Response types")
+
+    # コントローラーをパース
+    print("\n📖 Parsing Controllers...")
+    with profiler.phase("parse_controllers") as record:
+        controller_files = _collect_controller_files()
+        record["files"] = len(controller_files)
+        hits = parse_cache.hits
+        model.update_controllers(controller_files)
+        record["cache_hits"] = parse_cache.hits - hits
+
+    with profiler.phase("save_parse_cache"):
+        parse_cache.save()
+
+    with profiler.phase("fingerprint_sources"):
+        model.source_fingerprint = _source_fingerprint()
+
+    return model, value_object_types
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
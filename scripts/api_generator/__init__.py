@@ -0,0 +1,5 @@
+"""
+HttpApi モデルを介した API クライアントジェネレーター
+
+scripts/ を sys.path に置いて import する（scripts/models・scripts/helpers を使う）。
+"""
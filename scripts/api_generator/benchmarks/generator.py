@@ -0,0 +1,183 @@
+import json
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from models import CSharpClass, CSharpProperty
+from helpers import SymbolIndex, TypeRef, parse_csharp_type
+from helpers.csharp_types import ARRAY, DICTIONARY_TYPES, LIST_TYPES, PRIMITIVE_TYPES, TUPLE
+from ..loadtest.payload import DEFAULT_INT_RANGE, Constraints, PayloadFactory
+from .templates import csharp as _cs
+
+VALUE_OBJECT_NAMESPACE = "NariNoteBackend.Domain.ValueObject"
+
+# 整数型 → Sample.NextInt() の結果を収める範囲
+_INTEGER_RANGES = {
+    "int": (-2 ** 31, 2 ** 31 - 1), "Int32": (-2 ** 31, 2 ** 31 - 1),
+    "uint": (0, 2 ** 31 - 1), "UInt32": (0, 2 ** 31 - 1),
+    "long": (-2 ** 31, 2 ** 31 - 1), "Int64": (-2 ** 31, 2 ** 31 - 1),
+    "ulong": (0, 2 ** 31 - 1), "UInt64": (0, 2 ** 31 - 1),
+    "short": (-2 ** 15, 2 ** 15 - 1), "Int16": (-2 ** 15, 2 ** 15 - 1),
+    "ushort": (0, 2 ** 16 - 1), "UInt16": (0, 2 ** 16 - 1),
+    "byte": (0, 255), "Byte": (0, 255),
+    "sbyte": (-128, 127), "SByte": (-128, 127),
+}
+_FLOAT_TYPES = frozenset({"float", "double", "decimal", "Single", "Double", "Decimal"})
+# Sample.Many() の List<T> をそのまま代入できるコレクション型
+_LIST_INTERFACES = frozenset({"List", "IList", "ICollection", "IEnumerable", "IReadOnlyList", "IReadOnlyCollection"})
+# それ以外のコレクション型 → List<T> から作る式
+_COLLECTION_CONVERSIONS = {
+    "HashSet": "new HashSet<{element}>({list})", "ISet": "new HashSet<{element}>({list})",
+    "IReadOnlySet": "new HashSet<{element}>({list})",
+    "Collection": "new System.Collections.ObjectModel.Collection<{element}>({list})",
+    "ReadOnlyCollection": "{list}.AsReadOnly()",
+}
+
+
+def csharp_type(ref: TypeRef) -> str:
+    """TypeRef → C# の型式"""
+    if ref.name == ARRAY:
+        text = f"{csharp_type(ref.args[0])}[]"
+    elif ref.name == TUPLE:
+        text = "(" + ", ".join(csharp_type(arg) for arg in ref.args) + ")"
+    elif ref.args:
+        text = f"{ref.name}<{', '.join(csharp_type(arg) for arg in ref.args)}>"
+    else:
+        text = ref.name
+    return f"{text}?" if ref.nullable else text
+
+
+class BenchmarkGenerator:
+    """
+    DTO クラスから BenchmarkDotNet のシリアライズ・デシリアライズのベンチマーク（C#）を生成する
+
+    nari-note-benchmarks/Generated/ に、DTO ごとのインスタンスを作る DtoSamples と、
+    DTO ごとの [GenericTypeArguments] を付けた DtoJsonBenchmarks<T> を出力する。
+    値はプロパティの型（ValueObject の ID は Guid / int）と検証属性（[MaxLength]・[Range] など）に従い、
+    SampleSize.Max では文字列・コレクションを上限まで埋める。
+    """
+
+    def __init__(self, value_object_types: Dict[str, str], class_map: Dict[str, CSharpClass], index: Optional[SymbolIndex] = None):
+        self.value_object_types = value_object_types
+        self.class_map = class_map
+        self.index = index or SymbolIndex(class_map.values(), value_object_types)
+        # [RegularExpression] の値だけは生成時に Python 側で作ってリテラルにする
+        self._patterns = PayloadFactory(class_map, value_object_types, seed=0)
+
+    def _usings(self, classes: List[CSharpClass], *extra: str) -> List[str]:
+        namespaces = {cls.namespace for cls in classes if cls.namespace} | set(extra)
+        return [f"using {namespace};" for namespace in sorted(namespaces)]
+
+    def render_samples(self, classes: Iterable[CSharpClass]) -> Iterator[str]:
+        classes = sorted(classes, key=lambda c: c.name)
+        yield _cs.FILE_HEADER
+        yield from self._usings(classes, VALUE_OBJECT_NAMESPACE)
+        yield ""
+        yield "namespace NariNoteBenchmarks;"
+        yield ""
+        yield _cs.SAMPLES_CLASS
+        yield "    static readonly Dictionary<Type, Func<SampleSize, object>> Factories = new()"
+        yield "    {"
+        for cls in classes:
+            yield f"        [typeof({cls.name})] = size => Create{cls.name}(size),"
+        yield "    };"
+        for cls in classes:
+            yield ""
+            yield from self._render_factory(cls)
+        yield "}"
+
+    def render_benchmarks(self, classes: Iterable[CSharpClass]) -> Iterator[str]:
+        classes = sorted(classes, key=lambda c: c.name)
+        yield _cs.FILE_HEADER
+        yield "using System.Text.Json;"
+        yield "using BenchmarkDotNet.Attributes;"
+        yield from self._usings(classes)
+        yield ""
+        yield "namespace NariNoteBenchmarks;"
+        yield ""
+        yield _cs.BENCHMARK_SUMMARY
+        for cls in classes:
+            yield f"[GenericTypeArguments(typeof({cls.name}))]"
+        yield _cs.BENCHMARK_CLASS
+
+    def _render_factory(self, cls: CSharpClass) -> Iterator[str]:
+        yield f"    static {cls.name} Create{cls.name}(SampleSize size, int depth = 0) => new()"
+        yield "    {"
+        for prop in cls.properties:
+            yield f"        {prop.name} = {self._property_expression(cls, prop)},"
+        yield "    };"
+
+    def _property_expression(self, cls: CSharpClass, prop: CSharpProperty) -> str:
+        constraints = Constraints(prop.validation)
+        return self._expression(parse_csharp_type(prop.type), constraints, cls.name, f"{cls.name}.{prop.name}")
+
+    def _expression(self, ref: TypeRef, constraints: Constraints, owner: str, label: str) -> str:
+        """型 ref の値を作る C# の式（コレクションなら長さの制約は要素数に適用する）"""
+        simple_name = ref.name.rsplit(".", 1)[-1]
+        if ref.name == ARRAY or (simple_name in LIST_TYPES and len(ref.args) == 1):
+            element_ref = ref.args[0]
+            element = self._expression(element_ref, Constraints(), owner, label)
+            low = constraints.min_length or 0
+            high = "null" if constraints.max_length is None else str(constraints.max_length)
+            items = f"Sample.Many(size, depth, {low}, {high}, () => {element})"
+            if ref.name == ARRAY:
+                return f"{items}.ToArray()"
+            if simple_name in _LIST_INTERFACES:
+                return items
+            return _COLLECTION_CONVERSIONS[simple_name].format(element=csharp_type(element_ref), list=items)
+        if simple_name in DICTIONARY_TYPES and len(ref.args) == 2:
+            return f"new Dictionary<{csharp_type(ref.args[0])}, {csharp_type(ref.args[1])}>()"
+        if ref.args or ref.name == TUPLE:
+            return "default!"
+
+        if ref.name in self.value_object_types:
+            if self.value_object_types[ref.name] == "string":
+                return f"{ref.name}.From(Sample.NextGuid())"
+            return f"{ref.name}.From(Sample.NextInt({DEFAULT_INT_RANGE[0]}, {DEFAULT_INT_RANGE[1]}))"
+        if ref.name in self.class_map:
+            create = f"Create{ref.name}(size, depth + 1)"
+            # 循環参照は MaxDepth で打ち切る
+            if ref.name == owner or owner in self.index.dependencies(ref.name):
+                return f"depth < MaxDepth ? {create} : null!"
+            return create
+        if simple_name not in PRIMITIVE_TYPES:
+            # パースしていない型（enum など）は既定値
+            return "default!"
+
+        if simple_name in ("bool", "Boolean"):
+            return "Sample.NextBool()"
+        if simple_name == "Guid":
+            return "Sample.NextGuid()"
+        if simple_name == "DateTime":
+            return "Sample.NextDateTime()"
+        if simple_name == "DateTimeOffset":
+            return "new DateTimeOffset(Sample.NextDateTime())"
+        if simple_name == "DateOnly":
+            return "DateOnly.FromDateTime(Sample.NextDateTime())"
+        if simple_name == "TimeOnly":
+            return "TimeOnly.FromDateTime(Sample.NextDateTime())"
+        if simple_name == "TimeSpan":
+            return "TimeSpan.FromSeconds(Sample.NextInt(0, 86399))"
+        if simple_name in ("char", "Char"):
+            return "'a'"
+        if simple_name in _FLOAT_TYPES:
+            low = constraints.minimum if constraints.minimum is not None else 0.0
+            high = constraints.maximum if constraints.maximum is not None else 1000.0
+            return f"({simple_name})Sample.NextDouble({float(low)!r}, {float(high)!r})"
+        if simple_name in _INTEGER_RANGES:
+            type_low, type_high = _INTEGER_RANGES[simple_name]
+            low = int(constraints.minimum) if constraints.minimum is not None else DEFAULT_INT_RANGE[0]
+            high = int(constraints.maximum) if constraints.maximum is not None else DEFAULT_INT_RANGE[1]
+            low, high = max(low, type_low), min(high, type_high)
+            call = f"Sample.NextInt({low}, {max(low, high)})"
+            return call if simple_name in ("int", "Int32") else f"({simple_name}){call}"
+
+        # 文字列
+        if constraints.email:
+            return "Sample.Email()"
+        if constraints.url:
+            return "Sample.Url()"
+        if constraints.phone:
+            return "Sample.Phone()"
+        if constraints.pattern is not None:
+            return json.dumps(self._patterns.value(ref, constraints, 0, label))
+        high = "null" if constraints.max_length is None else str(constraints.max_length)
+        return f"Sample.Text(size, {constraints.min_length or 0}, {high})"
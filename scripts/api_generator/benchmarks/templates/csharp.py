@@ -0,0 +1,54 @@
+FILE_HEADER = """\
+// Auto-generated by api-generator
+// Do not edit manually
+"""
+
+SAMPLES_CLASS = """\
+/// <summary>
+/// DTO ごとのベンチマーク用インスタンス（プロパティの型と検証属性から作る）
+/// </summary>
+public static partial class DtoSamples
+{
+    // 循環参照する DTO の入れ子の上限
+    const int MaxDepth = 3;
+
+    /// <summary>
+    /// T のインスタンス（同じ T・size なら毎回同じ内容）
+    /// </summary>
+    public static T Create<T>(SampleSize size) where T : class
+    {
+        Sample.Reset();
+        return (T)Factories[typeof(T)](size);
+    }
+"""
+
+BENCHMARK_SUMMARY = """\
+/// <summary>
+/// DTO ごとの JSON シリアライズ・デシリアライズ（設定は API と同じ BenchmarkJson.Options）
+/// </summary>
+[MemoryDiagnoser]"""
+
+BENCHMARK_CLASS = """\
+public class DtoJsonBenchmarks<T> where T : class
+{
+    T value = default!;
+    byte[] json = [];
+
+    [Params(SampleSize.Typical, SampleSize.Max)]
+    public SampleSize Size { get; set; }
+
+    [GlobalSetup]
+    public void Setup()
+    {
+        value = DtoSamples.Create<T>(Size);
+        json = JsonSerializer.SerializeToUtf8Bytes(value, BenchmarkJson.Options);
+        Console.WriteLine($"// {typeof(T).Name} ({Size}): {json.Length:N0} bytes");
+    }
+
+    [Benchmark]
+    public byte[] Serialize() => JsonSerializer.SerializeToUtf8Bytes(value, BenchmarkJson.Options);
+
+    [Benchmark]
+    public T? Deserialize() => JsonSerializer.Deserialize<T>(json, BenchmarkJson.Options);
+}
+"""
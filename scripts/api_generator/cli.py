@@ -0,0 +1,21 @@
+"""
+サブコマンド（diff / loadtest / mock / waterfalls / invalidations）の共通部分
+
+各サブパッケージの cli.main(argv, ...) は api-generator.py から呼ばれる。モデルの読み込み（パース・パースキャッシュ・
+--from-ir / --rev）は api-generator.py 側にあるので、読み込む関数を引数で受け取る。
+"""
+
+import argparse
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# args（--from-ir / --rev / --verbose / jobs）からモデルを読み込み、(ResolvedModel, ValueObject 型) を返す。
+# 読み込めなければメッセージを表示して None を返す
+ModelLoader = Callable[[argparse.Namespace], Optional[Tuple[Any, Dict[str, str]]]]
+
+
+def add_model_arguments(parser: argparse.ArgumentParser, verbose_help: str = 'Show parsing progress') -> None:
+    """モデルの読み込み元を選ぶ引数（--from-ir / --rev / --verbose）を追加する"""
+    parser.add_argument('--from-ir', type=Path, metavar='FILE', help='Read the API model from an IR file instead of parsing')
+    parser.add_argument('--rev', metavar='REV', help='Parse the sources of a git revision instead of the working tree')
+    parser.add_argument('--verbose', '-v', action='store_true', help=verbose_help)
@@ -0,0 +1,66 @@
+from typing import Iterator, List
+
+from ...protocols.http import HttpMethod
+from ..base import ClientGenerator
+from .templates import typescript as _ts
+
+
+class AxiosGenerator(ClientGenerator):
+    """HttpApi リストから Axios クライアント用 TypeScript コードを生成する"""
+
+    def render(self, apis: List) -> Iterator[str]:
+        """生成するコードを行単位で順に返す（write_lines_if_changed でそのまま書き出せる）"""
+        yield _ts.FILE_HEADER
+        yield _ts.IMPORT_HEADER
+
+        all_types = self._collect_types(apis)
+        yield from (f"  {t}," for t in sorted(all_types))
+        yield _ts.IMPORT_FOOTER
+        yield ""
+
+        by_controller = self._group_by_controller(apis)
+        for controller, eps in sorted(by_controller.items()):
+            yield _ts.CONTROLLER_COMMENT.format(controller=controller.capitalize())
+            yield _ts.CONTROLLER_OPEN.format(controller=controller)
+            for ep in eps:
+                yield from self._render_function(ep)
+            yield _ts.CONTROLLER_CLOSE
+            yield ""
+
+    def _render_function(self, ep) -> List[str]:
+        lines: List[str] = []
+        func_name, request_type, response_type, url_expr, has_path_params, send_body = self._signature(ep)
+
+        if ep.is_form_file:
+            pname = ep.form_file_param
+            lines.append(f"  {func_name}: async ({pname}: File): Promise<{response_type}> => {{")
+            lines.append(f"    const formData = new FormData();")
+            lines.append(f"    formData.append('{pname}', {pname});")
+            lines.append(f"    const response = await apiClient.{ep.method.value.lower()}<{response_type}>({url_expr}, formData);")
+            lines.append("    return response;")
+        elif request_type == "void":
+            lines.append(f"  {func_name}: async (): Promise<{response_type}> => {{")
+            if ep.method == HttpMethod.DELETE:
+                lines.append(f"    await apiClient.delete({url_expr});")
+            else:
+                lines.append(f"    const response = await apiClient.{ep.method.value.lower()}<{response_type}>({url_expr});")
+                lines.append("    return response;")
+        else:
+            lines.append(f"  {func_name}: async (data: {request_type}): Promise<{response_type}> => {{")
+            if ep.method == HttpMethod.DELETE:
+                lines.append(f"    await apiClient.delete({url_expr});")
+            elif ep.method == HttpMethod.GET:
+                if has_path_params:
+                    lines.append(f"    const response = await apiClient.get<{response_type}>({url_expr});")
+                else:
+                    lines.append(f"    const response = await apiClient.get<{response_type}>({url_expr}, {{ params: data }});")
+                lines.append("    return response;")
+            else:
+                if send_body:
+                    lines.append(f"    const response = await apiClient.{ep.method.value.lower()}<{response_type}>({url_expr}, data);")
+                else:
+                    lines.append(f"    const response = await apiClient.{ep.method.value.lower()}<{response_type}>({url_expr});")
+                lines.append("    return response;")
+
+        lines.append("  },")
+        return lines
@@ -0,0 +1,96 @@
+from typing import Dict, List, NamedTuple, Optional
+
+from models import CSharpClass
+from helpers import SymbolIndex
+from ..protocols.http import HttpApi
+
+
+class FunctionSignature(NamedTuple):
+    """HttpApi 1件分の、クライアント関数の組み立てに必要な情報"""
+    name: str           # camelCase の関数名
+    request_type: str   # "void" / Request DTO 名 / パスパラメータだけのインライン型（"{ id: string }"）
+    response_type: str
+    url_expr: str       # '/api/tags' またはテンプレートリテラル `/api/users/${data.userId}`
+    has_path_params: bool
+    send_body: bool     # Request DTO をボディとして送るか（[FromBody]）
+
+
+class ClientGenerator:
+    """HttpApi リストから TypeScript クライアントを生成するジェネレーターの共通部分（axios / fetch）"""
+
+    def __init__(
+        self,
+        value_object_types: Dict[str, str],
+        class_map: Dict[str, CSharpClass],
+        index: Optional[SymbolIndex] = None,
+    ):
+        self.value_object_types = value_object_types
+        self.class_map = class_map
+        self.index = index or SymbolIndex(class_map.values(), value_object_types)
+
+    def generate(self, apis: List) -> str:
+        return "\n".join(self.render(apis))
+
+    def _signature(self, ep: HttpApi) -> FunctionSignature:
+        request_type = (
+            ep.request.body.type_name if ep.request and ep.request.body else
+            ep.request.query.type_name if ep.request and ep.request.query else
+            ep.request.path.type_name if ep.request and ep.request.path else
+            "void"
+        )
+        response_type = ep.response.payload.type_name if ep.response and ep.response.payload else "void"
+        path_param_entities = ep.endpoint.path_params()
+
+        if path_param_entities:
+            parts = []
+            for entity in ep.endpoint.entities:
+                if entity.type is not None:
+                    resolved = self._resolve_path_param(entity.name, request_type)
+                    parts.append(f"${{data.{resolved}}}")
+                else:
+                    parts.append(entity.name)
+            url_expr = f"`/{'/'.join(parts)}`"
+        else:
+            url_expr = f"'{ep.endpoint.to_path_string()}'"
+
+        if request_type == "void" and path_param_entities:
+            request_type = "{ " + ", ".join(
+                f"{e.name}: {e.type.value}" for e in path_param_entities
+            ) + " }"
+
+        return FunctionSignature(
+            name=self._to_camel(ep.function_name),
+            request_type=request_type,
+            response_type=response_type,
+            url_expr=url_expr,
+            has_path_params=bool(path_param_entities),
+            send_body=ep.request is not None and ep.request.body is not None,
+        )
+
+    # --- utilities ---
+
+    def _to_camel(self, name: str) -> str:
+        return name[0].lower() + name[1:] if name else name
+
+    def _collect_types(self, apis: List) -> set:
+        types: set = set()
+        for ep in apis:
+            if ep.request:
+                if ep.request.body:
+                    types.add(ep.request.body.type_name)
+                elif ep.request.query:
+                    types.add(ep.request.query.type_name)
+                elif ep.request.path:
+                    types.add(ep.request.path.type_name)
+            if ep.response and ep.response.payload:
+                types.add(ep.response.payload.type_name)
+        return types
+
+    def _group_by_controller(self, apis: List) -> Dict[str, List]:
+        result: Dict[str, List] = {}
+        for ep in apis:
+            result.setdefault(ep.controller_name, []).append(ep)
+        return result
+
+    def _resolve_path_param(self, param: str, request_type: str) -> str:
+        return self.index.resolve_path_param(param, request_type)
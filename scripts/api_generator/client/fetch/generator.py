@@ -0,0 +1,68 @@
+from typing import Iterator, List
+
+from ...protocols.http import HttpMethod
+from ..base import ClientGenerator
+from .templates import typescript as _ts
+
+
+class FetchGenerator(ClientGenerator):
+    """
+    HttpApi リストから fetch だけを使う TypeScript クライアントを生成する
+
+    axios に依存せず、401 時の unauthorizedHandler 呼び出しとサーバーのエラーメッセージの扱いは
+    client.ts と同じ。関数のシグネチャは AxiosGenerator と共通なので、呼び出し側はそのまま差し替えられる。
+    """
+
+    def render(self, apis: List) -> Iterator[str]:
+        """生成するコードを行単位で順に返す（write_lines_if_changed でそのまま書き出せる）"""
+        yield _ts.FILE_HEADER
+        yield _ts.IMPORT_HEADER
+
+        all_types = self._collect_types(apis)
+        yield from (f"  {t}," for t in sorted(all_types))
+        yield _ts.IMPORT_FOOTER
+        yield ""
+        yield _ts.RUNTIME
+
+        by_controller = self._group_by_controller(apis)
+        for controller, eps in sorted(by_controller.items()):
+            yield _ts.CONTROLLER_COMMENT.format(controller=controller.capitalize())
+            yield _ts.CONTROLLER_OPEN.format(controller=controller)
+            for ep in eps:
+                yield from self._render_function(ep)
+            yield _ts.CONTROLLER_CLOSE
+            yield ""
+
+    def _render_function(self, ep) -> List[str]:
+        lines: List[str] = []
+        func_name, request_type, response_type, url_expr, has_path_params, send_body = self._signature(ep)
+        method = ep.method.value
+
+        if ep.is_form_file:
+            pname = ep.form_file_param
+            lines.append(f"  {func_name}: async ({pname}: File): Promise<{response_type}> => {{")
+            lines.append(f"    const formData = new FormData();")
+            lines.append(f"    formData.append('{pname}', {pname});")
+            lines.append(f"    return request<{response_type}>('{method}', {url_expr}, {{ body: formData }});")
+        elif request_type == "void":
+            lines.append(f"  {func_name}: async (): Promise<{response_type}> => {{")
+            if ep.method == HttpMethod.DELETE:
+                lines.append(f"    await request<void>('DELETE', {url_expr});")
+            else:
+                lines.append(f"    return request<{response_type}>('{method}', {url_expr});")
+        else:
+            lines.append(f"  {func_name}: async (data: {request_type}): Promise<{response_type}> => {{")
+            if ep.method == HttpMethod.DELETE:
+                lines.append(f"    await request<void>('DELETE', {url_expr});")
+            elif ep.method == HttpMethod.GET:
+                if has_path_params:
+                    lines.append(f"    return request<{response_type}>('GET', {url_expr});")
+                else:
+                    lines.append(f"    return request<{response_type}>('GET', {url_expr}, {{ params: data }});")
+            elif send_body:
+                lines.append(f"    return request<{response_type}>('{method}', {url_expr}, {{ body: data }});")
+            else:
+                lines.append(f"    return request<{response_type}>('{method}', {url_expr});")
+
+        lines.append("  },")
+        return lines
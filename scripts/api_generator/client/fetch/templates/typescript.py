@@ -0,0 +1,77 @@
+FILE_HEADER = """\
+// Auto-generated by api-generator
+// Do not edit manually
+"""
+
+IMPORT_HEADER = """\
+import { unauthorizedHandler } from '@/lib/unauthorizedHandler';
+import type {\
+"""
+
+IMPORT_FOOTER = "} from './types';"
+
+# client.ts（axios インスタンス + インターセプター）と同じ振る舞いを fetch だけで実装したもの
+#   - Cookie を送る（withCredentials）、FormData 以外は JSON で送る
+#   - クエリは axios と同じ形式（null / undefined は省略、配列は key[]=、Date は ISO 文字列）
+#   - 2xx 以外: 401 なら unauthorizedHandler.trigger()、サーバーの message があればそれを Error にして投げる
+#   - レスポンスは JSON として読み、JSON でなければ文字列、空なら undefined を返す
+RUNTIME = """\
+const API_BASE_URL = '';
+
+type RequestOptions = {
+  params?: object;
+  body?: unknown;
+};
+
+const toQueryString = (params: object): string => {
+  const search = new URLSearchParams();
+  for (const [key, value] of Object.entries(params)) {
+    if (value === undefined || value === null) continue;
+    const values: unknown[] = Array.isArray(value) ? value : [value];
+    const name = Array.isArray(value) ? `${key}[]` : key;
+    for (const item of values) {
+      if (item === undefined || item === null) continue;
+      search.append(name, item instanceof Date ? item.toISOString() : String(item));
+    }
+  }
+  const query = search.toString();
+  return query ? `?${query}` : '';
+};
+
+const parseBody = async (response: Response): Promise<unknown> => {
+  const text = await response.text();
+  if (!text) return undefined;
+  try {
+    return JSON.parse(text);
+  } catch {
+    return text;
+  }
+};
+
+const request = async <T>(method: string, url: string, options: RequestOptions = {}): Promise<T> => {
+  const { params, body } = options;
+  const init: RequestInit = { method, credentials: 'include', headers: {} };
+  if (body instanceof FormData) {
+    init.body = body;
+  } else if (body !== undefined) {
+    init.headers = { 'Content-Type': 'application/json' };
+    init.body = JSON.stringify(body);
+  }
+
+  const response = await fetch(API_BASE_URL + url + (params ? toQueryString(params) : ''), init);
+  const data = await parseBody(response);
+  if (!response.ok) {
+    if (response.status === 401) {
+      // モーダルを表示
+      unauthorizedHandler.trigger();
+    }
+    const serverMessage = (data as { message?: string } | undefined)?.message;
+    throw new Error(serverMessage || `Request failed with status code ${response.status}`);
+  }
+  return data as T;
+};
+"""
+
+CONTROLLER_OPEN = "export const {controller}Api = {{"
+CONTROLLER_CLOSE = "};"
+CONTROLLER_COMMENT = "// {controller} API"
@@ -0,0 +1,239 @@
+import keyword
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from models import CSharpClass
+from helpers import TypeRef, parse_csharp_type
+from helpers.csharp_types import ARRAY, DICTIONARY_TYPES, LIST_TYPES, PRIMITIVE_TYPES, TUPLE
+from ...protocols.http import EndpointType, HttpApi, HttpMethod
+from ..base import ClientGenerator
+from .templates import python as _py
+
+# C# のプリミティブ型 → Python の型（TypeScript の number は小数型だけ float にする）
+_FLOAT_TYPES = frozenset({"float", "double", "decimal", "Single", "Double", "Decimal"})
+PYTHON_PRIMITIVES: Dict[str, str] = {
+    name: "float" if name in _FLOAT_TYPES else {"string": "str", "number": "int", "boolean": "bool"}[ts_type]
+    for name, ts_type in PRIMITIVE_TYPES.items()
+}
+_PATH_PARAM_TYPES = {EndpointType.STRING: "str", EndpointType.NUMBER: "int"}
+
+# 生成ファイルに埋め込むランタイム（runtime.py の docstring より後ろ）
+RUNTIME_FILE = Path(__file__).with_name("runtime.py")
+_RUNTIME_START = "from __future__ import annotations\n"
+
+_SNAKE_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+# JSON → DTO の変換。(ラッパー関数, 要素の変換関数) で、ラッパーは runtime の _opt / _list / _dict
+Decoder = Tuple[str, str]
+
+
+@lru_cache(maxsize=None)
+def runtime_source() -> str:
+    source = RUNTIME_FILE.read_text(encoding="utf-8")
+    return source[source.index(_RUNTIME_START):]
+
+
+@lru_cache(maxsize=None)
+def to_snake(name: str) -> str:
+    """PascalCase / camelCase → snake_case（予約語には _ を付ける）"""
+    snake = _SNAKE_BOUNDARY.sub("_", name).lower()
+    return f"{snake}_" if keyword.iskeyword(snake) else snake
+
+
+class PythonClientGenerator(ClientGenerator):
+    """
+    HttpApi リストと DTO クラスから、バッチジョブ用の asyncio クライアント（Python）を生成する
+
+    DTO は __slots__ 付きの dataclass（フィールドは snake_case、JSON のキーは camelCase）、
+    コントローラーごとの API クラスは NariNoteClient の属性になる。HTTP の送受信は
+    生成ファイルに埋め込むランタイム（runtime.py）で行い、外部パッケージには依存しない。
+    """
+
+    def render(self, apis: List, classes: Iterable[CSharpClass]) -> Iterator[str]:
+        """生成するコードを行単位で順に返す（write_lines_if_changed でそのまま書き出せる）"""
+        yield _py.FILE_HEADER + _py.MODULE_DOCSTRING
+        yield runtime_source()
+        yield _py.DTO_SECTION
+
+        for cls in sorted(classes, key=lambda c: c.name):
+            yield ""
+            yield from self._render_dto(cls)
+            yield ""
+
+        yield _py.API_SECTION
+        by_controller = self._group_by_controller(apis)
+        for controller, eps in sorted(by_controller.items()):
+            yield ""
+            yield from self._render_api_class(controller, eps)
+            yield ""
+        yield ""
+        yield from self._render_client(sorted(by_controller))
+
+    # --- DTO ---
+
+    def _render_dto(self, cls: CSharpClass) -> Iterator[str]:
+        yield "@dataclass(slots=True, kw_only=True)"
+        yield f"class {cls.name}:"
+        if not cls.properties:
+            yield "    def to_json(self) -> Dict[str, Any]:"
+            yield "        return {}"
+            yield ""
+            yield "    @classmethod"
+            yield f"    def from_json(cls, data: Dict[str, Any]) -> {cls.name}:"
+            yield "        return cls()"
+            return
+
+        fields = []
+        for prop in cls.properties:
+            ref = parse_csharp_type(prop.type)
+            optional = ref.nullable or prop.is_optional
+            fields.append((to_snake(prop.name), self._to_camel(prop.name), ref, optional))
+
+        for attr, _, ref, optional in fields:
+            annotation = self._annotation(ref)
+            yield f"    {attr}: Optional[{annotation}] = None" if optional else f"    {attr}: {annotation}"
+        yield ""
+        yield "    def to_json(self) -> Dict[str, Any]:"
+        yield "        return {"
+        for attr, key, ref, _ in fields:
+            value = f"self.{attr}" if self._is_plain(ref) else f"_encode(self.{attr})"
+            yield f'            "{key}": {value},'
+        yield "        }"
+        yield ""
+        yield "    @classmethod"
+        yield f"    def from_json(cls, data: Dict[str, Any]) -> {cls.name}:"
+        yield "        return cls("
+        for attr, key, ref, _ in fields:
+            value = self._decode_expr(ref, f'data.get("{key}")')
+            yield f"            {attr}={value},"
+        yield "        )"
+
+    def _annotation(self, ref: TypeRef) -> str:
+        """型注釈（ネストした nullable は Optional[...]）"""
+        if ref.name == ARRAY:
+            return f"List[{self._nested_annotation(ref.args[0])}]"
+        if ref.name == TUPLE:
+            return "Tuple[" + ", ".join(self._nested_annotation(arg) for arg in ref.args) + "]"
+
+        simple_name = ref.name.rsplit(".", 1)[-1]
+        if not ref.args:
+            if ref.name in self.value_object_types:
+                return "str" if self.value_object_types[ref.name] == "string" else "int"
+            if simple_name in PYTHON_PRIMITIVES:
+                return PYTHON_PRIMITIVES[simple_name]
+            if ref.name in self.class_map:
+                return ref.name
+            return "Any"
+        if simple_name in LIST_TYPES and len(ref.args) == 1:
+            return f"List[{self._nested_annotation(ref.args[0])}]"
+        if simple_name in DICTIONARY_TYPES and len(ref.args) == 2:
+            return f"Dict[{self._annotation(ref.args[0])}, {self._nested_annotation(ref.args[1])}]"
+        return "Any"
+
+    def _nested_annotation(self, ref: TypeRef) -> str:
+        annotation = self._annotation(ref)
+        return f"Optional[{annotation}]" if ref.nullable else annotation
+
+    def _decoder(self, ref: TypeRef) -> Optional[Decoder]:
+        """JSON の値を DTO に変換する関数（変換が要らない型なら None）"""
+        simple_name = ref.name.rsplit(".", 1)[-1]
+        if ref.name == ARRAY or (simple_name in LIST_TYPES and len(ref.args) == 1):
+            inner = self._decoder(ref.args[0])
+            return ("_list", self._decoder_callable(inner)) if inner else None
+        if simple_name in DICTIONARY_TYPES and len(ref.args) == 2:
+            inner = self._decoder(ref.args[1])
+            return ("_dict", self._decoder_callable(inner)) if inner else None
+        if not ref.args and ref.name in self.class_map:
+            return ("_opt", f"{ref.name}.from_json")
+        return None
+
+    def _decoder_callable(self, decoder: Decoder) -> str:
+        wrapper, inner = decoder
+        # 要素の None は _list / _dict 側で扱うので、_opt は外してよい
+        return inner if wrapper == "_opt" else f"partial({wrapper}, {inner})"
+
+    def _decode_expr(self, ref: TypeRef, expr: str) -> str:
+        decoder = self._decoder(ref)
+        return f"{decoder[0]}({decoder[1]}, {expr})" if decoder else expr
+
+    def _is_plain(self, ref: TypeRef) -> bool:
+        """JSON にそのまま入れられる型か（DTO を含まない）"""
+        return self._decoder(ref) is None
+
+    # --- API ---
+
+    def _api_class_name(self, controller: str) -> str:
+        return "".join(part.capitalize() for part in re.split(r"[^0-9A-Za-z]+", controller) if part) + "Api"
+
+    def _render_api_class(self, controller: str, eps: List[HttpApi]) -> Iterator[str]:
+        yield f"class {self._api_class_name(controller)}:"
+        yield f'    """{controller.capitalize()} API"""'
+        yield ""
+        yield '    __slots__ = ("_client",)'
+        yield ""
+        yield "    def __init__(self, client: BaseClient):"
+        yield "        self._client = client"
+        for ep in eps:
+            yield ""
+            yield from self._render_method(ep)
+
+    def _render_method(self, ep: HttpApi) -> List[str]:
+        lines: List[str] = []
+        sig = self._signature(ep)
+        name = to_snake(sig.name)
+        method = ep.method.value
+        response_ref = parse_csharp_type(sig.response_type)
+        returns = "None" if sig.response_type == "void" else self._annotation(response_ref)
+        path_params = ep.endpoint.path_params()
+        dto_request = sig.request_type != "void" and not sig.request_type.startswith("{")
+
+        if ep.is_form_file:
+            pname = to_snake(ep.form_file_param)
+            params = f'{pname}: bytes, filename: str = "{ep.form_file_param}", content_type: str = "application/octet-stream"'
+        elif dto_request:
+            params = f"data: {sig.request_type}"
+        else:
+            params = ", ".join(f"{to_snake(e.name)}: {_PATH_PARAM_TYPES[e.type]}" for e in path_params)
+        lines.append(f"    async def {name}(self{', ' + params if params else ''}) -> {returns}:")
+
+        parts = []
+        for entity in ep.endpoint.entities:
+            if entity.type is None:
+                parts.append(entity.name)
+            elif dto_request:
+                resolved = self._resolve_path_param(entity.name, sig.request_type)
+                parts.append(f"{{_path(data.{to_snake(resolved)})}}")
+            else:
+                parts.append(f"{{_path({to_snake(entity.name)})}}")
+        url = f'f"/{"/".join(parts)}"' if path_params else f'"{ep.endpoint.to_path_string()}"'
+
+        options = ""
+        if ep.is_form_file:
+            pname = to_snake(ep.form_file_param)
+            options = f', files={{"{ep.form_file_param}": (filename, {pname}, content_type)}}'
+        elif dto_request:
+            if ep.method == HttpMethod.GET:
+                options = "" if sig.has_path_params else ", params=data.to_json()"
+            elif ep.method != HttpMethod.DELETE and sig.send_body:
+                options = ", body=data"
+        call = f'await self._client.request("{method}", {url}{options})'
+
+        decoder = self._decoder(response_ref)
+        if returns == "None":
+            lines.append(f"        {call}")
+        elif decoder and decoder[0] == "_opt":
+            lines.append(f"        return {decoder[1]}({call})")
+        else:
+            lines.append(f"        return {self._decode_expr(response_ref, call)}")
+        return lines
+
+    def _render_client(self, controllers: List[str]) -> Iterator[str]:
+        yield "class NariNoteClient(BaseClient):"
+        yield '    """nari-note API のクライアント（async with で使う。オプションは BaseClient を参照）"""'
+        yield ""
+        yield "    def __init__(self, base_url: str, **options: Any):"
+        yield "        super().__init__(base_url, **options)"
+        for controller in controllers:
+            yield f"        self.{to_snake(controller)} = {self._api_class_name(controller)}(self)"
@@ -0,0 +1,420 @@
+"""
+生成する Python クライアント（nari_note_client.py）のランタイム
+
+PythonClientGenerator はこの docstring より後ろ（from __future__ 以降）をそのまま生成ファイルに埋め込む。
+ロードテスト（api_generator/loadtest）は生成ファイルを使わず、このモジュールの BaseClient を直接使う。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import ssl
+from dataclasses import dataclass  # noqa: F401（生成する DTO で使う）
+from functools import partial  # noqa: F401（生成する DTO で使う）
+from http.cookiejar import CookieJar
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, TypeVar
+from urllib.parse import quote, urlencode, urlsplit
+from urllib.request import Request as _CookieRequest
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 送り直しても結果が変わらないメソッド（RFC 9110 9.2.2）。これ以外は届いたか分からなければ送り直さない
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"})
+
+
+class ApiError(Exception):
+    """2xx 以外のレスポンス。メッセージはサーバーの message（なければ "Request failed with status code N"）"""
+
+    def __init__(self, status: int, message: str, body: Any = None):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+
+
+class UnauthorizedError(ApiError):
+    """401（未ログイン・セッション切れ）"""
+
+
+class _StaleConnection(Exception):
+    """使い回した接続がレスポンスを返す前に閉じられた（サーバーが処理したかどうかは分からない）"""
+
+
+class Response(NamedTuple):
+    """1つの HTTP レスポンス（cookies は Set-Cookie ヘッダーの値）"""
+    status: int
+    headers: Dict[str, str]
+    cookies: List[str]
+    body: bytes
+    keep_alive: bool
+
+
+class _Connection:
+    """1本の HTTP/1.1 接続"""
+
+    __slots__ = ("reader", "writer")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, head: bytes, body: bytes, reused: bool) -> Response:
+        try:
+            self.writer.write(head + body)
+            await self.writer.drain()
+            status_line = await self.reader.readline()
+        except (ConnectionError, OSError) as e:
+            if reused:
+                raise _StaleConnection() from e
+            raise
+        if not status_line:
+            if reused:
+                raise _StaleConnection()
+            raise ConnectionResetError("server closed the connection")
+
+        status = int(status_line.split(None, 2)[1])
+        headers: Dict[str, str] = {}
+        cookies: List[str] = []
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name = name.strip().lower()
+            if name == "set-cookie":
+                cookies.append(value.strip())
+            else:
+                headers[name] = value.strip()
+
+        keep_alive = headers.get("connection", "").lower() != "close"
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            data = await self._read_chunked()
+        elif "content-length" in headers:
+            data = await self.reader.readexactly(int(headers["content-length"]))
+        elif status in (204, 304) or head.startswith(b"HEAD "):
+            data = b""
+        else:
+            # 長さの指定がない場合は接続が閉じられるまでがボディ
+            data = await self.reader.read()
+            keep_alive = False
+        return Response(status, headers, cookies, data, keep_alive)
+
+    def is_closed(self) -> bool:
+        """プールで待っている間にサーバーが閉じた（まだ何も書いていないので捨てれば済む）"""
+        return self.reader.at_eof() or self.writer.is_closing()
+
+    async def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int((await self.reader.readline()).split(b";", 1)[0], 16)
+            if size == 0:
+                # trailer を読み飛ばす
+                while (await self.reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class ConnectionPool:
+    """1つのホストへの keep-alive 接続のプール（同時に使う接続は max_connections 本まで）"""
+
+    def __init__(self, host: str, port: int, ssl_context: Optional[ssl.SSLContext], max_connections: int):
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.max_connections = max_connections
+        self.opened = 0  # これまでに開いた接続の数（使い回せているかの確認用）
+        self._idle: List[_Connection] = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def _open(self) -> _Connection:
+        reader, writer = await asyncio.open_connection(
+            self.host, self.port, ssl=self.ssl_context,
+            server_hostname=self.host if self.ssl_context else None,
+        )
+        self.opened += 1
+        return _Connection(reader, writer)
+
+    def _take_idle(self) -> Optional[_Connection]:
+        """使い回せる接続を取り出す（閉じられていたものは捨てる）"""
+        while self._idle:
+            connection = self._idle.pop()
+            if not connection.is_closed():
+                return connection
+            connection.close()
+        return None
+
+    async def send(self, head: bytes, body: bytes, idempotent: bool) -> Response:
+        """
+        リクエストを送ってレスポンスを返す
+
+        使い回した接続が送った後に切れた場合、idempotent なリクエストだけ新しい接続で1回送り直す
+        （POST などはサーバーが処理済みかもしれないので ConnectionResetError にする）。
+        """
+        async with self._slots:
+            connection = self._take_idle()
+            try:
+                if connection is not None:
+                    try:
+                        response = await connection.send(head, body, reused=True)
+                    except _StaleConnection as e:
+                        # 送った直後にサーバーが keep-alive をタイムアウトで閉じた
+                        connection.close()
+                        connection = None
+                        if not idempotent:
+                            raise ConnectionResetError("server closed the connection before responding") from e
+                if connection is None:
+                    connection = await self._open()
+                    response = await connection.send(head, body, reused=False)
+            except BaseException:
+                # キャンセル・タイムアウトを含め、途中で止まった接続は状態が分からないので捨てる
+                if connection is not None:
+                    connection.close()
+                raise
+            if response.keep_alive:
+                self._idle.append(connection)
+            else:
+                connection.close()
+            return response
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+        for connection in idle:
+            try:
+                await connection.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+
+def _query_items(params: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """クエリ文字列の項目（None は省略、リストは同じキーを繰り返す。ASP.NET のバインドと同じ形式）"""
+    items: List[Tuple[str, str]] = []
+    for key, value in params.items():
+        for item in (value if isinstance(value, (list, tuple)) else [value]):
+            if item is None:
+                continue
+            items.append((key, ("true" if item else "false") if isinstance(item, bool) else str(item)))
+    return items
+
+
+def _path(value: Any) -> str:
+    """パスパラメータの値"""
+    return quote(str(value), safe="")
+
+
+def _encode(value: Any) -> Any:
+    """DTO を JSON に変換できる値にする"""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if hasattr(value, "to_json"):
+        return value.to_json()
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_encode(item) for item in value]
+    return str(value)
+
+
+def _opt(decode: Callable[[Any], T], value: Any) -> Optional[T]:
+    return None if value is None else decode(value)
+
+
+def _list(decode: Callable[[Any], T], value: Any) -> Optional[List[Optional[T]]]:
+    return None if value is None else [None if item is None else decode(item) for item in value]
+
+
+def _dict(decode: Callable[[Any], T], value: Any) -> Optional[Dict[str, Optional[T]]]:
+    return None if value is None else {key: None if item is None else decode(item) for key, item in value.items()}
+
+
+class BaseClient:
+    """
+    接続プール・Cookie・エラー処理を持つクライアントの本体（エンドポイントは NariNoteClient の各 API から呼ぶ）
+
+    max_connections: 同時に使う接続の数（= 同時に送るリクエストの上限）。
+    timeout: 1リクエストのタイムアウト秒（接続の空き待ちを含む）。
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        max_connections: int = 8,
+        timeout: Optional[float] = 30.0,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        url = urlsplit(base_url)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"unsupported URL scheme: {base_url}")
+        secure = url.scheme == "https"
+        port = url.port or (443 if secure else 80)
+        self.host_header = url.hostname if url.port is None else f"{url.hostname}:{port}"
+        self.origin = f"{url.scheme}://{self.host_header}"
+        self.prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        # Domain / Path / Expires / Max-Age / Secure はブラウザと同じ規則で扱う
+        self.cookies = CookieJar()
+        self.pool = ConnectionPool(url.hostname, port, ssl.create_default_context() if secure else None, max_connections)
+
+    async def __aenter__(self) -> "BaseClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.pool.close()
+
+    async def send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        body: Any = None,
+        files: Optional[Dict[str, Tuple[str, bytes, str]]] = None,
+    ) -> Response:
+        """
+        リクエストを送り、レスポンスをそのまま返す（ステータスコードでは例外にしない）
+
+        files: フィールド名 → (ファイル名, 内容, Content-Type)。指定すると multipart/form-data で送る。
+        """
+        target = self.prefix + path
+        if params:
+            query = urlencode(_query_items(params))
+            if query:
+                target += "?" + query
+
+        lines = [
+            f"{method} {target} HTTP/1.1",
+            f"Host: {self.host_header}",
+            "Connection: keep-alive",
+            "Accept: application/json",
+        ]
+        lines += [f"{name}: {value}" for name, value in self.headers.items()]
+        cookie_request = _CookieRequest(self.origin + target, method=method)
+        if self.cookies:
+            self.cookies.add_cookie_header(cookie_request)
+            if cookie_request.has_header("Cookie"):
+                lines.append("Cookie: " + cookie_request.get_header("Cookie"))
+        if files is not None:
+            payload, content_type = _multipart(files)
+        elif body is not None:
+            payload, content_type = json.dumps(_encode(body), ensure_ascii=False).encode("utf-8"), "application/json"
+        else:
+            payload, content_type = b"", None
+        if content_type:
+            lines.append(f"Content-Type: {content_type}")
+        if payload or method in ("POST", "PUT", "PATCH"):
+            lines.append(f"Content-Length: {len(payload)}")
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8")
+
+        response = await asyncio.wait_for(self.pool.send(head, payload, method in _IDEMPOTENT_METHODS), self.timeout)
+        if response.cookies:
+            self.cookies.extract_cookies(_CookieResponse(response.cookies), cookie_request)
+        return response
+
+    def set_cookie(self, name: str, value: str) -> None:
+        """このホストのすべてのパスに送る Cookie を設定する（ログイン済みのセッションを渡す場合など）"""
+        request = _CookieRequest(self.origin + self.prefix + "/")
+        self.cookies.extract_cookies(_CookieResponse([f"{name}={value}; Path=/"]), request)
+
+    async def request(self, method: str, path: str, **options: Any) -> Any:
+        """
+        send() と同じ引数でリクエストを送り、レスポンスの JSON（JSON でなければ文字列、空なら None）を返す
+
+        2xx 以外は ApiError（401 は UnauthorizedError）にする。
+        """
+        response = await self.send(method, path, **options)
+        data = _parse_body(response.body)
+        if not 200 <= response.status < 300:
+            message = data.get("message") if isinstance(data, dict) else None
+            error = UnauthorizedError if response.status == 401 else ApiError
+            raise error(response.status, message or f"Request failed with status code {response.status}", data)
+        return data
+
+    async def map(
+        self,
+        func: Callable[[T], Awaitable[R]],
+        items: Iterable[T],
+        *,
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        items の各要素に func を同時に最大 concurrency 個（既定は max_connections の4倍）まで適用し、結果を items の順で返す
+
+        タスクは concurrency 個しか作らないので、items が多くてもメモリを食わない。
+        return_exceptions=True なら例外も結果として返し、残りの処理を続ける。
+        そうでなければ最初の例外で他のワーカーをキャンセルし、終わるのを待ってから例外を投げる。
+        """
+        items = list(items)
+        results: List[Any] = [None] * len(items)
+        pending = iter(enumerate(items))
+
+        async def worker() -> None:
+            for index, item in pending:
+                try:
+                    results[index] = await func(item)
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[index] = e
+
+        workers = min(concurrency or self.pool.max_connections * 4, len(items))
+        tasks = [asyncio.ensure_future(worker()) for _ in range(workers)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return results
+
+
+class _CookieResponse:
+    """CookieJar.extract_cookies に Set-Cookie ヘッダーを渡すためのレスポンス"""
+
+    __slots__ = ("set_cookies",)
+
+    def __init__(self, set_cookies: List[str]):
+        self.set_cookies = set_cookies
+
+    def info(self) -> "_CookieResponse":
+        return self
+
+    def get_all(self, name: str, default: Any = None) -> Any:
+        return self.set_cookies if name.lower() == "set-cookie" else default
+
+
+def _parse_body(body: bytes) -> Any:
+    if not body:
+        return None
+    text = body.decode("utf-8", errors="replace")
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def _multipart(files: Dict[str, Tuple[str, bytes, str]]) -> Tuple[bytes, str]:
+    boundary = os.urandom(16).hex()
+    parts = []
+    for field, (filename, content, content_type) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n".encode("utf-8") + content + b"\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n".encode("ascii"))
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
@@ -0,0 +1,29 @@
+FILE_HEADER = """\
+# Auto-generated by api-generator
+# Do not edit manually
+"""
+
+MODULE_DOCSTRING = '''\
+"""
+nari-note API の asyncio クライアント（標準ライブラリのみ・Python 3.10+）
+
+    async with NariNoteClient("http://localhost:5000", max_connections=8) as client:
+        await client.auth.sign_in(SignInRequest(username_or_email=..., password=...))
+        page = await client.articles.get_articles(GetArticlesRequest(limit=100, offset=0))
+        await client.map(handle_article, page.articles, concurrency=64)
+
+HTTP/1.1 の keep-alive 接続を max_connections 本までプールして使い回す。同時に投げたリクエストは
+空いた接続を待つので、並行数を上げても接続数は増えない。Cookie（ログインセッション）はクライアントごとに保持する。
+2xx 以外は ApiError（401 は UnauthorizedError）になり、メッセージはサーバーの message を使う。
+"""
+'''
+
+DTO_SECTION = """
+
+# --- DTO ---
+"""
+
+API_SECTION = """
+
+# --- API ---
+"""
@@ -0,0 +1,96 @@
+"""
+invalidations: Mutation フックが成功時に無効化するクエリ（hooks.ts の onSuccess）をミューテーションごとに表示する
+
+無効化するクエリの数（fan-out）の多い順に、範囲を限るかどうかと推測の根拠、コントローラー単位で
+無効化していたときの数を並べる。推測できずコントローラー全体を無効化するものには印を付ける。
+合計がコントローラー単位で無効化していたときの合計を超えたら終了コード 1 を返す。
+規則は helpers/invalidation.py（hooks.ts の生成と同じ InvalidationMap）。
+"""
+
+import argparse
+import fnmatch
+import json
+from pathlib import Path
+from typing import List
+
+from helpers import InvalidationMap
+from ..cli import ModelLoader, add_model_arguments
+
+
+def main(argv: List[str], load_model: ModelLoader) -> int:
+    parser = argparse.ArgumentParser(
+        prog='api-generator.py invalidations',
+        description='Show which queries each generated mutation hook invalidates, ordered by fan-out',
+    )
+    parser.add_argument('--endpoint', '-e', action='append', metavar='PATTERN',
+                        help="Only mutations matching controller.FunctionName (fnmatch, repeatable; e.g. 'articles.*')")
+    parser.add_argument('--json', type=Path, metavar='FILE', help='Also write the invalidation map as JSON')
+    add_model_arguments(parser, 'Show parsing progress and the reason for every key')
+    args = parser.parse_args(argv)
+
+    loaded = load_model(args)
+    if loaded is None:
+        return 2
+    resolved, _ = loaded
+    invalidations = InvalidationMap(resolved.endpoints, resolved.index)
+
+    mutations = [
+        ep for ep in resolved.endpoints
+        if ep.method != "GET" and (
+            not args.endpoint
+            or any(fnmatch.fnmatch(f"{ep.controller_name}.{ep.function_name}", pattern) for pattern in args.endpoint)
+        )
+    ]
+    results = sorted(
+        (invalidations.for_mutation(ep) for ep in mutations),
+        key=lambda inv: (-len(inv.keys), inv.mutation.controller_name, inv.mutation.function_name),
+    )
+    if not results:
+        print("ℹ️  No mutations matched")
+        return 0
+
+    total = sum(len(inv.keys) for inv in results)
+    controller_total = sum(invalidations.controller_fan_out(inv.mutation) for inv in results)
+    print(f"🔁 {len(results)} mutations invalidate {total} query keys "
+          f"({controller_total} when invalidating every query of the controller)")
+    for inv in results:
+        ep = inv.mutation
+        scoped = sum(1 for key in inv.keys if key.scope)
+        marker = "  ⚠️  nothing inferred, invalidating the whole controller" if inv.fallback else ""
+        print(f"\n  {len(inv.keys):>3}  {ep.method} {ep.path}  ({ep.controller_name}.{ep.function_name}, "
+              f"{scoped} scoped, controller-wide {invalidations.controller_fan_out(ep)}){marker}")
+        for key in inv.keys:
+            scope = f" {{ {key.scope[0]}: variables.{key.scope[1]} }}" if key.scope else ""
+            reasons = "; ".join(key.reasons) if args.verbose else key.reasons[0] + (f" (+{len(key.reasons) - 1})" if len(key.reasons) > 1 else "")
+            print(f"       - {key.query.controller_name}.{key.query.function_name}{scope}  ← {reasons}")
+        for name in inv.unknown:
+            print(f"       ⚠️  [Invalidates] names no GET endpoint: {name}")
+
+    exceeded = total > controller_total
+    if exceeded:
+        print(f"\n❌ Fan-out {total} exceeds the controller-wide baseline {controller_total}")
+    else:
+        print(f"\n✅ Fan-out {total} is within the controller-wide baseline {controller_total}")
+
+    if args.json:
+        args.json.write_text(json.dumps([
+            {
+                "mutation": f"{inv.mutation.controller_name}.{inv.mutation.function_name}",
+                "method": inv.mutation.method,
+                "path": inv.mutation.path,
+                "fallback": inv.fallback,
+                "controller_fan_out": invalidations.controller_fan_out(inv.mutation),
+                "unknown": list(inv.unknown),
+                "keys": [
+                    {
+                        "query": f"{key.query.controller_name}.{key.query.function_name}",
+                        "scope": dict([key.scope]) if key.scope else None,
+                        "reasons": list(key.reasons),
+                    }
+                    for key in inv.keys
+                ],
+            }
+            for inv in results
+        ], ensure_ascii=False, indent=2) + "\n", encoding='utf-8')
+        print(f"\n📝 Wrote {args.json}")
+    return 1 if exceeded else 0
@@ -0,0 +1,114 @@
+"""
+loadtest: パースした API モデルから、起動中のバックエンドに負荷をかける
+
+リクエストは DTO の定義（検証属性・ValueObject の ID 型）から作り、エンドポイントごとに
+closed loop（同時実行数を固定）か open loop（到着率を固定）で送る。
+エンドポイントごとのスループットとレイテンシのパーセンタイル（HDR 形式のヒストグラム）を表示する。
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from ..cli import ModelLoader, add_model_arguments
+from ..protocols.diff import describe_api
+from .payload import PayloadFactory
+from .runner import MODES, LoadProfile, RequestBuilder, format_report, matches, run_load, select_apis, stats_to_dict
+
+
+def key_value(separator: str):
+    """NAME=VALUE 形式の引数を (NAME, VALUE) にする argparse の type"""
+    def parse(text: str) -> Tuple[str, str]:
+        name, found, value = text.partition(separator)
+        if not found or not name.strip():
+            raise argparse.ArgumentTypeError(f"expected NAME{separator}VALUE: {text!r}")
+        return name.strip(), value.strip()
+    return parse
+
+
+def main(argv: List[str], load_model: ModelLoader) -> int:
+    parser = argparse.ArgumentParser(
+        prog='api-generator.py loadtest',
+        description='Load-test a running backend with requests generated from the parsed endpoint model',
+    )
+    parser.add_argument('--url', default='http://localhost:5005', help='Backend base URL (default: http://localhost:5005)')
+    parser.add_argument('--endpoints', '-e', nargs='+', default=[], metavar='PATTERN',
+                        help='Endpoints to load, as globs over "controller.Function" or "METHOD /path" (default: all)')
+    parser.add_argument('--include-mutations', action='store_true', help='Also load POST/PUT/DELETE endpoints (default: GET only)')
+    parser.add_argument('--mode', choices=MODES, default='closed', help='closed: fixed concurrency; open: fixed arrival rate (default: closed)')
+    parser.add_argument('--concurrency', '-c', type=int, default=4, help='Closed loop: concurrent requests per endpoint (default: 4)')
+    parser.add_argument('--rate', '-r', type=float, default=10.0, help='Open loop: requests per second per endpoint (default: 10)')
+    parser.add_argument('--max-in-flight', type=int, default=256, help='Open loop: outstanding requests per endpoint before dropping (default: 256)')
+    parser.add_argument('--profile', type=Path, metavar='FILE',
+                        help='JSON file of per-endpoint load settings: {"PATTERN": {"mode": "open", "rate": 50}, ...} '
+                             '(its patterns also select endpoints, including POST/PUT/DELETE)')
+    parser.add_argument('--duration', '-d', type=float, default=10.0, help='Seconds to run (default: 10)')
+    parser.add_argument('--timeout', type=float, default=10.0, help='Per-request timeout in seconds (default: 10)')
+    parser.add_argument('--seed', type=int, help='Random seed for request payloads (same seed = same payloads)')
+    parser.add_argument('--id-range', default='1:100', metavar='MIN:MAX', help='Range for int-backed ValueObject IDs (default: 1:100)')
+    parser.add_argument('--header', action='append', default=[], type=key_value(':'), metavar='NAME:VALUE', help='Extra request header')
+    parser.add_argument('--cookie', action='append', default=[], type=key_value('='), metavar='NAME=VALUE', help='Cookie to send (e.g. a session)')
+    parser.add_argument('--json', type=Path, metavar='FILE', help='Also write the results as JSON')
+    parser.add_argument('--dry-run', action='store_true', help='Print one sample request per endpoint and exit')
+    add_model_arguments(parser)
+    args = parser.parse_args(argv)
+
+    try:
+        low, high = (int(part) for part in args.id_range.split(':'))
+    except ValueError:
+        parser.error(f"--id-range: expected MIN:MAX, got {args.id_range!r}")
+    overrides: Dict[str, Dict] = {}
+    if args.profile:
+        try:
+            overrides = json.loads(args.profile.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            parser.error(f"--profile: {e}")
+
+    loaded = load_model(args)
+    if loaded is None:
+        return 2
+    resolved, value_object_types = loaded
+
+    patterns = list(args.endpoints) + list(overrides)
+    apis = select_apis(resolved.apis, patterns if args.endpoints or overrides else [], args.include_mutations or bool(overrides))
+    if not apis:
+        print("❌ No endpoints matched")
+        return 2
+
+    factory = PayloadFactory(resolved.class_map, value_object_types, seed=args.seed, id_range=(low, high))
+    builders = [RequestBuilder(api, factory, resolved.index) for api in apis]
+    profiles = []
+    for api in apis:
+        profile = LoadProfile(args.mode, args.concurrency, args.rate, args.max_in_flight)
+        for pattern, settings in overrides.items():
+            if matches(api, pattern):
+                profile = dataclasses.replace(profile, **settings)
+        profiles.append(profile)
+
+    if args.dry_run:
+        for builder in builders:
+            sample = json.dumps(builder.next(), ensure_ascii=False, default=lambda value: f"<{len(value)} bytes>")
+            print(f"{describe_api(builder.api)}\n    {sample}")
+        return 0
+
+    print(f"🚀 Load testing {args.url}: {len(apis)} endpoints for {args.duration:g}s")
+    try:
+        stats = asyncio.run(run_load(
+            args.url, builders, profiles, args.duration,
+            timeout=args.timeout, headers=dict(args.header), cookies=dict(args.cookie),
+        ))
+    except KeyboardInterrupt:
+        print("\n👋 Interrupted")
+        return 130
+    print()
+    for line in format_report(stats):
+        print(line)
+    if factory.unmatched_patterns:
+        print(f"\n⚠️  Could not generate values matching [RegularExpression] for: {', '.join(sorted(factory.unmatched_patterns))}")
+    if args.json:
+        args.json.write_text(json.dumps(stats_to_dict(stats), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"\n💾 Results written to {args.json}")
+    return 0
@@ -0,0 +1,84 @@
+"""
+HDR 形式のレイテンシヒストグラム
+
+HdrHistogram と同じく、2^k ごとの区間を同じ数のサブバケットに等分して数える。
+どの値も相対誤差 10^-significant_figures 以内で記録でき、件数が増えてもメモリはバケット数で頭打ちになる。
+値はマイクロ秒の整数で記録する。
+"""
+
+import math
+from typing import Dict, Iterable, List, Tuple
+
+
+class LatencyHistogram:
+    def __init__(self, significant_figures: int = 3):
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5")
+        self.significant_figures = significant_figures
+        # 2 * 10^sf 以上の 2 の累乗個のサブバケット（sf=3 → 2048）
+        self._sub_bits = (2 * 10 ** significant_figures - 1).bit_length()
+        self._half_bits = self._sub_bits - 1
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self.min = 0
+        self.max = 0
+        self._sum = 0
+
+    def _index(self, value: int) -> int:
+        bucket = max(0, value.bit_length() - self._sub_bits)
+        return (bucket << self._half_bits) + (value >> bucket)
+
+    def _range(self, index: int) -> Tuple[int, int]:
+        """バケットに入る値の範囲 [lowest, highest]"""
+        bucket = max(0, (index >> self._half_bits) - 1)
+        lowest = (index - (bucket << self._half_bits)) << bucket
+        return lowest, lowest + (1 << bucket) - 1
+
+    def record(self, value_us: int, count: int = 1) -> None:
+        value_us = max(0, int(value_us))
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + count
+        if self.total == 0 or value_us < self.min:
+            self.min = value_us
+        if value_us > self.max:
+            self.max = value_us
+        self.total += count
+        self._sum += value_us * count
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.significant_figures != self.significant_figures:
+            raise ValueError("cannot merge histograms with different precision")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        if other.total:
+            self.min = other.min if self.total == 0 else min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        self.total += other.total
+        self._sum += other._sum
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.total if self.total else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """percent パーセンタイル（その順位の値が入るバケットの上限。max は超えない）"""
+        return self.percentiles([percent])[0][1]
+
+    def percentiles(self, percents: Iterable[float]) -> List[Tuple[float, int]]:
+        """複数のパーセンタイルを1回の走査で求める（percents は昇順）"""
+        percents = list(percents)
+        result: List[Tuple[float, int]] = []
+        if not self.total:
+            return [(p, 0) for p in percents]
+        ranks = [(p, max(1, math.ceil(self.total * p / 100))) for p in percents]
+        seen = 0
+        pending = iter(ranks)
+        current = next(pending, None)
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            while current is not None and seen >= current[1]:
+                result.append((current[0], min(self._range(index)[1], self.max)))
+                current = next(pending, None)
+            if current is None:
+                break
+        return result
@@ -0,0 +1,226 @@
+"""
+DTO の定義からリクエストのペイロードを作る
+
+[MaxLength] / [MinLength] / [StringLength] / [Range] / [EmailAddress] / [RegularExpression] などの検証属性と、
+ValueObject の ID 型（Guid → UUID 文字列、int → 整数）に従った値を作るので、
+バリデーションで 400 にならないリクエストを送れる。キーは JSON と同じ camelCase。
+seed を指定すると毎回同じペイロード列になる。
+"""
+
+import ast
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from models import CSharpClass, CSharpProperty, ValidationRule
+from helpers import TypeRef, parse_csharp_type
+from helpers.csharp_types import ARRAY, DICTIONARY_TYPES, LIST_TYPES, PRIMITIVE_TYPES
+from ..protocols.http import EndpointEntity, EndpointType
+
+# [Range(0, int.MaxValue)] などの定数
+_NUMERIC_CONSTANTS = {
+    "int.MaxValue": 2 ** 31 - 1, "int.MinValue": -2 ** 31,
+    "long.MaxValue": 2 ** 63 - 1, "long.MinValue": -2 ** 63,
+    "double.MaxValue": 1.7976931348623157e308, "double.MinValue": -1.7976931348623157e308,
+}
+_FLOAT_TYPES = frozenset({"float", "double", "decimal", "Single", "Double", "Decimal"})
+_DATE_TYPES = frozenset({"DateTime", "DateTimeOffset", "DateOnly"})
+_ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+# 制約がないときの文字列の長さ・コレクションの要素数・整数の範囲
+DEFAULT_STRING_LENGTH = (8, 24)
+DEFAULT_COLLECTION_SIZE = (1, 3)
+DEFAULT_INT_RANGE = (1, 100)
+# [RegularExpression] に合う文字列を探す回数
+_PATTERN_ATTEMPTS = 50
+
+
+def _csharp_literal(argument: str) -> Optional[str]:
+    """C# の文字列リテラル（"..." / @"..."）の中身"""
+    if argument.startswith('@"') and argument.endswith('"'):
+        return argument[2:-1].replace('""', '"')
+    if argument.startswith('"') and argument.endswith('"'):
+        try:
+            return ast.literal_eval(argument)
+        except (ValueError, SyntaxError):
+            return argument[1:-1]
+    return None
+
+
+def _csharp_number(argument: str) -> Optional[float]:
+    argument = argument.strip()
+    if argument in _NUMERIC_CONSTANTS:
+        return _NUMERIC_CONSTANTS[argument]
+    try:
+        return float(argument.rstrip("dDfFmMlLuU"))
+    except ValueError:
+        return None
+
+
+class Constraints:
+    """1つのプロパティの検証属性を解釈したもの"""
+
+    __slots__ = ("min_length", "max_length", "minimum", "maximum", "email", "url", "phone", "pattern")
+
+    def __init__(self, rules: Iterable[ValidationRule] = ()):
+        self.min_length: Optional[int] = None
+        self.max_length: Optional[int] = None
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+        self.email = self.url = self.phone = False
+        self.pattern: Optional["re.Pattern[str]"] = None
+        for rule in rules:
+            numbers = [_csharp_number(arg) for arg in rule.arguments]
+            if rule.name == "Required":
+                self.min_length = max(self.min_length or 0, 1)
+            elif rule.name == "MinLength" and numbers and numbers[0] is not None:
+                self.min_length = max(self.min_length or 0, int(numbers[0]))
+            elif rule.name in ("MaxLength", "StringLength") and numbers and numbers[0] is not None:
+                self.max_length = int(numbers[0])
+            elif rule.name == "Range" and len(numbers) >= 2:
+                self.minimum, self.maximum = numbers[0], numbers[1]
+            elif rule.name == "EmailAddress":
+                self.email = True
+            elif rule.name == "Url":
+                self.url = True
+            elif rule.name == "Phone":
+                self.phone = True
+            elif rule.name == "RegularExpression" and rule.arguments:
+                literal = _csharp_literal(rule.arguments[0])
+                try:
+                    self.pattern = re.compile(literal) if literal is not None else None
+                except re.error:
+                    self.pattern = None
+
+    def length_range(self, default: Tuple[int, int]) -> Tuple[int, int]:
+        low, high = default
+        if self.min_length is not None:
+            low = max(low, self.min_length) if self.max_length is None else self.min_length
+        if self.max_length is not None:
+            high = min(high, self.max_length)
+            low = min(low, high)
+        return low, max(low, high)
+
+
+class PayloadFactory:
+    """
+    DTO のクラス名からペイロード（JSON に変換できる dict）を作る
+
+    id_range: int の ValueObject（記事 ID など）に使う範囲。既存のデータに当たるよう、ローカルのデータに合わせて指定する。
+    items: 一番外側のコレクション（GetArticlesResponse.Articles など）の要素数。None なら DEFAULT_COLLECTION_SIZE の範囲で決める。
+    """
+
+    def __init__(
+        self,
+        class_map: Dict[str, CSharpClass],
+        value_object_types: Dict[str, str],
+        seed: Optional[int] = None,
+        id_range: Tuple[int, int] = (1, 100),
+        max_depth: int = 3,
+        items: Optional[int] = None,
+    ):
+        import random
+
+        self.class_map = class_map
+        self.value_object_types = value_object_types
+        self.random = random.Random(seed)
+        self.id_range = id_range
+        self.max_depth = max_depth
+        self.items = items
+        self.unmatched_patterns: set = set()  # [RegularExpression] に合う値を作れなかったプロパティ
+        self._constraints: Dict[Tuple[str, str], Constraints] = {}
+        self._serial = 0
+
+    def reseed(self, key: Any) -> None:
+        """key ごとに決まった値の列にする（同じ key なら同じペイロードになる）"""
+        self.random.seed(key)
+        self._serial = 0
+
+    def build(self, class_name: str, depth: int = 0) -> Optional[Dict[str, Any]]:
+        cls = self.class_map.get(class_name)
+        if cls is None or depth > self.max_depth:
+            return None
+        return {
+            prop.name[:1].lower() + prop.name[1:]: self.property_value(cls.name, prop, depth)
+            for prop in cls.properties
+        }
+
+    def property_value(self, class_name: str, prop: CSharpProperty, depth: int = 0) -> Any:
+        key = (class_name, prop.name)
+        constraints = self._constraints.get(key)
+        if constraints is None:
+            constraints = self._constraints[key] = Constraints(prop.validation)
+        return self.value(parse_csharp_type(prop.type), constraints, depth, f"{class_name}.{prop.name}")
+
+    def value(self, ref: TypeRef, constraints: Constraints, depth: int = 0, label: str = "") -> Any:
+        """型 ref の値。コレクションなら長さの制約は要素数に適用する（depth は外側の DTO の数）"""
+        simple_name = ref.name.rsplit(".", 1)[-1]
+        if ref.name == ARRAY or (simple_name in LIST_TYPES and len(ref.args) == 1):
+            default = (self.items, self.items) if self.items is not None and depth == 0 else DEFAULT_COLLECTION_SIZE
+            low, high = constraints.length_range(default)
+            element = Constraints()
+            return [self.value(ref.args[0], element, depth, label) for _ in range(self.random.randint(low, high))]
+        if simple_name in DICTIONARY_TYPES:
+            return {}
+        if ref.args:
+            return None
+
+        if ref.name in self.value_object_types:
+            return self.identifier(self.value_object_types[ref.name])
+        if ref.name in self.class_map:
+            return self.build(ref.name, depth + 1)
+        if simple_name in ("bool", "Boolean"):
+            return self.random.random() < 0.5
+        if simple_name in ("Guid",):
+            return self._uuid()
+        if simple_name in _DATE_TYPES:
+            moment = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=self.random.randrange(365 * 86400))
+            return moment.date().isoformat() if simple_name == "DateOnly" else moment.isoformat().replace("+00:00", "Z")
+        if simple_name in PRIMITIVE_TYPES and PRIMITIVE_TYPES[simple_name] == "number":
+            return self._number(constraints, simple_name in _FLOAT_TYPES)
+        if simple_name in PRIMITIVE_TYPES:
+            return self._string(constraints, label)
+        # パースしていない型（enum など）は既定値にする
+        return 0
+
+    def identifier(self, ts_type: str) -> Any:
+        """ValueObject の ID（Guid 型なら UUID 文字列、int 型なら id_range の整数）"""
+        return self._uuid() if ts_type == "string" else self.random.randint(*self.id_range)
+
+    def path_value(self, entity: EndpointEntity) -> Any:
+        """DTO に対応するプロパティがないパスパラメータの値"""
+        if entity.type == EndpointType.NUMBER:
+            return self.random.randint(*self.id_range)
+        # 文字列の {id} / {xxxId} は Guid の ValueObject
+        if entity.name == "id" or entity.name.endswith("Id"):
+            return self._uuid()
+        return self._string(Constraints(), entity.name)
+
+    def _uuid(self) -> str:
+        return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    def _number(self, constraints: Constraints, is_float: bool) -> Any:
+        low = constraints.minimum if constraints.minimum is not None else DEFAULT_INT_RANGE[0]
+        high = constraints.maximum if constraints.maximum is not None else max(low, DEFAULT_INT_RANGE[1])
+        if is_float:
+            return round(self.random.uniform(low, high), 3)
+        # int.MaxValue まで許す範囲でも、大きすぎない値にする
+        high = min(int(high), int(low) + 10_000)
+        return self.random.randint(int(low), high)
+
+    def _string(self, constraints: Constraints, label: str) -> str:
+        self._serial += 1
+        low, high = constraints.length_range(DEFAULT_STRING_LENGTH)
+        if constraints.email:
+            local = f"load{self._serial}"
+            return f"{local}@example.com"[:high] if high >= len(local) + 12 else f"{local}@ex.jp"
+        if constraints.url:
+            return f"https://example.com/{self._serial}"
+        if constraints.phone:
+            return "090" + "".join(self.random.choices("0123456789", k=8))
+        for _ in range(_PATTERN_ATTEMPTS if constraints.pattern else 1):
+            text = "".join(self.random.choices(_ALPHABET, k=self.random.randint(low, high)))
+            if constraints.pattern is None or constraints.pattern.fullmatch(text):
+                return text
+        self.unmatched_patterns.add(label)
+        return text
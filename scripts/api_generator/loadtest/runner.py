@@ -0,0 +1,286 @@
+"""
+エンドポイントごとの負荷をかけて、スループットとレイテンシを測る
+
+- closed loop: concurrency 個のワーカーが、レスポンスを受け取るたびに次のリクエストを送る（同時実行数を固定）
+- open loop: 応答を待たずに rate 件/秒の一定間隔でリクエストを送る（到着率を固定）。
+  レイテンシは予定した送信時刻から測るので、サーバーが詰まって送信が遅れた分も含まれる（coordinated omission の補正）。
+  応答待ちが max_in_flight 件に達している間に来た送信予定は送らずに dropped として数える。
+
+HTTP の送受信は Python クライアントのランタイム（api_generator/client/python/runtime.py）を使う。
+"""
+
+import asyncio
+import fnmatch
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+from helpers import SymbolIndex
+from ..client.python.runtime import BaseClient
+from ..protocols.diff import describe_api
+from ..protocols.http import HttpApi, HttpMethod
+from .histogram import LatencyHistogram
+from .payload import PayloadFactory
+
+MODES = ["closed", "open"]
+REPORT_PERCENTILES = [50, 90, 99, 99.9]
+# form-file エンドポイントに送るダミーのファイル
+_UPLOAD = ("load.bin", bytes(256), "application/octet-stream")
+
+
+@dataclass
+class LoadProfile:
+    """1つのエンドポイントにかける負荷"""
+    mode: str = "closed"
+    concurrency: int = 4     # closed: 同時に送るリクエスト数
+    rate: float = 10.0       # open: 1秒あたりのリクエスト数
+    max_in_flight: int = 256  # open: 応答待ちの上限
+
+
+@dataclass
+class EndpointStats:
+    name: str
+    profile: LoadProfile
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+    dropped: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values()) + sum(self.errors.values())
+
+    @property
+    def ok(self) -> int:
+        return sum(count for status, count in self.statuses.items() if 200 <= status < 300)
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+
+class RequestBuilder:
+    """1つのエンドポイントの、送るたびに変わるリクエスト（パス・クエリ・ボディ）を作る"""
+
+    def __init__(self, api: HttpApi, factory: PayloadFactory, index: SymbolIndex):
+        self.api = api
+        self.factory = factory
+        request = api.request
+        payload = request.body or request.query or request.path if request else None
+        self.request_type = payload.type_name if payload else None
+        self.send_body = bool(request and request.body)
+        self.path_params = api.endpoint.path_params()
+        # パスパラメータ → ペイロードのキー（{id} → articleId など）
+        self.path_keys = {
+            entity.name: index.resolve_path_param(entity.name, self.request_type) for entity in self.path_params
+        }
+
+    def next(self) -> Dict[str, Any]:
+        """BaseClient.send() に渡す引数"""
+        data = self.factory.build(self.request_type) if self.request_type else None
+        segments = []
+        for entity in self.api.endpoint.entities:
+            if entity.type is None:
+                segments.append(entity.name)
+                continue
+            key = self.path_keys[entity.name]
+            value = data.get(key) if data and key in data else self.factory.path_value(entity)
+            segments.append(quote(str(value), safe=""))
+        request: Dict[str, Any] = {"method": self.api.method.value, "path": "/" + "/".join(segments)}
+        if self.api.is_form_file:
+            request["files"] = {self.api.form_file_param: _UPLOAD}
+        elif data is not None:
+            if self.api.method == HttpMethod.GET:
+                # パスに埋め込んだ項目以外はクエリ文字列で送る
+                path_keys = set(self.path_keys.values())
+                request["params"] = {key: value for key, value in data.items() if key not in path_keys}
+            elif self.send_body:
+                request["body"] = data
+        return request
+
+
+def api_names(api: HttpApi) -> Tuple[str, str]:
+    """パターンで指定するときのエンドポイントの名前（"articles.GetArticles" と "GET /api/articles"）"""
+    return f"{api.controller_name}.{api.function_name}", f"{api.method.value} {api.endpoint.to_path_string()}"
+
+
+def matches(api: HttpApi, pattern: str) -> bool:
+    return any(fnmatch.fnmatchcase(name, pattern) for name in api_names(api))
+
+
+def select_apis(apis: Sequence[HttpApi], patterns: Sequence[str], include_mutations: bool) -> List[HttpApi]:
+    """
+    patterns（"articles.GetArticles" / "articles.*" / "GET /api/articles*" などの glob）に合うエンドポイント
+
+    patterns を指定しない場合は全エンドポイント。include_mutations でなければ GET 以外は除く。
+    """
+    return [
+        api for api in apis
+        if (api.method == HttpMethod.GET or include_mutations)
+        and (not patterns or any(matches(api, pattern) for pattern in patterns))
+    ]
+
+
+async def _send(client: BaseClient, builder: RequestBuilder, stats: EndpointStats, started: float) -> None:
+    request = builder.next()
+    try:
+        response = await client.send(request.pop("method"), request.pop("path"), **request)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        stats.errors[type(e).__name__] += 1
+        return
+    stats.statuses[response.status] += 1
+    stats.histogram.record((time.perf_counter() - started) * 1_000_000)
+
+
+async def _closed_loop(client: BaseClient, builder: RequestBuilder, stats: EndpointStats, deadline: float) -> None:
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            await _send(client, builder, stats, time.perf_counter())
+
+    await asyncio.gather(*(worker() for _ in range(stats.profile.concurrency)))
+
+
+async def _open_loop(client: BaseClient, builder: RequestBuilder, stats: EndpointStats, deadline: float) -> None:
+    interval = 1.0 / stats.profile.rate
+    in_flight: set = set()
+    start = time.perf_counter()
+    sent = 0
+    while True:
+        scheduled = start + sent * interval
+        if scheduled >= deadline:
+            break
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        sent += 1
+        if len(in_flight) >= stats.profile.max_in_flight:
+            stats.dropped += 1
+            continue
+        task = asyncio.create_task(_send(client, builder, stats, scheduled))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+    if in_flight:
+        await asyncio.gather(*in_flight)
+
+
+async def _run_endpoint(
+    base_url: str,
+    builder: RequestBuilder,
+    stats: EndpointStats,
+    duration: float,
+    client_options: Dict[str, Any],
+    cookies: Dict[str, str],
+) -> None:
+    profile = stats.profile
+    connections = profile.concurrency if profile.mode == "closed" else profile.max_in_flight
+    async with BaseClient(base_url, max_connections=connections, **client_options) as client:
+        for name, value in cookies.items():
+            client.set_cookie(name, value)
+        start = time.perf_counter()
+        loop = _closed_loop if profile.mode == "closed" else _open_loop
+        await loop(client, builder, stats, start + duration)
+        stats.elapsed = time.perf_counter() - start
+
+
+async def run_load(
+    base_url: str,
+    builders: Sequence[RequestBuilder],
+    profiles: Sequence[LoadProfile],
+    duration: float,
+    *,
+    timeout: Optional[float] = 10.0,
+    headers: Optional[Dict[str, str]] = None,
+    cookies: Optional[Dict[str, str]] = None,
+) -> List[EndpointStats]:
+    """全エンドポイントに同時に負荷をかける（エンドポイントごとに接続プールを分ける）"""
+    stats = [EndpointStats(describe_api(builder.api), profile) for builder, profile in zip(builders, profiles)]
+    client_options = {"timeout": timeout, "headers": headers or {}}
+    await asyncio.gather(*(
+        _run_endpoint(base_url, builder, endpoint_stats, duration, client_options, cookies or {})
+        for builder, endpoint_stats in zip(builders, stats)
+    ))
+    return stats
+
+
+# --- レポート ---
+
+def _format_us(value: int) -> str:
+    if value >= 1_000_000:
+        return f"{value / 1_000_000:.2f}s"
+    if value >= 1_000:
+        return f"{value / 1_000:.1f}ms"
+    return f"{value}µs"
+
+
+def _describe_profile(profile: LoadProfile) -> str:
+    if profile.mode == "closed":
+        return f"closed ×{profile.concurrency}"
+    return f"open {profile.rate:g}/s"
+
+
+def total_stats(stats: Sequence[EndpointStats]) -> EndpointStats:
+    total = EndpointStats("TOTAL", LoadProfile())
+    for endpoint in stats:
+        total.histogram.merge(endpoint.histogram)
+        total.statuses.update(endpoint.statuses)
+        total.errors.update(endpoint.errors)
+        total.dropped += endpoint.dropped
+        total.elapsed = max(total.elapsed, endpoint.elapsed)
+    return total
+
+
+def format_report(stats: Sequence[EndpointStats]) -> Iterator[str]:
+    """エンドポイントごとのスループット・成功率・レイテンシのパーセンタイルの表"""
+    header = ["endpoint", "load", "reqs", "req/s", "2xx%"] + [f"p{p:g}" for p in REPORT_PERCENTILES] + ["max"]
+    rows = []
+    for endpoint in [*stats, total_stats(stats)]:
+        percentiles = endpoint.histogram.percentiles(REPORT_PERCENTILES)
+        rows.append([
+            endpoint.name,
+            "" if endpoint.name == "TOTAL" else _describe_profile(endpoint.profile),
+            str(endpoint.requests),
+            f"{endpoint.throughput:.1f}",
+            f"{endpoint.ok * 100 / endpoint.requests:.1f}" if endpoint.requests else "-",
+            *(_format_us(value) for _, value in percentiles),
+            _format_us(endpoint.histogram.max),
+        ])
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    yield "  ".join(cell.ljust(widths[0]) if i == 0 else cell.rjust(widths[i]) for i, cell in enumerate(header))
+    for endpoint, row in zip([*stats, None], rows):
+        yield "  ".join(cell.ljust(widths[0]) if i == 0 else cell.rjust(widths[i]) for i, cell in enumerate(row))
+        if endpoint is None:
+            continue
+        details = [f"{status}×{count}" for status, count in sorted(endpoint.statuses.items())]
+        details += [f"{name}×{count}" for name, count in endpoint.errors.most_common()]
+        if endpoint.dropped:
+            details.append(f"dropped×{endpoint.dropped}")
+        if endpoint.ok != endpoint.requests or endpoint.dropped:
+            yield "    " + ", ".join(details)
+
+
+def stats_to_dict(stats: Sequence[EndpointStats]) -> Dict[str, Any]:
+    """--json 用"""
+    def encode(endpoint: EndpointStats) -> Dict[str, Any]:
+        histogram = endpoint.histogram
+        return {
+            "endpoint": endpoint.name,
+            "profile": vars(endpoint.profile) if endpoint.name != "TOTAL" else None,
+            "requests": endpoint.requests,
+            "throughput": round(endpoint.throughput, 3),
+            "statuses": {str(status): count for status, count in sorted(endpoint.statuses.items())},
+            "errors": dict(endpoint.errors),
+            "dropped": endpoint.dropped,
+            "latency_us": {
+                "min": histogram.min,
+                "mean": round(histogram.mean, 1),
+                **{f"p{p:g}": value for p, value in histogram.percentiles(REPORT_PERCENTILES)},
+                "max": histogram.max,
+            },
+        }
+
+    return {"endpoints": [encode(endpoint) for endpoint in stats], "total": encode(total_stats(stats))}
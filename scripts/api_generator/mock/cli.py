@@ -0,0 +1,88 @@
+"""
+mock: パースした API モデルから、バックエンドの代わりになるモックサーバーを起動する
+
+すべてのエンドポイントに、レスポンス DTO の形をした決まったペイロードを返す。
+DB もバックエンドも要らないので、フロントエンドのレンダリング・ハイドレーションの性能を単独で測れる。
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+from pathlib import Path
+from typing import Dict, List
+
+from ..cli import ModelLoader, add_model_arguments
+from ..loadtest.payload import PayloadFactory
+from ..loadtest.runner import matches
+from .server import MockServer, Route, RouteProfile
+
+
+def main(argv: List[str], load_model: ModelLoader) -> int:
+    parser = argparse.ArgumentParser(
+        prog='api-generator.py mock',
+        description='Serve a mock backend that answers every parsed endpoint with deterministic DTO-shaped payloads',
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', '-p', type=int, default=5243, help="Port to listen on (default: 5243, the frontend's default API_URL)")
+    parser.add_argument('--items', '-n', type=int, default=20, help='Elements in top-level collections of a response (default: 20)')
+    parser.add_argument('--latency', type=float, default=0.0, metavar='MS', help='Delay before each response in milliseconds (default: 0)')
+    parser.add_argument('--jitter', type=float, default=0.0, metavar='MS', help='Random extra delay of up to MS milliseconds (default: 0)')
+    parser.add_argument('--profile', type=Path, metavar='FILE',
+                        help='JSON file of per-endpoint settings: {"PATTERN": {"items": 100, "latency": 200, "jitter": 50}, ...} '
+                             '(patterns are globs over "controller.Function" or "METHOD /path")')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for payloads; the same seed and URL always give the same response (default: 0)')
+    parser.add_argument('--id-range', default='1:100', metavar='MIN:MAX', help='Range for int-backed ValueObject IDs (default: 1:100)')
+    parser.add_argument('--routes', action='store_true', help='Print the routes with their settings and exit')
+    add_model_arguments(parser, 'Show parsing progress and log every request')
+    args = parser.parse_args(argv)
+
+    try:
+        low, high = (int(part) for part in args.id_range.split(':'))
+    except ValueError:
+        parser.error(f"--id-range: expected MIN:MAX, got {args.id_range!r}")
+    overrides: Dict[str, Dict] = {}
+    if args.profile:
+        try:
+            overrides = json.loads(args.profile.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            parser.error(f"--profile: {e}")
+
+    loaded = load_model(args)
+    if loaded is None:
+        return 2
+    resolved, value_object_types = loaded
+
+    routes = []
+    for api in resolved.apis:
+        profile = RouteProfile(args.items, args.latency, args.jitter)
+        for pattern, settings in overrides.items():
+            if matches(api, pattern):
+                profile = dataclasses.replace(profile, **settings)
+        routes.append(Route(api, resolved.index, profile))
+    unused = [pattern for pattern in overrides if not any(matches(route.api, pattern) for route in routes)]
+    if unused:
+        print(f"⚠️  No endpoints matched: {', '.join(unused)}")
+
+    if args.routes:
+        for route in routes:
+            profile = route.profile
+            delay = f"{profile.latency:g}" + (f"+{profile.jitter:g}" if profile.jitter else "")
+            print(f"{route.name}  items={profile.items} latency={delay}ms")
+        return 0
+
+    factory = PayloadFactory(resolved.class_map, value_object_types, id_range=(low, high))
+    server = MockServer(routes, factory, seed=args.seed, verbose=args.verbose)
+    print(f"🎭 Mock backend for {len(routes)} endpoints on http://{args.host}:{args.port} (Ctrl+C to stop)")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"❌ {e}")
+        return 1
+    total = sum(server.requests.values())
+    print(f"\n👋 Served {total} requests")
+    for name, count in server.requests.most_common(10):
+        print(f"   {count:>6}  {name}")
+    return 0
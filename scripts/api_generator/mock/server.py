@@ -0,0 +1,203 @@
+"""
+API モデルから作るモックバックエンド（asyncio の HTTP/1.1 サーバー）
+
+パースしたすべてのエンドポイントに、レスポンス DTO の形をしたペイロードを返す。
+ペイロードは loadtest と同じ PayloadFactory で作り、乱数の seed を「seed + メソッド + パス + クエリ」から決めるので、
+同じリクエストには毎回同じレスポンスを返す（作ったレスポンスは LRU キャッシュに残す）。
+一番外側のコレクションの要素数（GetArticlesResponse の ArticleDto の数など）と、応答までの遅延はエンドポイントごとに指定できる。
+認証やリクエストの検証はしない。
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import unquote
+
+from helpers import SymbolIndex, TypeRef, parse_csharp_type
+from ..loadtest.payload import Constraints, PayloadFactory
+from ..protocols.diff import describe_api
+from ..protocols.http import EndpointEntity, EndpointType, HttpApi
+
+# 作ったレスポンスを残しておく件数
+CACHE_SIZE = 4096
+_REASONS = {200: "OK", 204: "No Content", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+@dataclass
+class RouteProfile:
+    """1つのエンドポイントのレスポンスの大きさと遅延"""
+    items: int = 20          # 一番外側のコレクションの要素数
+    latency: float = 0.0     # 応答までの遅延（ミリ秒）
+    jitter: float = 0.0      # latency に足すランダムな遅延の上限（ミリ秒）
+
+
+class Route:
+    __slots__ = ("api", "name", "segments", "params", "path_keys", "response", "profile")
+
+    def __init__(self, api: HttpApi, index: SymbolIndex, profile: RouteProfile):
+        self.api = api
+        self.name = describe_api(api)
+        # パスパラメータの位置は None
+        self.segments = tuple(None if entity.type else entity.name for entity in api.endpoint.entities)
+        self.params: List[Tuple[int, EndpointEntity]] = [
+            (position, entity) for position, entity in enumerate(api.endpoint.entities) if entity.type
+        ]
+        request = api.request
+        payload = request.body or request.query or request.path if request else None
+        request_type = payload.type_name if payload else None
+        # レスポンスに同じ値を入れるキー（{id} → id / articleId）
+        self.path_keys = {
+            entity.name: {entity.name, index.resolve_path_param(entity.name, request_type)} for _, entity in self.params
+        }
+        response = api.response.payload if api.response else None
+        self.response: Optional[TypeRef] = parse_csharp_type(response.type_name) if response else None
+        self.profile = profile
+
+    def match(self, segments: Sequence[str]) -> Optional[Dict[str, str]]:
+        """パスが合えばパスパラメータの値を返す"""
+        for expected, actual in zip(self.segments, segments):
+            if expected is not None and expected != actual:
+                return None
+        values = {entity.name: unquote(segments[position]) for position, entity in self.params}
+        for _, entity in self.params:
+            if entity.type == EndpointType.NUMBER and not values[entity.name].lstrip("-").isdigit():
+                return None
+        return values
+
+
+class Router:
+    def __init__(self, routes: Sequence[Route]):
+        self._routes: Dict[Tuple[str, int], List[Route]] = {}
+        # /api/articles/my を /api/articles/{id} より先に試す
+        for route in sorted(routes, key=lambda r: len(r.params)):
+            self._routes.setdefault((route.api.method.value, len(route.segments)), []).append(route)
+
+    def resolve(self, method: str, path: str) -> Tuple[Optional[Route], Dict[str, str], bool]:
+        """(ルート, パスパラメータ, パスは合うがメソッドが違うか)"""
+        segments = [segment for segment in path.split("/") if segment]
+        for route in self._routes.get((method, len(segments)), ()):
+            values = route.match(segments)
+            if values is not None:
+                return route, values, False
+        other_method = any(
+            route.match(segments) is not None
+            for (other, length), routes in self._routes.items() if other != method and length == len(segments)
+            for route in routes
+        )
+        return None, {}, other_method
+
+
+class MockServer:
+    def __init__(self, routes: Sequence[Route], factory: PayloadFactory, seed: int = 0, verbose: bool = False):
+        self.router = Router(routes)
+        self.factory = factory
+        self.seed = seed
+        self.verbose = verbose
+        self.requests: Counter = Counter()
+        self._jitter = random.Random(seed)
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def payload(self, route: Route, target: str, values: Dict[str, str]) -> bytes:
+        """レスポンスのボディ（同じ target には同じバイト列）"""
+        key = f"{self.seed}:{route.api.method.value} {target}:{route.profile.items}"
+        body = self._cache.get(key)
+        if body is not None:
+            self._cache.move_to_end(key)
+            return body
+        self.factory.reseed(key)
+        self.factory.items = route.profile.items
+        ref = route.response
+        # DTO ならそのプロパティのコレクション、List<DTO> ならそのリストが items 件になる
+        data: Any = (
+            self.factory.build(ref.name) if ref.name in self.factory.class_map and not ref.args
+            else self.factory.value(ref, Constraints())
+        )
+        if isinstance(data, dict):
+            for _, entity in route.params:
+                value: Any = values[entity.name]
+                if entity.type == EndpointType.NUMBER:
+                    value = int(value)
+                for key_name in route.path_keys[entity.name] & data.keys():
+                    data[key_name] = value
+        body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self._cache[key] = body
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return body
+
+    async def respond(self, method: str, target: str) -> Tuple[int, bytes, Optional[Route]]:
+        path = target.partition("?")[0]
+        route, values, other_method = self.router.resolve(method, path)
+        if route is None:
+            status = 405 if other_method else 404
+            return status, json.dumps({"message": _REASONS[status]}).encode("utf-8"), None
+        profile = route.profile
+        delay = profile.latency + (self._jitter.uniform(0, profile.jitter) if profile.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if route.response is None:
+            return 204, b"", route
+        return 200, self.payload(route, target, values), route
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    return
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, target, version = request_line.split(" ", 2)
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+                await _read_body(reader, headers)
+
+                started = time.perf_counter()
+                status, body, route = await self.respond(method, target)
+                self.requests[route.name if route else f"{status} {method} {target.partition('?')[0]}"] += 1
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+
+                lines = [f"HTTP/1.1 {status} {_REASONS[status]}", f"Content-Length: {len(body)}"]
+                if body:
+                    lines.append("Content-Type: application/json; charset=utf-8")
+                if not keep_alive:
+                    lines.append("Connection: close")
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+                await writer.drain()
+                if self.verbose:
+                    print(f"   {status} {method} {target} ({len(body)} bytes, {(time.perf_counter() - started) * 1000:.1f} ms)")
+                if not keep_alive:
+                    return
+        except (ConnectionError, ValueError, asyncio.LimitOverrunError):
+            return
+        finally:
+            writer.close()
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: Dict[str, str]) -> bytes:
+    """リクエストのボディ（内容は使わないが、次のリクエストを読むために読み捨てる）"""
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            if size == 0:
+                while await reader.readuntil(b"\r\n") != b"\r\n":
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+    length = int(headers.get("content-length", "0") or 0)
+    return await reader.readexactly(length) if length else b""
@@ -0,0 +1,58 @@
+"""
+diff <rev-a> [<rev-b>]: 2つのリビジョンの API モデル（エンドポイント・DTO のフィールド）を比較する
+
+どちらのリビジョンもチェックアウトせず、1つの git cat-file --batch プロセスから読む。
+rev-b を省略すると作業ツリーと比較する。
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from helpers import FileSystemSource, GitBlobReader, GitSource, SourceError
+from .diff import diff_models, format_diff
+
+
+def main(
+    argv: List[str],
+    load_source: Callable[[FileSystemSource], Tuple[Any, Dict[str, str]]],
+    backend_root: Path,
+) -> int:
+    """load_source は source（GitSource など）をパースして (ResolvedModel, ValueObject 型) を返す"""
+    parser = argparse.ArgumentParser(
+        prog='api-generator.py diff',
+        description='Compare the API models (endpoints and DTO fields) of two git revisions without a checkout or worktree',
+    )
+    parser.add_argument('rev_a', metavar='REV_A', help='Base revision (branch, tag or commit)')
+    parser.add_argument('rev_b', metavar='REV_B', nargs='?', help='Revision to compare with REV_A (default: the working tree)')
+    parser.add_argument('--exit-code', action='store_true', help='Exit with 1 if the API models differ')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Show parsing progress')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    models = []
+    reader = GitBlobReader()
+    try:
+        for rev in (args.rev_a, args.rev_b):
+            source = GitSource(rev, [backend_root], reader=reader) if rev else FileSystemSource()
+            # パースの進捗表示は差分の邪魔になるので捨てる（--verbose なら表示する）
+            with source, contextlib.redirect_stdout(sys.stdout if args.verbose else io.StringIO()):
+                resolved, value_object_types = load_source(source)
+            models.append((source.label, resolved, value_object_types))
+    except SourceError as e:
+        print(f"❌ {e}")
+        return 2
+    finally:
+        reader.close()
+
+    (old_label, old, old_vo), (new_label, new, new_vo) = models
+    diff = diff_models(old.apis, old.classes, new.apis, new.classes, old_vo, new_vo)
+    print(f"🔀 API diff: {old_label} → {new_label}\n")
+    for line in format_diff(diff):
+        print(line)
+    print(f"\n⏱️  {(time.perf_counter() - start) * 1000:.0f} ms")
+    return 1 if args.exit_code and not diff.empty else 0
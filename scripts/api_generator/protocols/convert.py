@@ -0,0 +1,65 @@
+"""
+EndpointInfo（helpers.csharp_parser / templates/*）と HttpApi の相互変換
+
+パース結果は HttpApi に変換して保持し、templates/* には EndpointInfo として渡す。
+endpoint_info_to_http_api → http_api_to_endpoint_info で元の EndpointInfo に戻る。
+"""
+
+from models import EndpointInfo
+from .http import Endpoint, HttpApi, HttpHeader, HttpMethod, HttpPayload, HttpRequest, HttpResponse
+
+
+def endpoint_info_to_http_api(ep: EndpointInfo) -> HttpApi:
+    """
+    EndpointInfo を HttpApi に変換する
+
+    Request DTO は [FromBody] なら body、GET なら query、
+    それ以外（パスパラメータから組み立てるもの）は path に入れる。
+    """
+    request = None
+    if ep.request_type or ep.is_form_file:
+        payload = HttpPayload(type_name=ep.request_type) if ep.request_type else None
+        request = HttpRequest(
+            body=payload if ep.has_body_param else None,
+            query=payload if not ep.has_body_param and ep.method == "GET" else None,
+            path=payload if not ep.has_body_param and ep.method != "GET" else None,
+            header=HttpHeader(content_type="multipart/form-data") if ep.is_form_file else HttpHeader(),
+        )
+
+    response_type = ep.response_type
+    return HttpApi(
+        method=HttpMethod(ep.method),
+        endpoint=Endpoint.from_path_string(ep.path),
+        function_name=ep.function_name,
+        controller_name=ep.controller_name,
+        request=request,
+        response=HttpResponse(
+            payload=HttpPayload(type_name=response_type) if response_type and response_type != "void" else None,
+        ),
+        is_form_file=ep.is_form_file,
+        form_file_param=ep.form_file_param,
+        auth=ep.auth,
+        invalidates=ep.invalidates,
+        invalidates_only=ep.invalidates_only,
+    )
+
+
+def http_api_to_endpoint_info(api: HttpApi) -> EndpointInfo:
+    """HttpApi を templates/* が使う EndpointInfo に変換する"""
+    request = api.request
+    payload = request and (request.body or request.query or request.path)
+    response_payload = api.response.payload if api.response else None
+    return EndpointInfo(
+        method=api.method.value,
+        path=api.endpoint.to_path_string(),
+        function_name=api.function_name,
+        request_type=payload.type_name if payload else None,
+        response_type=response_payload.type_name if response_payload else "void",
+        controller_name=api.controller_name,
+        has_body_param=bool(request and request.body),
+        is_form_file=api.is_form_file,
+        form_file_param=api.form_file_param,
+        auth=api.auth,
+        invalidates=api.invalidates,
+        invalidates_only=api.invalidates_only,
+    )
@@ -0,0 +1,149 @@
+"""
+2つの API モデル（HttpApi リスト + DTO クラス）の差分
+
+エンドポイントは「コントローラー.関数名」で対応づけ、メソッド・パス・Request / Response 型などの変化を、
+DTO はクラス名で対応づけ、プロパティの追加・削除・型や optional の変化を列挙する。
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from models import CSharpClass, CSharpProperty
+from .http import HttpApi
+
+
+@dataclass
+class Change:
+    """1つのエンドポイント / クラスの変更。details は "項目: 旧 → 新" 形式の説明"""
+    name: str
+    details: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ApiDiff:
+    added_endpoints: List[str] = field(default_factory=list)
+    removed_endpoints: List[str] = field(default_factory=list)
+    changed_endpoints: List[Change] = field(default_factory=list)
+    added_types: List[str] = field(default_factory=list)
+    removed_types: List[str] = field(default_factory=list)
+    changed_types: List[Change] = field(default_factory=list)
+    value_object_changes: List[str] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not any((
+            self.added_endpoints, self.removed_endpoints, self.changed_endpoints,
+            self.added_types, self.removed_types, self.changed_types, self.value_object_changes,
+        ))
+
+
+def _api_key(api: HttpApi) -> str:
+    return f"{api.controller_name}.{api.function_name}"
+
+
+def describe_api(api: HttpApi) -> str:
+    """例: GET /api/users/{id} (users.GetUser)"""
+    return f"{api.method.value} {api.endpoint.to_path_string()} ({_api_key(api)})"
+
+
+def _api_fields(api: HttpApi) -> Dict[str, Optional[str]]:
+    """比較する項目 → 値（表示用の文字列）"""
+    request = api.request
+    fields: Dict[str, Optional[str]] = {
+        "method": api.method.value,
+        "path": api.endpoint.to_path_string(),
+        "response": api.response.payload.type_name if api.response and api.response.payload else "void",
+    }
+    for slot in ("body", "query", "path"):
+        payload = getattr(request, slot) if request else None
+        fields[f"request {slot}"] = payload.type_name if payload else None
+    fields["content type"] = request.header.content_type if request else None
+    fields["form file"] = api.form_file_param if api.is_form_file else None
+    fields["auth"] = api.auth
+    fields["invalidates"] = (
+        ", ".join(api.invalidates) + (" (only)" if api.invalidates_only else "") if api.invalidates or api.invalidates_only else None
+    )
+    return fields
+
+
+def _describe_property(prop: CSharpProperty) -> str:
+    return f"{prop.name}{'?' if prop.is_optional else ''}: {prop.type}"
+
+
+def _class_changes(old: CSharpClass, new: CSharpClass) -> List[str]:
+    old_props = {prop.name: prop for prop in old.properties}
+    new_props = {prop.name: prop for prop in new.properties}
+    details = [f"+ {_describe_property(new_props[name])}" for name in new_props if name not in old_props]
+    details += [f"- {_describe_property(old_props[name])}" for name in old_props if name not in new_props]
+    for name in old_props.keys() & new_props.keys():
+        before, after = old_props[name], new_props[name]
+        if (before.type, before.is_optional) != (after.type, after.is_optional):
+            details.append(f"~ {_describe_property(before)} → {_describe_property(after)}")
+    if old.namespace != new.namespace:
+        details.append(f"~ namespace: {old.namespace} → {new.namespace}")
+    return details
+
+
+def diff_models(
+    old_apis: Iterable[HttpApi],
+    old_classes: Iterable[CSharpClass],
+    new_apis: Iterable[HttpApi],
+    new_classes: Iterable[CSharpClass],
+    old_value_objects: Optional[Dict[str, str]] = None,
+    new_value_objects: Optional[Dict[str, str]] = None,
+) -> ApiDiff:
+    """old → new の差分を返す（各リストは名前順）"""
+    diff = ApiDiff()
+
+    old_by_key = {_api_key(api): api for api in old_apis}
+    new_by_key = {_api_key(api): api for api in new_apis}
+    for key in sorted(new_by_key.keys() - old_by_key.keys()):
+        diff.added_endpoints.append(describe_api(new_by_key[key]))
+    for key in sorted(old_by_key.keys() - new_by_key.keys()):
+        diff.removed_endpoints.append(describe_api(old_by_key[key]))
+    for key in sorted(old_by_key.keys() & new_by_key.keys()):
+        before, after = _api_fields(old_by_key[key]), _api_fields(new_by_key[key])
+        details = [
+            f"{name}: {before[name] or '-'} → {after[name] or '-'}"
+            for name in before if before[name] != after[name]
+        ]
+        if details:
+            diff.changed_endpoints.append(Change(describe_api(new_by_key[key]), details))
+
+    old_types = {cls.name: cls for cls in old_classes}
+    new_types = {cls.name: cls for cls in new_classes}
+    diff.added_types = sorted(new_types.keys() - old_types.keys())
+    diff.removed_types = sorted(old_types.keys() - new_types.keys())
+    for name in sorted(old_types.keys() & new_types.keys()):
+        details = _class_changes(old_types[name], new_types[name])
+        if details:
+            diff.changed_types.append(Change(name, details))
+
+    old_vo, new_vo = old_value_objects or {}, new_value_objects or {}
+    for name in sorted(old_vo.keys() | new_vo.keys()):
+        if old_vo.get(name) != new_vo.get(name):
+            diff.value_object_changes.append(f"{name}: {old_vo.get(name) or '-'} → {new_vo.get(name) or '-'}")
+    return diff
+
+
+def _section(title: str, added: List[str], removed: List[str], changed: List[Change]) -> Iterator[str]:
+    if not (added or removed or changed):
+        return
+    yield f"{title}: +{len(added)} -{len(removed)} ~{len(changed)}"
+    yield from (f"  + {name}" for name in added)
+    yield from (f"  - {name}" for name in removed)
+    for change in changed:
+        yield f"  ~ {change.name}"
+        yield from (f"      {detail}" for detail in change.details)
+
+
+def format_diff(diff: ApiDiff) -> Iterator[str]:
+    """差分を表示用の行にする"""
+    if diff.empty:
+        yield "No API changes"
+        return
+    yield from _section("Endpoints", diff.added_endpoints, diff.removed_endpoints, diff.changed_endpoints)
+    yield from _section("Types", diff.added_types, diff.removed_types, diff.changed_types)
+    if diff.value_object_changes:
+        yield f"ValueObjects: ~{len(diff.value_object_changes)}"
+        yield from (f"  ~ {change}" for change in diff.value_object_changes)
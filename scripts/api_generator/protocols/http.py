@@ -1,6 +1,14 @@
+"""
+HTTP API のモデル
+
+CSharpProperty などと同じく（models/types.py）、__slots__ 付きの frozen dataclass にし、名前・型名の文字列は intern する。
+"""
+
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from models import intern_fields
 
 
 class HttpMethod(Enum):
@@ -17,17 +25,23 @@ class EndpointType(Enum):
     NUMBER = "number"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EndpointEntity:
     """URL パスの1セグメント。type が None = 静的セグメント、not None = パスパラメータ"""
     name: str
     type: Optional[EndpointType] = None
 
+    def __post_init__(self):
+        intern_fields(self, "name")
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Endpoint:
     """URL パス全体を構造化して保持する"""
-    entities: List[EndpointEntity]
+    entities: Tuple[EndpointEntity, ...]
+
+    def __post_init__(self):
+        object.__setattr__(self, "entities", tuple(self.entities))
 
     @staticmethod
     def from_path_string(
@@ -60,35 +74,42 @@ class Endpoint:
         return [e for e in self.entities if e.type is not None]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HttpPayload:
     """JSON でやり取りされるボディの型情報"""
     type_name: str
 
+    def __post_init__(self):
+        intern_fields(self, "type_name")
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HttpHeader:
     """HTTP ヘッダー情報"""
     content_type: str = "application/json"
     custom: Dict[str, str] = field(default_factory=dict)
 
+    def __post_init__(self):
+        intern_fields(self, "content_type")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class HttpRequest:
-    """HTTP リクエスト = body (JSON ボディ) or query (クエリ文字列) + Header"""
+    """HTTP リクエスト = body (JSON ボディ) or query (クエリ文字列) or path (パスパラメータ) + Header"""
     body: Optional[HttpPayload] = None    # [FromBody] / POST・PUT・PATCH のボディ
     query: Optional[HttpPayload] = None   # GET クエリ文字列パラメータ
+    path: Optional[HttpPayload] = None    # ボディなしでパスパラメータだけから組み立てる Request DTO
     header: HttpHeader = field(default_factory=HttpHeader)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HttpResponse:
     """HTTP レスポンス = Payload (受信 JSON 型) + Header"""
     payload: Optional[HttpPayload] = None
     header: HttpHeader = field(default_factory=HttpHeader)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HttpApi:
     method: HttpMethod
     endpoint: Endpoint
@@ -98,3 +119,10 @@ class HttpApi:
     response: Optional[HttpResponse] = None
     is_form_file: bool = False
     form_file_param: str = "file"
+    auth: Optional[str] = None   # 認証属性（AllowAnonymous / OptionalAuth / RequireAuth / Authorize）
+    invalidates: Tuple[str, ...] = ()   # [Invalidates(...)] で指定した GET アクションのメソッド名
+    invalidates_only: bool = False
+
+    def __post_init__(self):
+        intern_fields(self, "function_name", "controller_name", "form_file_param", "auth")
+        object.__setattr__(self, "invalidates", tuple(self.invalidates))
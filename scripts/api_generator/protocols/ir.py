@@ -0,0 +1,235 @@
+"""
+パース済み API モデルの中間表現（IR）
+
+HttpApi リスト・DTO クラス・ValueObject マップを、ソースファイル単位で
+バージョン付きのファイルに保存・復元する。JSON と、読み込みの速いバイナリ形式
+（zlib 圧縮した marshal）の2種類を扱う。読み込み時は先頭バイトで形式を判別する。
+
+IR があればバックエンドのソースを読まずにクライアントを再生成できる。
+"""
+
+import json
+import marshal
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from models import CSharpClass, CSharpProperty
+from .http import Endpoint, EndpointType, HttpApi, HttpHeader, HttpMethod, HttpPayload, HttpRequest, HttpResponse
+
+IR_FORMAT = "nari-note-api-ir"
+# 形式を変えたら上げる（古い IR は読み込み時にエラーにする）
+IR_VERSION = 1
+# バイナリ形式の先頭バイト
+BINARY_MAGIC = b"NIRB"
+
+_DEFAULT_CONTENT_TYPE = HttpHeader().content_type
+
+
+class IRError(Exception):
+    """IR ファイルを読み込めない（形式・バージョン違いなど）"""
+
+
+@dataclass
+class ControllerIR:
+    """1つの Controller ファイルのパース結果"""
+    file: str
+    apis: List[HttpApi]
+    skipped: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ClassIR:
+    """1つの DTO ファイルのパース結果（クラスが見つからなければ cls は None）"""
+    file: str
+    cls: Optional[CSharpClass]
+
+
+@dataclass
+class ApiIR:
+    """
+    IR 全体。file はバックエンドのソースルートからの相対パス
+
+    source_fingerprint はパースしたソースの内容ハッシュ（helpers/fingerprint.py）。
+    --from-ir で生成したファイルにもソースから生成したときと同じフィンガープリントを埋め込むために持つ。
+    """
+    value_object_types: Dict[str, str]
+    classes: List[ClassIR]
+    controllers: List[ControllerIR]
+    source_fingerprint: Optional[str] = None
+
+
+# --- dict への変換 ---
+
+def _encode_header(header: HttpHeader) -> Dict[str, Any]:
+    data: Dict[str, Any] = {}
+    if header.content_type != _DEFAULT_CONTENT_TYPE:
+        data["content_type"] = header.content_type
+    if header.custom:
+        data["custom"] = dict(header.custom)
+    return data
+
+
+def _decode_header(data: Dict[str, Any]) -> HttpHeader:
+    return HttpHeader(
+        content_type=data.get("content_type", _DEFAULT_CONTENT_TYPE),
+        custom=dict(data.get("custom", {})),
+    )
+
+
+def _encode_api(api: HttpApi) -> Dict[str, Any]:
+    data: Dict[str, Any] = {
+        "method": api.method.value,
+        "path": api.endpoint.to_path_string(),
+        "function": api.function_name,
+        "controller": api.controller_name,
+    }
+    param_types = {e.name: e.type.value for e in api.endpoint.path_params() if e.type is not EndpointType.STRING}
+    if param_types:
+        data["param_types"] = param_types
+    if api.request is not None:
+        request: Dict[str, Any] = {}
+        for slot in ("body", "query", "path"):
+            payload = getattr(api.request, slot)
+            if payload is not None:
+                request[slot] = payload.type_name
+        request.update(_encode_header(api.request.header))
+        data["request"] = request
+    if api.response is not None:
+        response: Dict[str, Any] = _encode_header(api.response.header)
+        if api.response.payload is not None:
+            response["payload"] = api.response.payload.type_name
+        data["response"] = response
+    if api.is_form_file:
+        data["form_file_param"] = api.form_file_param
+    # 省略可能（認証属性を持たない古い IR も読めるように、ないときはキーごと出さない）
+    if api.auth:
+        data["auth"] = api.auth
+    if api.invalidates or api.invalidates_only:
+        data["invalidates"] = list(api.invalidates)
+        if api.invalidates_only:
+            data["invalidates_only"] = True
+    return data
+
+
+def _decode_api(data: Dict[str, Any]) -> HttpApi:
+    param_types = {name: EndpointType(value) for name, value in data.get("param_types", {}).items()}
+    request = None
+    if "request" in data:
+        req = data["request"]
+        request = HttpRequest(
+            header=_decode_header(req),
+            **{slot: HttpPayload(type_name=req[slot]) for slot in ("body", "query", "path") if slot in req},
+        )
+    response = None
+    if "response" in data:
+        res = data["response"]
+        response = HttpResponse(
+            payload=HttpPayload(type_name=res["payload"]) if "payload" in res else None,
+            header=_decode_header(res),
+        )
+    return HttpApi(
+        method=HttpMethod(data["method"]),
+        endpoint=Endpoint.from_path_string(data["path"], param_types),
+        function_name=data["function"],
+        controller_name=data["controller"],
+        request=request,
+        response=response,
+        is_form_file="form_file_param" in data,
+        form_file_param=data.get("form_file_param", "file"),
+        auth=data.get("auth"),
+        invalidates=tuple(data.get("invalidates", ())),
+        invalidates_only=data.get("invalidates_only", False),
+    )
+
+
+def _encode_class(cls: Optional[CSharpClass]) -> Optional[Dict[str, Any]]:
+    if cls is None:
+        return None
+    return {
+        "name": cls.name,
+        "namespace": cls.namespace,
+        # [name, type, is_optional, is_list]（検証属性があれば5番目に [[属性名, [引数...]], ...]）
+        "properties": [
+            [p.name, p.type, p.is_optional, p.is_list, *([[[r.name, list(r.arguments)] for r in p.validation]] if p.validation else [])]
+            for p in cls.properties
+        ],
+    }
+
+
+def _decode_class(data: Optional[Dict[str, Any]]) -> Optional[CSharpClass]:
+    if data is None:
+        return None
+    return CSharpClass(
+        name=data["name"],
+        namespace=data["namespace"],
+        properties=[CSharpProperty(*fields) for fields in data["properties"]],
+    )
+
+
+def to_dict(ir: ApiIR) -> Dict[str, Any]:
+    data = {
+        "format": IR_FORMAT,
+        "version": IR_VERSION,
+        "value_object_types": dict(sorted(ir.value_object_types.items())),
+        "classes": [{"file": c.file, "class": _encode_class(c.cls)} for c in ir.classes],
+        "controllers": [
+            {"file": c.file, "apis": [_encode_api(api) for api in c.apis], "skipped": list(c.skipped)}
+            for c in ir.controllers
+        ],
+    }
+    # 省略可能（古い IR との互換のため、ないときはキーごと出さない）
+    if ir.source_fingerprint:
+        data["source_fingerprint"] = ir.source_fingerprint
+    return data
+
+
+def from_dict(data: Dict[str, Any]) -> ApiIR:
+    if data.get("format") != IR_FORMAT:
+        raise IRError(f"not an API IR file (format: {data.get('format')!r})")
+    if data.get("version") != IR_VERSION:
+        raise IRError(f"unsupported IR version {data.get('version')} (expected {IR_VERSION})")
+    return ApiIR(
+        value_object_types=dict(data["value_object_types"]),
+        classes=[ClassIR(c["file"], _decode_class(c["class"])) for c in data["classes"]],
+        controllers=[
+            ControllerIR(c["file"], [_decode_api(api) for api in c["apis"]], list(c["skipped"]))
+            for c in data["controllers"]
+        ],
+        source_fingerprint=data.get("source_fingerprint"),
+    )
+
+
+# --- ファイル入出力 ---
+
+def dumps(ir: ApiIR, binary: bool = False) -> bytes:
+    """IR をバイト列にする。binary=False なら1行の JSON（UTF-8）"""
+    data = to_dict(ir)
+    if binary:
+        return BINARY_MAGIC + zlib.compress(marshal.dumps(data), 6)
+    return (json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def loads(raw: bytes) -> ApiIR:
+    """dumps の出力（JSON / バイナリ どちらでも）から IR を復元する"""
+    try:
+        if raw.startswith(BINARY_MAGIC):
+            data = marshal.loads(zlib.decompress(raw[len(BINARY_MAGIC):]))
+        else:
+            data = json.loads(raw.decode("utf-8"))
+    except (ValueError, EOFError, TypeError, zlib.error) as e:
+        raise IRError(f"corrupt IR file: {e}") from e
+    if not isinstance(data, dict):
+        raise IRError("corrupt IR file: top-level value is not an object")
+    return from_dict(data)
+
+
+def is_binary_path(file_path: Path) -> bool:
+    """拡張子が .json 以外ならバイナリ形式で書き出す"""
+    return file_path.suffix.lower() != ".json"
+
+
+def load_ir(file_path: Path) -> ApiIR:
+    return loads(file_path.read_bytes())
+
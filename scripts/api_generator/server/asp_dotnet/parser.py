@@ -0,0 +1,73 @@
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from models import CSharpClass
+from helpers import (
+    FileSystemSource,
+    load_value_object_types,
+    parallel_map,
+    parse_controller as parse_controller_infos,
+    parse_csharp_class,
+)
+from ...protocols.convert import endpoint_info_to_http_api
+from ...protocols.http import HttpApi
+
+
+class AspDotnetParser:
+    """
+    ASP.NET Core Controller / DTO ファイルをパースして HttpApi を生成する
+
+    パース自体は helpers.csharp_parser（scripts/api-generator.py と同じ実装）で行い、
+    エンドポイントを HttpApi に変換して返す。
+    source（helpers.source_provider）を渡すとファイルをそこから読む（GitSource なら任意のリビジョン）。
+    """
+
+    def __init__(self, source: Optional[FileSystemSource] = None):
+        self.source = source
+
+    def _jobs(self, jobs: int) -> int:
+        # GitSource の cat-file プロセスはワーカープロセスに渡せないので、作業ツリー以外は直列にパースする
+        return jobs if self.source is None else 1
+
+    def parse_value_objects(self, value_object_file: Path) -> Dict[str, str]:
+        """ValueObject ファイルから struct 名 → TypeScript 型のマッピングを返す"""
+        return load_value_object_types(value_object_file, self.source)
+
+    def parse_class(self, file_path: Path) -> Optional[CSharpClass]:
+        """C# クラスファイルをパースして CSharpClass を返す（内部用）"""
+        return parse_csharp_class(file_path, self.source)
+
+    def parse_classes(self, file_paths: List[Path], jobs: int = 1) -> List[Optional[CSharpClass]]:
+        """複数の C# クラスファイルを jobs 並列でパースし、file_paths と同じ順序で返す"""
+        parse = partial(parse_csharp_class, source=self.source) if self.source else parse_csharp_class
+        return parallel_map(parse, file_paths, self._jobs(jobs))
+
+    def parse_controller(
+        self,
+        file_path: Path,
+        all_request_types: set,
+        all_response_types: set,
+    ) -> Tuple[List[HttpApi], List[str]]:
+        """Controller ファイルをパースして (HttpApi リスト, スキップメソッド名リスト) を返す"""
+        endpoints, skipped = parse_controller_infos(file_path, all_request_types, all_response_types, self.source)
+        return [endpoint_info_to_http_api(ep) for ep in endpoints], skipped
+
+    def parse_controllers(
+        self,
+        file_paths: List[Path],
+        all_request_types: set,
+        all_response_types: set,
+        jobs: int = 1,
+    ) -> List[Tuple[List[HttpApi], List[str]]]:
+        """複数の Controller ファイルを jobs 並列でパースし、file_paths と同じ順序で返す"""
+        parse = partial(
+            parse_controller_infos,
+            all_request_types=all_request_types,
+            all_response_types=all_response_types,
+            source=self.source,
+        )
+        return [
+            ([endpoint_info_to_http_api(ep) for ep in endpoints], skipped)
+            for endpoints, skipped in parallel_map(parse, file_paths, self._jobs(jobs))
+        ]
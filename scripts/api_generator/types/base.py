@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Iterator
 
 
 class BaseParser(ABC):
@@ -11,6 +12,10 @@ class BaseParser(ABC):
 
 class BaseGenerator(ABC):
     @abstractmethod
+    def render(self, apis: list) -> Iterator[str]:
+        """HttpApi リストからコードを行単位で順に生成する（行は改行を含まない）"""
+        ...
+
     def generate(self, apis: list) -> str:
         """HttpApi リストからコード文字列を生成する"""
-        ...
+        return "\n".join(self.render(apis))
@@ -0,0 +1,356 @@
+"""
+生成したフックと server.ts の関数の使われ方から、リクエストのウォーターフォールを静的に見つける
+
+- hook-in-list: .map() の中で描画するコンポーネントが（子孫のコンポーネント・カスタムフックを含めて）クエリフックを呼んでいる。
+  リストの要素数だけリクエストが飛ぶ（N+1）
+- enabled-chain: 同じコンポーネントのクエリフックの引数（enabled: やパラメータ）が、別のクエリフックの結果を参照している。
+  前のリクエストが終わるまで次が始まらない
+- sequential-await: 同じブロックで server.ts の関数を1つずつ await しているが、後の呼び出しが前の結果を使っていない
+  （Promise.all で並列にできる）。ループの中の await も含む
+
+TypeScript はパースせず、scanner.py のマスク済みソースと括弧の対応だけで調べるので、結果はヒューリスティック。
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from .scanner import FunctionScope, SourceFile, Span, bound_names, referenced_names
+
+# ルールごとの重み（score = 重み × 余分に待つリクエストの数）
+RULE_WEIGHTS = {"hook-in-list": 3, "enabled-chain": 2, "sequential-await": 2}
+
+_COMPONENT_NAME = re.compile(r"[A-Z][\w$]*")
+_CUSTOM_HOOK_NAME = re.compile(r"use[A-Z][\w$]*")
+_JSX_ELEMENT = re.compile(r"<([A-Z][\w$]*)(?=[\s/>])")
+_LIST_CALL = re.compile(r"\.(?:map|flatMap)\s*\(")
+_LOOP_HEAD = re.compile(r"\b(?:for|while)\s*$")
+_SIMPLE_DECLARATION = re.compile(r"\b(?:const|let)\s+([A-Za-z_$][\w$]*)\s*(?::[^=;\n]+)?=\s*([^;\n]+)")
+
+
+class Finding(NamedTuple):
+    rule: str
+    path: str
+    line: int
+    score: int
+    message: str
+    details: Tuple[str, ...] = ()
+
+
+class _Unit:
+    """コンポーネント・カスタムフック（名前の付いた関数）が直接使っているもの"""
+    __slots__ = ("hooks", "uses", "renders")
+
+    def __init__(self) -> None:
+        self.hooks: Set[str] = set()     # 生成したクエリフック
+        self.uses: Set[str] = set()      # カスタムフック
+        self.renders: Set[str] = set()   # JSX で描画するコンポーネント
+
+
+class WaterfallAnalyzer:
+    """
+    query_hooks: 生成したクエリフック名（useGetArticles）→ エンドポイントの説明
+    server_functions: server.ts の関数名（getArticles）→ エンドポイントの説明
+    """
+
+    def __init__(self, query_hooks: Dict[str, str], server_functions: Dict[str, str]):
+        self.query_hooks = query_hooks
+        self.server_functions = server_functions
+
+    def analyze(self, files: Sequence[SourceFile]) -> List[Finding]:
+        scopes = {file.path: file.functions() for file in files}
+        units = self._collect_units(files, scopes)
+        findings = self._hooks_in_lists(files, units)
+        for file in files:
+            findings += self._enabled_chains(file, scopes[file.path])
+            findings += self._sequential_awaits(file, scopes[file.path])
+        return sorted(findings, key=lambda f: (-f.score, f.path, f.line))
+
+    # --- コンポーネントの呼び出し関係 ---
+
+    def _is_unit(self, scope: FunctionScope) -> bool:
+        name = scope.name or ""
+        return bool(_COMPONENT_NAME.fullmatch(name) or _CUSTOM_HOOK_NAME.fullmatch(name)) and name not in self.query_hooks
+
+    def _collect_units(self, files: Sequence[SourceFile], scopes: Dict[str, List[FunctionScope]]) -> Dict[str, _Unit]:
+        units: Dict[str, _Unit] = defaultdict(_Unit)
+        custom_hooks = {scope.name for file_scopes in scopes.values() for scope in file_scopes
+                        if self._is_unit(scope) and _CUSTOM_HOOK_NAME.fullmatch(scope.name or "")}
+        for file in files:
+            named = [scope for scope in scopes[file.path] if self._is_unit(scope)]
+            for name, offset, _ in file.calls(set(self.query_hooks) | custom_hooks):
+                owner = file.innermost(named, offset)
+                if owner is None or owner.name == name:
+                    continue
+                (units[owner.name].hooks if name in self.query_hooks else units[owner.name].uses).add(name)
+            for match in _JSX_ELEMENT.finditer(file.masked):
+                owner = file.innermost(named, match.start())
+                if owner is not None and match.group(1) != owner.name:
+                    units[owner.name].renders.add(match.group(1))
+        return units
+
+    def _fetch_paths(self, units: Dict[str, _Unit]) -> Dict[str, Dict[str, List[str]]]:
+        """コンポーネント → (呼ばれるクエリフック → そこまでのコンポーネント・カスタムフックの経路)"""
+        memo: Dict[str, Dict[str, List[str]]] = {}
+
+        def visit(name: str, stack: Tuple[str, ...]) -> Dict[str, List[str]]:
+            if name in memo:
+                return memo[name]
+            unit = units.get(name)
+            if unit is None or name in stack:
+                return {}
+            paths: Dict[str, List[str]] = {hook: [name] for hook in unit.hooks}
+            for child in sorted(unit.uses | unit.renders):
+                for hook, path in visit(child, stack + (name,)).items():
+                    if hook not in paths or len(path) + 1 < len(paths[hook]):
+                        paths[hook] = [name] + path
+            memo[name] = paths
+            return paths
+
+        return {name: visit(name, ()) for name in list(units)}
+
+    # --- hook-in-list ---
+
+    def _hooks_in_lists(self, files: Sequence[SourceFile], units: Dict[str, _Unit]) -> List[Finding]:
+        fetches = self._fetch_paths(units)
+        findings: List[Finding] = []
+        for file in files:
+            seen: Set[Tuple[int, str]] = set()
+            for match in _LIST_CALL.finditer(file.masked):
+                span = file.call_arguments(match.end() - 1)
+                if span is None:
+                    continue
+                # .map() の中で直接呼んでいるフック（Rules of Hooks 違反でもある）
+                for name, offset, _ in file.calls(set(self.query_hooks), span):
+                    line = file.line(offset)
+                    if (line, name) not in seen:
+                        seen.add((line, name))
+                        findings.append(Finding(
+                            "hook-in-list", file.path, line, RULE_WEIGHTS["hook-in-list"],
+                            f"{name}() is called inside .map() — one request per item",
+                            (f"{name}: {self.query_hooks[name]}",),
+                        ))
+                for element in _JSX_ELEMENT.finditer(file.masked, span.start, span.end):
+                    component = element.group(1)
+                    hooks = fetches.get(component)
+                    line = file.line(element.start())
+                    if not hooks or (line, component) in seen:
+                        continue
+                    seen.add((line, component))
+                    details = tuple(
+                        f"{hook}: {self.query_hooks[hook]} (via {' → '.join(path)})"
+                        for hook, path in sorted(hooks.items())
+                    )
+                    findings.append(Finding(
+                        "hook-in-list", file.path, line, RULE_WEIGHTS["hook-in-list"] * len(hooks),
+                        f"<{component}> is rendered per item of .map() and fetches {', '.join(sorted(hooks))} — "
+                        f"{len(hooks)} request(s) per item",
+                        details,
+                    ))
+        return findings
+
+    # --- enabled-chain ---
+
+    def _enabled_chains(self, file: SourceFile, scopes: List[FunctionScope]) -> List[Finding]:
+        findings: List[Finding] = []
+        calls_by_scope: Dict[FunctionScope, List[Tuple[str, int, Span]]] = defaultdict(list)
+        for call in file.calls(set(self.query_hooks)):
+            scope = file.innermost(scopes, call[1])
+            if scope is not None:
+                calls_by_scope[scope].append(call)
+
+        for scope, calls in calls_by_scope.items():
+            if len(calls) < 2:
+                continue
+            owners = _propagate(file, scope.body, {
+                name: index for index, (_, offset, _) in enumerate(calls)
+                for name in bound_names(file.declaration_before(offset))
+            })
+            # edges[j] = [(i, 参照している名前, enabled: で参照しているか)]
+            edges: Dict[int, List[Tuple[int, str, bool]]] = defaultdict(list)
+            for j, (_, _, arguments) in enumerate(calls):
+                text = file.text(arguments)
+                enabled = _enabled_expression(text)
+                enabled_refs = referenced_names(enabled) if enabled is not None else set()
+                for name in sorted(referenced_names(text)):
+                    i = owners.get(name)
+                    if i is not None and i != j:
+                        edges[j].append((i, name, name in enabled_refs))
+            if not edges:
+                continue
+
+            depth: Dict[int, int] = {}
+
+            def chain_depth(j: int, stack: Tuple[int, ...] = ()) -> int:
+                if j not in depth:
+                    depth[j] = 1 + max((chain_depth(i, stack + (j,)) for i, _, _ in edges.get(j, ()) if i not in stack), default=0)
+                return depth[j]
+
+            longest = max(range(len(calls)), key=chain_depth)
+            chain = [longest]
+            while edges.get(chain[0]):
+                previous = max((i for i, _, _ in edges[chain[0]] if i not in chain), key=chain_depth, default=None)
+                if previous is None:
+                    break
+                chain.insert(0, previous)
+            details = []
+            for j in chain[1:]:
+                for i, name, in_enabled in edges[j]:
+                    if i in chain:
+                        where = "enabled:" if in_enabled else "params"
+                        details.append(f"{calls[j][0]} waits for {calls[i][0]} ({where} uses `{name}`, line {file.line(calls[j][1])})")
+            names = " → ".join(calls[index][0] for index in chain)
+            any_enabled = any(in_enabled for j in chain[1:] for _, _, in_enabled in edges[j])
+            findings.append(Finding(
+                "enabled-chain", file.path, file.line(calls[chain[0]][1]),
+                RULE_WEIGHTS["enabled-chain"] * (len(chain) - 1),
+                f"{len(chain)} dependent queries in {scope.name or 'a callback'}: {names}"
+                + (" (chained with enabled:)" if any_enabled else ""),
+                tuple(details),
+            ))
+        return findings
+
+    # --- sequential-await ---
+
+    def _sequential_awaits(self, file: SourceFile, scopes: List[FunctionScope]) -> List[Finding]:
+        if not self.server_functions:
+            return []
+        pattern = re.compile(r"\bawait\s+(" + "|".join(map(re.escape, sorted(self.server_functions))) + r")\s*\(")
+        blocks: Dict[Tuple[int, int], List[Tuple[str, int, Span]]] = defaultdict(list)
+        findings: List[Finding] = []
+        for match in pattern.finditer(file.masked):
+            arguments = file.call_arguments(match.end() - 1)
+            block = _innermost_block(file, match.start())
+            if arguments is None or block is None:
+                continue
+            if _is_loop_body(file, block):
+                name = match.group(1)
+                findings.append(Finding(
+                    "sequential-await", file.path, file.line(match.start()), RULE_WEIGHTS["sequential-await"] * 2,
+                    f"await {name}() inside a loop — one request at a time per iteration",
+                    (f"{name}: {self.server_functions[name]}", "map the items to promises and await Promise.all(...)"),
+                ))
+                continue
+            blocks[block].append((match.group(1), match.start(), arguments))
+
+        for block, awaits in blocks.items():
+            if len(awaits) < 2:
+                continue
+            owners = _propagate(file, Span(*block), {
+                name: index for index, (_, offset, _) in enumerate(awaits)
+                for name in bound_names(file.declaration_before(offset))
+            })
+            independent = []
+            for j, (name, offset, arguments) in enumerate(awaits[1:], start=1):
+                if not any(owners.get(ref, j) < j for ref in referenced_names(file.text(arguments))):
+                    independent.append(j)
+            if not independent:
+                continue
+            scope = file.innermost(scopes, awaits[0][1])
+            calls = ", ".join(f"{name}()" for name, _, _ in awaits)
+            findings.append(Finding(
+                "sequential-await", file.path, file.line(awaits[0][1]),
+                RULE_WEIGHTS["sequential-await"] * len(independent),
+                f"{calls} are awaited one after another in {(scope.name if scope else None) or 'a function'}; "
+                f"{len(independent)} could start without waiting for the earlier ones",
+                tuple(
+                    f"{awaits[j][0]}() (line {file.line(awaits[j][1])}) can start together with the earlier call(s) — use Promise.all"
+                    for j in independent
+                ),
+            ))
+        return findings
+
+
+def _enabled_expression(arguments: str) -> Optional[str]:
+    """引数の中の enabled: の式（次の , か } まで）"""
+    match = re.search(r"\benabled\s*:", arguments)
+    if match is None:
+        return None
+    depth = 0
+    for index in range(match.end(), len(arguments)):
+        char = arguments[index]
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            if depth == 0:
+                return arguments[match.end():index]
+            depth -= 1
+        elif char == "," and depth == 0:
+            return arguments[match.end():index]
+    return arguments[match.end():]
+
+
+def _propagate(file: SourceFile, span: Span, owners: Dict[str, int]) -> Dict[str, int]:
+    """const x = user?.id のような派生した変数も、元の呼び出しの結果として扱う"""
+    owners = dict(owners)
+    declarations = [
+        (match.group(1), referenced_names(match.group(2)))
+        for match in _SIMPLE_DECLARATION.finditer(file.masked, span.start, span.end)
+    ]
+    for _ in range(3):
+        changed = False
+        for name, refs in declarations:
+            sources = [owners[ref] for ref in refs if ref in owners]
+            if sources and name not in owners:
+                owners[name] = max(sources)
+                changed = True
+        if not changed:
+            break
+    return owners
+
+
+def _innermost_block(file: SourceFile, offset: int) -> Optional[Tuple[int, int]]:
+    """offset を含む一番内側の { } の範囲"""
+    depth_start = None
+    index = offset
+    depth = 0
+    while index > 0:
+        index -= 1
+        char = file.masked[index]
+        if char == "}":
+            depth += 1
+        elif char == "{":
+            if depth == 0:
+                depth_start = index
+                break
+            depth -= 1
+    if depth_start is None:
+        return None
+    close = file.closing(depth_start)
+    return (depth_start + 1, close) if close is not None else None
+
+
+def _is_loop_body(file: SourceFile, block: Tuple[int, int]) -> bool:
+    """for (...) { } / while (...) { } / .forEach(async () => { }) の本体か"""
+    head = file.masked[:block[0] - 1].rstrip()
+    if head.endswith(")"):
+        close = len(head) - 1
+        opener = next((start for start, end in file._pairs.items() if end == close), None)
+        if opener is not None and _LOOP_HEAD.search(file.masked[:opener]):
+            return True
+    if head.endswith("=>"):
+        call = file.masked.rfind(".forEach", 0, block[0])
+        if call >= 0:
+            paren = file.next_char(call + len(".forEach"), "(")
+            arguments = file.call_arguments(paren) if paren is not None else None
+            return arguments is not None and block[0] in arguments
+    return False
+
+
+def format_report(findings: Sequence[Finding], scanned: int) -> Iterable[str]:
+    """スコアの高い順の一覧"""
+    if not findings:
+        yield f"✅ No request waterfalls found in {scanned} files"
+        return
+    by_rule = defaultdict(int)
+    for finding in findings:
+        by_rule[finding.rule] += 1
+    summary = ", ".join(f"{rule} ×{count}" for rule, count in sorted(by_rule.items()))
+    yield f"🔎 {len(findings)} potential request waterfalls in {scanned} files ({summary})"
+    width = len(str(len(findings)))
+    for rank, finding in enumerate(findings, start=1):
+        yield ""
+        yield f"{rank:>{width}}. [{finding.score}] {finding.rule}  {finding.path}:{finding.line}"
+        yield f"{'':>{width}}  {finding.message}"
+        for detail in finding.details:
+            yield f"{'':>{width}}    - {detail}"
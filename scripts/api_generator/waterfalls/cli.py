@@ -0,0 +1,69 @@
+"""
+waterfalls: フロントエンドのソースから、生成したフック・server.ts の関数によるリクエストのウォーターフォールを探す
+
+フック名・関数名は API モデルから作るので、生成コードと同じ名前だけを対象にする。
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, List
+
+from ..cli import ModelLoader, add_model_arguments
+from ..protocols.diff import describe_api
+from .analyzer import WaterfallAnalyzer, format_report
+from .scanner import SourceFile
+
+
+def main(argv: List[str], load_model: ModelLoader) -> int:
+    parser = argparse.ArgumentParser(
+        prog='api-generator.py waterfalls',
+        description='Statically find N+1 queries, dependent query chains and sequential server awaits in the frontend',
+    )
+    parser.add_argument('--root', type=Path, default=Path('nari-note-frontend/src'), help='Directory to scan (default: nari-note-frontend/src)')
+    parser.add_argument('--glob', action='append', metavar='PATTERN',
+                        help="Files to scan under --root (repeatable; default: '**/*.tsx' and '**/*.ts')")
+    parser.add_argument('--min-score', type=int, default=0, metavar='N', help='Only report findings with a score of at least N')
+    parser.add_argument('--json', type=Path, metavar='FILE', help='Also write the findings as JSON')
+    parser.add_argument('--exit-code', action='store_true', help='Exit with 1 when anything is reported')
+    add_model_arguments(parser)
+    args = parser.parse_args(argv)
+
+    loaded = load_model(args)
+    if loaded is None:
+        return 2
+    resolved, _ = loaded
+
+    # hooks.ts の useXxx と server.ts の xxx（どちらも GET のみ）
+    query_hooks: Dict[str, str] = {}
+    server_functions: Dict[str, str] = {}
+    for api in resolved.apis:
+        if api.method.value == "GET":
+            query_hooks[f"use{api.function_name}"] = describe_api(api)
+            server_functions[api.function_name[:1].lower() + api.function_name[1:]] = describe_api(api)
+
+    if not args.root.is_dir():
+        parser.error(f"--root: {args.root} is not a directory")
+    paths = sorted({
+        path for pattern in (args.glob or ['**/*.tsx', '**/*.ts'])
+        for path in args.root.glob(pattern)
+        if path.is_file() and not path.is_relative_to(args.root / 'lib' / 'api')
+    })
+    files = []
+    for path in paths:
+        try:
+            files.append(SourceFile(path.relative_to(args.root).as_posix(), path.read_text(encoding='utf-8')))
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"⚠️  Skipping {path}: {e}")
+
+    analyzer = WaterfallAnalyzer(query_hooks, server_functions)
+    findings = [finding for finding in analyzer.analyze(files) if finding.score >= args.min_score]
+    for line in format_report(findings, len(files)):
+        print(line)
+    if args.json:
+        args.json.write_text(
+            json.dumps([finding._asdict() for finding in findings], ensure_ascii=False, indent=2) + "\n",
+            encoding='utf-8',
+        )
+        print(f"\n📝 Wrote {args.json}")
+    return 1 if args.exit_code and findings else 0
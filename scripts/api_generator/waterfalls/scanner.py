@@ -0,0 +1,318 @@
+"""
+TSX / TS ソースの軽量なスキャナー
+
+TypeScript をパースする代わりに、コメント・文字列・正規表現リテラルの中身を空白で潰した「マスク済み」のソースを作り、
+括弧の対応と正規表現だけで関数・コンポーネント・呼び出しの範囲を調べる。
+位置（オフセット・行番号）は元のソースと同じ。
+"""
+
+import bisect
+import re
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+_OPENERS = {"(": ")", "[": "]", "{": "}"}
+# この文字の直後の / は正規表現リテラル、' " ` は文字列の開始とみなす（JSX のテキスト中の ' は文字列にしない）
+_EXPRESSION_START = set("=(,:[!&|?{};+-*%<>~^") | {""}
+_KEYWORDS_BEFORE_EXPRESSION = ("return", "typeof", "case", "in", "of", "await", "yield", "from", "import", "else", "default")
+
+IDENTIFIER = re.compile(r"(?<![\w$.])[A-Za-z_$][\w$]*")
+# 分割代入・変数宣言で束縛される名前（"data: user" なら user、"...rest" なら rest）
+_BOUND_NAME = re.compile(r"(?:\.\.\.)?([A-Za-z_$][\w$]*)\s*(?![\w$]|\s*:(?!:))")
+
+
+class Span(NamedTuple):
+    start: int
+    end: int   # 閉じ括弧の位置（含まない）
+
+    def __contains__(self, offset: object) -> bool:
+        return isinstance(offset, int) and self.start <= offset < self.end
+
+
+class FunctionScope(NamedTuple):
+    """関数の本体（{ ... } の中身）"""
+    name: Optional[str]   # 宣言から名前が分かる場合
+    body: Span
+    is_async: bool
+
+
+def _previous_token(masked: List[str], index: int) -> str:
+    """index より前の、空白でない最後の文字（識別子ならその語）"""
+    i = index - 1
+    while i >= 0 and masked[i] in " \t\r\n":
+        i -= 1
+    if i < 0:
+        return ""
+    if masked[i].isalnum() or masked[i] in "_$":
+        end = i + 1
+        while i >= 0 and (masked[i].isalnum() or masked[i] in "_$"):
+            i -= 1
+        return "".join(masked[i + 1:end])
+    return masked[i]
+
+
+def _expression_may_start(masked: List[str], index: int) -> bool:
+    token = _previous_token(masked, index)
+    return token in _EXPRESSION_START or token in _KEYWORDS_BEFORE_EXPRESSION
+
+
+def mask_source(source: str) -> str:
+    """コメント・文字列・正規表現リテラルの中身を空白にしたソース（改行と区切りの引用符は残す）"""
+    masked = list(source)
+    length = len(source)
+    i = 0
+
+    def blank(start: int, end: int) -> None:
+        for k in range(start, end):
+            if masked[k] != "\n":
+                masked[k] = " "
+
+    # テンプレートリテラルの ${ } の入れ子（ } でテンプレートに戻る深さ）
+    template_stack: List[int] = []
+    depth = 0
+    while i < length:
+        char = source[i]
+        pair = source[i:i + 2]
+        if pair == "//":
+            end = source.find("\n", i)
+            end = length if end < 0 else end
+            blank(i, end)
+            i = end
+        elif pair == "/*":
+            end = source.find("*/", i + 2)
+            end = length if end < 0 else end + 2
+            blank(i, end)
+            i = end
+        elif char in "'\"" and _expression_may_start(masked, i):
+            k = i + 1
+            while k < length and source[k] != char and source[k] != "\n":
+                k += 2 if source[k] == "\\" else 1
+            blank(i + 1, min(k, length))
+            i = k + 1
+        elif char == "`" or (char == "}" and template_stack and template_stack[-1] == depth):
+            if char == "}":
+                template_stack.pop()
+            k = i + 1
+            while k < length and source[k] != "`":
+                if source[k] == "\\":
+                    k += 2
+                    continue
+                if source.startswith("${", k):
+                    break
+                k += 1
+            blank(i + 1, min(k, length))
+            if k < length and source[k] != "`":
+                template_stack.append(depth)
+                i = k + 2
+            else:
+                i = k + 1
+        elif char == "/" and source[i + 1:i + 2] != ">" and _expression_may_start(masked, i) and _previous_token(masked, i) not in ("<", ""):
+            k = i + 1
+            in_class = False
+            while k < length and source[k] != "\n":
+                if source[k] == "\\":
+                    k += 2
+                    continue
+                if source[k] == "[":
+                    in_class = True
+                elif source[k] == "]":
+                    in_class = False
+                elif source[k] == "/" and not in_class:
+                    break
+                k += 1
+            blank(i + 1, min(k, length))
+            i = k + 1
+        else:
+            if char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+            i += 1
+    return "".join(masked)
+
+
+class SourceFile:
+    """1つのソースファイル（マスク済みのソースと、括弧の対応・行番号の索引）"""
+
+    def __init__(self, path: str, source: str):
+        self.path = path
+        self.source = source
+        self.masked = mask_source(source)
+        self._line_starts = [0] + [m.end() for m in re.finditer("\n", source)]
+        self._pairs = self._match_brackets()
+
+    def _match_brackets(self) -> Dict[int, int]:
+        pairs: Dict[int, int] = {}
+        stack: List[Tuple[str, int]] = []
+        for index, char in enumerate(self.masked):
+            if char in _OPENERS:
+                stack.append((char, index))
+            elif char in ")]}":
+                # 対応しない閉じ括弧（JSX のテキストなど）は読み飛ばす
+                while stack and _OPENERS[stack[-1][0]] != char:
+                    stack.pop()
+                if stack:
+                    pairs[stack.pop()[1]] = index
+        return pairs
+
+    def line(self, offset: int) -> int:
+        return bisect.bisect_right(self._line_starts, offset)
+
+    def closing(self, opener: int) -> Optional[int]:
+        return self._pairs.get(opener)
+
+    def next_char(self, offset: int, chars: str) -> Optional[int]:
+        """offset 以降で、空白を除いた最初の文字が chars のどれかならその位置"""
+        match = re.compile(r"\s*").match(self.masked, offset)
+        index = match.end() if match else offset
+        return index if index < len(self.masked) and self.masked[index] in chars else None
+
+    def call_arguments(self, open_paren: int) -> Optional[Span]:
+        close = self.closing(open_paren)
+        return Span(open_paren + 1, close) if close is not None else None
+
+    def text(self, span: Span) -> str:
+        return self.masked[span.start:span.end]
+
+    @property
+    def is_client(self) -> bool:
+        """'use client' のファイルか（先頭のディレクティブ）"""
+        head = self.source.lstrip()[:20]
+        return head.startswith(("'use client'", '"use client"'))
+
+    def functions(self) -> List[FunctionScope]:
+        """ファイル中のすべての関数本体（function 宣言・式、ブロック本体のアロー関数）"""
+        scopes: List[FunctionScope] = []
+        for match in re.finditer(r"\b(async\s+)?function\b\s*\*?\s*([A-Za-z_$][\w$]*)?\s*(<[^>(]*>)?\s*\(", self.masked):
+            params = self.closing(match.end() - 1)
+            body_open = self._body_open(params)
+            if body_open is not None and self.closing(body_open) is not None:
+                scopes.append(FunctionScope(match.group(2), Span(body_open + 1, self.closing(body_open)), bool(match.group(1))))
+        for match in re.finditer(r"=>", self.masked):
+            body_open = self.next_char(match.end(), "{")
+            if body_open is None or self.closing(body_open) is None:
+                continue
+            name, is_async = self._arrow_declaration(match.start())
+            scopes.append(FunctionScope(name, Span(body_open + 1, self.closing(body_open)), is_async))
+        return sorted(scopes, key=lambda scope: scope.body.start)
+
+    def _body_open(self, params_close: Optional[int]) -> Optional[int]:
+        """引数リストの ) の後（戻り値の型注釈を飛ばして）の { の位置"""
+        if params_close is None:
+            return None
+        index = params_close + 1
+        if self.next_char(index, ":") is None:
+            return self.next_char(index, "{")
+        index = self.next_char(index, ":") + 1
+        literal = self.next_char(index, "{")
+        if literal is not None:
+            # 戻り値の型がオブジェクト型リテラル（): { a: string } {）
+            close = self.closing(literal)
+            if close is None:
+                return None
+            index = close + 1
+        depth = 0
+        while index < len(self.masked):
+            char = self.masked[index]
+            if char in "(<[":
+                depth += 1
+            elif char in ")>]":
+                depth -= 1
+            elif char == "{" and depth == 0:
+                return index
+            elif char == ";":
+                return None
+            index += 1
+        return None
+
+    def _arrow_declaration(self, arrow: int) -> Tuple[Optional[str], bool]:
+        """アロー関数を代入している変数名（const Name = (...) => / const Name = memo((...) => など）と async か"""
+        line_start = self.masked.rfind("\n", 0, arrow) + 1
+        # 引数リストが複数行にわたる場合に備えて、数行さかのぼって宣言を探す
+        window_start = max(0, self.masked.rfind("\n", 0, max(0, line_start - 1)) - 200)
+        head = self.masked[window_start:arrow]
+        match = None
+        for match in re.finditer(r"\b(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*(?::[^=]+)?=\s*(async\b)?", head):
+            pass
+        if match is None:
+            return None, bool(re.search(r"\basync\s*(\([^)]*\)|[\w$]+)\s*$", head))
+        between = head[match.end():]
+        # 宣言からアローまでの間に別の文やアロー関数が挟まっていれば、その宣言の関数ではない
+        if ";" in between or "=>" in between:
+            return None, bool(re.search(r"\basync\s*(\([^)]*\)|[\w$]+)\s*$", head))
+        is_async = bool(match.group(2)) or bool(re.search(r"\basync\s*\(", between))
+        return match.group(1), is_async
+
+    def innermost(self, scopes: List[FunctionScope], offset: int) -> Optional[FunctionScope]:
+        inner = None
+        for scope in scopes:
+            if offset in scope.body and (inner is None or scope.body.start >= inner.body.start):
+                inner = scope
+        return inner
+
+    def calls(self, names: Set[str], span: Optional[Span] = None) -> Iterator[Tuple[str, int, Span]]:
+        """names のいずれかの関数呼び出し（名前, 位置, 引数の範囲）"""
+        start, end = (span.start, span.end) if span else (0, len(self.masked))
+        for match in IDENTIFIER.finditer(self.masked, start, end):
+            name = match.group(0)
+            if name not in names:
+                continue
+            paren = self.next_char(match.end(), "(<")
+            if paren is not None and self.masked[paren] == "<":
+                # 型引数付きの呼び出し useX<T>(...)
+                close = self.masked.find(">", paren)
+                paren = self.next_char(close + 1, "(") if close >= 0 else None
+            if paren is None:
+                continue
+            arguments = self.call_arguments(paren)
+            if arguments is not None:
+                yield name, match.start(), arguments
+
+    def declaration_before(self, offset: int) -> Optional[str]:
+        """offset の式を代入している宣言の左辺（"const { data: user } = " の "{ data: user }"）"""
+        statement_start = max(self.masked.rfind(";", 0, offset), self.masked.rfind("\n\n", 0, offset)) + 1
+        match = None
+        for match in re.finditer(r"\b(?:const|let|var)\s+", self.masked[statement_start:offset]):
+            pass
+        if match is None:
+            return None
+        start = statement_start + match.end()
+        if self.masked[start] in "{[":
+            # 分割代入は括弧の対応で左辺の終わりを決める（{ data: user } の : を型注釈と区別する）
+            close = self.closing(start)
+            if close is None or close >= offset:
+                return None
+            end = close + 1
+        else:
+            name = IDENTIFIER.match(self.masked, start)
+            if name is None:
+                return None
+            end = name.end()
+        rest = self.masked[end:offset]
+        if not re.fullmatch(r"\s*(?::[^=]+)?=\s*(?:await\s+)?", rest):
+            return None
+        return self.masked[start:end]
+
+def bound_names(pattern: Optional[str]) -> Set[str]:
+    """宣言の左辺で束縛される名前（{ data: user, isLoading } → {user, isLoading}）"""
+    if not pattern:
+        return set()
+    pattern = pattern.strip()
+    if not pattern.startswith(("{", "[")):
+        return {pattern} if IDENTIFIER.fullmatch(pattern) else set()
+    # 既定値（= 以降）は名前に含めない
+    pattern = re.sub(r"=[^,}\]]*", "", pattern)
+    return {name for name in _BOUND_NAME.findall(pattern)}
+
+
+def referenced_names(text: str) -> Set[str]:
+    """式の中で参照している識別子（プロパティアクセスの . の後ろとオブジェクトのキーは除く）"""
+    names = set()
+    for match in IDENTIFIER.finditer(text):
+        following = text[match.end():match.end() + 2].lstrip()
+        if following.startswith(":") and not following.startswith("::"):
+            # { key: value } のキー（三項演算子の : の前の識別子も含まれるが、後ろの値側で拾える）
+            before = text[:match.start()].rstrip()[-1:]
+            if before in ("{", ","):
+                continue
+        names.add(match.group(0))
+    return names
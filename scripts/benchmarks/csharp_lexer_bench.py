@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+helpers.csharp_lexer の病的入力ベンチマーク
+
+旧実装の PROPERTY / HTTP_METHOD_ATTR 正規表現がバックトラックで二乗時間になる入力
+（長い空白、長い属性の積み重ね、複数行のジェネリック型、{ get; set; } を含むコメント）を
+サイズを倍々にしながら与え、字句解析器が線形にスケールすることを確認する。
+
+    python scripts/benchmarks/csharp_lexer_bench.py [--max-size 1000000] [--legacy]
+
+最小サイズに対する最大サイズでの1文字あたりのコストの比が --max-ratio を超えたケースがあれば
+終了コード 1 を返す（線形なら ~1、二乗なら入力サイズの比に比例して増える）。
+
+続けて、実際のバックエンド（nari-note-backend/Src。なければ合成コーパス）の DTO とコントローラーを
+字句解析器と旧実装の正規表現の両方で読み、1回あたりの時間を比べる（病的でない普通のファイルで
+遅くなっていないかの確認）。旧実装の側は正規表現のマッチだけで宣言オブジェクトを組み立てないため、
+比は実際のパース全体の差より大きめに出る。--max-typical-ratio を指定すると、旧実装に対する比がそれを超えたとき
+終了コード 1 を返す。
+"""
+
+import argparse
+import gc
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+_SCRIPTS_ROOT = Path(__file__).parent.parent  # scripts/
+if str(_SCRIPTS_ROOT) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_ROOT))
+
+from benchmarks.synthetic_corpus import CorpusSpec, render_controller, render_dto
+from helpers.csharp_lexer import parse_source
+
+BACKEND_ROOT = _SCRIPTS_ROOT.parent / "nari-note-backend" / "Src"
+
+# 比較用: 字句解析器に置き換える前の正規表現
+LEGACY_PROPERTY = re.compile(
+    r'public\s+(required\s+)?([\w<>,\s?]+?)\s+(\w+)\s*\{\s*get;\s*set;\s*\}'
+)
+LEGACY_HTTP_METHOD_ATTR = re.compile(
+    r'\[Http(Get|Post|Put|Delete)(?:\("([^"]+)"\))?\](?:\s*\[[^\]]+\])*'
+    r'\s+public\s+(?:async\s+Task<)?ActionResult(?:<(\w+)>)?(?:>)?\s+(\w+)\s*\(([^)]*)\)'
+)
+LEGACY_CLASS = re.compile(r'public class (\w+)')
+LEGACY_NAMESPACE = re.compile(r'namespace ([^;]+)')
+
+
+def _repeat_to(unit: str, size: int) -> str:
+    return unit * max(1, size // len(unit))
+
+
+# ケース名 -> サイズ(文字数)を受け取って C# ソースを返す関数
+CASES: Dict[str, Callable[[int], str]] = {
+    # 型と名前の間の長い空白: PROPERTY の遅延量指定子と \s+ が空白の分割を総当たりする
+    "whitespace-run": lambda size: "public class A {\n    public int" + " " * size + "X;\n}\n",
+    # { get; set; } が続かない長い属性の積み重ね: 各 [HttpGet] から末尾まで走査し直す
+    "attribute-stack": lambda size: "public class A {\n" + _repeat_to("    [HttpGet]\n", size) + "    void X() {}\n}\n",
+    # 複数行にまたがる巨大なジェネリック型
+    "multiline-generic": lambda size: (
+        "public class A {\n    public Dictionary<string,\n"
+        + _repeat_to("        List<Dictionary<int, string?>>,\n", size)
+        + "        int> X { get; set; }\n}\n"
+    ),
+    # { get; set; } を含むコメントが大量にある（旧実装は誤検出もする）
+    "commented-properties": lambda size: "public class A {\n" + _repeat_to("    // public int X { get; set; }\n", size) + "}\n",
+    # 通常の DTO が大量に並ぶ（基準値）
+    "plain-properties": lambda size: "public class A {\n" + _repeat_to(
+        "    [Required]\n    [MaxLength(100)]\n    public required string Name { get; set; }\n", size
+    ) + "}\n",
+}
+
+
+def _time(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def _legacy(source: str) -> None:
+    list(LEGACY_PROPERTY.finditer(source))
+    list(LEGACY_HTTP_METHOD_ATTR.finditer(source))
+
+
+def _legacy_dto(source: str) -> None:
+    """旧 parse_csharp_class の正規表現部分"""
+    LEGACY_CLASS.search(source)
+    LEGACY_NAMESPACE.search(source)
+    list(LEGACY_PROPERTY.finditer(source))
+
+
+def _legacy_controller(source: str) -> None:
+    """旧 parse_controller の正規表現部分"""
+    LEGACY_CLASS.search(source)
+    list(LEGACY_HTTP_METHOD_ATTR.finditer(source))
+
+
+def _typical_sources() -> Tuple[str, Dict[str, List[str]]]:
+    """(出どころ, {"dto": [...], "controller": [...]})。バックエンドがなければ合成コーパスを使う"""
+    if BACKEND_ROOT.is_dir():
+        dtos = [
+            path.read_text(encoding="utf-8")
+            for directory in ("Application/Dto", "Application/Dto/Request", "Application/Dto/Response")
+            for path in sorted((BACKEND_ROOT / directory).glob("*.cs"))
+        ]
+        controllers = [path.read_text(encoding="utf-8") for path in sorted((BACKEND_ROOT / "Controller").glob("*Controller.cs"))]
+        if dtos and controllers:
+            return str(BACKEND_ROOT), {"dto": dtos, "controller": controllers}
+    spec = CorpusSpec.for_files(80)
+    return "synthetic corpus", {
+        "dto": [render_dto(spec, index) for index in range(spec.dtos)],
+        "controller": [render_controller(spec, index) for index in range(spec.controllers)],
+    }
+
+
+def run_typical(repeat: int, max_ratio: Optional[float]) -> List[str]:
+    """普通のファイルでの字句解析器と旧実装の正規表現の時間を比べ、--max-typical-ratio を超えたものを返す"""
+    origin, groups = _typical_sources()
+    legacy = {"dto": _legacy_dto, "controller": _legacy_controller}
+    print(f"\n## typical files ({origin})")
+    print(f"{'kind':<12} {'files':>6} {'chars':>9} {'lexer ms':>10} {'legacy ms':>10} {'ratio':>7}")
+    failures: List[str] = []
+    for kind, sources in groups.items():
+        lexer_seconds = _time(lambda: [parse_source(source) for source in sources], repeat)
+        legacy_seconds = _time(lambda: [legacy[kind](source) for source in sources], repeat)
+        ratio = lexer_seconds / legacy_seconds if legacy_seconds else float("inf")
+        print(
+            f"{kind:<12} {len(sources):>6} {sum(map(len, sources)):>9} "
+            f"{lexer_seconds * 1000:>10.2f} {legacy_seconds * 1000:>10.2f} {ratio:>6.1f}x"
+        )
+        if max_ratio is not None and ratio > max_ratio:
+            failures.append(f"{kind}: x{ratio:.2f} slower than the legacy regexes")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pathological-input benchmark for helpers.csharp_lexer")
+    parser.add_argument("--min-size", type=int, default=2_000, help="Smallest input size in characters")
+    parser.add_argument("--max-size", type=int, default=512_000, help="Largest input size in characters")
+    parser.add_argument("--legacy", action="store_true", help="Also time the legacy regexes (slow: quadratic)")
+    parser.add_argument("--legacy-max-size", type=int, default=16_000, help="Largest input for the legacy regexes")
+    parser.add_argument("--max-ratio", type=float, default=2.0, help="Fail when the per-character cost grows by more than this across the size range")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per measurement (best is reported)")
+    parser.add_argument("--typical-repeat", type=int, default=50, help="Repetitions for the typical-file comparison")
+    parser.add_argument("--max-typical-ratio", type=float, default=None, help="Fail when typical files parse more than this many times slower than with the legacy regexes")
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    for name, build in CASES.items():
+        print(f"\n## {name}")
+        print(f"{'size':>10} {'lexer ms':>10} {'ns/char':>9}" + (f" {'legacy ms':>11}" if args.legacy else ""))
+        baseline_cost = None
+        cost = 0.0
+        size = args.min_size
+        while size <= args.max_size:
+            source = build(size)
+            elapsed = _time(lambda: parse_source(source), args.repeat)
+            cost = elapsed / len(source)
+            # 計測誤差が大きい極小時間は基準にしない
+            if baseline_cost is None and elapsed > 0.001:
+                baseline_cost = cost
+            line = f"{len(source):>10} {elapsed * 1000:>10.2f} {cost * 1e9:>9.1f}"
+            if args.legacy and size <= args.legacy_max_size:
+                line += f" {_time(lambda: _legacy(source), 1) * 1000:>11.2f}"
+            print(line)
+            size *= 2
+
+        if baseline_cost and cost / baseline_cost > args.max_ratio:
+            failures.append(f"{name}: per-character cost grew x{cost / baseline_cost:.2f}")
+
+    typical_failures = run_typical(args.typical_repeat, args.max_typical_ratio)
+
+    if failures:
+        print("\n❌ Non-linear scaling detected:")
+        for failure in failures:
+            print(f"   - {failure}")
+    if typical_failures:
+        print("\n❌ Typical files are slower than the legacy regexes:")
+        for failure in typical_failures:
+            print(f"   - {failure}")
+    if failures or typical_failures:
+        return 1
+    print("\n✅ Lexer scales linearly on all pathological inputs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
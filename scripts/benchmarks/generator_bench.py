@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+API ジェネレーターのベンチマーク
+
+合成コーパス（benchmarks/synthetic_corpus.py）を一時ディレクトリに書き出し、
+scripts/api-generator.py と scripts/api_generator/ パッケージ（AspDotnetParser / AxiosGenerator）の
+各フェーズの時間をファイル数を変えながら計測する。
+
+    python scripts/benchmarks/generator_bench.py [--sizes 10,100,1000,10000] [--output result.json]
+    python scripts/benchmarks/generator_bench.py --baseline result.json
+
+結果は JSON で保存する。--baseline を指定すると同じ (ファイル数, ジェネレーター, フェーズ) の
+時間と、パース済みモデルのプロパティ1件あたりのメモリを比較し、--threshold を超えて
+悪化したものがあれば終了コード 1 を返す。
+"""
+
+import argparse
+import contextlib
+import dataclasses
+import enum
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+_SCRIPTS_ROOT = Path(__file__).parent.parent  # scripts/
+if str(_SCRIPTS_ROOT) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_ROOT))
+
+from api_generator.client.axios.generator import AxiosGenerator
+from api_generator.server.asp_dotnet.parser import AspDotnetParser
+from benchmarks.synthetic_corpus import CorpusSpec, write_corpus
+
+# 結果 JSON の形式を変えたら上げる
+RESULT_VERSION = 1
+
+DEFAULT_OUTPUT = _SCRIPTS_ROOT / ".cache" / "benchmarks" / "generator-bench.json"
+
+Phases = Dict[str, float]
+Memory = Dict[str, float]
+
+
+def _load(name: str, path: Path):
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class _Timer:
+    """フェーズごとの経過時間を記録する"""
+
+    def __init__(self):
+        self.phases: Phases = {}
+
+    def __call__(self, phase: str, func: Callable[[], object]):
+        start = time.perf_counter()
+        result = func()
+        self.phases[phase] = self.phases.get(phase, 0.0) + time.perf_counter() - start
+        return result
+
+
+def retained_bytes(roots: Iterable[object]) -> int:
+    """
+    roots から辿れるオブジェクトの合計サイズ（sys.getsizeof、同じオブジェクトは1回だけ数える）
+
+    intern された文字列や共有された Enum はまとめて1回分になる。
+    """
+    seen = set()
+    stack = list(roots)
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or obj is None or isinstance(obj, (bool, int, float, enum.Enum)):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif dataclasses.is_dataclass(obj):
+            # __slots__ のないクラスはインスタンスごとの __dict__ も数える
+            if hasattr(obj, "__dict__"):
+                total += sys.getsizeof(obj.__dict__)
+            stack.extend(getattr(obj, f.name) for f in dataclasses.fields(obj))
+    return total
+
+
+def model_memory(classes: List, apis: List) -> Memory:
+    """パース済みモデル（DTO クラス・HttpApi）が保持するメモリと、プロパティ / エンドポイント1件あたりの値"""
+    properties = sum(len(cls.properties) for cls in classes)
+    class_bytes = retained_bytes(classes)
+    api_bytes = retained_bytes(apis)
+    return {
+        "properties": properties,
+        "class_bytes": class_bytes,
+        "api_bytes": api_bytes,
+        "bytes_per_property": class_bytes / properties if properties else 0.0,
+        "bytes_per_endpoint": api_bytes / len(apis) if apis else 0.0,
+    }
+
+
+def bench_script(jobs: int) -> Tuple[Phases, int, Memory]:
+    """
+    scripts/api-generator.py の各フェーズを計測する（カレントディレクトリがコーパスのルート）
+
+    Returns:
+        tuple: (フェーズ → 秒, 生成したエンドポイント数, パース済みモデルのメモリ)
+    """
+    gen = _load("api_generator_script", _SCRIPTS_ROOT / "api-generator.py")
+    timer = _Timer()
+
+    vo = timer("value_objects", lambda: gen.load_value_object_types(gen.VALUE_OBJECT_FILE))
+
+    cache_file = Path(".cache") / "parse-cache.json"
+    model = gen.ApiModel(gen.ParseCache(cache_file, enabled=False), jobs=jobs)
+    timer("parse_dtos", lambda: model.update_classes(gen._collect_dto_files()))
+    timer("parse_controllers", lambda: model.update_controllers(gen._collect_controller_files()))
+    timer("cache_save", model.parse_cache.save)
+
+    resolved = timer("resolve", lambda: model.resolve(vo))
+    plans, _ = gen._plan_outputs(vo, resolved)
+    gen.FRONTEND_API_DIR.mkdir(parents=True, exist_ok=True)
+    for plan in plans:
+        timer(f"render:{plan.file_path.name}", lambda: gen.stage_lines(plan.file_path, plan.render()).commit())
+
+    # 2 回目の実行: すべてパースキャッシュから読む
+    warm = gen.ApiModel(gen.ParseCache(cache_file), jobs=jobs)
+    timer("parse_warm_cache", lambda: (
+        warm.update_classes(gen._collect_dto_files()),
+        warm.update_controllers(gen._collect_controller_files()),
+    ))
+
+    return timer.phases, len(resolved.endpoints), model_memory(warm.classes, warm.apis)
+
+
+def bench_package(jobs: int) -> Tuple[Phases, int, Memory]:
+    """scripts/api_generator/ パッケージ（AspDotnetParser → AxiosGenerator）の各フェーズを計測する"""
+    gen = _load("api_generator_script", _SCRIPTS_ROOT / "api-generator.py")
+    timer = _Timer()
+
+    parser = AspDotnetParser()
+    vo = timer("value_objects", lambda: parser.parse_value_objects(gen.VALUE_OBJECT_FILE))
+
+    dto_files = gen._collect_dto_files()
+    classes = [c for c in timer("parse_dtos", lambda: parser.parse_classes(dto_files, jobs)) if c]
+    request_types = {c.name for c in classes if c.name.endswith("Request")}
+    response_types = {c.name for c in classes if c.name.endswith("Response")}
+
+    results = timer("parse_controllers", lambda: parser.parse_controllers(
+        gen._collect_controller_files(), request_types, response_types, jobs,
+    ))
+    apis = [api for endpoints, _ in results for api in endpoints]
+
+    class_map = {c.name: c for c in classes}
+    timer("render:axios", lambda: AxiosGenerator(vo, class_map).generate(apis))
+
+    return timer.phases, len(apis), model_memory(classes, apis)
+
+
+GENERATORS: Dict[str, Callable[[int], Tuple[Phases, int, Memory]]] = {
+    "script": bench_script,
+    "package": bench_package,
+}
+
+
+def run_size(spec: CorpusSpec, repeat: int, jobs: int, keep: bool) -> Dict:
+    """1 つのコーパス規模で全ジェネレーターを計測する（フェーズごとに repeat 回の最小値）"""
+    root = Path(tempfile.mkdtemp(prefix="api-gen-bench-"))
+    cwd = Path.cwd()
+    try:
+        source_bytes = write_corpus(root, spec)
+        os.chdir(root)
+        generators: Dict[str, Dict] = {}
+        for name, bench in GENERATORS.items():
+            best: Phases = {}
+            endpoints = 0
+            memory: Memory = {}
+            for _ in range(repeat):
+                # 前回の出力・キャッシュを消して毎回コールドな状態から計測する
+                shutil.rmtree(root / ".cache", ignore_errors=True)
+                with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                    phases, endpoints, memory = bench(jobs)
+                for phase, seconds in phases.items():
+                    best[phase] = min(seconds, best.get(phase, float("inf")))
+            generators[name] = {"endpoints": endpoints, "phases": best, "total": sum(best.values()), "memory": memory}
+        return {
+            "files": spec.files,
+            "controllers": spec.controllers,
+            "actions": spec.actions,
+            "dtos": spec.dtos,
+            "source_bytes": source_bytes,
+            "generators": generators,
+        }
+    finally:
+        os.chdir(cwd)
+        if keep:
+            print(f"   corpus kept at {root}")
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def compare(current: Dict, baseline: Dict, threshold: float, min_seconds: float) -> List[str]:
+    """
+    baseline より threshold（割合）を超えて遅くなったフェーズを返す
+
+    どちらの実行でも min_seconds 未満のフェーズは計測誤差が大きいため比較しない。
+    """
+    baseline_runs = {run["files"]: run for run in baseline.get("runs", [])}
+    regressions: List[str] = []
+    for run in current["runs"]:
+        base_run = baseline_runs.get(run["files"])
+        if not base_run:
+            continue
+        for gen_name, result in run["generators"].items():
+            base_phases = base_run["generators"].get(gen_name, {}).get("phases", {})
+            phases = dict(result["phases"], total=result["total"])
+            base_phases = dict(base_phases, total=base_run["generators"].get(gen_name, {}).get("total", 0.0))
+            for phase, seconds in phases.items():
+                base_seconds = base_phases.get(phase)
+                if not base_seconds or max(seconds, base_seconds) < min_seconds:
+                    continue
+                ratio = seconds / base_seconds
+                if ratio > 1 + threshold:
+                    regressions.append(
+                        f"{run['files']} files / {gen_name} / {phase}: "
+                        f"{base_seconds * 1000:.1f} ms → {seconds * 1000:.1f} ms (x{ratio:.2f})"
+                    )
+            # メモリは計測誤差がないので、baseline にあれば常に比較する
+            per_property = result.get("memory", {}).get("bytes_per_property")
+            base_per_property = base_run["generators"].get(gen_name, {}).get("memory", {}).get("bytes_per_property")
+            if per_property and base_per_property and per_property / base_per_property > 1 + threshold:
+                regressions.append(
+                    f"{run['files']} files / {gen_name} / memory: "
+                    f"{base_per_property:.0f} → {per_property:.0f} bytes per property (x{per_property / base_per_property:.2f})"
+                )
+    return regressions
+
+
+def _print_run(run: Dict) -> None:
+    for gen_name, result in run["generators"].items():
+        print(f"   {gen_name:<8} total {result['total'] * 1000:>9.1f} ms  ({result['endpoints']} endpoints)")
+        for phase, seconds in result["phases"].items():
+            print(f"     {phase:<24} {seconds * 1000:>9.1f} ms")
+        memory = result["memory"]
+        print(f"     {'memory':<24} {memory['bytes_per_property']:>9.0f} B/property, "
+              f"{memory['bytes_per_endpoint']:.0f} B/endpoint ({memory['properties']:,} properties)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the API generators on a synthetic C# backend")
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="Comma-separated corpus sizes in files")
+    parser.add_argument("--actions", type=int, default=8, help="Actions per controller")
+    parser.add_argument("--attribute-depth", type=int, default=4, help="Attributes stacked on each DTO property")
+    parser.add_argument("--generic-depth", type=int, default=3, help="Nesting depth of generic DTO properties")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per size (best phase time is kept)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Worker processes for parsing (0 = number of CPUs)")
+    parser.add_argument("--output", "-o", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    parser.add_argument("--baseline", type=Path, help="Earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown against the baseline (0.25 = +25%%)")
+    parser.add_argument("--min-ms", type=float, default=5.0, help="Ignore phases faster than this in the comparison")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated corpora for inspection")
+    args = parser.parse_args()
+
+    baseline: Optional[Dict] = None
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("version") != RESULT_VERSION:
+            print(f"❌ Baseline format v{baseline.get('version')} is not supported (expected v{RESULT_VERSION})")
+            return 2
+
+    runs: List[Dict] = []
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        spec = CorpusSpec.for_files(
+            size, actions=args.actions, attribute_depth=args.attribute_depth, generic_depth=args.generic_depth,
+        )
+        print(f"\n## {spec.files} files ({spec.controllers} controllers × {spec.actions} actions, {spec.dtos} DTOs)")
+        run = run_size(spec, args.repeat, args.jobs, args.keep)
+        _print_run(run)
+        runs.append(run)
+
+    result = {
+        "version": RESULT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": {
+            "actions": args.actions,
+            "attribute_depth": args.attribute_depth,
+            "generic_depth": args.generic_depth,
+            "repeat": args.repeat,
+            "jobs": args.jobs,
+        },
+        "runs": runs,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+    print(f"\n💾 Results written to {args.output}")
+
+    if baseline is None:
+        return 0
+    regressions = compare(result, baseline, args.threshold, args.min_ms / 1000)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        return 1
+    print(f"\n✅ No regressions against {args.baseline} (threshold +{args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
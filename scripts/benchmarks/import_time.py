@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+ジェネレーターの起動時間（import にかかる時間）を python -X importtime で計測する
+
+pre-commit や dev container の起動時に毎回実行されるため、import だけで予算を超えたら終了コード 1 を返す。
+
+    python scripts/benchmarks/import_time.py [--budget-ms 100] [--repeat 5] [--top 10]
+
+各コマンドを --repeat 回実行し、トップレベル import の累積時間の最小値（他プロセスの影響が最も少ない回）を予算と比較する。
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+_SCRIPTS_ROOT = Path(__file__).parent.parent  # scripts/
+_REPO_ROOT = _SCRIPTS_ROOT.parent
+
+# (名前, コマンド, 作業ディレクトリ)。--help で引数解析までの起動コストだけを測る
+COMMANDS: List[Tuple[str, List[str], Path]] = [
+    ("api-generator", [str(_SCRIPTS_ROOT / "api-generator.py"), "--help"], _REPO_ROOT),
+    ("generate_from_entities", [str(_REPO_ROOT / "nari-note-backend" / "Scripts" / "generate_from_entities.py"), "--help"], _REPO_ROOT),
+]
+
+
+def measure(command: List[str], cwd: Path) -> Dict[str, int]:
+    """
+    1回実行して、トップレベル import（インタープリター起動時の site などを除く）ごとの累積時間 [µs] を返す
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *command],
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"),
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(command)} exited with {result.returncode}:\n{result.stderr[-2000:]}")
+
+    # "import time: self [us] | cumulative | imported package" — 先頭の空白の数がネストの深さ
+    imports: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.startswith("  "):
+            continue
+        imports[name.strip()] = imports.get(name.strip(), 0) + int(cumulative)
+    return imports
+
+
+def _startup_modules(imports: Dict[str, int], baseline: Dict[str, int]) -> Dict[str, int]:
+    """python -c pass でも読み込まれるモジュール（site など）を除く"""
+    return {name: us for name, us in imports.items() if name not in baseline}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check the import-time budget of the generator scripts")
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="Allowed import time per command (fastest run)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per command")
+    parser.add_argument("--top", type=int, default=8, help="Slowest top-level imports to show")
+    args = parser.parse_args()
+
+    baseline = measure(["-c", "pass"], _REPO_ROOT)
+    over_budget: List[str] = []
+    for name, command, cwd in COMMANDS:
+        runs = [_startup_modules(measure(command, cwd), baseline) for _ in range(args.repeat)]
+        totals = [sum(run.values()) / 1000 for run in runs]
+        fastest = min(totals)
+        status = "✓" if fastest <= args.budget_ms else "✗"
+        print(f"\n{status} {name}: {fastest:.1f} ms (median {statistics.median(totals):.1f} ms, budget {args.budget_ms:.0f} ms)")
+
+        per_module: Dict[str, List[int]] = {}
+        for run in runs:
+            for module, us in run.items():
+                per_module.setdefault(module, []).append(us)
+        slowest = sorted(per_module.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+        for module, values in slowest[:args.top]:
+            print(f"   {module:<40} {statistics.median(values) / 1000:>7.1f} ms")
+        if fastest > args.budget_ms:
+            over_budget.append(name)
+
+    if over_budget:
+        print(f"\n❌ Over the import-time budget: {', '.join(over_budget)}")
+        return 1
+    print("\n✅ All commands within the import-time budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
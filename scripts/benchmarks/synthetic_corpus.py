@@ -0,0 +1,216 @@
+"""
+ベンチマーク用の合成 C# バックエンドを生成する
+
+nari-note-backend/Src と同じディレクトリ構成で、
+Controller（N 個 × M アクション）、Request / Response / DTO（K 個）、ValueObject を書き出す。
+DTO にはネストしたジェネリック型と長い属性の積み重ねを含める。
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+BACKEND_ROOT = Path("nari-note-backend/Src")
+FRONTEND_API_DIR = Path("nari-note-frontend/src/lib/api")
+
+# 生成する ValueObject: (struct 名, 基底型)
+VALUE_OBJECTS = [
+    ("UserId", "int"),
+    ("ArticleId", "Guid"),
+    ("CourseId", "Guid"),
+    ("TagId", "int"),
+    ("CommentId", "int"),
+]
+
+# アクションのパターン: (HTTP 属性, ルート, 関数名の接頭辞, Request を body で受けるか)
+_ACTIONS = [
+    ("HttpGet", None, "List", False),
+    ("HttpGet", "{id}", "Get", False),
+    ("HttpPost", None, "Create", True),
+    ("HttpPut", "{id}", "Update", True),
+    ("HttpDelete", "{id}", "Delete", False),
+    ("HttpPost", "{id}/like", "Toggle", False),
+]
+
+_ATTRIBUTES = [
+    '[Required(ErrorMessage = "必須です")]',
+    '[MaxLength(200, ErrorMessage = "200文字以内で入力してください")]',
+    '[JsonPropertyName("{name}")]',
+    '[Display(Name = "{name}")]',
+    "[ValidTagNames]",
+    '[RegularExpression(@"^[a-z0-9_-]+$")]',
+]
+
+
+@dataclass
+class CorpusSpec:
+    """合成コーパスの規模"""
+    controllers: int
+    actions: int
+    dtos: int
+    # 1 プロパティあたりの属性の数
+    attribute_depth: int = 4
+    # Dictionary<string, List<...>> のネストの深さ
+    generic_depth: int = 3
+
+    @property
+    def files(self) -> int:
+        return self.controllers + self.dtos
+
+    @classmethod
+    def for_files(cls, files: int, actions: int = 8, **kwargs) -> "CorpusSpec":
+        """合計ファイル数から、アクションごとに Request / Response が揃う程度の比率で規模を決める"""
+        controllers = max(1, files // (2 * actions + 1))
+        return cls(controllers=controllers, actions=actions, dtos=max(1, files - controllers), **kwargs)
+
+
+def _dto_role(index: int) -> str:
+    return ("Request", "Response", "Dto")[index % 3]
+
+
+def dto_name(index: int) -> str:
+    role = _dto_role(index)
+    if role == "Dto":
+        return f"Item{index}Dto"
+    return f"Op{index}{role}"
+
+
+def _dto_dir(index: int) -> Path:
+    role = _dto_role(index)
+    if role == "Dto":
+        return BACKEND_ROOT / "Application/Dto"
+    return BACKEND_ROOT / "Application/Dto" / role
+
+
+def _nested_generic(depth: int, leaf: str) -> str:
+    type_str = leaf
+    for level in range(depth):
+        type_str = f"Dictionary<string, List<{type_str}>>" if level % 2 == 0 else f"List<{type_str}?>"
+    return type_str
+
+
+def _attributes(spec: CorpusSpec, name: str) -> List[str]:
+    return [
+        "    " + _ATTRIBUTES[i % len(_ATTRIBUTES)].format(name=name[0].lower() + name[1:])
+        for i in range(spec.attribute_depth)
+    ]
+
+
+def render_dto(spec: CorpusSpec, index: int) -> str:
+    name = dto_name(index)
+    namespace = "NariNoteBackend.Application.Dto"
+    if _dto_role(index) != "Dto":
+        namespace += f".{_dto_role(index)}"
+
+    # 自分より前にある直近の *Dto を参照する（Item2Dto, Item5Dto, ...）
+    nested = dto_name(index - 1 - (index - 3) % 3) if index >= 3 else "string"
+    vo_name = VALUE_OBJECTS[index % len(VALUE_OBJECTS)][0]
+    properties = [
+        ("Id", vo_name),
+        ("Title", "string"),
+        ("Count", "int?"),
+        ("Score", "double"),
+        ("IsPublished", "bool"),
+        ("CreatedAt", "DateTime"),
+        ("PublishedAt", "DateTime?"),
+        ("Tags", "List<string>"),
+        ("OwnerIds", f"IReadOnlyList<{vo_name}?>"),
+        ("Children", f"List<{nested}>"),
+        ("Index", _nested_generic(spec.generic_depth, "int?")),
+    ]
+
+    lines = [
+        "using System.ComponentModel.DataAnnotations;",
+        "using NariNoteBackend.Domain.ValueObject;",
+        "",
+        f"namespace {namespace};",
+        "",
+        f"public class {name}",
+        "{",
+    ]
+    for prop_name, prop_type in properties:
+        lines.extend(_attributes(spec, prop_name))
+        # ジェネリック型は複数行に折り返す（字句解析器の負荷を上げる）
+        if prop_type.startswith("Dictionary<"):
+            prop_type = prop_type.replace(", ", ",\n        ")
+        lines.append(f"    public {prop_type} {prop_name} {{ get; set; }}")
+        lines.append("")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def render_controller(spec: CorpusSpec, index: int) -> str:
+    name = f"Resource{index}"
+    lines = [
+        "using Microsoft.AspNetCore.Mvc;",
+        "using NariNoteBackend.Application.Dto.Request;",
+        "using NariNoteBackend.Application.Dto.Response;",
+        "using NariNoteBackend.Domain.ValueObject;",
+        "",
+        "namespace NariNoteBackend.Controller;",
+        "",
+        "[ApiController]",
+        '[Route("api/[controller]")]',
+        f"public class {name}Controller : ApplicationController",
+        "{",
+    ]
+    for action in range(spec.actions):
+        http_attr, route, prefix, has_body = _ACTIONS[action % len(_ACTIONS)]
+        # アクションごとに Request / Response の DTO を割り当てる
+        slot = (index * spec.actions + action) % ((spec.dtos + 2) // 3) * 3
+        request_type = dto_name(slot)
+        response_type = dto_name(slot + 1) if slot + 1 < spec.dtos else None
+
+        function_name = f"{prefix}{name}{action}"
+        params = []
+        if route and "{id}" in route:
+            params.append("ArticleId id")
+        if has_body:
+            params.append(f"[FromBody] {request_type} request")
+
+        route_arg = f'("{route}")' if route else ""
+        lines.append(f"    [{http_attr}{route_arg}]")
+        lines.append("    [RequireAuth]")
+        lines.append("    [ValidateModelState]")
+        if http_attr == "HttpDelete" or response_type is None:
+            lines.append(f"    public async Task<ActionResult> {function_name}({', '.join(params)})")
+        else:
+            lines.append(f"    public async Task<ActionResult<{response_type}>> {function_name}({', '.join(params)})")
+        lines.append("    {")
+        lines.append("        return Ok();")
+        lines.append("    }")
+        lines.append("")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def render_value_objects() -> str:
+    lines = ["using Vogen;", "", "namespace NariNoteBackend.Domain.ValueObject;", ""]
+    for name, underlying in VALUE_OBJECTS:
+        lines.append(f"[ValueObject<{underlying}>(Conversions.EfCoreValueConverter)]")
+        lines.append(f"public partial struct {name};")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def write_corpus(root: Path, spec: CorpusSpec) -> int:
+    """root 以下に合成コーパスを書き出し、書き出したソースの合計バイト数を返す"""
+    backend = root / BACKEND_ROOT
+    for directory in ("Controller", "Application/Dto/Request", "Application/Dto/Response", "Domain/ValueObject"):
+        (backend / directory).mkdir(parents=True, exist_ok=True)
+    (root / FRONTEND_API_DIR).mkdir(parents=True, exist_ok=True)
+
+    total = 0
+
+    def write(path: Path, content: str) -> None:
+        nonlocal total
+        data = content.encode("utf-8")
+        path.write_bytes(data)
+        total += len(data)
+
+    write(backend / "Domain/ValueObject/EntityKeyObject.cs", render_value_objects())
+    for index in range(spec.dtos):
+        write(root / _dto_dir(index) / f"{dto_name(index)}.cs", render_dto(spec, index))
+    for index in range(spec.controllers):
+        write(backend / "Controller" / f"Resource{index}Controller.cs", render_controller(spec, index))
+    return total
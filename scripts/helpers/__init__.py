@@ -1,15 +1,77 @@
-"""Helper modules for API generator."""
-
-from .csharp_parser import (
-    load_value_object_types,
-    csharp_type_to_typescript,
-    parse_csharp_class,
-    parse_controller
-)
-
-__all__ = [
-    'load_value_object_types',
-    'csharp_type_to_typescript',
-    'parse_csharp_class',
-    'parse_controller'
-]
+"""
+Helper modules for API generator.
+
+サブモジュールは属性に初めてアクセスしたときに読み込む（PEP 562）。
+templates が csharp_type_to_typescript だけを使う場合などに、
+プロセスプール・ファイル監視・プロファイラの import コストを払わずに済む。
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+# 公開名 → 定義しているサブモジュール
+_EXPORTS = {
+    'load_value_object_types': 'csharp_parser',
+    'csharp_type_to_typescript': 'csharp_parser',
+    'parse_csharp_class': 'csharp_parser',
+    'parse_controller': 'csharp_parser',
+    'TypeRef': 'csharp_types',
+    'TypeScriptTypeMapper': 'csharp_types',
+    'get_type_mapper': 'csharp_types',
+    'parse_csharp_type': 'csharp_types',
+    'ParseCache': 'parse_cache',
+    'StagedFile': 'file_writer',
+    'stage_lines': 'file_writer',
+    'write_if_changed': 'file_writer',
+    'write_lines_if_changed': 'file_writer',
+    'FileWatcher': 'file_watcher',
+    'parallel_map': 'parallel',
+    'resolve_jobs': 'parallel',
+    'PhaseProfiler': 'profiler',
+    'SymbolIndex': 'symbol_index',
+    'Invalidation': 'invalidation',
+    'InvalidationMap': 'invalidation',
+    'QueryKey': 'invalidation',
+    'FileSystemSource': 'source_provider',
+    'GitBlobReader': 'source_provider',
+    'GitSource': 'source_provider',
+    'SourceError': 'source_provider',
+    'FINGERPRINT_PREFIX': 'fingerprint',
+    'is_fingerprint_line': 'fingerprint',
+    'hash_files': 'fingerprint',
+    'input_fingerprint': 'fingerprint',
+    'read_fingerprint': 'fingerprint',
+    'stamp_fingerprint': 'fingerprint',
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .csharp_parser import (
+        load_value_object_types,
+        csharp_type_to_typescript,
+        parse_csharp_class,
+        parse_controller
+    )
+    from .csharp_types import TypeRef, TypeScriptTypeMapper, get_type_mapper, parse_csharp_type
+    from .parse_cache import ParseCache
+    from .file_writer import StagedFile, stage_lines, write_if_changed, write_lines_if_changed
+    from .file_watcher import FileWatcher
+    from .parallel import parallel_map, resolve_jobs
+    from .profiler import PhaseProfiler
+    from .symbol_index import SymbolIndex
+    from .invalidation import Invalidation, InvalidationMap, QueryKey
+    from .source_provider import FileSystemSource, GitBlobReader, GitSource, SourceError
+    from .fingerprint import FINGERPRINT_PREFIX, hash_files, is_fingerprint_line, input_fingerprint, read_fingerprint, stamp_fingerprint
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,658 @@
+"""
+C# の宣言部分だけを読む線形時間の宣言パーサー
+
+api-generator が必要とするサブセット（namespace / class 等の型宣言 / 属性 / プロパティ /
+メソッドシグネチャ）のみを扱う。メソッド本体や初期化式の中身は括弧の対応だけ追って読み飛ばす。
+
+トークンの列は作らない。先にコメント・プリプロセッサ行・BOM を同じ長さの空白に、文字列・文字リテラルを
+同じ長さの制御文字の並びに置き換え（残った括弧はすべて構文上の括弧になる）、その文字列の上で
+属性・型・メンバーなどの構成要素ごとに正規表現を当てて先頭から一度だけ読み進める。
+正規表現は次の1文字で分岐が決まり、量指定子はすべて所有的（Python 3.11+）なのでバックトラックしない。
+括弧の対応は、ファイル全体の入れ子が正しければ入れ子の深さに上限のある正規表現で、そうでなければ
+（深すぎる・閉じ忘れなど）括弧を1つずつたどって読み飛ばすので、どちらでも線形時間になる。
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+MODIFIERS = frozenset({
+    'public', 'private', 'protected', 'internal', 'static', 'readonly', 'const',
+    'virtual', 'override', 'abstract', 'sealed', 'async', 'required', 'partial',
+    'new', 'extern', 'unsafe', 'volatile', 'file',
+})
+TYPE_KEYWORDS = frozenset({'class', 'struct', 'interface', 'record', 'enum'})
+_CLOSE_OF = {'(': ')', '[': ']', '{': '}'}
+
+
+@dataclass
+class AttributeDecl:
+    """[Name(arg1, arg2)] の1属性。arguments は各引数のソース文字列"""
+    name: str
+    arguments: List[str] = field(default_factory=list)
+
+    def string_argument(self, index: int = 0) -> Optional[str]:
+        """index 番目の引数が文字列リテラルならその中身を返す"""
+        if index >= len(self.arguments):
+            return None
+        arg = self.arguments[index]
+        if len(arg) >= 2 and arg[0] == '"' and arg[-1] == '"':
+            return arg[1:-1]
+        return None
+
+
+@dataclass
+class PropertyDecl:
+    name: str
+    type: str
+    modifiers: List[str]
+    attributes: List[AttributeDecl]
+    accessors: List[str]    # 例: ["get", "set"], ["get", "private set"]
+    is_auto: bool           # すべてのアクセサが本体なし（get; set; 形式）
+
+
+@dataclass
+class MethodDecl:
+    name: str
+    return_type: str
+    modifiers: List[str]
+    attributes: List[AttributeDecl]
+    parameters: str         # 括弧内のソース文字列
+
+
+@dataclass
+class TypeDecl:
+    kind: str               # class / struct / interface / record / enum
+    name: str
+    modifiers: List[str]
+    attributes: List[AttributeDecl]
+    base_types: List[str] = field(default_factory=list)
+    properties: List[PropertyDecl] = field(default_factory=list)
+    methods: List[MethodDecl] = field(default_factory=list)
+
+
+@dataclass
+class SourceFile:
+    namespace: str
+    types: List[TypeDecl]   # 出現順（ネストした型も含む）
+
+    def first_type(self, kind: str = 'class', public: bool = True, suffix: str = '') -> Optional[TypeDecl]:
+        """条件に合う最初の型宣言を返す"""
+        for decl in self.types:
+            if decl.kind != kind or not decl.name.endswith(suffix):
+                continue
+            if public and 'public' not in decl.modifiers:
+                continue
+            return decl
+        return None
+
+
+def parse_source(source: str) -> SourceFile:
+    """C# ソースから宣言情報を抽出する（線形時間）"""
+    masked = _MASK_PATTERN.sub(_mask, source)
+    return _DeclarationParser(source, masked, _is_balanced(masked)).parse()
+
+
+# --- 前処理 ---
+
+_LITERAL = '\x01'
+_LITERAL_REST = '\x02'
+# コメント・プリプロセッサ行・BOM と文字列・文字リテラル（未終端なら行末・ファイル末尾まで）。
+# どの選択肢もリテラルの1文字で始めると正規表現エンジンが先頭文字の集合で候補位置を探すので、
+# \$? などは選択肢ごとに展開してある
+_MASK_PATTERN = re.compile(
+    r'//[^\n]*|/\*[\s\S]*?(?:\*/|\Z)|\#[^\n]*|\ufeff'
+    r'|"""(?:[^"]|"(?!""))*(?:"""|\Z)|\$"""(?:[^"]|"(?!""))*(?:"""|\Z)'
+    r'|\$@"(?:[^"]|"")*"?|@\$"(?:[^"]|"")*"?|@"(?:[^"]|"")*"?'
+    r'|"(?:\\.|[^"\\\n])*"?|\$"(?:\\.|[^"\\\n])*"?'
+    r"|'(?:\\.|[^'\\\n])*'?"
+)
+# UTF-8 にしたソースから括弧以外のバイトを消すための表（括弧は ASCII なので他の文字のバイトと重ならない）
+_NON_BRACKET_BYTES = bytes(c for c in range(256) if c not in b'()[]{}')
+_BRACKET_PAIR = re.compile(rb'\(\)|\[\]|\{\}')
+# 入れ子の確認と 'balanced' の正規表現で読める深さの上限（これより深いファイルは括弧を1つずつたどる）
+_MAX_DEPTH = 12
+
+
+def _mask(match: 're.Match[str]') -> str:
+    text = match.group()
+    if text[0] in '/#\ufeff':
+        return ' ' * len(text)
+    # 隣り合うリテラルを別のトークンとして読めるよう、2文字目以降は _LITERAL_REST にする
+    return _LITERAL + _LITERAL_REST * (len(text) - 1)
+
+
+def _is_balanced(masked: str) -> bool:
+    """括弧だけを残し、内側の対を消していって空になれば入れ子が正しい（_MAX_DEPTH 段まで）"""
+    brackets = masked.encode('utf-8', 'surrogatepass').translate(None, _NON_BRACKET_BYTES)
+    for _ in range(_MAX_DEPTH):
+        if not brackets:
+            return True
+        reduced = _BRACKET_PAIR.sub(b'', brackets)
+        if len(reduced) == len(brackets):
+            return False
+        brackets = reduced
+    return not brackets
+
+
+def _nested(depth: int) -> str:
+    """開き括弧から対応する閉じ括弧までを depth 段まで読む正規表現（入れ子が正しい前提なので種類は区別しない）"""
+    pattern = r'[(\[{][^(){}\[\]]*+[)\]}]'
+    for _ in range(depth):
+        pattern = rf'[(\[{{](?:[^(){{}}\[\]]++|{pattern})*+[)\]}}]'
+    return pattern
+
+
+# --- 構成要素の正規表現 ---
+
+_NAME = r'@?[^\W\d]\w*+'
+# ジェネリック引数は3段まで（それより深い・型以外の記号を含むものは _skip_angle で読む）
+_GENERIC_ARGUMENT = r'(?:[\w\s,.?]|\[[\s,]*+\])'
+_GENERIC = rf'<(?:{_GENERIC_ARGUMENT}|<(?:{_GENERIC_ARGUMENT}|<{_GENERIC_ARGUMENT}*+>)*+>)*+>'
+_DOTTED = rf'{_NAME}(?:\s*+(?:\.|::)\s*+{_NAME})*+'
+# 隣り合う '??' は null 合体演算子なので nullable の '?' としては読まない
+_TYPE = rf'{_DOTTED}(?:\s*+{_GENERIC})?+(?:\s*+(?:\?(?!\?)|\*|\[[\s,]*+\]))*+'
+_MODIFIER_LIST = rf'(?:(?:{"|".join(sorted(MODIFIERS))})(?!\w)\s*+)*+'
+_PATTERNS = {
+    'ws': r'\s*+',
+    'name': _NAME,
+    'dotted': _DOTTED,
+    'generic': _GENERIC,
+    # 修飾子の並びと、その次の識別子
+    'head': rf'({_MODIFIER_LIST})(?:({_NAME})\s*+)?+',
+    'namespace': rf'(?:{_NAME}|\.)(?:\s*+(?:{_NAME}|\.))*+',
+    'balanced': _nested(_MAX_DEPTH),
+    # 属性の多くを占める [Name] / [Name(引数)]（引数に括弧を含まないもの）
+    'attribute': rf'\[\s*+({_NAME})\s*+(?:\(([^(){{}}\[\];]*+)\)\s*+)?+\]\s*+',
+    # DTO の大半を占める `修飾子 T Name { get; set; }`（一般の経路で読んだ場合と同じ PropertyDecl になる）
+    'auto_property': (
+        rf'({_MODIFIER_LIST})(?!(?:{"|".join(sorted(TYPE_KEYWORDS))}|namespace)(?!\w))'
+        rf'({_TYPE})\s*+({_NAME})\s*+\{{\s*+get\s*+;\s*+set\s*+;\s*+\}}\s*+'
+    ),
+    'accessor': rf'{_MODIFIER_LIST}{_NAME}',
+    'token': rf'{_NAME}|\d[\w.]*+|=>|\?\?|::|{_LITERAL}{_LITERAL_REST}*+|[\s\S]',
+    # 次の区切りまでの読み飛ばし（_skip_* が見る文字の手前まで）
+    'statement_text': r'[^;{}(\[]*+',
+    'angle_text': r'[^<>()\[\];{}=]*+',
+    'argument_text': r'[^()\[{},;]*+',
+    'bracket': r'[(){}\[\]]',
+}
+
+
+@lru_cache(maxsize=None)
+def _patterns() -> Dict[str, 're.Pattern[str]']:
+    """構成要素の正規表現（コンパイルに数 ms かかるので、パースするときに初めてコンパイルする）"""
+    return {name: re.compile(pattern) for name, pattern in _PATTERNS.items()}
+
+
+def _strip_span(source: str, masked: str, start: int, end: int) -> str:
+    """masked[start:end] の前後の空白（コメントを含む）を除いた範囲のソース文字列"""
+    chunk = masked[start:end]
+    stripped = chunk.strip()
+    if not stripped:
+        return ""
+    start += chunk.index(stripped[0])
+    return source[start:start + len(stripped)]
+
+
+class _DeclarationParser:
+    """
+    マスクしたソースを先頭から一度だけ読んで宣言を拾うパーサー
+
+    位置は常に次のトークンの先頭（空白の後ろ）を指す。どの分岐も必ず位置を前に進める。
+    """
+
+    def __init__(self, source: str, masked: str, balanced: bool):
+        patterns = _patterns()
+        self.source = source
+        self.masked = masked
+        self.n = len(masked)
+        self.balanced = balanced
+        self.namespace = ""
+        self.types: List[TypeDecl] = []
+        self._ws = patterns['ws'].match
+        self._name = patterns['name'].match
+        self._head = patterns['head'].match
+        self._auto_property = patterns['auto_property'].match
+        self._patterns = patterns
+
+    def _span(self, start: int, end: int) -> str:
+        """位置 start から end（次のトークンの先頭）までのトークンのソース文字列"""
+        return _strip_span(self.source, self.masked, start, end)
+
+    def _next(self, pos: int) -> int:
+        """1トークン読み進める（ファイル末尾ではそのまま）"""
+        if pos >= self.n:
+            return self.n
+        return self._ws(self.masked, self._patterns['token'].match(self.masked, pos).end()).end()
+
+    # --- 読み飛ばし ---
+
+    def _skip_balanced(self, pos: int) -> int:
+        """開き括弧から対応する閉じ括弧の次まで進める"""
+        close = self._find_close(pos)
+        return self.n if close is None else self._ws(self.masked, close + 1).end()
+
+    def _find_close(self, pos: int) -> Optional[int]:
+        """開き括弧に対応する閉じ括弧の位置。閉じないままファイルが終われば None"""
+        masked = self.masked
+        if self.balanced:
+            match = self._patterns['balanced'].match(masked, pos)
+            if match:
+                return match.end() - 1
+        # 深すぎる・対応が崩れている: 閉じ記号が一致するところまで戻して先へ進む
+        stack = [_CLOSE_OF[masked[pos]]]
+        for match in self._patterns['bracket'].finditer(masked, pos + 1):
+            text = match.group()
+            if text in _CLOSE_OF:
+                stack.append(_CLOSE_OF[text])
+                continue
+            while stack and stack.pop() != text:
+                pass
+            if not stack:
+                return match.start()
+        return None
+
+    def _last_token_start(self, pos: int) -> int:
+        """pos 以降の最後のトークンの先頭（トークンが無ければ pos）"""
+        last = pos
+        while pos < self.n:
+            last, pos = pos, self._next(pos)
+        return last
+
+    def _skip_angle(self, pos: int) -> int:
+        """ジェネリック引数 <...> を読み飛ばす。型以外の記号が来たらそこで打ち切る"""
+        masked = self.masked
+        match = self._patterns['generic'].match(masked, pos)
+        if match:
+            return self._ws(masked, match.end()).end()
+        angle_text = self._patterns['angle_text'].match
+        depth = 0
+        while True:
+            pos = angle_text(masked, pos).end()
+            if pos >= self.n:
+                return self.n
+            text = masked[pos]
+            if text == '<':
+                depth += 1
+            elif text == '>':
+                depth -= 1
+                if depth == 0:
+                    return self._ws(masked, pos + 1).end()
+            elif text in '([':
+                pos = self._skip_balanced(pos)
+                continue
+            else:
+                return pos
+            pos += 1
+
+    def _skip_statement(self, pos: int) -> int:
+        """';' まで、または {...} ブロックの終わりまで読み飛ばす。外側の '}' は消費しない"""
+        masked = self.masked
+        statement_text = self._patterns['statement_text'].match
+        while True:
+            pos = statement_text(masked, pos).end()
+            if pos >= self.n:
+                return self.n
+            text = masked[pos]
+            if text == ';':
+                return self._ws(masked, pos + 1).end()
+            if text == '}':
+                return pos
+            pos = self._skip_balanced(pos)
+            if text == '{':
+                return self._ws(masked, pos + 1).end() if masked.startswith(';', pos) else pos
+
+    def _skip_to_body(self, pos: int) -> int:
+        """where 制約・base(...) などを、本体の '{' か ';'（または外側の '}'）の手前まで読み飛ばす"""
+        masked = self.masked
+        statement_text = self._patterns['statement_text'].match
+        while True:
+            pos = statement_text(masked, pos).end()
+            if pos >= self.n or masked[pos] in '{;}':
+                return pos
+            pos = self._skip_balanced(pos)
+
+    # --- 宣言 ---
+
+    def parse(self) -> SourceFile:
+        pos = self._ws(self.masked, 0).end()
+        while pos < self.n:
+            pos = self._parse_members(pos, None)
+            # ファイルレベルの余分な '}' は読み飛ばす
+            if self.masked.startswith('}', pos):
+                pos = self._ws(self.masked, pos + 1).end()
+        return SourceFile(namespace=self.namespace, types=self.types)
+
+    def _parse_members(self, pos: int, owner: Optional[TypeDecl]) -> int:
+        """'}' またはファイル末尾までのメンバー宣言を読む（'}' は消費しない）"""
+        attributes: List[AttributeDecl] = []
+        modifiers: List[str] = []
+        masked = self.masked
+        while pos < self.n:
+            if owner is not None:
+                match = self._auto_property(masked, pos)
+                if match:
+                    owner.properties.append(PropertyDecl(
+                        name=match.group(3),
+                        type=self.source[match.start(2):match.end(2)],
+                        modifiers=modifiers + match.group(1).split(),
+                        attributes=attributes,
+                        accessors=['get', 'set'],
+                        is_auto=True,
+                    ))
+                    pos = match.end()
+                    if masked.startswith('=', pos):
+                        pos = self._skip_statement(pos)
+                    attributes, modifiers = [], []
+                    continue
+            match = self._head(masked, pos)
+            if match.end(1) > pos:
+                modifiers.extend(match.group(1).split())
+            word = match.group(2)
+            if word is None:
+                pos = match.end()
+                if pos >= self.n:
+                    break
+                text = masked[pos]
+                if text == '}':
+                    return pos
+                if text == '[':
+                    parsed, pos = self._parse_attribute_section(pos)
+                    attributes.extend(parsed)
+                    continue
+                if text == ';':
+                    pos = self._ws(masked, pos + 1).end()
+                else:
+                    pos = self._skip_statement(pos)
+            elif word == 'using' and owner is None:
+                pos = self._skip_statement(match.start(2))
+            elif word == 'namespace':
+                pos = self._parse_namespace(match.end())
+            elif word in TYPE_KEYWORDS:
+                pos = self._parse_type(word, match.end(), attributes, modifiers)
+            elif owner is not None:
+                pos = self._parse_member(match.start(2), owner, attributes, modifiers)
+            else:
+                pos = self._skip_statement(match.start(2))
+            attributes, modifiers = [], []
+        return pos
+
+    def _parse_namespace(self, pos: int) -> int:
+        masked = self.masked
+        # 識別子と '.' の並び（namespace A . B も A.B と同じく1つの名前として読む）
+        match = self._patterns['namespace'].match(masked, pos)
+        if match:
+            if not self.namespace:
+                self.namespace = self.source[pos:match.end()]
+            pos = self._ws(masked, match.end()).end()
+        if masked.startswith('{', pos):
+            pos = self._parse_members(self._ws(masked, pos + 1).end(), None)
+            if masked.startswith('}', pos):
+                pos = self._ws(masked, pos + 1).end()
+        elif masked.startswith(';', pos):
+            pos = self._ws(masked, pos + 1).end()
+        return pos
+
+    def _parse_attribute_section(self, pos: int) -> Tuple[List[AttributeDecl], int]:
+        """[A, B(x)] を読んで (属性リスト, 次の位置) を返す"""
+        masked = self.masked
+        match = self._patterns['attribute'].match(masked, pos)
+        if match:
+            arguments: List[str] = []
+            if match.start(2) >= 0:
+                start = match.start(2)
+                for part in match.group(2).split(','):
+                    text = self._span(start, start + len(part))
+                    if text:
+                        arguments.append(text)
+                    start += len(part) + 1
+            return [AttributeDecl(name=match.group(1), arguments=arguments)], match.end()
+
+        attributes: List[AttributeDecl] = []
+        pos = self._ws(masked, pos + 1).end()
+        # [assembly: ...] / [return: ...] などのターゲット指定（'::' は別のトークン）
+        target = self._name(masked, pos)
+        if target:
+            after = self._ws(masked, target.end()).end()
+            if masked.startswith(':', after) and not masked.startswith('::', after):
+                pos = self._ws(masked, after + 1).end()
+
+        while pos < self.n:
+            if masked[pos] == ']':
+                return attributes, self._ws(masked, pos + 1).end()
+            if masked[pos] == ',':
+                pos = self._ws(masked, pos + 1).end()
+                continue
+            name = self._name(masked, pos)
+            if not name:
+                break
+            start = pos
+            pos = self._ws(masked, name.end()).end()
+            # '.' / '::' の次のトークンは何であれ名前の一部として読む
+            while masked.startswith('.', pos) or masked.startswith('::', pos):
+                pos = self._next(self._next(pos))
+            if masked.startswith('<', pos):
+                pos = self._skip_angle(pos)
+            attribute = AttributeDecl(name=self._span(start, pos))
+            if masked.startswith('(', pos):
+                attribute.arguments, pos = self._parse_arguments(pos)
+            attributes.append(attribute)
+
+        # 想定外の形: 対応する ']' まで読み飛ばす（'{' / '}' / ';' の手前で止める）
+        depth = 1
+        while pos < self.n and depth:
+            text = masked[pos]
+            if text == '[':
+                depth += 1
+            elif text == ']':
+                depth -= 1
+            elif text in '{};':
+                break
+            pos = self._next(pos)
+        return attributes, pos
+
+    def _parse_arguments(self, pos: int) -> Tuple[List[str], int]:
+        """(a, b(c, d), "e") を読んで (トップレベルの引数ごとのソース文字列, 次の位置) を返す"""
+        masked = self.masked
+        argument_text = self._patterns['argument_text'].match
+        arguments: List[str] = []
+        pos = start = self._ws(masked, pos + 1).end()
+        while True:
+            pos = argument_text(masked, pos).end()
+            if pos >= self.n:
+                return arguments, self.n
+            text = masked[pos]
+            if text == ')' or text == ',':
+                if pos > start:
+                    arguments.append(self._span(start, pos))
+                pos = start = self._ws(masked, pos + 1).end()
+                if text == ')':
+                    return arguments, pos
+            elif text in '};':
+                return arguments, pos
+            else:
+                pos = self._skip_balanced(pos)
+
+    def _parse_type_reference(self, pos: int) -> Optional[int]:
+        """型の参照（List<int>?, int[], (int, string), global::A.B など）を読み、次の位置を返す"""
+        masked = self.masked
+        if masked.startswith('(', pos):
+            pos = self._skip_balanced(pos)
+        else:
+            match = self._patterns['dotted'].match(masked, pos)
+            if not match:
+                return None
+            pos = self._ws(masked, match.end()).end()
+            if masked.startswith('<', pos):
+                pos = self._skip_angle(pos)
+
+        while pos < self.n:
+            text = masked[pos]
+            if text == '[':
+                pos = self._skip_balanced(pos)
+            elif text == '*' or (text == '?' and not masked.startswith('??', pos)):
+                pos = self._ws(masked, pos + 1).end()
+            else:
+                break
+        return pos
+
+    def _parse_type(self, kind: str, pos: int, attributes: List[AttributeDecl], modifiers: List[str]) -> int:
+        masked = self.masked
+        # record class / record struct
+        if kind == 'record':
+            keyword = self._name(masked, pos)
+            if keyword and keyword.group() in ('class', 'struct'):
+                pos = self._ws(masked, keyword.end()).end()
+        name = self._name(masked, pos)
+        if not name:
+            return self._skip_statement(pos)
+
+        decl = TypeDecl(kind=kind, name=name.group(), modifiers=modifiers, attributes=attributes)
+        self.types.append(decl)
+        pos = self._ws(masked, name.end()).end()
+        if masked.startswith('<', pos):
+            pos = self._skip_angle(pos)
+        if masked.startswith('(', pos):  # プライマリコンストラクタ
+            pos = self._skip_balanced(pos)
+
+        if masked.startswith(':', pos):
+            pos = self._ws(masked, pos + 1).end()
+            while pos < self.n:
+                start = pos
+                end = self._parse_type_reference(pos)
+                if end is None:
+                    break
+                pos = end
+                if masked.startswith('(', pos):  # record の基底コンストラクタ引数
+                    pos = self._skip_balanced(pos)
+                decl.base_types.append(self._span(start, pos))
+                if not masked.startswith(',', pos):
+                    break
+                pos = self._ws(masked, pos + 1).end()
+
+        pos = self._skip_to_body(pos)
+        if masked.startswith('{', pos):
+            if kind == 'enum':
+                return self._skip_balanced(pos)
+            pos = self._parse_members(self._ws(masked, pos + 1).end(), decl)
+            if masked.startswith('}', pos):
+                pos = self._ws(masked, pos + 1).end()
+        elif masked.startswith(';', pos):
+            pos = self._ws(masked, pos + 1).end()
+        return pos
+
+    def _parse_member(self, pos: int, owner: TypeDecl, attributes: List[AttributeDecl], modifiers: List[str]) -> int:
+        masked = self.masked
+        type_start = pos
+        type_end = self._parse_type_reference(pos)
+        if type_end is None:
+            return self._skip_statement(pos)
+        pos = type_end
+
+        # コンストラクタ（型名の直後が '('）
+        if masked.startswith('(', pos):
+            return self._skip_statement(self._skip_balanced(pos))
+
+        name_match = self._name(masked, pos)
+        if not name_match:
+            return self._skip_statement(pos)
+        name = name_match.group()
+        pos = self._ws(masked, name_match.end()).end()
+        # 明示的インターフェイス実装 (IFoo.Bar)
+        while masked.startswith('.', pos):
+            qualified = self._name(masked, self._ws(masked, pos + 1).end())
+            if not qualified:
+                break
+            name = qualified.group()
+            pos = self._ws(masked, qualified.end()).end()
+
+        return_type = self._span(type_start, type_end)
+
+        if masked.startswith('<', pos) or masked.startswith('(', pos):
+            if masked.startswith('<', pos):
+                pos = self._skip_angle(pos)
+            if not masked.startswith('(', pos):
+                return self._skip_statement(pos)
+            params_start = self._ws(masked, pos + 1).end()
+            close = self._find_close(pos)
+            if close is None:
+                # 閉じないままファイルが終わった場合は最後のトークンを閉じ括弧とみなす
+                close = self._last_token_start(params_start)
+                pos = self.n
+            else:
+                pos = self._ws(masked, close + 1).end()
+            owner.methods.append(MethodDecl(
+                name=name,
+                return_type=return_type,
+                modifiers=modifiers,
+                attributes=attributes,
+                parameters=self._span(params_start, close),
+            ))
+            if masked.startswith('=>', pos):
+                return self._skip_statement(pos)
+            pos = self._skip_to_body(pos)
+            if masked.startswith('{', pos):
+                return self._skip_balanced(pos)
+            if masked.startswith(';', pos):
+                return self._ws(masked, pos + 1).end()
+            return pos
+
+        if masked.startswith('{', pos):
+            accessors, is_auto, pos = self._parse_accessors(pos)
+            owner.properties.append(PropertyDecl(
+                name=name,
+                type=return_type,
+                modifiers=modifiers,
+                attributes=attributes,
+                accessors=accessors,
+                is_auto=is_auto,
+            ))
+            # 初期化子 (= value;)
+            return self._skip_statement(pos) if masked.startswith('=', pos) else pos
+
+        # 式形式プロパティ・フィールド・イベントなど
+        return self._skip_statement(pos)
+
+    def _parse_accessors(self, pos: int) -> Tuple[List[str], bool, int]:
+        """{ get; private set; } を読んで (アクセサ一覧, 自動実装か, 次の位置) を返す"""
+        masked = self.masked
+        accessor = self._patterns['accessor'].match
+        accessors: List[str] = []
+        is_auto = True
+        pos = self._ws(masked, pos + 1).end()
+
+        while pos < self.n:
+            text = masked[pos]
+            if text == '}':
+                return accessors, is_auto, self._ws(masked, pos + 1).end()
+            if text == '[':
+                pos = self._parse_attribute_section(pos)[1]
+                continue
+            match = accessor(masked, pos)
+            if not match:
+                break
+            accessors.append(self.source[pos:match.end()])
+            pos = self._ws(masked, match.end()).end()
+            if masked.startswith(';', pos):
+                pos = self._ws(masked, pos + 1).end()
+            elif masked.startswith('{', pos):
+                is_auto = False
+                pos = self._skip_balanced(pos)
+            elif masked.startswith('=>', pos):
+                is_auto = False
+                pos = self._skip_statement(pos)
+            else:
+                break
+
+        # 想定外の形: アクセサブロックの残りを読み飛ばす
+        depth = 1
+        while pos < self.n and depth:
+            text = masked[pos]
+            if text == '{':
+                depth += 1
+            elif text == '}':
+                depth -= 1
+            pos = self._next(pos)
+        return accessors, False, pos
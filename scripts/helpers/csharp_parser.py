@@ -4,19 +4,48 @@ import re
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 
-from models import CSharpProperty, CSharpClass, EndpointInfo
-
-
-def load_value_object_types(value_object_file: Path) -> Dict[str, str]:
+from models import CSharpProperty, CSharpClass, EndpointInfo, ValidationRule
+from .csharp_lexer import AttributeDecl, MethodDecl, PropertyDecl, parse_source
+from .csharp_types import get_type_mapper
+from .source_provider import FileSystemSource
+
+# source を指定しない場合の読み込み元（作業ツリー）
+_FILE_SYSTEM = FileSystemSource()
+
+_HTTP_ATTRIBUTES = {
+    'HttpGet': 'GET',
+    'HttpPost': 'POST',
+    'HttpPut': 'PUT',
+    'HttpDelete': 'DELETE',
+}
+# EndpointInfo.auth に残す認証属性（メソッドに付いていなければクラスの属性を使う）
+AUTH_ATTRIBUTES = ('AllowAnonymous', 'OptionalAuth', 'RequireAuth', 'Authorize')
+# 更新系アクションの成功後に無効化するクエリを指定する属性（EndpointInfo.invalidates）
+INVALIDATES_ATTRIBUTE = 'Invalidates'
+# nameof(UsersController.GetLikedArticles) → GetLikedArticles
+_NAMEOF = re.compile(r'nameof\(\s*(?:[\w.]+\.)?(\w+)\s*\)')
+# CSharpProperty.validation に残す検証属性（System.ComponentModel.DataAnnotations）
+VALIDATION_ATTRIBUTES = frozenset({
+    'Required', 'MinLength', 'MaxLength', 'StringLength', 'Range',
+    'EmailAddress', 'RegularExpression', 'Url', 'Phone',
+})
+# ErrorMessage = "..." などの名前付き引数
+_NAMED_ARGUMENT = re.compile(r'[A-Za-z_]\w*\s*=(?!=)')
+# 空白を除去した戻り値型に対して使う（短い文字列なのでバックトラックの心配はない）
+_ACTION_RESULT = re.compile(r'Task<ActionResult(?:<(\w+)>)?>|ActionResult(?:<(\w+)>)?')
+
+
+def load_value_object_types(value_object_file: Path, source: Optional[FileSystemSource] = None) -> Dict[str, str]:
     """Load ValueObject types from C# file. Returns mapping of struct name -> TypeScript type."""
     value_object_types: Dict[str, str] = {}
+    source = source or _FILE_SYSTEM
 
-    if not value_object_file.exists():
+    if not source.exists(value_object_file):
         print(f"⚠️  ValueObject file not found: {value_object_file}")
         return value_object_types
 
     try:
-        content = value_object_file.read_text(encoding='utf-8')
+        content = source.read_text(value_object_file)
         # [ValueObject<Guid>(Conversions.EfCoreValueConverter)] public partial struct XxxId; のパターンを探す
         # 基底型（Guid or int など）も取得して TS 型を決定する
         pattern = r'\[ValueObject<(\w+)>(?:\([^)]+\))?\]\s+public\s+partial\s+struct\s+(\w+);'
@@ -40,117 +69,159 @@ def csharp_type_to_typescript(csharp_type: str, value_object_types: Dict[str, st
     Returns:
         tuple: (typescript_type, is_nullable)
     """
-    type_mapping = {
-        'string': 'string',
-        'int': 'number',
-        'long': 'number',
-        'float': 'number',
-        'double': 'number',
-        'decimal': 'number',
-        'bool': 'boolean',
-        'DateTime': 'string',
-        'Guid': 'string',
-    }
-
-    # Nullable型（?）をチェック
-    is_nullable = csharp_type.endswith('?')
-    base_type = csharp_type.rstrip('?')
-
-    # ValueObject型を基底型に応じた TS 型に変換（Guid → string, int → number）
-    if base_type in value_object_types:
-        return value_object_types[base_type], is_nullable
-
-    # Dictionary<TKey, TValue> を Record<K, V> に変換
-    dict_match = re.match(r'Dictionary<(.+),\s*(.+)>', base_type)
-    if dict_match:
-        key_type = dict_match.group(1).strip()
-        value_type = dict_match.group(2).strip()
-        # 再帰的に内部の型も変換
-        ts_key, _ = csharp_type_to_typescript(key_type, value_object_types)
-        ts_value, _ = csharp_type_to_typescript(value_type, value_object_types)
-        return f"Record<{ts_key}, {ts_value}>", is_nullable
-
-    # List<T> を T[] に変換
-    list_match = re.match(r'List<(.+)>', base_type)
-    if list_match:
-        inner_type = list_match.group(1)
-        converted, _ = csharp_type_to_typescript(inner_type, value_object_types)
-        return f"{converted}[]", is_nullable
-
-    ts_type = type_mapping.get(base_type, base_type)
-    return ts_type, is_nullable
-
-
-def parse_csharp_class(file_path: Path) -> Optional[CSharpClass]:
-    """C#クラスファイルをパースしてクラス情報を抽出"""
+    # 型式の AST 化と変換結果は helpers.csharp_types 側でキャッシュされる
+    return get_type_mapper(value_object_types).to_typescript(csharp_type)
+
+
+def validation_rules(attributes: List[AttributeDecl]) -> Tuple[ValidationRule, ...]:
+    """検証属性を ValidationRule にする（名前付き引数は捨て、位置引数だけ残す）"""
+    rules = []
+    for attribute in attributes:
+        name = attribute.name.rsplit('.', 1)[-1]
+        if name.endswith('Attribute'):
+            name = name[:-len('Attribute')]
+        if name in VALIDATION_ATTRIBUTES:
+            arguments = tuple(arg for arg in attribute.arguments if not _NAMED_ARGUMENT.match(arg))
+            rules.append(ValidationRule(name, arguments))
+    return tuple(rules)
+
+
+def auth_attribute(attributes: List[AttributeDecl]) -> Optional[str]:
+    """認証属性の名前（[AllowAnonymous] → "AllowAnonymous"）。なければ None"""
+    for attribute in attributes:
+        name = attribute.name.rsplit('.', 1)[-1]
+        if name.endswith('Attribute'):
+            name = name[:-len('Attribute')]
+        if name in AUTH_ATTRIBUTES:
+            return name
+    return None
+
+
+def invalidates_attribute(attributes: List[AttributeDecl]) -> Tuple[Tuple[str, ...], bool]:
+    """[Invalidates("GetX", nameof(C.GetY), Only = true)] → (("GetX", "GetY"), True)。属性がなければ ((), False)"""
+    for attribute in attributes:
+        name = attribute.name.rsplit('.', 1)[-1]
+        if name.endswith('Attribute'):
+            name = name[:-len('Attribute')]
+        if name != INVALIDATES_ATTRIBUTE:
+            continue
+        queries = []
+        only = False
+        for index, arg in enumerate(attribute.arguments):
+            if _NAMED_ARGUMENT.match(arg):
+                key, _, value = arg.partition('=')
+                only = only or (key.strip() == 'Only' and value.strip() == 'true')
+                continue
+            nameof = _NAMEOF.fullmatch(arg.strip())
+            query = nameof.group(1) if nameof else attribute.string_argument(index)
+            if query:
+                queries.append(query)
+        return tuple(queries), only
+    return (), False
+
+
+def is_get_set_property(prop: PropertyDecl) -> bool:
+    """public な { get; set; } 自動プロパティか"""
+    return 'public' in prop.modifiers and prop.is_auto and prop.accessors == ['get', 'set']
+
+
+def match_http_endpoint(method: MethodDecl) -> Optional[Tuple[str, str, Optional[str]]]:
+    """
+    [HttpGet("route")] 等が付いた public な ActionResult メソッドを判定する
+
+    Returns:
+        tuple: (HTTP メソッド, ルート文字列, ActionResult<T> の T) 。エンドポイントでなければ None
+    """
+    if 'public' not in method.modifiers:
+        return None
+
+    http_attr = next((a for a in method.attributes if a.name in _HTTP_ATTRIBUTES), None)
+    if http_attr is None:
+        return None
+
+    # Task<ActionResult<T>> / ActionResult<T> / ActionResult（T は単純な型名のみ）
+    return_match = _ACTION_RESULT.fullmatch(''.join(method.return_type.split()))
+    if not return_match:
+        return None
+
+    http_method = _HTTP_ATTRIBUTES[http_attr.name]
+    route = http_attr.string_argument(0) or ""
+    return http_method, route, return_match.group(1) or return_match.group(2)
+
+
+def parse_csharp_class(file_path: Path, source: Optional[FileSystemSource] = None) -> Optional[CSharpClass]:
+    """C#クラスファイルをパースしてクラス情報を抽出（source を指定するとそこから読む。既定は作業ツリー）"""
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = (source or _FILE_SYSTEM).read_text(file_path)
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return None
 
-    # クラス名を抽出
-    class_match = re.search(r'public class (\w+)', content)
-    if not class_match:
-        return None
-    class_name = class_match.group(1)
+    parsed = parse_source(content)
 
-    # 名前空間を抽出
-    namespace_match = re.search(r'namespace ([^;]+)', content)
-    namespace = namespace_match.group(1) if namespace_match else ""
+    # 最初の public class を対象にする
+    decl = parsed.first_type('class')
+    if not decl:
+        return None
 
     # プロパティを抽出
-    properties = []
     # int, DateTime, List<T>などをサポート、requiredキーワードとnullable型(?）を扱う
-    # required キーワードをグループ1でキャプチャし、型をグループ2、プロパティ名をグループ3でキャプチャ
-    property_pattern = r'public\s+(required\s+)?([\w<>,\s?]+?)\s+(\w+)\s*\{\s*get;\s*set;\s*\}'
-    for match in re.finditer(property_pattern, content):
-        prop_type = match.group(2).strip()
-        prop_name = match.group(3)
+    properties = []
+    for prop in decl.properties:
+        if not is_get_set_property(prop):
+            continue
 
+        prop_type = prop.type.strip()
         is_list = 'List<' in prop_type
         # nullable判定は csharp_type_to_typescript が型末尾の ? で行うため、
         # is_optional は常に False とする（required の有無に関わらず）
         is_optional = False
 
         properties.append(CSharpProperty(
-            name=prop_name,
+            name=prop.name,
             type=prop_type,
             is_optional=is_optional,
-            is_list=is_list
+            is_list=is_list,
+            validation=validation_rules(prop.attributes),
         ))
 
-    return CSharpClass(name=class_name, properties=properties, namespace=namespace)
+    return CSharpClass(name=decl.name, properties=properties, namespace=parsed.namespace)
 
 
-def parse_controller(file_path: Path, all_request_types: set, all_response_types: set) -> Tuple[List[EndpointInfo], List[str]]:
-    """コントローラーをパースしてエンドポイント情報とスキップされたメソッドを返す"""
+def parse_controller(
+    file_path: Path,
+    all_request_types: set,
+    all_response_types: set,
+    source: Optional[FileSystemSource] = None,
+) -> Tuple[List[EndpointInfo], List[str]]:
+    """コントローラーをパースしてエンドポイント情報とスキップされたメソッドを返す（source は parse_csharp_class と同じ）"""
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = (source or _FILE_SYSTEM).read_text(file_path)
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return [], []
 
     # コントローラー名を抽出
-    controller_match = re.search(r'public class (\w+)Controller', content)
-    if not controller_match:
+    controller = parse_source(content).first_type('class', suffix='Controller')
+    if not controller:
         return [], []
-    controller_name = controller_match.group(1).lower()
+    controller_name = controller.name[:-len('Controller')].lower()
+    controller_auth = auth_attribute(controller.attributes)
 
     endpoints = []
     skipped_methods = []
 
     # エンドポイントを抽出
-    # [HttpGet], [HttpPost]などのアトリビュートとメソッド、パラメータを見つける
+    # [HttpGet], [HttpPost]などのアトリビュートが付いたメソッドとパラメータを見つける
     # 複数の属性（[RequireAuth]、[AllowAnonymous]、[OptionalAuth]、[ValidateModelState]など）に対応
-    method_pattern = r'\[Http(Get|Post|Put|Delete)(?:\("([^"]+)"\))?\](?:\s*\[[^\]]+\])*\s+public\s+(?:async\s+Task<)?ActionResult(?:<(\w+)>)?(?:>)?\s+(\w+)\s*\(([^)]*)\)'
-
-    for match in re.finditer(method_pattern, content):
-        http_method = match.group(1).upper()
-        route = match.group(2) or ""
-        explicit_response_type = match.group(3)
-        function_name = match.group(4)
-        parameters = match.group(5)
+    # 認証属性は EndpointInfo.auth に残す（server.ts のキャッシュ設定に使う）
+    for method in controller.methods:
+        signature = match_http_endpoint(method)
+        if signature is None:
+            continue
+        http_method, route, explicit_response_type = signature
+        function_name = method.name
+        parameters = method.parameters
 
         # パラメータからリクエスト型を抽出
         request_type = None
@@ -198,6 +269,8 @@ def parse_controller(file_path: Path, all_request_types: set, all_response_types
             else:
                 response_type = None
 
+        invalidates, invalidates_only = invalidates_attribute(method.attributes)
+
         # ルートパスを構築
         path = f"/api/{controller_name}"
         if route:
@@ -214,6 +287,9 @@ def parse_controller(file_path: Path, all_request_types: set, all_response_types
                 has_body_param=has_body_param,
                 is_form_file=is_form_file,
                 form_file_param=form_file_param,
+                auth=auth_attribute(method.attributes) or controller_auth,
+                invalidates=invalidates,
+                invalidates_only=invalidates_only,
             ))
         else:
             skipped_methods.append(f"{function_name} (no response type found)")
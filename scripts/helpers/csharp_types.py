@@ -0,0 +1,259 @@
+"""C# の型式をパースして TypeScript の型へ変換する"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# 型文字列ごとの AST / 変換結果キャッシュの上限
+TYPE_CACHE_SIZE = 4096
+
+PRIMITIVE_TYPES: Dict[str, str] = {
+    'string': 'string',
+    'char': 'string',
+    'int': 'number',
+    'uint': 'number',
+    'long': 'number',
+    'ulong': 'number',
+    'short': 'number',
+    'ushort': 'number',
+    'byte': 'number',
+    'sbyte': 'number',
+    'float': 'number',
+    'double': 'number',
+    'decimal': 'number',
+    'bool': 'boolean',
+    'DateTime': 'string',
+    'DateTimeOffset': 'string',
+    'DateOnly': 'string',
+    'TimeOnly': 'string',
+    'TimeSpan': 'string',
+    'Guid': 'string',
+    # CLR 型名（System.String など）
+    'String': 'string',
+    'Char': 'string',
+    'Int16': 'number',
+    'Int32': 'number',
+    'Int64': 'number',
+    'UInt16': 'number',
+    'UInt32': 'number',
+    'UInt64': 'number',
+    'Byte': 'number',
+    'SByte': 'number',
+    'Single': 'number',
+    'Double': 'number',
+    'Decimal': 'number',
+    'Boolean': 'boolean',
+}
+
+# T[] に変換するコレクション型
+LIST_TYPES = frozenset({
+    'List', 'IList', 'ICollection', 'IEnumerable', 'IReadOnlyList', 'IReadOnlyCollection',
+    'HashSet', 'ISet', 'IReadOnlySet', 'Collection', 'ReadOnlyCollection',
+})
+
+# Record<K, V> に変換する辞書型
+DICTIONARY_TYPES = frozenset({'Dictionary', 'IDictionary', 'IReadOnlyDictionary', 'ReadOnlyDictionary'})
+
+ARRAY = '[]'
+TUPLE = '()'
+
+
+@dataclass(frozen=True)
+class TypeRef:
+    """
+    C# の型式の AST ノード
+
+    name が ARRAY なら args[0] の配列、TUPLE なら args のタプル、それ以外は型名（ジェネリック引数が args）。
+    """
+    name: str
+    args: Tuple['TypeRef', ...] = ()
+    nullable: bool = False
+
+
+_TOKEN = re.compile(r'\s*(::|[^\W\d]\w*|@\w+|[<>,?\[\]().])')
+
+
+class _TypeParser:
+    def __init__(self, text: str):
+        self.tokens: List[str] = []
+        pos = 0
+        while pos < len(text):
+            m = _TOKEN.match(text, pos)
+            if not m:
+                if text[pos:].strip():
+                    raise ValueError(f"unexpected character in type: {text!r}")
+                break
+            self.tokens.append(m.group(1))
+            pos = m.end()
+        self.i = 0
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.i] if self.i < len(self.tokens) else None
+
+    def _expect(self, token: str) -> None:
+        if self._peek() != token:
+            raise ValueError(f"expected {token!r}")
+        self.i += 1
+
+    def parse(self) -> TypeRef:
+        ref = self._type()
+        if self._peek() is not None:
+            raise ValueError("trailing tokens")
+        return ref
+
+    def _type(self) -> TypeRef:
+        if self._peek() == '(':
+            ref = self._tuple()
+        else:
+            ref = self._named()
+
+        # int?[] / int[]? / int[,] など、後置修飾は左から順に適用する
+        while self._peek() in ('?', '['):
+            if self._peek() == '?':
+                self.i += 1
+                ref = TypeRef(ref.name, ref.args, nullable=True)
+            else:
+                self.i += 1
+                rank = 1
+                while self._peek() == ',':
+                    rank += 1
+                    self.i += 1
+                self._expect(']')
+                for _ in range(rank):
+                    ref = TypeRef(ARRAY, (ref,))
+        return ref
+
+    def _named(self) -> TypeRef:
+        token = self._peek()
+        if token is None or not (token[0].isalpha() or token[0] in '_@'):
+            raise ValueError("expected type name")
+        parts = [token.lstrip('@')]
+        self.i += 1
+        while self._peek() in ('.', '::'):
+            self.i += 1
+            name = self._peek()
+            if name is None:
+                raise ValueError("expected type name")
+            parts.append(name.lstrip('@'))
+            self.i += 1
+        # global::System.String → System.String
+        if parts[0] == 'global':
+            parts = parts[1:]
+
+        args: List[TypeRef] = []
+        if self._peek() == '<':
+            self.i += 1
+            args.append(self._type())
+            while self._peek() == ',':
+                self.i += 1
+                args.append(self._type())
+            self._expect('>')
+
+        # Nullable<T> は T? と同じ扱い
+        if parts[-1] == 'Nullable' and len(args) == 1:
+            return TypeRef(args[0].name, args[0].args, nullable=True)
+        return TypeRef('.'.join(parts), tuple(args))
+
+    def _tuple(self) -> TypeRef:
+        self._expect('(')
+        items: List[TypeRef] = []
+        while True:
+            items.append(self._type())
+            # 要素名 (int Count, string Name)
+            token = self._peek()
+            if token is not None and token[0].isalpha():
+                self.i += 1
+            if self._peek() != ',':
+                break
+            self.i += 1
+        self._expect(')')
+        return TypeRef(TUPLE, tuple(items))
+
+
+@lru_cache(maxsize=TYPE_CACHE_SIZE)
+def parse_csharp_type(text: str) -> TypeRef:
+    """
+    C# の型文字列（例: "Dictionary<string, List<int?>>?"）を TypeRef にする
+
+    解釈できない文字列は、その文字列をそのまま名前に持つ TypeRef になる。
+    """
+    try:
+        return _TypeParser(text).parse()
+    except ValueError:
+        stripped = text.strip()
+        nullable = stripped.endswith('?')
+        return TypeRef(stripped.rstrip('?'), nullable=nullable)
+
+
+class TypeScriptTypeMapper:
+    """
+    value_object_types を前提にした C# → TypeScript 型変換
+
+    変換結果は型文字列ごとに LRU でキャッシュする。
+    同じ value_object_types に対しては get_type_mapper で同じインスタンスを共有する。
+    """
+
+    def __init__(self, value_object_types: Dict[str, str], maxsize: int = TYPE_CACHE_SIZE):
+        self.value_object_types = dict(value_object_types)
+        self.to_typescript = lru_cache(maxsize=maxsize)(self._to_typescript)
+
+    def _to_typescript(self, csharp_type: str) -> Tuple[str, bool]:
+        """
+        C# 型を TypeScript 型へ変換
+
+        Returns:
+            tuple: (typescript_type, is_nullable)。トップレベルの ? は is_nullable で返し、
+            ネストした nullable（List<int?> など）は `| null` として型に含める。
+        """
+        ref = parse_csharp_type(csharp_type)
+        return self._render(ref), ref.nullable
+
+    def _render(self, ref: TypeRef) -> str:
+        if ref.name == ARRAY:
+            return f"{self._render_element(ref.args[0])}[]"
+        if ref.name == TUPLE:
+            return "[" + ", ".join(self._render_nested(arg) for arg in ref.args) + "]"
+
+        simple_name = ref.name.rsplit('.', 1)[-1]
+
+        if not ref.args:
+            # ValueObject型を基底型に応じた TS 型に変換（Guid → string, int → number）
+            if ref.name in self.value_object_types:
+                return self.value_object_types[ref.name]
+            if simple_name in PRIMITIVE_TYPES:
+                return PRIMITIVE_TYPES[simple_name]
+            return ref.name
+
+        # List<T> / IEnumerable<T> など を T[] に変換
+        if simple_name in LIST_TYPES and len(ref.args) == 1:
+            return f"{self._render_element(ref.args[0])}[]"
+
+        # Dictionary<TKey, TValue> を Record<K, V> に変換（キーの nullable は無視する）
+        if simple_name in DICTIONARY_TYPES and len(ref.args) == 2:
+            key = self._render(ref.args[0])
+            return f"Record<{key}, {self._render_nested(ref.args[1])}>"
+
+        return f"{ref.name}<" + ", ".join(self._render_nested(arg) for arg in ref.args) + ">"
+
+    def _render_nested(self, ref: TypeRef) -> str:
+        """ネストした位置の型。nullable なら | null を付ける"""
+        rendered = self._render(ref)
+        return f"{rendered} | null" if ref.nullable else rendered
+
+    def _render_element(self, ref: TypeRef) -> str:
+        """配列要素の型。union になる場合は括弧で囲む"""
+        rendered = self._render_nested(ref)
+        return f"({rendered})" if ref.nullable else rendered
+
+
+_mappers: Dict[FrozenSet[Tuple[str, str]], TypeScriptTypeMapper] = {}
+
+
+def get_type_mapper(value_object_types: Dict[str, str]) -> TypeScriptTypeMapper:
+    """value_object_types ごとに共有される TypeScriptTypeMapper を返す"""
+    key = frozenset(value_object_types.items())
+    mapper = _mappers.get(key)
+    if mapper is None:
+        mapper = _mappers[key] = TypeScriptTypeMapper(value_object_types)
+    return mapper
@@ -0,0 +1,149 @@
+"""ソースディレクトリの変更監視（inotify、使えない環境ではポーリング）"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """libc の inotify を ctypes 経由で使う最小ラッパー"""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            raise OSError("libc not found")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, Path] = {}
+
+    def add_tree(self, root: Path) -> None:
+        """root 以下の全ディレクトリを監視対象に追加する"""
+        for dir_path, _, _ in os.walk(root):
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(dir_path), _WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {dir_path}")
+            self._dirs[wd] = Path(dir_path)
+
+    def read(self, timeout: Optional[float]) -> Set[Path]:
+        """timeout 秒までイベントを待ち、変更されたファイルパスを返す"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed: Set[Path] = set()
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _, name_len = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            name = buf[offset:offset + name_len].rstrip(b"\0").decode("utf-8", "surrogateescape")
+            offset += name_len
+            parent = self._dirs.get(wd)
+            if parent is None or not name:
+                continue
+            path = parent / name
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    self.add_tree(path)
+                continue
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """
+    指定ディレクトリ以下の suffix に一致するファイルの変更を監視する
+
+    エディタの保存（一時ファイル + rename 等）で短時間に複数イベントが来るため、
+    debounce 秒イベントが途切れるまで待ってからまとめて返す。
+    """
+
+    def __init__(self, directories: List[Path], suffix: str = ".cs", debounce: float = 0.3, poll_interval: float = 1.0):
+        self.directories = [d for d in directories if d.exists()]
+        self.suffix = suffix
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._inotify: Optional[_Inotify] = None
+        self._snapshot: Dict[Path, Tuple[int, int]] = {}
+
+        inotify: Optional[_Inotify] = None
+        try:
+            inotify = _Inotify()
+            for directory in self.directories:
+                inotify.add_tree(directory)
+            self._inotify = inotify
+        except (OSError, AttributeError):
+            if inotify:
+                inotify.close()
+            # inotify が使えない（非 Linux、watch 上限超過など）場合はポーリング
+            self._snapshot = self._scan()
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._inotify else "polling"
+
+    def wait_for_changes(self) -> Set[Path]:
+        """変更があるまでブロックし、デバウンス後に変更されたファイルの集合を返す"""
+        changed = set()
+        while not changed:
+            changed = self._poll(None)
+        while True:
+            more = self._poll(self.debounce)
+            if not more:
+                return changed
+            changed |= more
+
+    def close(self) -> None:
+        if self._inotify:
+            self._inotify.close()
+
+    def _poll(self, timeout: Optional[float]) -> Set[Path]:
+        if self._inotify:
+            return {p for p in self._inotify.read(timeout) if p.name.endswith(self.suffix)}
+
+        time.sleep(self.poll_interval if timeout is None else timeout)
+        current = self._scan()
+        changed = {p for p in current.keys() | self._snapshot.keys() if current.get(p) != self._snapshot.get(p)}
+        self._snapshot = current
+        return changed
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        result: Dict[Path, Tuple[int, int]] = {}
+        for directory in self.directories:
+            for dir_path, _, file_names in os.walk(directory):
+                for name in file_names:
+                    if not name.endswith(self.suffix):
+                        continue
+                    path = Path(dir_path) / name
+                    try:
+                        stat = path.stat()
+                    except FileNotFoundError:
+                        continue
+                    result[path] = (stat.st_mtime_ns, stat.st_size)
+        return result
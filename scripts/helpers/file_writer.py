@@ -0,0 +1,141 @@
+"""生成ファイルの書き込みユーティリティ"""
+
+import filecmp
+import itertools
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+
+# write_lines_if_changed の書き込みバッファ。これを超えた分から順にディスクへ流す
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+def write_if_changed(file_path: Path, content: Union[str, bytes]) -> bool:
+    """
+    内容が既存ファイルと異なる場合のみ書き込む
+
+    書き込みは同じディレクトリの一時ファイル + rename で行うため、
+    next dev などが書き込み途中のファイルを読むことはない。
+    内容が同一なら mtime も変えない（不要な再ビルド・HMR を防ぐ）。
+    content が str なら UTF-8 で書き込む。
+
+    Returns:
+        bool: ファイルを書き換えた場合 True
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    try:
+        if file_path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        _replace(tmp_name, file_path)
+    except BaseException:
+        _unlink(tmp_name)
+        raise
+    return True
+
+
+class StagedFile:
+    """
+    一時ファイルに書き終えた出力
+
+    commit() で出力先を置き換え、discard() で破棄する。複数の出力を先にすべて書き終えてから
+    まとめて commit することで、途中で失敗しても一部のファイルだけが更新された状態にならない。
+    """
+
+    def __init__(self, file_path: Path, tmp_name: str):
+        self.file_path = file_path
+        self.tmp_name = tmp_name
+
+    def commit(self, ignore: Optional[Callable[[str], bool]] = None) -> bool:
+        """
+        内容が既存ファイルと異なる場合のみ置き換える
+
+        ignore を指定すると、それが True を返す行（ヘッダーのフィンガープリントなど）の違いだけなら置き換えない。
+
+        Returns:
+            bool: ファイルを書き換えた場合 True
+        """
+        try:
+            if self.file_path.exists() and self._same_as_target(ignore):
+                _unlink(self.tmp_name)
+                return False
+            _replace(self.tmp_name, self.file_path)
+        except BaseException:
+            _unlink(self.tmp_name)
+            raise
+        return True
+
+    def _same_as_target(self, ignore: Optional[Callable[[str], bool]]) -> bool:
+        if ignore is None:
+            return filecmp.cmp(self.tmp_name, self.file_path, shallow=False)
+        try:
+            with open(self.tmp_name, encoding="utf-8", newline="") as new, open(self.file_path, encoding="utf-8", newline="") as old:
+                kept = (itertools.filterfalse(ignore, f) for f in (new, old))
+                return all(a == b for a, b in itertools.zip_longest(*kept))
+        except UnicodeDecodeError:
+            return False
+
+    def discard(self) -> None:
+        _unlink(self.tmp_name)
+
+
+def stage_lines(file_path: Path, lines: Iterable[str], buffer_size: int = WRITE_BUFFER_SIZE) -> StagedFile:
+    """
+    テンプレートの render() が返す行を "\\n" 区切りで file_path と同じディレクトリの一時ファイルに書き出す
+
+    ファイル全体をメモリ上に組み立てず、buffer_size ごとにディスクへ流す。
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with open(fd, "w", encoding="utf-8", newline="", buffering=buffer_size) as f:
+            lines = iter(lines)
+            first = next(lines, None)
+            if first is not None:
+                f.write(first)
+                for line in lines:
+                    f.write("\n")
+                    f.write(line)
+    except BaseException:
+        _unlink(tmp_name)
+        raise
+    return StagedFile(file_path, tmp_name)
+
+
+def write_lines_if_changed(file_path: Path, lines: Iterable[str], buffer_size: int = WRITE_BUFFER_SIZE) -> bool:
+    """
+    テンプレートの render() が返す行を "\\n" 区切りで書き出す（内容が変わった場合のみ置き換える）
+
+    "\\n".join(lines) を write_if_changed に渡すのと同じ結果になるが、ファイル全体を
+    メモリ上に組み立てない。行は一時ファイルへ流し、書き終えてから既存ファイルとチャンク単位で比較する。
+
+    Returns:
+        bool: ファイルを書き換えた場合 True
+    """
+    return stage_lines(file_path, lines, buffer_size).commit()
+
+
+def _replace(tmp_name: str, file_path: Path) -> None:
+    """一時ファイルを file_path に rename する"""
+    # mkstemp は 0600 で作るので、既存ファイルと同じ（なければ通常の）パーミッションにする
+    try:
+        mode = file_path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    os.chmod(tmp_name, mode)
+    os.replace(tmp_name, file_path)
+
+
+def _unlink(tmp_name: str) -> None:
+    try:
+        os.unlink(tmp_name)
+    except FileNotFoundError:
+        pass
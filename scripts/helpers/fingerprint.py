@@ -0,0 +1,82 @@
+"""
+生成ファイルの入力フィンガープリント（--check 用）
+
+C# ソースの内容ハッシュ・その出力をレンダリングするジェネレーターのソース・出力オプションから
+出力ファイルごとのハッシュを作り、生成ファイルのヘッダーに埋め込む。--check はパースもレンダリングもせずに、
+今の入力から計算した値とヘッダーの値を比べるだけで生成ファイルが古いかどうかを判定できる。
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
+
+from .source_provider import FileSystemSource
+
+# 形式を変えたら上げる（既存の生成ファイルはすべて古い扱いになる）
+FINGERPRINT_VERSION = 1
+FINGERPRINT_LABEL = "Input fingerprint: "
+FINGERPRINT_PREFIX = f"// {FINGERPRINT_LABEL}"
+# ヘッダーは先頭数行に収まるので、それ以上は読まない
+_HEADER_LINES = 5
+
+
+def hash_files(files: Iterable[Path], root: Optional[Path] = None, source: Optional[FileSystemSource] = None) -> str:
+    """
+    ファイルのパス（root からの相対パス）と内容のハッシュをまとめた sha256 を返す
+
+    順序に依存しないようパスでソートする。存在しないファイルは「なし」として含める。
+    source を指定するとそこから読む（git のリビジョンでも作業ツリーと同じ値になる）。
+    """
+    source = source or FileSystemSource()
+    digest = hashlib.sha256()
+    for file_path in sorted(files):
+        name = (file_path.relative_to(root) if root else file_path).as_posix()
+        try:
+            content_hash = hashlib.sha256(source.read_bytes(file_path)).hexdigest()
+        except FileNotFoundError:
+            content_hash = "-"
+        digest.update(f"{name}\0{content_hash}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def input_fingerprint(inputs_hash: str, generator_hash: str, options: Sequence[str]) -> str:
+    """入力ソース・ジェネレーター・出力オプションのハッシュを1つにまとめる"""
+    payload = "\n".join([str(FINGERPRINT_VERSION), inputs_hash, generator_hash, *options])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def stamp_fingerprint(lines: Iterable[str], fingerprint: str) -> Iterator[str]:
+    """
+    render() の行の2行目（"// Auto-generated by ..." の次）にフィンガープリントを差し込む
+
+    ヘッダーは複数行を1つの文字列で返すテンプレートが多いため、最初の要素を1行目で分割する。
+    コメント記号は1行目に合わせる（Python クライアントは "# Auto-generated by ..."）。
+    """
+    lines = iter(lines)
+    first = next(lines, None)
+    if first is None:
+        return
+    head, newline, rest = first.partition("\n")
+    comment = head.split(" ", 1)[0]
+    yield head
+    yield f"{comment} {FINGERPRINT_LABEL}{fingerprint}"
+    if newline:
+        yield rest
+    yield from lines
+
+
+def is_fingerprint_line(line: str) -> bool:
+    """"// Input fingerprint: ..." / "# Input fingerprint: ..." の行か"""
+    return line.lstrip("/# ").startswith(FINGERPRINT_LABEL) and line[:1] in "/#"
+
+
+def read_fingerprint(file_path: Path) -> Optional[str]:
+    """生成ファイルのヘッダーに埋め込まれたフィンガープリント（ファイルがない・埋め込まれていなければ None）"""
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            for _, line in zip(range(_HEADER_LINES), f):
+                if is_fingerprint_line(line):
+                    return line.partition(FINGERPRINT_LABEL)[2].strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return None
@@ -0,0 +1,313 @@
+"""
+更新系 API（POST / PUT / DELETE）が成功したときに無効化するクエリ（GET）の推測
+
+ValueObject の ID 型（ArticleId など）を「エンティティ」とし、Id がその型の DTO（ArticleDto）を
+そのエンティティの DTO とみなす。推測には DTO の型とパスパラメータだけを使う。
+
+- 更新（PUT、新しい ID を返さない POST）: パスパラメータの ID 型のエンティティの DTO を含み、Request・Response の
+  プロパティ（ID を除く。CurrentLikeCount は LikeCount とみなす）と同じ名前のプロパティを持つクエリ。
+  XxxCount が変われば Xxxs も変わるものとみなす。ただしエンティティごとのカウンター（LikeCount と、そこから
+  みなした Likes）は、そのエンティティの ID をパスパラメータに持つクエリ（{ id } で限ったもの）だけに効かせ、
+  一覧の DTO に同じ名前があっても一覧は無効化しない
+- 作成（Response に新しい ID がある POST）・削除（DELETE）: そのエンティティの DTO・ID のリストを要素に持つクエリ。
+  削除ではその ID 型のプロパティで参照するクエリも
+- ID を持たない [RequireAuth] の更新（プロフィールの更新など）: ログイン中のユーザーの更新とみなす
+- Response の型が同じクエリ（SignIn → GetCurrentUser）
+
+推測の対象はミューテーションと同じコントローラーのクエリだけで、他のコントローラーのクエリは [Invalidates(...)] で
+指定したときだけ無効化する（合計がコントローラー単位で無効化したときを超えないようにする）。
+パスパラメータがそのエンティティ（作成では親のエンティティ）の ID のクエリ（GetArticleContent など）は、
+ミューテーションの変数と同じ ID のものだけを無効化する。
+他のエンティティの DTO に埋め込まれた値（記事一覧の AuthorName など）や名前だけで決まる件数（ArticleCount）は
+推測しない。staleTime が過ぎれば取り直されるが、すぐに反映したい場合は [Invalidates(...)] で指定する。
+[Invalidates(...)] で指定したクエリは追加で（Only = true なら指定したものだけを）無効化し、
+何も推測できなければコントローラーのクエリをすべて無効化する。
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from models import EndpointInfo
+from .csharp_types import ARRAY, LIST_TYPES, TypeRef, parse_csharp_type
+from .symbol_index import SymbolIndex, to_camel
+
+# ID を持たない [RequireAuth] の更新の対象（ログイン中のユーザー）
+CURRENT_USER_TYPE = "UserId"
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+# クエリ・ミューテーションを識別するキー（コントローラー名, メソッド名）。メソッド名はコントローラーをまたいで重なりうる
+EndpointKey = Tuple[str, str]
+
+
+def _key(ep: EndpointInfo) -> EndpointKey:
+    return ep.controller_name, ep.function_name
+
+
+class QueryKey(NamedTuple):
+    """無効化するクエリ。scope があれば (クエリのパラメータ名, ミューテーションの変数のプロパティ名) が一致するものだけ"""
+    query: EndpointInfo
+    scope: Optional[Tuple[str, str]]
+    reasons: Tuple[str, ...]
+
+
+class Invalidation(NamedTuple):
+    mutation: EndpointInfo
+    keys: Tuple[QueryKey, ...]
+    fallback: bool             # 推測できず、コントローラーのクエリをすべて無効化する
+    unknown: Tuple[str, ...]   # [Invalidates] で指定したが、GET にないメソッド名
+
+
+class _Node(NamedTuple):
+    """クエリの Response からたどれる1つのクラス（前計算した推測の材料）"""
+    class_name: str
+    via_collection: bool                 # コレクションの要素を経由したか
+    identity: Optional[str]              # このクラスが表すエンティティ（Id の型。ルートならクエリのパスパラメータの型）
+    fields: Dict[str, str]               # identity のフィールド（比べる形の名前 → プロパティ名）
+    collections: Dict[str, List[str]]    # ID 型 → そのエンティティ・ID のリストのプロパティ
+    references: Dict[str, List[str]]     # ID 型 → その ID 型のプロパティ（Id を除く）
+
+
+class _Target(NamedTuple):
+    """ミューテーションが変えるエンティティ"""
+    kind: str                   # update / create / delete
+    entity: str                 # ID 型
+    variable: Optional[str]     # その ID を持つ変数のプロパティ名（分からなければ None）
+    parent: Optional[Tuple[str, str]] = None   # 作成時の親（パスパラメータの ID 型, 変数のプロパティ名）
+
+
+def _stem(entity: str) -> str:
+    """ArticleId → Article"""
+    return entity[:-2] if entity.endswith("Id") and len(entity) > 2 else entity
+
+
+def _normalize(name: str, stem: str) -> str:
+    """フィールド名を比べる形にする（Username → name、ArticleOrder → order）"""
+    if name.lower().startswith(stem.lower()) and len(name) > len(stem):
+        name = name[len(stem):]
+    return name.lower()
+
+
+class InvalidationMap:
+    def __init__(self, endpoints: Iterable[EndpointInfo], index: SymbolIndex):
+        endpoints = list(endpoints)
+        self.index = index
+        self.entities = frozenset(index.value_object_types)
+        self.queries = [ep for ep in endpoints if ep.method == "GET"]
+        self._order = {_key(query): position for position, query in enumerate(self.queries)}
+        self._keyed = {_key(ep): self._keyed_entity(ep) for ep in self.queries}
+        self._nodes = {_key(ep): self._query_nodes(ep) for ep in self.queries}
+        self._by_name: Dict[str, List[EndpointInfo]] = defaultdict(list)
+        self._by_controller: Dict[str, List[EndpointInfo]] = defaultdict(list)
+        for query in self.queries:
+            self._by_name[query.function_name].append(query)
+            self._by_controller[query.controller_name].append(query)
+        self._invalidations: Dict[EndpointKey, Invalidation] = {}
+
+    # --- 型 ---
+
+    def _entity(self, ref: TypeRef) -> Optional[str]:
+        name = ref.name.rsplit(".", 1)[-1]
+        return name if name in self.entities and not ref.args else None
+
+    def _collection_entity(self, ref: TypeRef) -> Optional[str]:
+        if ref.name == ARRAY or ref.name.rsplit(".", 1)[-1] in LIST_TYPES:
+            return self._entity(ref.args[0]) if len(ref.args) == 1 else None
+        return None
+
+    def _identity(self, class_name: Optional[str]) -> Optional[str]:
+        """Id プロパティの ID 型（ArticleDto → ArticleId）"""
+        prop = self.index.properties(class_name or "").get("id")
+        return self._entity(parse_csharp_type(prop.type)) if prop else None
+
+    def _walk(self, class_name: Optional[str]) -> Iterator[Tuple[str, bool, bool]]:
+        """Response からたどれるクラス（クラス名, ルートか, コレクションの要素を経由したか）"""
+        if not class_name or class_name not in self.index.classes:
+            return
+        seen: Set[str] = set()
+        stack = [(class_name, True, False)]
+        while stack:
+            name, is_root, via_collection = stack.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            yield name, is_root, via_collection
+            for prop in self.index.classes[name].properties:
+                ref = parse_csharp_type(prop.type)
+                is_collection = ref.name == ARRAY or ref.name.rsplit(".", 1)[-1] in LIST_TYPES
+                for arg in (ref.args if is_collection else (ref,)):
+                    child = arg.name.rsplit(".", 1)[-1]
+                    if child in self.index.classes:
+                        stack.append((child, False, via_collection or is_collection))
+
+    def _keyed_entity(self, query: EndpointInfo) -> Optional[Tuple[str, str]]:
+        """パスパラメータがエンティティの ID のクエリなら (ID 型, クエリのパラメータ名)"""
+        params = _PATH_PARAM.findall(query.path)
+        if not params:
+            return None
+        if query.request_type:
+            prop = self.index.path_param_property(params[0], query.request_type)
+            entity = self._entity(parse_csharp_type(prop.type)) if prop else None
+            return (entity, self.index.resolve_path_param(params[0], query.request_type)) if entity else None
+        # Request DTO がない（{ id: string } を受け取る）ときは Response の Id の型
+        entity = self._identity(query.response_type)
+        return (entity, params[0]) if entity and len(params) == 1 else None
+
+    def _query_nodes(self, query: EndpointInfo) -> List[_Node]:
+        keyed = self._keyed[_key(query)]
+        nodes = []
+        for class_name, is_root, via_collection in self._walk(query.response_type):
+            identity = self._identity(class_name) or (keyed[0] if keyed and is_root else None)
+            fields: Dict[str, str] = {}
+            collections: Dict[str, List[str]] = defaultdict(list)
+            references: Dict[str, List[str]] = defaultdict(list)
+            for prop in self.index.classes[class_name].properties:
+                ref = parse_csharp_type(prop.type)
+                if identity and prop.name != "Id":
+                    fields[_normalize(prop.name, _stem(identity))] = prop.name
+                collection = self._collection_entity(ref)
+                if collection:
+                    collections[collection].append(prop.name)
+                reference = self._entity(ref)
+                if reference and prop.name != "Id":
+                    references[reference].append(prop.name)
+            nodes.append(_Node(class_name, via_collection, identity, fields, dict(collections), dict(references)))
+        return nodes
+
+    # --- ミューテーション ---
+
+    def _target(self, mutation: EndpointInfo) -> Optional[_Target]:
+        path_target = None
+        params = _PATH_PARAM.findall(mutation.path)
+        if params and mutation.request_type:
+            prop = self.index.path_param_property(params[0], mutation.request_type)
+            entity = self._entity(parse_csharp_type(prop.type)) if prop else None
+            if entity:
+                path_target = (entity, to_camel(prop.name))
+
+        created = self._identity(mutation.response_type)
+        if created is None and mutation.response_type in self.index.classes:
+            # CreateCourseResponse { Course: CourseDto } のように作ったものを1つだけ返す場合
+            nested = [
+                entity for entity in (
+                    self._identity(parse_csharp_type(prop.type).name)
+                    for prop in self.index.classes[mutation.response_type].properties
+                ) if entity
+            ]
+            created = nested[0] if len(nested) == 1 else None
+
+        if mutation.method == "DELETE" and path_target:
+            return _Target("delete", *path_target)
+        if mutation.method == "POST" and created and (path_target is None or created != path_target[0]):
+            return _Target("create", created, None, path_target)
+        if path_target:
+            return _Target("update", *path_target)
+        if mutation.auth == "RequireAuth" and CURRENT_USER_TYPE in self.entities:
+            return _Target("update", CURRENT_USER_TYPE, None)
+        return None
+
+    def _changed_fields(self, mutation: EndpointInfo, entity: str) -> Tuple[Set[str], Set[str]]:
+        """
+        Request・Response のプロパティ（ID を除く）から、変わるフィールドの比べる形の名前と、
+        そのうちエンティティごとのカウンター（likecount と、そこからみなした likes）
+        """
+        changed: Set[str] = set()
+        for class_name in (mutation.request_type, mutation.response_type):
+            for prop in self.index.classes[class_name].properties if class_name in self.index.classes else ():
+                if prop.name == "Id" or self._entity(parse_csharp_type(prop.type)):
+                    continue
+                name = re.sub(r"^Current(?=[A-Z])", "", prop.name)
+                changed.add(_normalize(name, _stem(entity)))
+        # FollowerCount が変われば Followers の一覧も変わる
+        counts = {name for name in changed if name.endswith("count") and len(name) > 5}
+        counters = counts | {name[:-len("count")] + "s" for name in counts}
+        return changed | counters, counters
+
+    def for_mutation(self, mutation: EndpointInfo) -> Invalidation:
+        """mutation が無効化するクエリ（hooks.ts の生成・invalidations・signature から何度も呼ばれるのでメモ化する）"""
+        key = _key(mutation)
+        if key not in self._invalidations:
+            self._invalidations[key] = self._infer(mutation)
+        return self._invalidations[key]
+
+    def _infer(self, mutation: EndpointInfo) -> Invalidation:
+        keys: Dict[EndpointKey, QueryKey] = {}
+
+        def add(query: EndpointInfo, scope: Optional[Tuple[str, str]], reason: str) -> None:
+            current = keys.get(_key(query))
+            if current is None:
+                keys[_key(query)] = QueryKey(query, scope, (reason,))
+                return
+            # 同じクエリを範囲を限らずに無効化するなら、そちらにまとめる
+            merged_scope = current.scope if current.scope == scope else None
+            reasons = current.reasons + ((reason,) if reason not in current.reasons else ())
+            keys[_key(query)] = QueryKey(query, merged_scope, reasons)
+
+        target = None if mutation.invalidates_only else self._target(mutation)
+        if target is not None:
+            changed, counters = self._changed_fields(mutation, target.entity) if target.kind == "update" else (set(), set())
+            for query in self._by_controller[mutation.controller_name]:
+                keyed = self._keyed[_key(query)]
+                for node in self._nodes[_key(query)]:
+                    same = not node.via_collection and keyed is not None
+                    if target.kind == "update":
+                        if node.identity != target.entity:
+                            continue
+                        scoped = same and keyed[0] == target.entity and target.variable
+                        # カウンターだけが一致する一覧（記事一覧の LikeCount など）は、そのエンティティのクエリに任せる
+                        for name in sorted((changed if scoped else changed - counters) & node.fields.keys()):
+                            add(query, (keyed[1], target.variable) if scoped else None, f"{node.class_name}.{node.fields[name]}")
+                        continue
+                    reasons = [f"{node.class_name}.{name}" for name in node.collections.get(target.entity, ())]
+                    if target.kind == "delete":
+                        reasons += [f"{node.class_name}.{name}" for name in node.references.get(target.entity, ())]
+                    if node.identity == target.entity:
+                        reasons.append(node.class_name)
+                    if not reasons:
+                        continue
+                    if keyed is not None and keyed[0] == target.entity:
+                        # 作ったばかりのエンティティの詳細はキャッシュにない。削除したものの詳細はその ID だけ
+                        if target.kind == "create":
+                            continue
+                        scope = (keyed[1], target.variable) if same and target.variable else None
+                    elif target.parent and keyed is not None and keyed[0] == target.parent[0]:
+                        # 記事に付けたコメントは、その記事の詳細にだけ表示される
+                        scope = (keyed[1], target.parent[1])
+                    else:
+                        scope = None
+                    for reason in reasons:
+                        add(query, scope, reason)
+
+        if not mutation.invalidates_only and mutation.response_type in self.index.classes:
+            for query in self._by_controller[mutation.controller_name]:
+                if query.response_type == mutation.response_type:
+                    add(query, None, f"same response type {mutation.response_type}")
+
+        unknown = tuple(name for name in mutation.invalidates if name not in self._by_name)
+        for name in mutation.invalidates:
+            for query in self._by_name.get(name, ()):
+                add(query, None, "[Invalidates]")
+
+        fallback = not keys and target is None and not mutation.invalidates_only
+        if fallback:
+            for query in self._by_controller[mutation.controller_name]:
+                add(query, None, "nothing inferred: every query of the controller")
+        ordered = sorted(keys.values(), key=lambda key: (key.query.controller_name, self._order[_key(key.query)]))
+        return Invalidation(mutation, tuple(ordered), fallback, unknown)
+
+    def scope_param(self, query: EndpointInfo) -> Optional[str]:
+        """クエリを ID で限るときのパラメータ名（QueryKey.scope の1つ目。パスパラメータがエンティティの ID でなければ None）"""
+        keyed = self._keyed.get(_key(query))
+        return keyed[1] if keyed else None
+
+    def controller_fan_out(self, mutation: EndpointInfo) -> int:
+        """コントローラー単位で無効化していたときに対象になるクエリの数（比較用）"""
+        return len(self._by_controller.get(mutation.controller_name, ()))
+
+    def signature(self, endpoints: Iterable[EndpointInfo]) -> str:
+        """エンドポイントのミューテーションが無効化するクエリ（生成ファイルの再レンダリングの判定用）"""
+        return repr([
+            (_key(ep), invalidation.fallback, [(key.query.controller_name, key.query.function_name, key.scope) for key in invalidation.keys])
+            for ep in endpoints if ep.method != "GET"
+            for invalidation in (self.for_mutation(ep),)
+        ])
@@ -0,0 +1,33 @@
+"""ファイル単位のパースをプロセスプールに分散するユーティリティ"""
+
+import os
+from typing import Callable, List, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def resolve_jobs(jobs: int) -> int:
+    """--jobs の値を実際のワーカー数にする（0 以下は CPU 数）"""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def parallel_map(func: Callable[[T], R], items: Sequence[T], jobs: int = 1) -> List[R]:
+    """
+    func を items に適用した結果を入力と同じ順序で返す
+
+    jobs > 1 の場合はプロセスプールで並列実行する。結果の順序は入力順に固定されるため、
+    直列実行と同じ出力になる。func と items は pickle 可能である必要がある。
+    """
+    workers = min(resolve_jobs(jobs), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+
+    # multiprocessing の import は重いので、実際にプールを使うときだけ読み込む
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items, chunksize=chunksize))
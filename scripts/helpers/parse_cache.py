@@ -0,0 +1,204 @@
+"""ファイル単位のパース結果キャッシュ"""
+
+import hashlib
+import json
+from dataclasses import asdict
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from models import CSharpProperty, CSharpClass, EndpointInfo
+from .csharp_parser import parse_csharp_class, parse_controller
+from .parallel import parallel_map
+
+# キャッシュ形式を変えたら上げる
+CACHE_VERSION = 1
+
+# パーサー実装が変わったらキャッシュを破棄するため、ソースのハッシュを salt にする
+_PARSER_SOURCES = [
+    Path(__file__).parent / "csharp_parser.py",
+    Path(__file__).parent / "csharp_lexer.py",
+    Path(__file__).parent.parent / "models" / "types.py",
+]
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _parser_salt() -> str:
+    digest = hashlib.sha256(str(CACHE_VERSION).encode())
+    for source in _PARSER_SOURCES:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _types_context(all_request_types: set, all_response_types: set) -> str:
+    """コントローラーのパース結果は既知の Request/Response 型に依存するため、それもキーに含める"""
+    joined = ",".join(sorted(all_request_types)) + "|" + ",".join(sorted(all_response_types))
+    return _sha256(joined.encode("utf-8"))
+
+
+def _decode_class(data: Optional[Dict]) -> Optional[CSharpClass]:
+    if data is None:
+        return None
+    return CSharpClass(
+        name=data["name"],
+        properties=[CSharpProperty(**p) for p in data["properties"]],
+        namespace=data["namespace"],
+    )
+
+
+class ParseCache:
+    """
+    parse_csharp_class / parse_controller の結果をファイル単位でディスクにキャッシュする
+
+    エントリは path + size + mtime + content hash で検証する。
+    size と mtime が一致すればファイルを読まずにヒット、
+    どちらかが違っても内容ハッシュが一致すればヒットとして扱う。
+    """
+
+    def __init__(self, cache_file: Path, enabled: bool = True):
+        self.cache_file = cache_file
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._salt = _parser_salt()
+        self._entries: Dict[str, Dict] = {}
+        self._seen: set = set()
+        if enabled:
+            self._entries = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if data.get("salt") != self._salt:
+            return {}
+        return data.get("entries", {})
+
+    def save(self) -> None:
+        """キャッシュをディスクへ書き出す（--force 時も次回用に更新する）"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # 今回参照されなかったエントリ（削除されたファイル等）は捨てる
+            entries = {k: v for k, v in self._entries.items() if k in self._seen}
+            payload = {"salt": self._salt, "entries": entries}
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            tmp_file.replace(self.cache_file)
+        except OSError as e:
+            print(f"⚠️  Failed to write parse cache: {e}")
+
+    def _lookup(self, key: str, file_path: Path, context: str) -> Tuple[Optional[Dict], Dict]:
+        """
+        キャッシュを引く
+
+        Returns:
+            tuple: (ヒットしたエントリ or None, 新しく保存する場合の検証情報)
+        """
+        self._seen.add(key)
+        stat = file_path.stat()
+        stamp = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "context": context}
+        entry = self._entries.get(key) if self.enabled else None
+
+        if entry and entry["context"] == context:
+            if entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                return entry, stamp
+            stamp["sha256"] = _sha256(file_path.read_bytes())
+            if entry["sha256"] == stamp["sha256"]:
+                # touch されただけ: 内容は同じなので stat だけ更新する
+                entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                return entry, stamp
+        else:
+            stamp["sha256"] = _sha256(file_path.read_bytes())
+
+        return None, stamp
+
+    def get_class(self, file_path: Path) -> Optional[CSharpClass]:
+        """キャッシュ経由で parse_csharp_class を呼ぶ"""
+        return self.get_classes([file_path])[0]
+
+    def get_classes(self, file_paths: List[Path], jobs: int = 1) -> List[Optional[CSharpClass]]:
+        """
+        キャッシュ経由で複数ファイルに parse_csharp_class を適用する
+
+        キャッシュに無いファイルだけを jobs 並列でパースし、結果は file_paths の順序で返す。
+        """
+        results: List[Optional[CSharpClass]] = [None] * len(file_paths)
+        pending: List[Tuple[int, Path, Optional[Dict]]] = []
+
+        for i, file_path in enumerate(file_paths):
+            key = f"class:{file_path.as_posix()}"
+            try:
+                entry, stamp = self._lookup(key, file_path, "")
+            except OSError:
+                pending.append((i, file_path, None))
+                continue
+            if entry is not None:
+                self.hits += 1
+                results[i] = _decode_class(entry["result"])
+            else:
+                self.misses += 1
+                pending.append((i, file_path, stamp))
+
+        parsed = parallel_map(parse_csharp_class, [file_path for _, file_path, _ in pending], jobs)
+        for (i, file_path, stamp), cls in zip(pending, parsed):
+            results[i] = cls
+            if stamp is not None:
+                self._entries[f"class:{file_path.as_posix()}"] = {**stamp, "result": asdict(cls) if cls else None}
+
+        return results
+
+    def get_controller(
+        self,
+        file_path: Path,
+        all_request_types: set,
+        all_response_types: set,
+    ) -> Tuple[List[EndpointInfo], List[str]]:
+        """キャッシュ経由で parse_controller を呼ぶ"""
+        return self.get_controllers([file_path], all_request_types, all_response_types)[0]
+
+    def get_controllers(
+        self,
+        file_paths: List[Path],
+        all_request_types: set,
+        all_response_types: set,
+        jobs: int = 1,
+    ) -> List[Tuple[List[EndpointInfo], List[str]]]:
+        """
+        キャッシュ経由で複数ファイルに parse_controller を適用する
+
+        キャッシュに無いファイルだけを jobs 並列でパースし、結果は file_paths の順序で返す。
+        """
+        context = _types_context(all_request_types, all_response_types)
+        results: List[Tuple[List[EndpointInfo], List[str]]] = [([], [])] * len(file_paths)
+        pending: List[Tuple[int, Path, Optional[Dict]]] = []
+
+        for i, file_path in enumerate(file_paths):
+            key = f"controller:{file_path.as_posix()}"
+            try:
+                entry, stamp = self._lookup(key, file_path, context)
+            except OSError:
+                pending.append((i, file_path, None))
+                continue
+            if entry is not None:
+                self.hits += 1
+                endpoints, skipped = entry["result"]
+                results[i] = ([EndpointInfo(**ep) for ep in endpoints], list(skipped))
+            else:
+                self.misses += 1
+                pending.append((i, file_path, stamp))
+
+        parse = partial(parse_controller, all_request_types=all_request_types, all_response_types=all_response_types)
+        parsed = parallel_map(parse, [file_path for _, file_path, _ in pending], jobs)
+        for (i, file_path, stamp), (endpoints, skipped) in zip(pending, parsed):
+            results[i] = (endpoints, skipped)
+            if stamp is not None:
+                self._entries[f"controller:{file_path.as_posix()}"] = {
+                    **stamp,
+                    "result": [[asdict(ep) for ep in endpoints], skipped],
+                }
+
+        return results
@@ -0,0 +1,133 @@
+"""生成処理のフェーズごとの時間・メモリ計測（--profile）"""
+
+import cProfile
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# レポート形式を変えたら上げる
+PROFILE_VERSION = 2
+
+
+class PhaseProfiler:
+    """
+    フェーズ（ValueObject 読み込み、DTO パース、テンプレートのレンダリングなど）ごとに
+    経過時間・処理ファイル数・tracemalloc のピークメモリを記録する
+
+    enabled=False の場合 phase() は何も計測しない。
+    cprofile=True の場合は各フェーズを cProfile でも計測し、最も遅かったフェーズの統計だけを残す
+    （計測オーバーヘッドが乗るため、その場合の時間は相対比較用）。
+    cProfile は呼び出したスレッドしか計測しないので、スレッドプールで動く処理は worker_profile() で囲む。
+    """
+
+    def __init__(self, command: str, enabled: bool = False, cprofile: bool = False):
+        self.command = command
+        self.enabled = enabled or cprofile
+        self.cprofile = cprofile
+        self.phases: List[Dict[str, Any]] = []
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._started = time.perf_counter()
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def phase(self, name: str, files: int = 0, **details: Any) -> Iterator[Dict[str, Any]]:
+        """
+        with 内の処理を1つのフェーズとして計測する
+
+        yield したレコードに files などを後から書き込める（処理してみないと件数が分からない場合）。
+        """
+        record: Dict[str, Any] = {"name": name, "files": files, **details}
+        if not self.enabled:
+            yield record
+            return
+
+        profile = cProfile.Profile() if self.cprofile else None
+        tracemalloc.reset_peak()
+        base_memory, _ = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        if profile:
+            profile.enable()
+        try:
+            yield record
+        finally:
+            if profile:
+                profile.disable()
+            record["wall_seconds"] = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            record["peak_memory_bytes"] = max(0, peak - base_memory)
+            self.phases.append(record)
+            if profile:
+                # 同名フェーズ（--watch の再生成など）は最新のものを残す
+                self._profiles[name] = profile
+
+    @contextmanager
+    def worker_profile(self, name: str) -> Iterator[None]:
+        """
+        別スレッドで動く処理を、そのスレッドの cProfile で計測する（cprofile=False なら何もしない）
+
+        時間は呼び出し側が測って add_record() で同じ name のフェーズとして追加する。
+        """
+        if not self.cprofile:
+            yield
+            return
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._profiles[name] = profile
+
+    def add_record(self, name: str, wall_seconds: float, files: int = 0, **details: Any) -> None:
+        """
+        別スレッドなどで計測済みの時間をフェーズとして追加する
+
+        tracemalloc はスレッドを区別できないため、ピークメモリは測れない（None。囲んでいるフェーズの値を参照する）。
+        """
+        if self.enabled:
+            self.phases.append({"name": name, "files": files, **details, "wall_seconds": wall_seconds, "peak_memory_bytes": None})
+
+    def slowest_phase(self) -> Optional[Dict[str, Any]]:
+        return max(self.phases, key=lambda record: record["wall_seconds"], default=None)
+
+    def report(self) -> Dict[str, Any]:
+        """計測結果を JSON にできる dict で返す"""
+        _, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        slowest = self.slowest_phase()
+        return {
+            "version": PROFILE_VERSION,
+            "command": self.command,
+            "python": sys.version.split()[0],
+            "pid": os.getpid(),
+            "total_seconds": time.perf_counter() - self._started,
+            "peak_memory_bytes": peak,
+            "slowest_phase": slowest["name"] if slowest else None,
+            "phases": self.phases,
+        }
+
+    def write(self, report_file: Path, cprofile_file: Optional[Path] = None) -> None:
+        """レポートを report_file に書き出し、cprofile_file があれば最も遅いフェーズの統計をダンプする"""
+        report = self.report()
+        if cprofile_file and report["slowest_phase"] in self._profiles:
+            cprofile_file.parent.mkdir(parents=True, exist_ok=True)
+            self._profiles[report["slowest_phase"]].dump_stats(str(cprofile_file))
+            report["cprofile_file"] = str(cprofile_file)
+
+        report_file.parent.mkdir(parents=True, exist_ok=True)
+        report_file.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    def summary_lines(self) -> List[str]:
+        """コンソール表示用の要約（遅い順）"""
+        lines = []
+        for record in sorted(self.phases, key=lambda r: r["wall_seconds"], reverse=True):
+            files = f"{record['files']:>5} files" if record["files"] else " " * 11
+            peak = record["peak_memory_bytes"]
+            memory = f"{peak / 1024:>9.1f} KiB peak" if peak is not None else f"{'n/a':>9}"
+            lines.append(f"   {record['name']:<32} {record['wall_seconds'] * 1000:>9.1f} ms {files} {memory}")
+        return lines
@@ -0,0 +1,153 @@
+"""
+パーサーが読む C# ソースの提供元
+
+既定は作業ツリーのファイル（FileSystemSource）。GitSource は任意のリビジョンのファイルを
+git のオブジェクトから直接読むため、チェックアウトも worktree も要らない。
+ファイル一覧は git ls-tree を1回、内容は常駐させた1つの git cat-file --batch プロセス（GitBlobReader）から読む。
+blob はハッシュで読むので、1つの GitBlobReader を複数のリビジョンの GitSource で共有できる。
+"""
+
+import fnmatch
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import subprocess
+
+
+class SourceError(Exception):
+    """リビジョンが見つからない・git が使えないなど、ソースを読めない"""
+
+
+class FileSystemSource:
+    """作業ツリーのファイルを読む"""
+
+    label = "working tree"
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def read_bytes(self, path: Path) -> bytes:
+        return path.read_bytes()
+
+    def read_text(self, path: Path) -> str:
+        return path.read_text(encoding="utf-8")
+
+    def glob(self, directory: Path, pattern: str) -> List[Path]:
+        """directory 直下で pattern に一致するファイル（ソート済み）"""
+        return sorted(directory.glob(pattern))
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "FileSystemSource":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class GitBlobReader:
+    """常駐させた git cat-file --batch に blob のハッシュを送って内容を読む（最初の読み込み時に起動する）"""
+
+    def __init__(self, cwd: Path = Path(".")):
+        self.cwd = cwd
+        self._process: Optional["subprocess.Popen"] = None
+
+    def read(self, object_hash: str) -> bytes:
+        if self._process is None:
+            # subprocess の import は重いので（作業ツリーから読むときは不要）、git を使うときだけ読み込む
+            import subprocess
+            try:
+                self._process = subprocess.Popen(
+                    ["git", "cat-file", "--batch"], cwd=self.cwd,
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                )
+            except OSError as e:
+                raise SourceError(f"git is not available: {e}") from e
+        self._process.stdin.write(f"{object_hash}\n".encode("ascii"))
+        self._process.stdin.flush()
+        # "<hash> <type> <size>\n<content>\n"（見つからなければ "<hash> missing\n"）
+        header = self._process.stdout.readline().split()
+        if len(header) != 3:
+            raise SourceError(f"git cat-file: unexpected response for {object_hash}: {b' '.join(header)!r}")
+        return self._process.stdout.read(int(header[2]) + 1)[:-1]
+
+    def close(self) -> None:
+        if self._process is not None:
+            self._process.stdin.close()
+            self._process.wait()
+            self._process = None
+
+
+class GitSource(FileSystemSource):
+    """
+    git のリビジョン（ブランチ名・タグ・コミット）からファイルを読む
+
+    パスは作業ディレクトリ（cwd）からの相対パスで、FileSystemSource と同じものを渡せる。
+    roots 以下のファイル一覧と blob のハッシュは最初のアクセス時に git ls-tree で1回だけ取得する。
+    reader を渡すとその GitBlobReader を使う（close() しても reader は閉じない）。
+    """
+
+    def __init__(self, rev: str, roots: List[Path], cwd: Path = Path("."), reader: Optional[GitBlobReader] = None):
+        self.rev = rev
+        self.cwd = cwd
+        try:
+            self.commit = self._git("rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}").strip()
+        except SourceError as e:
+            raise SourceError(f"unknown revision: {rev}") from e
+        self.label = f"{rev} ({self.commit[:10]})"
+        self._roots = roots
+        self._blobs: Optional[Dict[PurePosixPath, str]] = None
+        self._owns_reader = reader is None
+        self._reader = reader or GitBlobReader(cwd)
+
+    def _git(self, *args: str) -> str:
+        import subprocess
+        try:
+            result = subprocess.run(["git", *args], cwd=self.cwd, capture_output=True, text=True)
+        except OSError as e:
+            raise SourceError(f"git is not available: {e}") from e
+        if result.returncode != 0:
+            message = result.stderr.strip() or f"git {' '.join(args)} failed"
+            raise SourceError(f"{self.rev}: {message}")
+        return result.stdout
+
+    @property
+    def blobs(self) -> Dict[PurePosixPath, str]:
+        """roots 以下のファイル（cwd からの相対パス）→ blob のハッシュ"""
+        if self._blobs is None:
+            # -z: パスをクォートしない。"<mode> <type> <hash>\t<path>\0"
+            output = self._git("ls-tree", "-r", "-z", self.commit, "--", *(root.as_posix() for root in self._roots))
+            self._blobs = {}
+            for entry in output.split("\0"):
+                if not entry:
+                    continue
+                info, path = entry.split("\t", 1)
+                _, object_type, object_hash = info.split(" ")
+                if object_type == "blob":
+                    self._blobs[PurePosixPath(path)] = object_hash
+        return self._blobs
+
+    def exists(self, path: Path) -> bool:
+        return PurePosixPath(path.as_posix()) in self.blobs
+
+    def read_bytes(self, path: Path) -> bytes:
+        object_hash = self.blobs.get(PurePosixPath(path.as_posix()))
+        if object_hash is None:
+            raise FileNotFoundError(f"{path} does not exist in {self.label}")
+        return self._reader.read(object_hash)
+
+    def read_text(self, path: Path) -> str:
+        return self.read_bytes(path).decode("utf-8")
+
+    def glob(self, directory: Path, pattern: str) -> List[Path]:
+        parent = PurePosixPath(directory.as_posix())
+        return sorted(
+            Path(path) for path in self.blobs
+            if path.parent == parent and fnmatch.fnmatchcase(path.name, pattern)
+        )
+
+    def close(self) -> None:
+        if self._owns_reader:
+            self._reader.close()
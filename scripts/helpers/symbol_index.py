@@ -0,0 +1,120 @@
+"""プロジェクト全体のシンボルインデックス（クラスのプロパティ・ValueObject・DTO の依存グラフ）"""
+
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from models import CSharpClass, CSharpProperty
+from .csharp_types import ARRAY, TUPLE, TypeRef, parse_csharp_type
+
+
+def to_camel(name: str) -> str:
+    """先頭を小文字にする（C# のプロパティ名 → JSON / TypeScript のプロパティ名）"""
+    return name[0].lower() + name[1:] if name else name
+
+
+def _type_names(ref: TypeRef, names: Set[str]) -> None:
+    if ref.name not in (ARRAY, TUPLE):
+        # 名前空間付き（NariNoteBackend.Application.Dto.KifuDto）でもクラス名で引けるようにする
+        names.add(ref.name.rsplit('.', 1)[-1])
+    for arg in ref.args:
+        _type_names(arg, names)
+
+
+class SymbolIndex:
+    """
+    1回の生成で共有する、クラス・ValueObject の検索用インデックス
+
+    - クラス名 → camelCase のプロパティ名 → CSharpProperty
+    - ValueObject の ID 型（camelCase）の一覧
+    - DTO がプロパティで参照している型と、その逆引き（例: GetArticlesResponse → ArticleDto → KifuDto）
+
+    プロパティは渡されたクラスのオブジェクトをそのまま参照する。
+    """
+
+    def __init__(self, classes: Iterable[CSharpClass], value_object_types: Dict[str, str]):
+        self.classes: Dict[str, CSharpClass] = {cls.name: cls for cls in classes}
+        self.value_object_types = value_object_types
+        self._props_by_camel: Dict[str, Dict[str, CSharpProperty]] = {
+            name: {to_camel(prop.name): prop for prop in cls.properties}
+            for name, cls in self.classes.items()
+        }
+        # {id} の推測に使う ValueObject の ID 型（value_object_types の順序のまま）
+        self._vo_id_names: List[str] = [to_camel(vo) for vo in value_object_types if vo.endswith('Id')]
+
+        # 参照している型名（存在しないクラス名も含める: 削除されたクラスの参照元も辿れるようにする）
+        self.references: Dict[str, FrozenSet[str]] = {}
+        self.referenced_by: Dict[str, Set[str]] = {}
+        for name, cls in self.classes.items():
+            names: Set[str] = set()
+            for prop in cls.properties:
+                _type_names(parse_csharp_type(prop.type), names)
+            names.discard(name)
+            self.references[name] = frozenset(names)
+            for ref in names:
+                self.referenced_by.setdefault(ref, set()).add(name)
+
+    def properties(self, class_name: str) -> Dict[str, CSharpProperty]:
+        """camelCase のプロパティ名 → CSharpProperty（クラスがなければ空）"""
+        return self._props_by_camel.get(class_name, {})
+
+    def path_param_property(self, param: str, request_type: Optional[str]) -> Optional[CSharpProperty]:
+        """
+        パスパラメータ（{id} 等）に対応する Request のプロパティを返す
+
+        名前が一致するものを優先し、{id} の場合は *Id で終わるプロパティが1つだけならそれを採用する。
+        """
+        props = self.properties(request_type) if request_type else {}
+        camel_param = to_camel(param)
+        if camel_param in props:
+            return props[camel_param]
+        if camel_param == 'id':
+            id_props = [prop for name, prop in props.items() if name.endswith('Id')]
+            if len(id_props) == 1:
+                return id_props[0]
+        return None
+
+    def resolve_path_param(self, param: str, request_type: Optional[str]) -> str:
+        """
+        パスパラメータ名を Request のプロパティ名（camelCase）に解決する（{id} -> courseId など）
+
+        解決できない場合はパラメータ名を camelCase にして返す。
+        """
+        camel_param = to_camel(param)
+        props = self.properties(request_type) if request_type else {}
+        if not props or camel_param != 'id':
+            return camel_param
+        if 'id' in props:
+            return 'id'
+
+        # "*Id" がちょうど1つならそれを使う
+        id_like = [name for name in props if name.endswith('Id')]
+        if len(id_like) == 1:
+            return id_like[0]
+
+        # ValueObject型から候補を生成してマッチング
+        for candidate in self._vo_id_names:
+            if candidate in props:
+                return candidate
+        return camel_param
+
+    def dependencies(self, class_name: str) -> Set[str]:
+        """class_name が（推移的に）参照しているクラス名"""
+        seen: Set[str] = set()
+        stack = [class_name]
+        while stack:
+            for ref in self.references.get(stack.pop(), ()):
+                if ref in self.classes and ref not in seen:
+                    seen.add(ref)
+                    stack.append(ref)
+        seen.discard(class_name)
+        return seen
+
+    def dependents(self, names: Iterable[str]) -> Set[str]:
+        """names と、names を（推移的に）参照しているクラス名"""
+        seen = set(names)
+        stack = list(seen)
+        while stack:
+            for ref in self.referenced_by.get(stack.pop(), ()):
+                if ref not in seen:
+                    seen.add(ref)
+                    stack.append(ref)
+        return seen
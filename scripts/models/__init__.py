@@ -1,5 +1,5 @@
 """Data models for API generator."""
 
-from .types import CSharpProperty, CSharpClass, EndpointInfo
+from .types import CSharpProperty, CSharpClass, EndpointInfo, ValidationRule, intern_fields
 
-__all__ = ['CSharpProperty', 'CSharpClass', 'EndpointInfo']
+__all__ = ['CSharpProperty', 'CSharpClass', 'EndpointInfo', 'ValidationRule', 'intern_fields']
\ No newline at end of file
@@ -1,25 +1,63 @@
-"""Data models for C# code parsing."""
+"""
+Data models for C# code parsing.
 
+プロパティ数が数万件になっても軽いように、インスタンスは __slots__ 付きの frozen dataclass にし、
+型名・プロパティ名など同じ値が繰り返し現れる文字列は sys.intern で共有する。
+値を変えるときは dataclasses.replace で作り直す。
+"""
+
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import NamedTuple, Optional, Tuple
+
+
+_setattr = object.__setattr__
 
 
-@dataclass
+def intern_fields(obj: object, *names: str) -> None:
+    """frozen dataclass の文字列フィールドを sys.intern したものに置き換える（__post_init__ 用。None はそのまま）"""
+    for name in names:
+        value = getattr(obj, name)
+        if value is not None:
+            _setattr(obj, name, sys.intern(value))
+
+
+class ValidationRule(NamedTuple):
+    """プロパティの検証属性（[MaxLength(100)] → ValidationRule("MaxLength", ("100",))）。arguments は位置引数のソース文字列"""
+    name: str
+    arguments: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
 class CSharpProperty:
     name: str
     type: str
     is_optional: bool = False
     is_list: bool = False
+    validation: Tuple[ValidationRule, ...] = ()
+
+    def __post_init__(self):
+        # 最も数が多いモデルなので intern_fields のループを展開しておく
+        _setattr(self, "name", sys.intern(self.name))
+        _setattr(self, "type", sys.intern(self.type))
+        if self.validation:
+            # JSON（パースキャッシュ・IR）から戻したリストも ValidationRule のタプルにそろえる
+            _setattr(self, "validation", tuple(ValidationRule(name, tuple(args)) for name, args in self.validation))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CSharpClass:
     name: str
-    properties: List[CSharpProperty]
+    properties: Tuple[CSharpProperty, ...]
     namespace: str
 
+    def __post_init__(self):
+        # list で渡されても変更できないよう tuple にする
+        _setattr(self, "properties", tuple(self.properties))
+        intern_fields(self, "name", "namespace")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class EndpointInfo:
     method: str  # GET, POST, PUT, DELETE
     path: str
@@ -30,3 +68,11 @@ class EndpointInfo:
     has_body_param: bool = False  # [FromBody]パラメータがあるかどうか
     is_form_file: bool = False    # IFormFileパラメータがあるかどうか
     form_file_param: str = "file" # IFormFileパラメータ名
+    auth: Optional[str] = None    # 認証属性（AllowAnonymous / OptionalAuth / RequireAuth / Authorize）
+    invalidates: Tuple[str, ...] = ()  # [Invalidates(...)] で指定した GET アクションのメソッド名
+    invalidates_only: bool = False     # [Invalidates(..., Only = true)]（型からの推測を使わない）
+
+    def __post_init__(self):
+        intern_fields(self, "method", "path", "function_name", "request_type", "response_type", "controller_name", "form_file_param", "auth")
+        # JSON（パースキャッシュ）から戻したリストも tuple にそろえる
+        _setattr(self, "invalidates", tuple(self.invalidates))
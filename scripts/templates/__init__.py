@@ -2,14 +2,18 @@
 TypeScript生成用のテンプレートクラス
 """
 
+from .base import endpoint_key
 from .types_template import TypesTemplate
 from .endpoints_template import EndpointsTemplate
 from .hooks_template import HooksTemplate
 from .server_template import ServerTemplate
+from .barrel_template import BarrelTemplate
 
 __all__ = [
     'TypesTemplate',
     'EndpointsTemplate',
     'HooksTemplate',
     'ServerTemplate',
+    'BarrelTemplate',
+    'endpoint_key',
 ]
@@ -0,0 +1,45 @@
+"""
+--layout modules のバレルファイル（<controller>/index.ts と modules.ts）生成用テンプレート
+"""
+
+from typing import Iterator, List
+from .base import BaseTemplate
+
+
+class BarrelTemplate(BaseTemplate):
+    """コントローラー別モジュールを再 export するバレルファイル生成用テンプレート"""
+
+    def get_header(self) -> str:
+        return """// Auto-generated by api-generator.py
+// Do not edit manually
+"""
+
+    def render(self, controllers: List[str]) -> Iterator[str]:
+        """
+        modules.ts（全コントローラーのバレル）の内容を行単位で生成
+
+        hooks.ts と同じ形の queryKeys も組み立てて export する。
+
+        Args:
+            controllers: コントローラー名のリスト
+        """
+        yield self.get_header()
+        for controller in controllers:
+            yield f"import {{ {controller}QueryKeys }} from './{controller}/hooks';"
+        yield ""
+        for controller in controllers:
+            yield f"export * from './{controller}';"
+        yield ""
+        yield "// Query Keys"
+        yield "export const queryKeys = {"
+        for controller in controllers:
+            yield f"  {controller}: {controller}QueryKeys,"
+        yield "};"
+        yield ""
+
+    def render_controller(self, controller: str) -> Iterator[str]:
+        """<controller>/index.ts の内容を行単位で生成"""
+        yield self.get_header()
+        yield "export * from './endpoints';"
+        yield "export * from './hooks';"
+        yield ""
@@ -4,15 +4,19 @@
 
 import re
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
 from models import EndpointInfo
+from helpers import SymbolIndex
 
 
 class BaseTemplate(ABC):
     """テンプレート生成の基底クラス"""
 
-    def __init__(self, value_object_types: Dict[str, str]):
+    def __init__(self, value_object_types: Dict[str, str], index: Optional[SymbolIndex] = None):
         self.value_object_types = value_object_types
+        self.index = index or SymbolIndex([], value_object_types)
+        self._fragments: Optional[Dict[str, List[str]]] = None
+        self._dirty: Optional[Set[str]] = None
 
     @abstractmethod
     def get_header(self) -> str:
@@ -20,12 +24,21 @@ class BaseTemplate(ABC):
         pass
 
     @abstractmethod
+    def render(self, **kwargs) -> Iterator[str]:
+        """
+        ファイル内容を行単位で順に返す
+
+        行は改行を含まない。write_lines_if_changed に渡すと、全体を組み立てずに
+        先頭からバッファ付きで書き出せる。
+        """
+        pass
+
     def generate(self, **kwargs) -> str:
         """完全なファイル内容を生成"""
-        pass
+        return self._join_lines(self.render(**kwargs))
 
-    def _join_lines(self, lines: List[str]) -> str:
-        """行リストを結合してファイル内容にする"""
+    def _join_lines(self, lines: Iterable[str]) -> str:
+        """行を結合してファイル内容にする"""
         return "\n".join(lines)
 
     def _group_by_controller(self, endpoints: List[EndpointInfo]) -> Dict[str, List[EndpointInfo]]:
@@ -55,43 +68,39 @@ class BaseTemplate(ABC):
                 all_types.add(ep.response_type)
         return all_types
 
-    def _resolve_path_param(self, param: str, request_type: str, class_map: Dict) -> str:
+    def _resolve_path_param(self, param: str, request_type: str) -> str:
         """
         パスパラメータ名を解決（{id} -> 実際のプロパティ名）
 
         Args:
             param: パスパラメータ名
             request_type: リクエスト型名
-            class_map: クラス名->CSharpClassのマッピング
 
         Returns:
             解決されたプロパティ名（キャメルケース）
         """
-        camel_param = self._to_camel_case(param) if param else param
-
-        # リクエストクラスがある場合、プロパティ名を確認
-        if request_type in class_map:
-            req_class = class_map[request_type]
-            prop_names = [self._to_camel_case(prop.name) for prop in req_class.properties]
-
-            # {id} の場合の堅牢な推測
-            if camel_param == 'id':
-                if 'id' in prop_names:
-                    return 'id'
-
-                # "*Id" がちょうど1つならそれを使う
-                id_like = [p for p in prop_names if p.endswith('Id')]
-                if len(id_like) == 1:
-                    return id_like[0]
-
-                # ValueObject型から候補を生成してマッチング
-                candidates = [
-                    self._to_camel_case(vo_type)
-                    for vo_type in self.value_object_types
-                    if vo_type.endswith('Id')
-                ]
-                for candidate in candidates:
-                    if candidate in prop_names:
-                        return candidate
-
-        return camel_param
+        return self.index.resolve_path_param(param, request_type)
+
+    def use_fragments(self, fragments: Dict[str, List[str]], dirty: Optional[Set[str]]) -> None:
+        """
+        クラス・エンドポイント単位の出力断片を fragments に保持し、次回以降のレンダリングで再利用する
+
+        dirty に含まれないキー（クラス名 / endpoint_key）は前回の断片をそのまま使う。dirty が None なら全て作り直す。
+        """
+        self._fragments = fragments
+        self._dirty = dirty
+
+    def _fragment(self, key: str, build: Callable[[], List[str]]) -> List[str]:
+        """key の出力断片を返す（use_fragments されていて key が dirty でなければ前回の結果を使う）"""
+        if self._fragments is None:
+            return build()
+        if self._dirty is not None and key not in self._dirty and key in self._fragments:
+            return self._fragments[key]
+        lines = build()
+        self._fragments[key] = lines
+        return lines
+
+
+def endpoint_key(ep: EndpointInfo) -> str:
+    """出力断片・依存関係でエンドポイントを識別するキー（クラス名とは重ならない）"""
+    return f"{ep.controller_name}.{ep.function_name} {ep.method} {ep.path}"
@@ -2,16 +2,22 @@
 endpoints.ts生成用テンプレート
 """
 
-from typing import List, Dict
+from typing import Dict, Iterator, List, Optional, Tuple
 from models import CSharpClass, EndpointInfo
-from .base import BaseTemplate
+from helpers import SymbolIndex
+from .base import BaseTemplate, endpoint_key
 
 
 class EndpointsTemplate(BaseTemplate):
     """endpoints.ts生成用テンプレート"""
 
-    def __init__(self, value_object_types: Dict[str, str], class_map: Dict[str, CSharpClass]):
-        super().__init__(value_object_types)
+    def __init__(
+        self,
+        value_object_types: Dict[str, str],
+        class_map: Dict[str, CSharpClass],
+        index: Optional[SymbolIndex] = None,
+    ):
+        super().__init__(value_object_types, index or SymbolIndex(class_map.values(), value_object_types))
         self.class_map = class_map
 
     def get_header(self) -> str:
@@ -21,50 +27,85 @@ class EndpointsTemplate(BaseTemplate):
 import { apiClient } from './client';
 import type {"""
 
-    def generate(self, endpoints: List[EndpointInfo]) -> str:
+    def render(self, endpoints: List[EndpointInfo]) -> Iterator[str]:
         """
-        完全なendpoints.tsの内容を生成
+        endpoints.tsの内容を行単位で生成
 
         Args:
             endpoints: エンドポイント情報のリスト
 
-        Returns:
-            endpoints.tsの完全な内容
+        Yields:
+            endpoints.tsの各行
         """
-        lines = [self.get_header()]
+        yield self.get_header()
 
         # 型インポートを生成
-        lines.extend(self._generate_type_imports(endpoints))
-        lines.append("")
+        yield from self._generate_type_imports(endpoints)
+        yield ""
 
         # コントローラー別のAPI関数を生成
         by_controller = self._group_by_controller(endpoints)
         for controller, eps in sorted(by_controller.items()):
-            lines.extend(self._generate_controller_api(controller, eps))
-            lines.append("")
-
-        return self._join_lines(lines)
+            yield from self._generate_controller_api(controller, eps)
+            yield ""
 
     def _generate_type_imports(self, endpoints: List[EndpointInfo]) -> List[str]:
         """型インポートセクションを生成"""
         all_types = self._collect_types_from_endpoints(endpoints)
         return [f"  {type_name}," for type_name in sorted(all_types)] + ["} from './types';"]
 
-    def _generate_controller_api(self, controller: str, endpoints: List[EndpointInfo]) -> List[str]:
+    def _generate_controller_api(self, controller: str, endpoints: List[EndpointInfo]) -> Iterator[str]:
         """コントローラーごとのAPIオブジェクトを生成"""
-        lines = []
-        lines.append(f"// {controller.capitalize()} API")
-        lines.append(f"export const {controller}Api = {{")
+        yield f"// {controller.capitalize()} API"
+        yield f"export const {controller}Api = {{"
 
         for ep in endpoints:
-            lines.extend(self._generate_api_function(ep))
+            yield from self._fragment(endpoint_key(ep), lambda: self._generate_api_function(ep))
+
+        yield "};"
 
-        lines.append("};")
+    def render_module(self, controller: str, endpoints: List[EndpointInfo]) -> Iterator[str]:
+        """
+        <controller>/endpoints.ts の内容を行単位で生成（--layout modules）
 
-        return lines
+        API 関数をオブジェクトのメンバーではなく個別の export にするため、
+        使われない関数はバンドラーの tree shaking で取り除かれる。
+        """
+        yield """// Auto-generated by api-generator.py
+// Do not edit manually
+
+import { apiClient } from '../client';"""
+        all_types = self._collect_types_from_endpoints(endpoints)
+        if all_types:
+            yield "import type {"
+            yield from (f"  {type_name}," for type_name in sorted(all_types))
+            yield "} from '../types';"
+        yield ""
+
+        for ep in endpoints:
+            yield from self._fragment(f"{endpoint_key(ep)} module", lambda: self._generate_module_function(ep))
+            yield ""
 
     def _generate_api_function(self, ep: EndpointInfo) -> List[str]:
-        """個別のAPI関数を生成"""
+        """個別のAPI関数を生成（コントローラーの API オブジェクトのメンバー）"""
+        func_name, params, response_type, body = self._api_function_parts(ep)
+        return [
+            f"  {func_name}: async ({params}): Promise<{response_type}> => {{",
+            *(f"    {line}" for line in body),
+            "  },",
+        ]
+
+    def _generate_module_function(self, ep: EndpointInfo) -> List[str]:
+        """個別のAPI関数を export function として生成"""
+        func_name, params, response_type, body = self._api_function_parts(ep)
+        return [
+            f"export async function {func_name}({params}): Promise<{response_type}> {{",
+            *(f"  {line}" for line in body),
+            "}",
+        ]
+
+    def _api_function_parts(self, ep: EndpointInfo) -> Tuple[str, str, str, List[str]]:
+        """API関数の (関数名, 引数リスト, レスポンス型, 本体の行（インデントなし）) を返す"""
         lines = []
 
         func_name = self._to_camel_case(ep.function_name)
@@ -78,7 +119,7 @@ import type {"""
         if path_params:
             url_path = ep.path
             for param in path_params:
-                resolved_param = self._resolve_path_param(param, request_type, self.class_map)
+                resolved_param = self._resolve_path_param(param, request_type)
                 url_path = url_path.replace(f'{{{param}}}', f'${{data.{resolved_param}}}')
             url_expression = f"`{url_path}`"
         else:
@@ -96,38 +137,36 @@ import type {"""
 
         if ep.is_form_file:
             param_name = ep.form_file_param
-            lines.append(f"  {func_name}: async ({param_name}: File): Promise<{response_type}> => {{")
-            lines.append(f"    const formData = new FormData();")
-            lines.append(f"    formData.append('{param_name}', {param_name});")
-            lines.append(f"    const response = await apiClient.{ep.method.lower()}<{response_type}>({url_expression}, formData);")
-            lines.append("    return response;")
+            params = f"{param_name}: File"
+            lines.append(f"const formData = new FormData();")
+            lines.append(f"formData.append('{param_name}', {param_name});")
+            lines.append(f"const response = await apiClient.{ep.method.lower()}<{response_type}>({url_expression}, formData);")
+            lines.append("return response;")
         elif effective_request_type == "void":
-            lines.append(f"  {func_name}: async (): Promise<{response_type}> => {{")
+            params = ""
             if ep.method == "DELETE":
-                lines.append(f"    await apiClient.delete({url_expression});")
+                lines.append(f"await apiClient.delete({url_expression});")
             elif ep.method == "GET":
-                lines.append(f"    const response = await apiClient.get<{response_type}>({url_expression});")
-                lines.append("    return response;")
+                lines.append(f"const response = await apiClient.get<{response_type}>({url_expression});")
+                lines.append("return response;")
             else:
-                lines.append(f"    const response = await apiClient.{ep.method.lower()}<{response_type}>({url_expression});")
-                lines.append("    return response;")
+                lines.append(f"const response = await apiClient.{ep.method.lower()}<{response_type}>({url_expression});")
+                lines.append("return response;")
         else:
-            lines.append(f"  {func_name}: async (data: {effective_request_type}): Promise<{response_type}> => {{")
+            params = f"data: {effective_request_type}"
             if ep.method == "DELETE":
-                lines.append(f"    await apiClient.delete({url_expression});")
+                lines.append(f"await apiClient.delete({url_expression});")
             elif ep.method == "GET":
                 if path_params:
-                    lines.append(f"    const response = await apiClient.get<{response_type}>({url_expression});")
+                    lines.append(f"const response = await apiClient.get<{response_type}>({url_expression});")
                 else:
-                    lines.append(f"    const response = await apiClient.get<{response_type}>({url_expression}, {{ params: data }});")
-                lines.append("    return response;")
+                    lines.append(f"const response = await apiClient.get<{response_type}>({url_expression}, {{ params: data }});")
+                lines.append("return response;")
             else:
                 if send_body:
-                    lines.append(f"    const response = await apiClient.{ep.method.lower()}<{response_type}>({url_expression}, data);")
+                    lines.append(f"const response = await apiClient.{ep.method.lower()}<{response_type}>({url_expression}, data);")
                 else:
-                    lines.append(f"    const response = await apiClient.{ep.method.lower()}<{response_type}>({url_expression});")
-                lines.append("    return response;")
-
-        lines.append("  },")
+                    lines.append(f"const response = await apiClient.{ep.method.lower()}<{response_type}>({url_expression});")
+                lines.append("return response;")
 
-        return lines
+        return func_name, params, response_type, lines
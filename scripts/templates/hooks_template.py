@@ -2,13 +2,28 @@
 hooks.ts生成用テンプレート
 """
 
-from typing import List, Dict
+from typing import Dict, Iterator, List, Optional
 from models import EndpointInfo
+from helpers import Invalidation, InvalidationMap, SymbolIndex
 from .base import BaseTemplate
 
 
 class HooksTemplate(BaseTemplate):
-    """hooks.ts生成用テンプレート"""
+    """
+    hooks.ts生成用テンプレート
+
+    Mutation フックは成功時に、InvalidationMap で推測したクエリだけを無効化する。
+    invalidations を渡さなければ render に渡したエンドポイントから作る。
+    """
+
+    def __init__(
+        self,
+        value_object_types: Dict[str, str],
+        index: Optional[SymbolIndex] = None,
+        invalidations: Optional[InvalidationMap] = None,
+    ):
+        super().__init__(value_object_types, index)
+        self.invalidations = invalidations
 
     def get_header(self) -> str:
         return """// Auto-generated by api-generator.py
@@ -16,32 +31,74 @@ class HooksTemplate(BaseTemplate):
 
 import { useMutation, useQuery, useQueryClient, type UseMutationOptions, type UseQueryOptions } from '@tanstack/react-query';"""
 
-    def generate(self, endpoints: List[EndpointInfo]) -> str:
+    def render(self, endpoints: List[EndpointInfo]) -> Iterator[str]:
         """
-        完全なhooks.tsの内容を生成
+        hooks.tsの内容を行単位で生成
 
         Args:
             endpoints: エンドポイント情報のリスト
 
-        Returns:
-            hooks.tsの完全な内容
+        Yields:
+            hooks.tsの各行
         """
-        lines = [self.get_header()]
+        if self.invalidations is None:
+            self.invalidations = InvalidationMap(endpoints, self.index)
+        yield self.get_header()
         by_controller = self._group_by_controller(endpoints)
 
         # インポートを生成
-        lines.extend(self._generate_imports(endpoints, by_controller))
-        lines.append("")
+        yield from self._generate_imports(endpoints, by_controller)
+        yield ""
 
         # Query Keysを生成
-        lines.extend(self._generate_query_keys(by_controller))
-        lines.append("")
+        yield from self._generate_query_keys(by_controller)
+        yield ""
 
         # フックを生成
         for controller, eps in sorted(by_controller.items()):
-            lines.extend(self._generate_hooks(controller, eps))
+            yield from self._generate_hooks(controller, eps)
+
+    def render_module(self, controller: str, endpoints: List[EndpointInfo]) -> Iterator[str]:
+        """
+        <controller>/hooks.ts の内容を行単位で生成（--layout modules）
+
+        API 関数は ./endpoints から個別に import し、Query Keys は <controller>QueryKeys として export する。
+        """
+        # 使う関数・型だけを import する（モジュールごとに未使用の import を残さない）
+        if self.invalidations is None:
+            self.invalidations = InvalidationMap(endpoints, self.index)
+        has_query = any(ep.method == "GET" for ep in endpoints)
+        has_mutation = any(ep.method != "GET" for ep in endpoints)
+        invalidates = any(self.invalidations.for_mutation(ep).keys for ep in endpoints if ep.method != "GET")
+        react_query = (
+            (["useMutation"] if has_mutation else []) + (["useQuery"] if has_query else [])
+            + (["useQueryClient"] if invalidates else [])
+            + (["type UseMutationOptions"] if has_mutation else [])
+            + (["type UseQueryOptions"] if has_query else [])
+        )
+        yield """// Auto-generated by api-generator.py
+// Do not edit manually
+"""
+        yield f"import {{ {', '.join(react_query)} }} from '@tanstack/react-query';"
+        func_names = [self._to_camel_case(ep.function_name) for ep in endpoints]
+        yield f"import {{ {', '.join(func_names)} }} from './endpoints';"
+        all_types = self._collect_types_from_endpoints(endpoints)
+        if all_types:
+            yield "import type {"
+            yield from (f"  {type_name}," for type_name in sorted(all_types))
+            yield "} from '../types';"
+        yield ""
+
+        yield "// Query Keys"
+        yield f"export const {controller}QueryKeys = {{"
+        for ep in endpoints:
+            if ep.method == "GET":
+                func_name = self._to_camel_case(ep.function_name)
+                yield f"  {func_name}: ['{controller}', '{func_name}'] as const,"
+        yield "};"
+        yield ""
 
-        return self._join_lines(lines)
+        yield from self._generate_hooks(controller, endpoints, api_ref="", keys_ref=f"{controller}QueryKeys")
 
     def _generate_imports(self, endpoints: List[EndpointInfo], by_controller: Dict[str, List[EndpointInfo]]) -> List[str]:
         """インポート文を生成"""
@@ -77,10 +134,22 @@ import { useMutation, useQuery, useQueryClient, type UseMutationOptions, type Us
         lines.append("};")
         return lines
 
-    def _generate_hooks(self, controller: str, endpoints: List[EndpointInfo]) -> List[str]:
-        """コントローラーごとのフックを生成"""
-        lines = []
-        lines.append(f"// {controller.capitalize()} Hooks")
+    def _generate_hooks(
+        self,
+        controller: str,
+        endpoints: List[EndpointInfo],
+        api_ref: Optional[str] = None,
+        keys_ref: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        コントローラーごとのフックを生成
+
+        api_ref は API 関数の前に付ける参照（既定は "<controller>Api."）、
+        keys_ref は Query Keys オブジェクトの参照（既定は "queryKeys.<controller>"）。
+        """
+        api_ref = f"{controller}Api." if api_ref is None else api_ref
+        keys_ref = keys_ref or f"queryKeys.{controller}"
+        yield f"// {controller.capitalize()} Hooks"
 
         for ep in endpoints:
             func_name = self._to_camel_case(ep.function_name)
@@ -88,16 +157,14 @@ import { useMutation, useQuery, useQueryClient, type UseMutationOptions, type Us
 
             if ep.method == "GET":
                 # Query hook
-                lines.extend(self._generate_query_hook(ep, hook_name, func_name, controller))
-                lines.append("")
+                yield from self._generate_query_hook(ep, hook_name, func_name, api_ref, keys_ref)
+                yield ""
             else:
                 # Mutation hook
-                lines.extend(self._generate_mutation_hook(ep, hook_name, func_name, controller))
-                lines.append("")
-
-        return lines
+                yield from self._generate_mutation_hook(ep, hook_name, func_name, controller, api_ref)
+                yield ""
 
-    def _generate_query_hook(self, ep: EndpointInfo, hook_name: str, func_name: str, controller: str) -> List[str]:
+    def _generate_query_hook(self, ep: EndpointInfo, hook_name: str, func_name: str, api_ref: str, keys_ref: str) -> List[str]:
         """Queryフックを生成"""
         lines = []
 
@@ -114,23 +181,23 @@ import { useMutation, useQuery, useQueryClient, type UseMutationOptions, type Us
         if effective_request_type == "void":
             lines.append(f"export function {hook_name}(options?: Omit<UseQueryOptions<{return_type}>, 'queryKey' | 'queryFn'>) {{")
             lines.append(f"  return useQuery<{return_type}>({{")
-            lines.append(f"    queryKey: queryKeys.{controller}.{func_name},")
-            lines.append(f"    queryFn: () => {controller}Api.{func_name}(),")
+            lines.append(f"    queryKey: {keys_ref}.{func_name},")
+            lines.append(f"    queryFn: () => {api_ref}{func_name}(),")
             lines.append("    ...options,")
             lines.append("  });")
             lines.append("}")
         else:
             lines.append(f"export function {hook_name}(params: {effective_request_type}, options?: Omit<UseQueryOptions<{return_type}>, 'queryKey' | 'queryFn'>) {{")
             lines.append(f"  return useQuery<{return_type}>({{")
-            lines.append(f"    queryKey: [...queryKeys.{controller}.{func_name}, params],")
-            lines.append(f"    queryFn: () => {controller}Api.{func_name}(params),")
+            lines.append(f"    queryKey: [...{keys_ref}.{func_name}, params],")
+            lines.append(f"    queryFn: () => {api_ref}{func_name}(params),")
             lines.append("    ...options,")
             lines.append("  });")
             lines.append("}")
 
         return lines
 
-    def _generate_mutation_hook(self, ep: EndpointInfo, hook_name: str, func_name: str, controller: str) -> List[str]:
+    def _generate_mutation_hook(self, ep: EndpointInfo, hook_name: str, func_name: str, controller: str, api_ref: str) -> List[str]:
         """Mutationフックを生成"""
         response_type = ep.response_type or "void"
 
@@ -138,26 +205,53 @@ import { useMutation, useQuery, useQueryClient, type UseMutationOptions, type Us
             param_name = ep.form_file_param
             request_type = "File"
             mutation_fn_prefix = f"({param_name}) => "
-            mutation_fn_call = f"{controller}Api.{func_name}({param_name})"
+            mutation_fn_call = f"{api_ref}{func_name}({param_name})"
         else:
             request_type = ep.request_type or "void"
             if request_type == "void":
                 mutation_fn_prefix = "() => "
-                mutation_fn_call = f"{controller}Api.{func_name}()"
+                mutation_fn_call = f"{api_ref}{func_name}()"
             else:
                 mutation_fn_prefix = "(data) => "
-                mutation_fn_call = f"{controller}Api.{func_name}(data)"
+                mutation_fn_call = f"{api_ref}{func_name}(data)"
 
-        return [
-            f"export function {hook_name}(options?: UseMutationOptions<{response_type}, Error, {request_type}>) {{",
-            "  const queryClient = useQueryClient();",
+        invalidation = self.invalidations.for_mutation(ep)
+        lines = [f"export function {hook_name}(options?: UseMutationOptions<{response_type}, Error, {request_type}>) {{"]
+        if invalidation.keys:
+            lines.append("  const queryClient = useQueryClient();")
+        lines += [
             f"  return useMutation<{response_type}, Error, {request_type}>({{",
             f"    mutationFn: {mutation_fn_prefix}{mutation_fn_call},",
-            "    onSuccess: (...args) => {",
-            f"      queryClient.invalidateQueries({{ queryKey: ['{controller}'] }});",
-            "      options?.onSuccess?.(...args);",
-            "    },",
-            "    ...options,",
-            "  });",
-            "}",
         ]
+        if invalidation.keys:
+            lines.append("    onSuccess: (...args) => {")
+            if any(key.scope for key in invalidation.keys):
+                lines.append("      const [, variables] = args;")
+            for query_key in self._invalidated_keys(invalidation, controller):
+                lines.append(f"      queryClient.invalidateQueries({{ queryKey: {query_key} }});")
+            lines += [
+                "      options?.onSuccess?.(...args);",
+                "    },",
+            ]
+        lines += ["    ...options,", "  });", "}"]
+        return lines
+
+    def _invalidated_keys(self, invalidation: Invalidation, controller: str) -> List[str]:
+        """
+        無効化する Query Key（TS の式）
+
+        別のコントローラーの Query Keys を import しなくて済むよう、リテラルで書く。
+        推測できなかった場合は従来どおりコントローラー全体（['articles']）を無効化する。
+        範囲を限るキーは、変数の ID が undefined なら（型の上では省略できる場合など）範囲を限らないキーにする。
+        """
+        if invalidation.fallback:
+            return [f"['{controller}']"]
+        keys = []
+        for key in invalidation.keys:
+            query = f"'{key.query.controller_name}', '{self._to_camel_case(key.query.function_name)}'"
+            if key.scope:
+                param, variable = key.scope
+                keys.append(f"variables.{variable} === undefined ? [{query}] : [{query}, {{ {param}: variables.{variable} }}]")
+            else:
+                keys.append(f"[{query}]")
+        return keys
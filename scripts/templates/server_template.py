@@ -2,39 +2,79 @@
 server.ts生成用テンプレート
 """
 
-from typing import List, Dict
+import re
+from typing import Dict, Iterator, List, Optional
 from models import CSharpClass, EndpointInfo
-from .base import BaseTemplate
+from helpers import InvalidationMap, SymbolIndex
+from .base import BaseTemplate, endpoint_key
+
+# データキャッシュに残せる GET の認証属性。server.ts は Cookie を送らないので、
+# [OptionalAuth] の API も常に未ログインのレスポンスになり、利用者によって内容が変わらない
+CACHEABLE_AUTH = frozenset({"AllowAnonymous", "OptionalAuth"})
+# 認証属性ではキャッシュできるが、呼ぶたびに今の状態を返すべき GET（controller.FunctionName）。
+# ヘルスチェックはキャッシュすると障害を隠し、/api/auth/me は古いログイン状態を返してしまう
+NO_STORE_ENDPOINTS = frozenset({"health.GetHealth", "auth.GetCurrentUser"})
+# キャッシュする秒数を指定する環境変数。未設定・0 なら no-store（デプロイ先にキャッシュの保存先を用意してから設定する）
+REVALIDATE_ENV = "SERVER_CACHE_REVALIDATE_SECONDS"
+# JS の正規表現リテラルでエスケープが必要な文字
+_JS_REGEX_SPECIAL = re.compile(r"[\\^$.*+?()[\]{}|/]")
 
 
 class ServerTemplate(BaseTemplate):
-    """server.ts生成用テンプレート（GETエンドポイントのみ）"""
+    """
+    server.ts生成用テンプレート（GETエンドポイントのみ）
+
+    更新系 API の後に破棄するキャッシュタグは、hooks.ts と同じ InvalidationMap から作る。
+    invalidations を渡さなければ render に渡したエンドポイントから作る。
+    """
 
-    def __init__(self, value_object_types: Dict[str, str], class_map: Dict[str, CSharpClass]):
-        super().__init__(value_object_types)
+    def __init__(
+        self,
+        value_object_types: Dict[str, str],
+        class_map: Dict[str, CSharpClass],
+        index: Optional[SymbolIndex] = None,
+        invalidations: Optional[InvalidationMap] = None,
+    ):
+        super().__init__(value_object_types, index or SymbolIndex(class_map.values(), value_object_types))
         self.class_map = class_map
+        self.invalidations = invalidations
 
     def get_header(self) -> str:
         return """// Auto-generated by api-generator.py
 // Do not edit manually
 // Server-side fetch functions for Next.js Server Components
 
+import { revalidateTag } from 'next/cache';
 import { getEnv } from '../../../utils/env';
 
 function getBaseUrl(): string {
   return getEnv('API_URL') || 'http://localhost:5243';
 }
 
+type ServerFetchCache = { cache: 'no-store' } | { next: { revalidate: number; tags: string[] } };
+
+/**
+ * [AllowAnonymous] / [OptionalAuth] の GET のキャッシュ設定
+ * %(env)s（秒）を設定したときだけデータキャッシュに残し、未設定・0 なら no-store にする。
+ * Cloudflare（OpenNext）では open-next.config.ts の incrementalCache / tagCache を設定するまで
+ * キャッシュも revalidateTag も効かないので、それまでは設定しない
+ */
+function cacheFor(tags: string[]): ServerFetchCache {
+  const seconds = Number(getEnv('%(env)s') || 0);
+  return seconds > 0 ? { next: { revalidate: seconds, tags } } : { cache: 'no-store' };
+}
+
 /**
  * サーバーサイド用のfetch関数（共通処理）
+ * 既定では常に最新のデータを取得する（ログインが必要な API など）
  */
-async function serverFetch<T>(url: string): Promise<T> {
+async function serverFetch<T>(url: string, caching: ServerFetchCache = { cache: 'no-store' }): Promise<T> {
   const response = await fetch(url, {
     method: 'GET',
     headers: {
       'Content-Type': 'application/json',
     },
-    cache: 'no-store', // Next.js: 常に最新のデータを取得
+    ...caching,
   });
 
   if (!response.ok) {
@@ -44,36 +84,39 @@ async function serverFetch<T>(url: string): Promise<T> {
   return response.json();
 }
 
-import type {"""
+import type {""" % {"env": REVALIDATE_ENV}
 
-    def generate(self, endpoints: List[EndpointInfo]) -> str:
+    def render(self, endpoints: List[EndpointInfo]) -> Iterator[str]:
         """
-        完全なserver.tsの内容を生成（GETエンドポイントのみ）
+        server.tsの内容を行単位で生成（GETエンドポイントのみ）
 
         Args:
             endpoints: エンドポイント情報のリスト
 
-        Returns:
-            server.tsの完全な内容
+        Yields:
+            server.tsの各行
         """
+        if self.invalidations is None:
+            self.invalidations = InvalidationMap(endpoints, self.index)
         # GETエンドポイントのみをフィルタ
         get_endpoints = [ep for ep in endpoints if ep.method == "GET"]
 
-        lines = [self.get_header()]
+        yield self.get_header()
 
         # 型インポートを生成
-        lines.extend(self._generate_type_imports(get_endpoints))
-        lines.append("")
+        yield from self._generate_type_imports(get_endpoints)
+        yield ""
 
         # コントローラー別にサーバ関数を生成
         by_controller = self._group_by_controller(get_endpoints)
         for controller, eps in sorted(by_controller.items()):
-            lines.append(f"// {controller.capitalize()} Server Functions")
+            yield f"// {controller.capitalize()} Server Functions"
             for ep in eps:
-                lines.extend(self._generate_server_function(ep))
-                lines.append("")
+                yield from self._fragment(endpoint_key(ep), lambda: self._generate_server_function(ep))
+                yield ""
 
-        return self._join_lines(lines)
+        # 更新系 API の後に破棄するキャッシュタグ（無効化するクエリがエンドポイント全体に依存するので断片にしない）
+        yield from self._generate_revalidation(endpoints)
 
     def _generate_type_imports(self, endpoints: List[EndpointInfo]) -> List[str]:
         """型インポートセクションを生成"""
@@ -96,7 +139,7 @@ import type {"""
             url_path = ep.path
             for param in path_params:
                 if request_type != "void":
-                    resolved_param = self._resolve_path_param(param, request_type, self.class_map)
+                    resolved_param = self._resolve_path_param(param, request_type)
                     url_path = url_path.replace(f'{{{param}}}', f'${{params.{resolved_param}}}')
                 else:
                     # request_typeがvoidの場合、パスパラメータを直接引数として使用
@@ -136,10 +179,104 @@ import type {"""
 
         # 共通のfetch関数を呼び出し
         lines.append("")
-        if request_type != "void" and not path_params:
-            lines.append(f"  return serverFetch<{response_type}>(url.toString());")
+        url_argument = "url.toString()" if request_type != "void" and not path_params else "url"
+        if self._is_cacheable(ep):
+            tags = ", ".join(self._cache_tags(ep, request_type))
+            lines.append(f"  return serverFetch<{response_type}>({url_argument}, cacheFor([{tags}]));")
         else:
-            lines.append(f"  return serverFetch<{response_type}>(url);")
+            lines.append(f"  return serverFetch<{response_type}>({url_argument});")
         lines.append("}")
 
         return lines
+
+    @staticmethod
+    def _is_cacheable(ep: EndpointInfo) -> bool:
+        return (
+            ep.method == "GET" and ep.auth in CACHEABLE_AUTH
+            and f"{ep.controller_name}.{ep.function_name}" not in NO_STORE_ENDPOINTS
+        )
+
+    def _query_tag(self, query: EndpointInfo) -> str:
+        """クエリのタグ（hooks.ts の Query Key と同じ articles:getArticles）"""
+        return f"{query.controller_name}:{self._to_camel_case(query.function_name)}"
+
+    def _cache_tags(self, ep: EndpointInfo, request_type: str) -> List[str]:
+        """
+        キャッシュタグ（TS の式）
+
+        コントローラーのタグ（articles）とクエリのタグ（articles:getArticles）に加えて、エンティティの ID で
+        限れるクエリなら articles:getArticleContent:<id> を付ける（hooks.ts の { id } で限った Query Key に対応）。
+        """
+        tags = [f"'{ep.controller_name}'", f"'{self._query_tag(ep)}'"]
+        param = self.invalidations.scope_param(ep)
+        if param is not None:
+            value = f"params.{param}" if request_type != "void" else param
+            tags.append(f"`{self._query_tag(ep)}:${{{value}}}`")
+        return tags
+
+    def _mutation_tags(self, mutation: EndpointInfo) -> List[str]:
+        """
+        mutation の後に破棄するタグ（TS の式。match はパスの正規表現の結果）
+
+        hooks.ts と同じく InvalidationMap が推測したクエリのタグで、ID で限るクエリはパスパラメータの ID のタグだけにする
+        （ID がパスにない場合はクエリのタグ全体）。推測できなければコントローラーのタグごと破棄する。
+        キャッシュしない GET のタグは付かないので含めない。
+        """
+        invalidation = self.invalidations.for_mutation(mutation)
+        if invalidation.fallback:
+            cached = any(self._is_cacheable(key.query) for key in invalidation.keys)
+            return [f"'{mutation.controller_name}'"] if cached else []
+        path_params = [
+            self._resolve_path_param(param, mutation.request_type) if mutation.request_type else param
+            for param in self._extract_path_params(mutation.path)
+        ]
+        tags = []
+        for key in invalidation.keys:
+            if not self._is_cacheable(key.query):
+                continue
+            if key.scope and key.scope[1] in path_params:
+                tags.append(f"`{self._query_tag(key.query)}:${{match[{path_params.index(key.scope[1]) + 1}]}}`")
+            else:
+                tags.append(f"'{self._query_tag(key.query)}'")
+        return tags
+
+    def _generate_revalidation(self, endpoints: List[EndpointInfo]) -> Iterator[str]:
+        """
+        更新系 API（POST / PUT / DELETE）のパス → 破棄するキャッシュタグの表と revalidateMutation
+
+        キャッシュする GET のタグを1つも破棄しない API は表に入れない。
+        """
+        yield "// Cache Revalidation"
+        yield "const mutationTags: Array<[method: string, path: RegExp, tags: (match: RegExpMatchArray) => string[]]> = ["
+        for ep in sorted((ep for ep in endpoints if ep.method != "GET"), key=lambda e: (e.controller_name, e.path, e.method)):
+            tags = self._mutation_tags(ep)
+            if not tags:
+                continue
+            argument = "(match)" if any("match[" in tag for tag in tags) else "()"
+            yield f"  ['{ep.method}', {self._path_pattern(ep.path)}, {argument} => [{', '.join(tags)}]],"
+        yield "];"
+        yield ""
+        yield "/**"
+        yield " * 更新系 API が成功した後に、関係するキャッシュタグを破棄する（Route Handler / Server Action から呼ぶ）"
+        yield " * 破棄したタグを返す"
+        yield " */"
+        yield "export function revalidateMutation(method: string, path: string): string[] {"
+        yield "  const tags = new Set<string>();"
+        yield "  for (const [mutationMethod, pattern, toTags] of mutationTags) {"
+        yield "    const match = mutationMethod === method ? path.match(pattern) : null;"
+        yield "    if (match) {"
+        yield "      toTags(match).forEach((tag) => tags.add(tag));"
+        yield "    }"
+        yield "  }"
+        yield "  tags.forEach((tag) => revalidateTag(tag, { expire: 0 }));"
+        yield "  return [...tags];"
+        yield "}"
+        yield ""
+
+    @staticmethod
+    def _path_pattern(path: str) -> str:
+        """"/api/articles/{id}/like" → JS の正規表現リテラル（パスパラメータは ([^/]+)）"""
+        parts = []
+        for segment in path.strip("/").split("/"):
+            parts.append("([^/]+)" if segment.startswith("{") and segment.endswith("}") else _JS_REGEX_SPECIAL.sub(r"\\\g<0>", segment))
+        return "/^\\/" + "\\/".join(parts) + "$/"
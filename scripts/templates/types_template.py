@@ -2,37 +2,40 @@
 types.ts生成用テンプレート
 """
 
-from typing import List
+from typing import Dict, Iterator, List, Optional
 from models import CSharpClass
-from helpers import csharp_type_to_typescript
+from helpers import SymbolIndex, get_type_mapper
 from .base import BaseTemplate
 
 
 class TypesTemplate(BaseTemplate):
     """types.ts生成用テンプレート"""
 
+    def __init__(self, value_object_types: Dict[str, str], index: Optional[SymbolIndex] = None):
+        super().__init__(value_object_types, index)
+        self.type_mapper = get_type_mapper(value_object_types)
+
     def get_header(self) -> str:
         return """// Auto-generated by api-generator.py
 // Do not edit manually
 """
 
-    def generate(self, classes: List[CSharpClass]) -> str:
+    def render(self, classes: List[CSharpClass]) -> Iterator[str]:
         """
-        完全なtypes.tsの内容を生成
+        types.tsの内容を行単位で生成
 
         Args:
             classes: C#クラスのリスト
 
-        Returns:
-            types.tsの完全な内容
+        Yields:
+            types.tsの各行
         """
-        lines = [self.get_header(), ""]
+        yield self.get_header()
+        yield ""
 
         for cls in sorted(classes, key=lambda x: x.name):
-            lines.extend(self._generate_interface(cls))
-            lines.append("")
-
-        return self._join_lines(lines)
+            yield from self._fragment(cls.name, lambda: self._generate_interface(cls))
+            yield ""
 
     def _generate_interface(self, cls: CSharpClass) -> List[str]:
         """インターフェース全体を生成"""
@@ -46,7 +49,7 @@ class TypesTemplate(BaseTemplate):
 
         # プロパティ生成
         for prop in cls.properties:
-            ts_type, is_nullable = csharp_type_to_typescript(prop.type, self.value_object_types)
+            ts_type, is_nullable = self.type_mapper.to_typescript(prop.type)
             is_optional = is_nullable or prop.is_optional
             camel_name = self._to_camel_case(prop.name)
             optional = "?" if is_optional else ""